@@ -0,0 +1,4 @@
+from ..utils import extensions
+extensions.require('italgos')
+
+from .italgos import *
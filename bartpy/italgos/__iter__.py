@@ -1 +0,0 @@
-from .italgos import *
\ No newline at end of file
@@ -9,7 +9,10 @@ if _swig_python_version_info < (2, 7, 0):
     raise RuntimeError("Python 2.7 or later required")
 
 # Import the low-level C/C++ module
-import _italgos
+if __package__ or "." in __name__:
+    from . import _italgos
+else:
+    import _italgos
 
 try:
     import builtins as __builtin__
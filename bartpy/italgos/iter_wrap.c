@@ -2729,7 +2729,7 @@ static swig_module_info swig_module = {swig_types, 16, 0, 0, 0, 0};
     #include <complex.h>
     #include <stdbool.h>
 
-    #include "/Users/malits/bart_work/bart/src/iter/italgos.h"
+    #include "iter/italgos.h"
 
 
 #include <limits.h>
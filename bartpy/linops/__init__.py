@@ -1,2 +1,7 @@
+# keep OpenMP inside the SWIG modules within the process-wide thread budget
+from ..utils import extensions, threads
+threads.configure_openmp()
+extensions.require('linops')
+
 from .linop import *
 from .ops import *
\ No newline at end of file
@@ -2,14 +2,19 @@ import numpy as np
 
 from .linop_swig import plus, chain, stack, domain, codomain
 # FIXME: Clean up these imports, modify namespace in SWIG
-from .linop_swig import forward as _forward
-from .linop_swig import adjoint as _adjoint
 from .linop_swig import normal as _normal
 from .linop_swig import pseudo_inv as _pseudo_inv
+from .linop_swig import forward_strided as _forward_strided
+from .linop_swig import adjoint_strided as _adjoint_strided
+from .linop_swig import forward_into as _forward_into
+from .linop_swig import adjoint_into as _adjoint_into
+from .linop_swig import normal_into as _normal_into
+from .linop_swig import pseudo_inv_into as _pseudo_inv_into
 
-from ..utils.md_utils import expand_array, expand_dims
+from ..utils import threads
+from ..utils.md_utils import check_out, expand_array, expand_dims
 
-def forward(op, dest_dims, src_arr):
+def forward(op, dest_dims, src_arr, out=None):
     """
     TODO: Figure out a way to access operator out dimensions
 
@@ -17,43 +22,83 @@ def forward(op, dest_dims, src_arr):
     :param op: Linear operator
     :dest_dims: Output dimensions
     :src_arr: source numpy array
+    :out: writeable complex64 array in column-major order of `dest_dims` to write the result
+        into instead of a new array; must not overlap `src_arr`
+    :returns: result, or `out`
     """
     dst_dim = expand_dims(dest_dims)
     src = expand_array(src_arr)
 
-    return _forward(op, dst_dim, src).squeeze()
+    if out is not None:
+        check_out(out, dest_dims, src)
+        with threads.in_process():
+            _forward_into(op, out, src)
+        return out
 
-def adjoint(op, dest_dims, src_arr):
+    with threads.in_process():
+        return _forward_strided(op, dst_dim, src).squeeze()
+
+def adjoint(op, dest_dims, src_arr, out=None):
     """
     Apply adjoint
     :param op: Linear Operator
     :dest_dims: Output dimensions
     :src_arr: source numpy array
+    :out: writeable complex64 array in column-major order of `dest_dims` to write the result
+        into instead of a new array; must not overlap `src_arr`
+    :returns: result, or `out`
     """
     dst_dim = expand_dims(dest_dims)
     src = expand_array(src_arr)
 
-    return _adjoint(op, dst_dim, src).squeeze()
+    if out is not None:
+        check_out(out, dest_dims, src)
+        with threads.in_process():
+            _adjoint_into(op, out, src)
+        return out
+
+    with threads.in_process():
+        return _adjoint_strided(op, dst_dim, src).squeeze()
 
-def normal(op, dest_dims, src_arr):
+def normal(op, dest_dims, src_arr, out=None):
     """
     :param op: Linear Operator
     :dest_dims: Output dimensions
     :src_arr: 
+    :out: writeable complex64 array in column-major order of `dest_dims` to write the result
+        into instead of a new array; must not overlap `src_arr`
+    :returns: result, or `out`
     """
     dst_dim = expand_dims(dest_dims)
     src = expand_array(src_arr)
 
-    return _normal(op, dst_dim, src).squeeze()
+    if out is not None:
+        check_out(out, dest_dims, src)
+        with threads.in_process():
+            _normal_into(op, out, src)
+        return out
 
-def pseudo_inv(op, llambda, dest_dims, src_arr):
+    with threads.in_process():
+        return _normal(op, dst_dim, src).squeeze()
+
+def pseudo_inv(op, llambda, dest_dims, src_arr, out=None):
     """
     :param op: Linear Operator
     :dest_dims: Output dimensions
     :src_arr: 
     :llambda: lambda term
+    :out: writeable complex64 array in column-major order of `dest_dims` to write the result
+        into instead of a new array; must not overlap `src_arr`
+    :returns: result, or `out`
     """
     dst_dim = expand_dims(dest_dims)
     src = expand_array(src_arr)
 
-    return _pseudo_inv(op, llambda, dst_dim, src)
\ No newline at end of file
+    if out is not None:
+        check_out(out, dest_dims, src)
+        with threads.in_process():
+            _pseudo_inv_into(op, llambda, out, src)
+        return out
+
+    with threads.in_process():
+        return _pseudo_inv(op, llambda, dst_dim, src)
\ No newline at end of file
@@ -9,7 +9,10 @@ if _swig_python_version_info < (2, 7, 0):
     raise RuntimeError("Python 2.7 or later required")
 
 # Import the low-level C/C++ module
-import _linop_swig
+if __package__ or "." in __name__:
+    from . import _linop_swig
+else:
+    import _linop_swig
 
 try:
     import builtins as __builtin__
@@ -65,12 +68,30 @@ def forward(op, ddims, sdims):
 def adjoint(op, ddims, sdims):
     return _linop_swig.adjoint(op, ddims, sdims)
 
-def normal(op, dims, src):
-    return _linop_swig.normal(op, dims, src)
+def normal(op, dims, sdims):
+    return _linop_swig.normal(op, dims, sdims)
 
 def pseudo_inv(op, _lambda, ddims, sdims):
     return _linop_swig.pseudo_inv(op, _lambda, ddims, sdims)
 
+def forward_strided(op, ddims, sdims):
+    return _linop_swig.forward_strided(op, ddims, sdims)
+
+def adjoint_strided(op, ddims, sdims):
+    return _linop_swig.adjoint_strided(op, ddims, sdims)
+
+def forward_into(op, odims, sdims):
+    return _linop_swig.forward_into(op, odims, sdims)
+
+def adjoint_into(op, odims, sdims):
+    return _linop_swig.adjoint_into(op, odims, sdims)
+
+def normal_into(op, odims, sdims):
+    return _linop_swig.normal_into(op, odims, sdims)
+
+def pseudo_inv_into(op, _lambda, odims, sdims):
+    return _linop_swig.pseudo_inv_into(op, _lambda, odims, sdims)
+
 def create(ON, odims, IN, idims, data, forward, adjoint, normal, norm_inv, arg10):
     return _linop_swig.create(ON, odims, IN, idims, data, forward, adjoint, normal, norm_inv, arg10)
 
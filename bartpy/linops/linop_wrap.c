@@ -2715,10 +2715,11 @@ static swig_module_info swig_module = {swig_types, 10, 0, 0, 0, 0};
 		#include <complex.h>
 		#include <stdbool.h>
 
-		#include "/Users/malits/bart_work/bart/src/linops/linop.h"
-        #include "/Users/malits/bart_work/bart/src/linops/someops.h"
-        #include "/Users/malits/bart_work/bart/src/num/init.h"
-        #include "/Users/malits/bart_work/bart/src/num/ops.h"
+		#include "linops/linop.h"
+        #include "linops/someops.h"
+        #include "num/init.h"
+        #include "num/ops.h"
+        #include "num/iovec.h"
 
 
 #ifndef SWIG_FILE_WITH_INIT
@@ -2729,44 +2730,6 @@ static swig_module_info swig_module = {swig_types, 10, 0, 0, 0, 0};
 #include <numpy/arrayobject.h>
 
 
-void wrap_forward(struct linop_s* op, long ddims[16], complex float* dst, long sdims[16], const complex float* src) {
-    linop_forward(op, 16, ddims, dst, 16, sdims, src);
-}
-
-void wrap_adjoint(struct linop_s* op, long ddims[16], complex float* dst, long sdims[16], const complex float* src) {
-    linop_adjoint(op, 16, ddims, dst, 16, sdims, src);
-}
-
-void wrap_normal(struct linop_s* op, long dims[16], complex float *dst, complex float *src) {
-    linop_normal(op, 16, dims, dst, src);
-}
-
-void wrap_pseudo_inv(struct linop_s* op, float lambda, long ddims[16], complex float* dst, long sdims[16], const complex float* src) {
-    linop_pseudo_inv(op, lambda, 16, ddims, dst, 16, sdims, src);
-}
-
-// void wrap_resize_center_create() {
-//     linop_resize_center_create();
-// }
-
-// void wrap_expand_create() {
-//     linop_expand_create();
-// }
-
-// void wrap_reshape_create() {
-//     linop_reshape_create();
-// }
-
-// void wrap_extract_create() {
-//     linop_extract_create();
-// }
-
-// void wrap_transpose_create() {
-//     linop_transpose_create();
-// }
-
-
-
 #if NPY_API_VERSION < 0x00000007
 #define NPY_ARRAY_DEFAULT NPY_DEFAULT
 #define NPY_ARRAY_FARRAY  NPY_FARRAY
@@ -3245,6 +3208,164 @@ void wrap_pseudo_inv(struct linop_s* op, float lambda, long ddims[16], complex f
 
 
 
+    // arrays BART can read in place: aligned native complex64 with at most 16
+    // dimensions and no negative strides
+    static int borrowable(PyObject* obj)
+    {
+        if (!is_array(obj) || array_type(obj) != NPY_COMPLEX64 || array_numdims(obj) > 16)
+            return 0;
+
+        if (!PyArray_ISALIGNED((PyArrayObject*) obj) || !PyArray_ISNOTSWAPPED((PyArrayObject*) obj))
+            return 0;
+
+        for (int i = 0; i < array_numdims(obj); i++)
+            if (array_stride(obj, i) < 0)
+                return 0;
+
+        return 1;
+    }
+
+    // byte strides of a column-major complex float array
+    static void fortran_strides(long strs[16], const long dims[16])
+    {
+        long str = sizeof(complex float);
+
+        for (int i = 0; i < 16; i++) {
+            strs[i] = str;
+            str *= dims[i];
+        }
+    }
+
+    static int same_dims(const long a[16], const long b[16])
+    {
+        for (int i = 0; i < 16; i++)
+            if (a[i] != b[i])
+                return 0;
+
+        return 1;
+    }
+
+    // raise from a wrapper that runs with the GIL released; the
+    // interface file checks PyErr_Occurred() after the call with %exception
+    static void raise_value_error(const char* msg)
+    {
+        SWIG_PYTHON_THREAD_BEGIN_BLOCK;
+        PyErr_SetString(PyExc_ValueError, msg);
+        SWIG_PYTHON_THREAD_END_BLOCK;
+    }
+
+
+static int iovec_dims(const struct iovec_s* iov, const long dims[16]) {
+    return (16 == iov->N) && same_dims(iov->dims, dims);
+}
+
+
+void wrap_forward(struct linop_s* op, long ddims[16], complex float* dst, long sdims[16], const complex float* src) {
+    linop_forward(op, 16, ddims, dst, 16, sdims, src);
+}
+
+void wrap_adjoint(struct linop_s* op, long ddims[16], complex float* dst, long sdims[16], const complex float* src) {
+    linop_adjoint(op, 16, ddims, dst, 16, sdims, src);
+}
+
+void wrap_normal(struct linop_s* op, long dims[16], complex float *dst, long sdims[16], const complex float *src) {
+    if (!iovec_dims(linop_domain(op), dims) || !iovec_dims(linop_domain(op), sdims)) {
+        raise_value_error("Dimensions do not match the operator");
+        return;
+    }
+
+    linop_normal(op, 16, dims, dst, src);
+}
+
+void wrap_pseudo_inv(struct linop_s* op, float lambda, long ddims[16], complex float* dst, long sdims[16], const complex float* src) {
+    linop_pseudo_inv(op, lambda, 16, ddims, dst, 16, sdims, src);
+}
+
+// void wrap_resize_center_create() {
+//     linop_resize_center_create();
+// }
+
+// void wrap_expand_create() {
+//     linop_expand_create();
+// }
+
+// void wrap_reshape_create() {
+//     linop_reshape_create();
+// }
+
+// void wrap_extract_create() {
+//     linop_extract_create();
+// }
+
+// void wrap_transpose_create() {
+//     linop_transpose_create();
+// }
+
+
+/* Forward and adjoint of arrays in any memory layout: the operator is wrapped
+ * with linop_copy_wrapper for the strides of the input and of the column-major output.
+ * The copy wrapper has no strided normal or pseudo-inverse.
+ */
+void wrap_forward_strided(struct linop_s* op, long ddims[16], complex float* dst, long sdims[16], long sstrs[16], const complex float* src) {
+    long dstrs[16];
+
+    if (!iovec_dims(linop_codomain(op), ddims) || !iovec_dims(linop_domain(op), sdims)) {
+        raise_value_error("Dimensions do not match the operator");
+        return;
+    }
+
+    fortran_strides(dstrs, ddims);
+
+    const struct linop_s* wrapper = linop_copy_wrapper(16, sstrs, dstrs, op);
+    linop_forward_unchecked(wrapper, dst, src);
+    linop_free(wrapper);
+}
+
+void wrap_adjoint_strided(struct linop_s* op, long ddims[16], complex float* dst, long sdims[16], long sstrs[16], const complex float* src) {
+    long dstrs[16];
+
+    if (!iovec_dims(linop_domain(op), ddims) || !iovec_dims(linop_codomain(op), sdims)) {
+        raise_value_error("Dimensions do not match the operator");
+        return;
+    }
+
+    fortran_strides(dstrs, ddims);
+
+    const struct linop_s* wrapper = linop_copy_wrapper(16, dstrs, sstrs, op);
+    linop_adjoint_unchecked(wrapper, dst, src);
+    linop_free(wrapper);
+}
+
+/* Apply into a caller-supplied column-major output. The dims are checked against
+ * the operator first, since the checked BART functions abort on a mismatch.
+ */
+void wrap_forward_into(struct linop_s* op, long odims[16], complex float* out, long sdims[16], long sstrs[16], const complex float* src) {
+    wrap_forward_strided(op, odims, out, sdims, sstrs, src);
+}
+
+void wrap_adjoint_into(struct linop_s* op, long odims[16], complex float* out, long sdims[16], long sstrs[16], const complex float* src) {
+    wrap_adjoint_strided(op, odims, out, sdims, sstrs, src);
+}
+
+void wrap_normal_into(struct linop_s* op, long odims[16], complex float* out, long sdims[16], const complex float* src) {
+    if (!iovec_dims(linop_domain(op), odims) || !iovec_dims(linop_domain(op), sdims)) {
+        raise_value_error("Dimensions do not match the operator");
+        return;
+    }
+
+    linop_normal(op, 16, odims, out, src);
+}
+
+void wrap_pseudo_inv_into(struct linop_s* op, float lambda, long odims[16], complex float* out, long sdims[16], const complex float* src) {
+    if (!iovec_dims(linop_domain(op), odims) || !iovec_dims(linop_codomain(op), sdims)) {
+        raise_value_error("Dimensions do not match the operator");
+        return;
+    }
+
+    linop_pseudo_inv(op, lambda, 16, odims, out, 16, sdims, src);
+}
+
+
 #include <float.h>
 
 
@@ -3499,49 +3620,631 @@ SWIG_AsVal_long (PyObject *obj, long* val)
       }
     }
   }
-#endif
-  return SWIG_TypeError;
+#endif
+  return SWIG_TypeError;
+}
+
+
+SWIGINTERN int
+SWIG_AsVal_int (PyObject * obj, int *val)
+{
+  long v;
+  int res = SWIG_AsVal_long (obj, &v);
+  if (SWIG_IsOK(res)) {
+    if ((v < INT_MIN || v > INT_MAX)) {
+      return SWIG_OverflowError;
+    } else {
+      if (val) *val = (int)(v);
+    }
+  }  
+  return res;
+}
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+SWIGINTERN PyObject *_wrap_forward(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct linop_s *arg1 = (struct linop_s *) 0 ;
+  long *arg2 ;
+  float complex *arg3 = (float complex *) 0 ;
+  long *arg4 ;
+  float complex *arg5 = (float complex *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyArrayObject *out2 = NULL ;
+  PyArrayObject *in_dims2 = NULL ;
+  int is_new_object2 = 0 ;
+  long odims2[16] ;
+  PyArrayObject *arr4 = NULL ;
+  int is_new_object4 = 0 ;
+  long dims4[16] ;
+  PyObject *swig_obj[3] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "forward", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_linop_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "forward" "', argument " "1"" of type '" "struct linop_s *""'"); 
+  }
+  arg1 = (struct linop_s *)(argp1);
+  {
+    npy_intp dims[16];
+    
+    in_dims2 = obj_to_array_fortran_allow_conversion(swig_obj[1], 
+      NPY_LONG,
+      &is_new_object2);
+    
+    
+    if (!in_dims2 || !require_dimensions(in_dims2, 1)) SWIG_fail;
+    
+    int N = array_size(in_dims2, 0);
+    
+    if (N > 16) {
+      PyErr_SetString(PyExc_ValueError, "At most 16 dimensions are supported");
+      SWIG_fail;
+    }
+    
+    long * dim_data_in = (long *) array_data(in_dims2);
+    
+    for (int i = 0; i < 16; i++) {
+      odims2[i] = (i < N) ? dim_data_in[i] : 1;
+      dims[i] = (npy_intp) odims2[i];
+    }
+    
+    out2 = (PyArrayObject*) PyArray_EMPTY(16, dims, NPY_CFLOAT, 1);
+    
+    if (!out2) SWIG_fail;
+    
+    arg2 = odims2;
+    arg3 = (complex float *) array_data(out2);
+  }
+  {
+    arr4 = obj_to_array_fortran_allow_conversion(swig_obj[2],
+      NPY_COMPLEX64,
+      &is_new_object4);
+    
+    if (!arr4) SWIG_fail;
+    
+    if (array_numdims(arr4) > 16) {
+      PyErr_SetString(PyExc_ValueError, "Array must have at most 16 dimensions");
+      SWIG_fail;
+    }
+    
+    for (int i = 0; i < 16; i++)
+    dims4[i] = (i < array_numdims(arr4)) ? (long) array_size(arr4, i) : 1;
+    
+    arg4 = dims4;
+    arg5 = array_data(arr4);
+  }
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    wrap_forward(arg1,arg2,arg3,arg4,(float complex const *)arg5);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_Py_Void();
+  {
+    resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)out2);
+    out2 = NULL;
+  }
+  {
+    if (is_new_object2 && in_dims2) {
+      Py_DECREF(in_dims2); 
+    }
+    Py_XDECREF(out2);
+  }
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
+  }
+  return resultobj;
+fail:
+  {
+    if (is_new_object2 && in_dims2) {
+      Py_DECREF(in_dims2); 
+    }
+    Py_XDECREF(out2);
+  }
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
+  }
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_adjoint(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct linop_s *arg1 = (struct linop_s *) 0 ;
+  long *arg2 ;
+  float complex *arg3 = (float complex *) 0 ;
+  long *arg4 ;
+  float complex *arg5 = (float complex *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyArrayObject *out2 = NULL ;
+  PyArrayObject *in_dims2 = NULL ;
+  int is_new_object2 = 0 ;
+  long odims2[16] ;
+  PyArrayObject *arr4 = NULL ;
+  int is_new_object4 = 0 ;
+  long dims4[16] ;
+  PyObject *swig_obj[3] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "adjoint", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_linop_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "adjoint" "', argument " "1"" of type '" "struct linop_s *""'"); 
+  }
+  arg1 = (struct linop_s *)(argp1);
+  {
+    npy_intp dims[16];
+    
+    in_dims2 = obj_to_array_fortran_allow_conversion(swig_obj[1], 
+      NPY_LONG,
+      &is_new_object2);
+    
+    
+    if (!in_dims2 || !require_dimensions(in_dims2, 1)) SWIG_fail;
+    
+    int N = array_size(in_dims2, 0);
+    
+    if (N > 16) {
+      PyErr_SetString(PyExc_ValueError, "At most 16 dimensions are supported");
+      SWIG_fail;
+    }
+    
+    long * dim_data_in = (long *) array_data(in_dims2);
+    
+    for (int i = 0; i < 16; i++) {
+      odims2[i] = (i < N) ? dim_data_in[i] : 1;
+      dims[i] = (npy_intp) odims2[i];
+    }
+    
+    out2 = (PyArrayObject*) PyArray_EMPTY(16, dims, NPY_CFLOAT, 1);
+    
+    if (!out2) SWIG_fail;
+    
+    arg2 = odims2;
+    arg3 = (complex float *) array_data(out2);
+  }
+  {
+    arr4 = obj_to_array_fortran_allow_conversion(swig_obj[2],
+      NPY_COMPLEX64,
+      &is_new_object4);
+    
+    if (!arr4) SWIG_fail;
+    
+    if (array_numdims(arr4) > 16) {
+      PyErr_SetString(PyExc_ValueError, "Array must have at most 16 dimensions");
+      SWIG_fail;
+    }
+    
+    for (int i = 0; i < 16; i++)
+    dims4[i] = (i < array_numdims(arr4)) ? (long) array_size(arr4, i) : 1;
+    
+    arg4 = dims4;
+    arg5 = array_data(arr4);
+  }
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    wrap_adjoint(arg1,arg2,arg3,arg4,(float complex const *)arg5);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_Py_Void();
+  {
+    resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)out2);
+    out2 = NULL;
+  }
+  {
+    if (is_new_object2 && in_dims2) {
+      Py_DECREF(in_dims2); 
+    }
+    Py_XDECREF(out2);
+  }
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
+  }
+  return resultobj;
+fail:
+  {
+    if (is_new_object2 && in_dims2) {
+      Py_DECREF(in_dims2); 
+    }
+    Py_XDECREF(out2);
+  }
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
+  }
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_normal(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct linop_s *arg1 = (struct linop_s *) 0 ;
+  long *arg2 ;
+  float complex *arg3 = (float complex *) 0 ;
+  long *arg4 ;
+  float complex *arg5 = (float complex *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyArrayObject *out2 = NULL ;
+  PyArrayObject *in_dims2 = NULL ;
+  int is_new_object2 = 0 ;
+  long odims2[16] ;
+  PyArrayObject *arr4 = NULL ;
+  int is_new_object4 = 0 ;
+  long dims4[16] ;
+  PyObject *swig_obj[3] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "normal", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_linop_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "normal" "', argument " "1"" of type '" "struct linop_s *""'"); 
+  }
+  arg1 = (struct linop_s *)(argp1);
+  {
+    npy_intp dims[16];
+    
+    in_dims2 = obj_to_array_fortran_allow_conversion(swig_obj[1], 
+      NPY_LONG,
+      &is_new_object2);
+    
+    
+    if (!in_dims2 || !require_dimensions(in_dims2, 1)) SWIG_fail;
+    
+    int N = array_size(in_dims2, 0);
+    
+    if (N > 16) {
+      PyErr_SetString(PyExc_ValueError, "At most 16 dimensions are supported");
+      SWIG_fail;
+    }
+    
+    long * dim_data_in = (long *) array_data(in_dims2);
+    
+    for (int i = 0; i < 16; i++) {
+      odims2[i] = (i < N) ? dim_data_in[i] : 1;
+      dims[i] = (npy_intp) odims2[i];
+    }
+    
+    out2 = (PyArrayObject*) PyArray_EMPTY(16, dims, NPY_CFLOAT, 1);
+    
+    if (!out2) SWIG_fail;
+    
+    arg2 = odims2;
+    arg3 = (complex float *) array_data(out2);
+  }
+  {
+    arr4 = obj_to_array_fortran_allow_conversion(swig_obj[2],
+      NPY_COMPLEX64,
+      &is_new_object4);
+    
+    if (!arr4) SWIG_fail;
+    
+    if (array_numdims(arr4) > 16) {
+      PyErr_SetString(PyExc_ValueError, "Array must have at most 16 dimensions");
+      SWIG_fail;
+    }
+    
+    for (int i = 0; i < 16; i++)
+    dims4[i] = (i < array_numdims(arr4)) ? (long) array_size(arr4, i) : 1;
+    
+    arg4 = dims4;
+    arg5 = array_data(arr4);
+  }
+  {
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      wrap_normal(arg1,arg2,arg3,arg4,(float complex const *)arg5);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+    if (PyErr_Occurred()) SWIG_fail;
+  }
+  resultobj = SWIG_Py_Void();
+  {
+    resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)out2);
+    out2 = NULL;
+  }
+  {
+    if (is_new_object2 && in_dims2) {
+      Py_DECREF(in_dims2); 
+    }
+    Py_XDECREF(out2);
+  }
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
+  }
+  return resultobj;
+fail:
+  {
+    if (is_new_object2 && in_dims2) {
+      Py_DECREF(in_dims2); 
+    }
+    Py_XDECREF(out2);
+  }
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
+  }
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_pseudo_inv(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct linop_s *arg1 = (struct linop_s *) 0 ;
+  float arg2 ;
+  long *arg3 ;
+  float complex *arg4 = (float complex *) 0 ;
+  long *arg5 ;
+  float complex *arg6 = (float complex *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  float val2 ;
+  int ecode2 = 0 ;
+  PyArrayObject *out3 = NULL ;
+  PyArrayObject *in_dims3 = NULL ;
+  int is_new_object3 = 0 ;
+  long odims3[16] ;
+  PyArrayObject *arr5 = NULL ;
+  int is_new_object5 = 0 ;
+  long dims5[16] ;
+  PyObject *swig_obj[4] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "pseudo_inv", 4, 4, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_linop_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "pseudo_inv" "', argument " "1"" of type '" "struct linop_s *""'"); 
+  }
+  arg1 = (struct linop_s *)(argp1);
+  ecode2 = SWIG_AsVal_float(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "pseudo_inv" "', argument " "2"" of type '" "float""'");
+  } 
+  arg2 = (float)(val2);
+  {
+    npy_intp dims[16];
+    
+    in_dims3 = obj_to_array_fortran_allow_conversion(swig_obj[2], 
+      NPY_LONG,
+      &is_new_object3);
+    
+    
+    if (!in_dims3 || !require_dimensions(in_dims3, 1)) SWIG_fail;
+    
+    int N = array_size(in_dims3, 0);
+    
+    if (N > 16) {
+      PyErr_SetString(PyExc_ValueError, "At most 16 dimensions are supported");
+      SWIG_fail;
+    }
+    
+    long * dim_data_in = (long *) array_data(in_dims3);
+    
+    for (int i = 0; i < 16; i++) {
+      odims3[i] = (i < N) ? dim_data_in[i] : 1;
+      dims[i] = (npy_intp) odims3[i];
+    }
+    
+    out3 = (PyArrayObject*) PyArray_EMPTY(16, dims, NPY_CFLOAT, 1);
+    
+    if (!out3) SWIG_fail;
+    
+    arg3 = odims3;
+    arg4 = (complex float *) array_data(out3);
+  }
+  {
+    arr5 = obj_to_array_fortran_allow_conversion(swig_obj[3],
+      NPY_COMPLEX64,
+      &is_new_object5);
+    
+    if (!arr5) SWIG_fail;
+    
+    if (array_numdims(arr5) > 16) {
+      PyErr_SetString(PyExc_ValueError, "Array must have at most 16 dimensions");
+      SWIG_fail;
+    }
+    
+    for (int i = 0; i < 16; i++)
+    dims5[i] = (i < array_numdims(arr5)) ? (long) array_size(arr5, i) : 1;
+    
+    arg5 = dims5;
+    arg6 = array_data(arr5);
+  }
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    wrap_pseudo_inv(arg1,arg2,arg3,arg4,arg5,(float complex const *)arg6);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_Py_Void();
+  {
+    resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)out3);
+    out3 = NULL;
+  }
+  {
+    if (is_new_object3 && in_dims3) {
+      Py_DECREF(in_dims3); 
+    }
+    Py_XDECREF(out3);
+  }
+  {
+    if (is_new_object5 && arr5) {
+      Py_DECREF(arr5); 
+    }
+  }
+  return resultobj;
+fail:
+  {
+    if (is_new_object3 && in_dims3) {
+      Py_DECREF(in_dims3); 
+    }
+    Py_XDECREF(out3);
+  }
+  {
+    if (is_new_object5 && arr5) {
+      Py_DECREF(arr5); 
+    }
+  }
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_forward_strided(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct linop_s *arg1 = (struct linop_s *) 0 ;
+  long *arg2 ;
+  float complex *arg3 = (float complex *) 0 ;
+  long *arg4 ;
+  long *arg5 ;
+  float complex *arg6 = (float complex *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyArrayObject *out2 = NULL ;
+  PyArrayObject *in_dims2 = NULL ;
+  int is_new_object2 = 0 ;
+  long odims2[16] ;
+  PyArrayObject *arr4 = NULL ;
+  int is_new_object4 = 0 ;
+  long dims4[16] ;
+  long strs4[16] ;
+  PyObject *swig_obj[3] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "forward_strided", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_linop_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "forward_strided" "', argument " "1"" of type '" "struct linop_s *""'"); 
+  }
+  arg1 = (struct linop_s *)(argp1);
+  {
+    npy_intp dims[16];
+    
+    in_dims2 = obj_to_array_fortran_allow_conversion(swig_obj[1], 
+      NPY_LONG,
+      &is_new_object2);
+    
+    
+    if (!in_dims2 || !require_dimensions(in_dims2, 1)) SWIG_fail;
+    
+    int N = array_size(in_dims2, 0);
+    
+    if (N > 16) {
+      PyErr_SetString(PyExc_ValueError, "At most 16 dimensions are supported");
+      SWIG_fail;
+    }
+    
+    long * dim_data_in = (long *) array_data(in_dims2);
+    
+    for (int i = 0; i < 16; i++) {
+      odims2[i] = (i < N) ? dim_data_in[i] : 1;
+      dims[i] = (npy_intp) odims2[i];
+    }
+    
+    out2 = (PyArrayObject*) PyArray_EMPTY(16, dims, NPY_CFLOAT, 1);
+    
+    if (!out2) SWIG_fail;
+    
+    arg2 = odims2;
+    arg3 = (complex float *) array_data(out2);
+  }
+  {
+    if (borrowable(swig_obj[2])) {
+      arr4 = (PyArrayObject*) swig_obj[2];
+    } else {
+      arr4 = obj_to_array_fortran_allow_conversion(swig_obj[2],
+        NPY_COMPLEX64,
+        &is_new_object4);
+      
+      if (!arr4) SWIG_fail;
+      
+      if (array_numdims(arr4) > 16) {
+        PyErr_SetString(PyExc_ValueError, "Array must have at most 16 dimensions");
+        SWIG_fail;
+      }
+    }
+    
+    for (int i = 0; i < 16; i++) {
+      dims4[i] = (i < array_numdims(arr4)) ? (long) array_size(arr4, i) : 1;
+      strs4[i] = (i < array_numdims(arr4)) ? (long) array_stride(arr4, i) : 0;
+    }
+    
+    arg4 = dims4;
+    arg5 = strs4;
+    arg6 = (complex float *) array_data(arr4);
+  }
+  {
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      wrap_forward_strided(arg1,arg2,arg3,arg4,arg5,(float complex const *)arg6);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+    if (PyErr_Occurred()) SWIG_fail;
+  }
+  resultobj = SWIG_Py_Void();
+  {
+    resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)out2);
+    out2 = NULL;
+  }
+  {
+    if (is_new_object2 && in_dims2) {
+      Py_DECREF(in_dims2); 
+    }
+    Py_XDECREF(out2);
+  }
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
+  }
+  return resultobj;
+fail:
+  {
+    if (is_new_object2 && in_dims2) {
+      Py_DECREF(in_dims2); 
+    }
+    Py_XDECREF(out2);
+  }
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
+  }
+  return NULL;
 }
 
 
-SWIGINTERN int
-SWIG_AsVal_int (PyObject * obj, int *val)
-{
-  long v;
-  int res = SWIG_AsVal_long (obj, &v);
-  if (SWIG_IsOK(res)) {
-    if ((v < INT_MIN || v > INT_MAX)) {
-      return SWIG_OverflowError;
-    } else {
-      if (val) *val = (int)(v);
-    }
-  }  
-  return res;
-}
-
-#ifdef __cplusplus
-extern "C" {
-#endif
-SWIGINTERN PyObject *_wrap_forward(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_adjoint_strided(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   struct linop_s *arg1 = (struct linop_s *) 0 ;
   long *arg2 ;
   float complex *arg3 = (float complex *) 0 ;
   long *arg4 ;
-  float complex *arg5 = (float complex *) 0 ;
+  long *arg5 ;
+  float complex *arg6 = (float complex *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject *out2 = NULL ;
+  PyArrayObject *out2 = NULL ;
   PyArrayObject *in_dims2 = NULL ;
   int is_new_object2 = 0 ;
-  PyObject *arr4 = NULL ;
+  long odims2[16] ;
+  PyArrayObject *arr4 = NULL ;
   int is_new_object4 = 0 ;
+  long dims4[16] ;
+  long strs4[16] ;
   PyObject *swig_obj[3] ;
   
-  if (!SWIG_Python_UnpackTuple(args, "forward", 3, 3, swig_obj)) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "adjoint_strided", 3, 3, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_linop_s, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "forward" "', argument " "1"" of type '" "struct linop_s *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "adjoint_strided" "', argument " "1"" of type '" "struct linop_s *""'"); 
   }
   arg1 = (struct linop_s *)(argp1);
   {
@@ -3552,199 +4255,351 @@ SWIGINTERN PyObject *_wrap_forward(PyObject *SWIGUNUSEDPARM(self), PyObject *arg
       &is_new_object2);
     
     
-    if (!in_dims2 || !require_dimensions(in_dims2, 1)) SWIG_fail; // check dims not greater than 16
+    if (!in_dims2 || !require_dimensions(in_dims2, 1)) SWIG_fail;
     
     int N = array_size(in_dims2, 0);
     
+    if (N > 16) {
+      PyErr_SetString(PyExc_ValueError, "At most 16 dimensions are supported");
+      SWIG_fail;
+    }
+    
     long * dim_data_in = (long *) array_data(in_dims2);
     
-    for (int i = 0; i < N; i++) 
-    dims[i] = (npy_intp) dim_data_in[i];
+    for (int i = 0; i < 16; i++) {
+      odims2[i] = (i < N) ? dim_data_in[i] : 1;
+      dims[i] = (npy_intp) odims2[i];
+    }
     
-    for (int i = N; i < 16; i++)
-    dims[i] = 1;
+    out2 = (PyArrayObject*) PyArray_EMPTY(16, dims, NPY_CFLOAT, 1);
     
-    out2 = PyArray_SimpleNew(16, dims, NPY_CFLOAT);
+    if (!out2) SWIG_fail;
     
-    arg2 = (long *) array_data(in_dims2);
+    arg2 = odims2;
     arg3 = (complex float *) array_data(out2);
   }
   {
-    long dims[16];
-    
-    arr4 = obj_to_array_fortran_allow_conversion(swig_obj[2],
-      NPY_COMPLEX64,
-      &is_new_object4);
-    
-    if (!arr4) SWIG_fail;
+    if (borrowable(swig_obj[2])) {
+      arr4 = (PyArrayObject*) swig_obj[2];
+    } else {
+      arr4 = obj_to_array_fortran_allow_conversion(swig_obj[2],
+        NPY_COMPLEX64,
+        &is_new_object4);
+      
+      if (!arr4) SWIG_fail;
+      
+      if (array_numdims(arr4) > 16) {
+        PyErr_SetString(PyExc_ValueError, "Array must have at most 16 dimensions");
+        SWIG_fail;
+      }
+    }
     
-    for (int i = 0; i < 16; i++) dims[i] = (long) array_size(arr4, i);
+    for (int i = 0; i < 16; i++) {
+      dims4[i] = (i < array_numdims(arr4)) ? (long) array_size(arr4, i) : 1;
+      strs4[i] = (i < array_numdims(arr4)) ? (long) array_stride(arr4, i) : 0;
+    }
     
-    arg4 = dims;
-    arg5 = array_data(arr4);
+    arg4 = dims4;
+    arg5 = strs4;
+    arg6 = (complex float *) array_data(arr4);
   }
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
-    wrap_forward(arg1,arg2,arg3,arg4,(float complex const *)arg5);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      wrap_adjoint_strided(arg1,arg2,arg3,arg4,arg5,(float complex const *)arg6);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+    if (PyErr_Occurred()) SWIG_fail;
   }
   resultobj = SWIG_Py_Void();
   {
     resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)out2);
+    out2 = NULL;
+  }
+  {
+    if (is_new_object2 && in_dims2) {
+      Py_DECREF(in_dims2); 
+    }
+    Py_XDECREF(out2);
+  }
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
   }
   return resultobj;
 fail:
+  {
+    if (is_new_object2 && in_dims2) {
+      Py_DECREF(in_dims2); 
+    }
+    Py_XDECREF(out2);
+  }
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
+  }
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_adjoint(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_forward_into(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   struct linop_s *arg1 = (struct linop_s *) 0 ;
   long *arg2 ;
   float complex *arg3 = (float complex *) 0 ;
   long *arg4 ;
-  float complex *arg5 = (float complex *) 0 ;
+  long *arg5 ;
+  float complex *arg6 = (float complex *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject *out2 = NULL ;
-  PyArrayObject *in_dims2 = NULL ;
-  int is_new_object2 = 0 ;
-  PyObject *arr4 = NULL ;
+  long dims2[16] ;
+  PyArrayObject *arr4 = NULL ;
   int is_new_object4 = 0 ;
+  long dims4[16] ;
+  long strs4[16] ;
   PyObject *swig_obj[3] ;
   
-  if (!SWIG_Python_UnpackTuple(args, "adjoint", 3, 3, swig_obj)) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "forward_into", 3, 3, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_linop_s, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "adjoint" "', argument " "1"" of type '" "struct linop_s *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "forward_into" "', argument " "1"" of type '" "struct linop_s *""'"); 
   }
   arg1 = (struct linop_s *)(argp1);
   {
-    npy_intp dims[16];
-    
-    in_dims2 = obj_to_array_fortran_allow_conversion(swig_obj[1], 
-      NPY_LONG,
-      &is_new_object2);
-    
-    
-    if (!in_dims2 || !require_dimensions(in_dims2, 1)) SWIG_fail; // check dims not greater than 16
-    
-    int N = array_size(in_dims2, 0);
-    
-    long * dim_data_in = (long *) array_data(in_dims2);
-    
-    for (int i = 0; i < N; i++) 
-    dims[i] = (npy_intp) dim_data_in[i];
-    
-    for (int i = N; i < 16; i++)
-    dims[i] = 1;
+    if (!is_array(swig_obj[1]) || array_type(swig_obj[1]) != NPY_COMPLEX64 || array_numdims(swig_obj[1]) > 16
+      || !array_is_fortran(swig_obj[1]) || !PyArray_ISWRITEABLE((PyArrayObject*) swig_obj[1])
+      || !PyArray_ISALIGNED((PyArrayObject*) swig_obj[1]) || !PyArray_ISNOTSWAPPED((PyArrayObject*) swig_obj[1])) {
+      PyErr_SetString(PyExc_ValueError, "out must be a writeable complex64 array in column-major order "
+        "with at most 16 dimensions");
+      SWIG_fail;
+    }
     
-    out2 = PyArray_SimpleNew(16, dims, NPY_CFLOAT);
+    for (int i = 0; i < 16; i++)
+    dims2[i] = (i < array_numdims(swig_obj[1])) ? (long) array_size(swig_obj[1], i) : 1;
     
-    arg2 = (long *) array_data(in_dims2);
-    arg3 = (complex float *) array_data(out2);
+    arg2 = dims2;
+    arg3 = (complex float *) array_data(swig_obj[1]);
   }
   {
-    long dims[16];
-    
-    arr4 = obj_to_array_fortran_allow_conversion(swig_obj[2],
-      NPY_COMPLEX64,
-      &is_new_object4);
-    
-    if (!arr4) SWIG_fail;
+    if (borrowable(swig_obj[2])) {
+      arr4 = (PyArrayObject*) swig_obj[2];
+    } else {
+      arr4 = obj_to_array_fortran_allow_conversion(swig_obj[2],
+        NPY_COMPLEX64,
+        &is_new_object4);
+      
+      if (!arr4) SWIG_fail;
+      
+      if (array_numdims(arr4) > 16) {
+        PyErr_SetString(PyExc_ValueError, "Array must have at most 16 dimensions");
+        SWIG_fail;
+      }
+    }
     
-    for (int i = 0; i < 16; i++) dims[i] = (long) array_size(arr4, i);
+    for (int i = 0; i < 16; i++) {
+      dims4[i] = (i < array_numdims(arr4)) ? (long) array_size(arr4, i) : 1;
+      strs4[i] = (i < array_numdims(arr4)) ? (long) array_stride(arr4, i) : 0;
+    }
     
-    arg4 = dims;
-    arg5 = array_data(arr4);
+    arg4 = dims4;
+    arg5 = strs4;
+    arg6 = (complex float *) array_data(arr4);
   }
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
-    wrap_adjoint(arg1,arg2,arg3,arg4,(float complex const *)arg5);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      wrap_forward_into(arg1,arg2,arg3,arg4,arg5,(float complex const *)arg6);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+    if (PyErr_Occurred()) SWIG_fail;
   }
   resultobj = SWIG_Py_Void();
   {
-    resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)out2);
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
   }
   return resultobj;
 fail:
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
+  }
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_normal(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_adjoint_into(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   struct linop_s *arg1 = (struct linop_s *) 0 ;
   long *arg2 ;
   float complex *arg3 = (float complex *) 0 ;
-  float complex *arg4 = (float complex *) 0 ;
+  long *arg4 ;
+  long *arg5 ;
+  float complex *arg6 = (float complex *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject *out2 = NULL ;
-  PyArrayObject *in_dims2 = NULL ;
-  int is_new_object2 = 0 ;
-  PyObject *arr4 = NULL ;
+  long dims2[16] ;
+  PyArrayObject *arr4 = NULL ;
   int is_new_object4 = 0 ;
+  long dims4[16] ;
+  long strs4[16] ;
   PyObject *swig_obj[3] ;
   
-  if (!SWIG_Python_UnpackTuple(args, "normal", 3, 3, swig_obj)) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "adjoint_into", 3, 3, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_linop_s, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "normal" "', argument " "1"" of type '" "struct linop_s *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "adjoint_into" "', argument " "1"" of type '" "struct linop_s *""'"); 
   }
   arg1 = (struct linop_s *)(argp1);
   {
-    npy_intp dims[16];
-    
-    in_dims2 = obj_to_array_fortran_allow_conversion(swig_obj[1], 
-      NPY_LONG,
-      &is_new_object2);
-    
-    
-    if (!in_dims2 || !require_dimensions(in_dims2, 1)) SWIG_fail; // check dims not greater than 16
+    if (!is_array(swig_obj[1]) || array_type(swig_obj[1]) != NPY_COMPLEX64 || array_numdims(swig_obj[1]) > 16
+      || !array_is_fortran(swig_obj[1]) || !PyArray_ISWRITEABLE((PyArrayObject*) swig_obj[1])
+      || !PyArray_ISALIGNED((PyArrayObject*) swig_obj[1]) || !PyArray_ISNOTSWAPPED((PyArrayObject*) swig_obj[1])) {
+      PyErr_SetString(PyExc_ValueError, "out must be a writeable complex64 array in column-major order "
+        "with at most 16 dimensions");
+      SWIG_fail;
+    }
     
-    int N = array_size(in_dims2, 0);
+    for (int i = 0; i < 16; i++)
+    dims2[i] = (i < array_numdims(swig_obj[1])) ? (long) array_size(swig_obj[1], i) : 1;
     
-    long * dim_data_in = (long *) array_data(in_dims2);
+    arg2 = dims2;
+    arg3 = (complex float *) array_data(swig_obj[1]);
+  }
+  {
+    if (borrowable(swig_obj[2])) {
+      arr4 = (PyArrayObject*) swig_obj[2];
+    } else {
+      arr4 = obj_to_array_fortran_allow_conversion(swig_obj[2],
+        NPY_COMPLEX64,
+        &is_new_object4);
+      
+      if (!arr4) SWIG_fail;
+      
+      if (array_numdims(arr4) > 16) {
+        PyErr_SetString(PyExc_ValueError, "Array must have at most 16 dimensions");
+        SWIG_fail;
+      }
+    }
     
-    for (int i = 0; i < N; i++) 
-    dims[i] = (npy_intp) dim_data_in[i];
+    for (int i = 0; i < 16; i++) {
+      dims4[i] = (i < array_numdims(arr4)) ? (long) array_size(arr4, i) : 1;
+      strs4[i] = (i < array_numdims(arr4)) ? (long) array_stride(arr4, i) : 0;
+    }
     
-    for (int i = N; i < 16; i++)
-    dims[i] = 1;
+    arg4 = dims4;
+    arg5 = strs4;
+    arg6 = (complex float *) array_data(arr4);
+  }
+  {
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      wrap_adjoint_into(arg1,arg2,arg3,arg4,arg5,(float complex const *)arg6);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+    if (PyErr_Occurred()) SWIG_fail;
+  }
+  resultobj = SWIG_Py_Void();
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
+  }
+  return resultobj;
+fail:
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
+  }
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_normal_into(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  struct linop_s *arg1 = (struct linop_s *) 0 ;
+  long *arg2 ;
+  float complex *arg3 = (float complex *) 0 ;
+  long *arg4 ;
+  float complex *arg5 = (float complex *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  long dims2[16] ;
+  PyArrayObject *arr4 = NULL ;
+  int is_new_object4 = 0 ;
+  long dims4[16] ;
+  PyObject *swig_obj[3] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "normal_into", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_linop_s, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "normal_into" "', argument " "1"" of type '" "struct linop_s *""'"); 
+  }
+  arg1 = (struct linop_s *)(argp1);
+  {
+    if (!is_array(swig_obj[1]) || array_type(swig_obj[1]) != NPY_COMPLEX64 || array_numdims(swig_obj[1]) > 16
+      || !array_is_fortran(swig_obj[1]) || !PyArray_ISWRITEABLE((PyArrayObject*) swig_obj[1])
+      || !PyArray_ISALIGNED((PyArrayObject*) swig_obj[1]) || !PyArray_ISNOTSWAPPED((PyArrayObject*) swig_obj[1])) {
+      PyErr_SetString(PyExc_ValueError, "out must be a writeable complex64 array in column-major order "
+        "with at most 16 dimensions");
+      SWIG_fail;
+    }
     
-    out2 = PyArray_SimpleNew(16, dims, NPY_CFLOAT);
+    for (int i = 0; i < 16; i++)
+    dims2[i] = (i < array_numdims(swig_obj[1])) ? (long) array_size(swig_obj[1], i) : 1;
     
-    arg2 = (long *) array_data(in_dims2);
-    arg3 = (complex float *) array_data(out2);
+    arg2 = dims2;
+    arg3 = (complex float *) array_data(swig_obj[1]);
   }
   {
     arr4 = obj_to_array_fortran_allow_conversion(swig_obj[2],
       NPY_COMPLEX64,
       &is_new_object4);
     
-    if (!arr4) SWIG_fail; // TODO: More robust check here
+    if (!arr4) SWIG_fail;
     
-    arg4 = (complex float *) array_data(arr4);
+    if (array_numdims(arr4) > 16) {
+      PyErr_SetString(PyExc_ValueError, "Array must have at most 16 dimensions");
+      SWIG_fail;
+    }
+    
+    for (int i = 0; i < 16; i++)
+    dims4[i] = (i < array_numdims(arr4)) ? (long) array_size(arr4, i) : 1;
+    
+    arg4 = dims4;
+    arg5 = array_data(arr4);
   }
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
-    wrap_normal(arg1,arg2,arg3,arg4);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      wrap_normal_into(arg1,arg2,arg3,arg4,(float complex const *)arg5);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+    if (PyErr_Occurred()) SWIG_fail;
   }
   resultobj = SWIG_Py_Void();
   {
-    resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)out2);
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
   }
   return resultobj;
 fail:
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
+  }
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_pseudo_inv(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+SWIGINTERN PyObject *_wrap_pseudo_inv_into(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   PyObject *resultobj = 0;
   struct linop_s *arg1 = (struct linop_s *) 0 ;
   float arg2 ;
@@ -3756,74 +4611,77 @@ SWIGINTERN PyObject *_wrap_pseudo_inv(PyObject *SWIGUNUSEDPARM(self), PyObject *
   int res1 = 0 ;
   float val2 ;
   int ecode2 = 0 ;
-  PyObject *out3 = NULL ;
-  PyArrayObject *in_dims3 = NULL ;
-  int is_new_object3 = 0 ;
-  PyObject *arr5 = NULL ;
+  long dims3[16] ;
+  PyArrayObject *arr5 = NULL ;
   int is_new_object5 = 0 ;
+  long dims5[16] ;
   PyObject *swig_obj[4] ;
   
-  if (!SWIG_Python_UnpackTuple(args, "pseudo_inv", 4, 4, swig_obj)) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "pseudo_inv_into", 4, 4, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_linop_s, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "pseudo_inv" "', argument " "1"" of type '" "struct linop_s *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "pseudo_inv_into" "', argument " "1"" of type '" "struct linop_s *""'"); 
   }
   arg1 = (struct linop_s *)(argp1);
   ecode2 = SWIG_AsVal_float(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "pseudo_inv" "', argument " "2"" of type '" "float""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "pseudo_inv_into" "', argument " "2"" of type '" "float""'");
   } 
   arg2 = (float)(val2);
   {
-    npy_intp dims[16];
-    
-    in_dims3 = obj_to_array_fortran_allow_conversion(swig_obj[2], 
-      NPY_LONG,
-      &is_new_object3);
-    
-    
-    if (!in_dims3 || !require_dimensions(in_dims3, 1)) SWIG_fail; // check dims not greater than 16
-    
-    int N = array_size(in_dims3, 0);
-    
-    long * dim_data_in = (long *) array_data(in_dims3);
-    
-    for (int i = 0; i < N; i++) 
-    dims[i] = (npy_intp) dim_data_in[i];
-    
-    for (int i = N; i < 16; i++)
-    dims[i] = 1;
+    if (!is_array(swig_obj[2]) || array_type(swig_obj[2]) != NPY_COMPLEX64 || array_numdims(swig_obj[2]) > 16
+      || !array_is_fortran(swig_obj[2]) || !PyArray_ISWRITEABLE((PyArrayObject*) swig_obj[2])
+      || !PyArray_ISALIGNED((PyArrayObject*) swig_obj[2]) || !PyArray_ISNOTSWAPPED((PyArrayObject*) swig_obj[2])) {
+      PyErr_SetString(PyExc_ValueError, "out must be a writeable complex64 array in column-major order "
+        "with at most 16 dimensions");
+      SWIG_fail;
+    }
     
-    out3 = PyArray_SimpleNew(16, dims, NPY_CFLOAT);
+    for (int i = 0; i < 16; i++)
+    dims3[i] = (i < array_numdims(swig_obj[2])) ? (long) array_size(swig_obj[2], i) : 1;
     
-    arg3 = (long *) array_data(in_dims3);
-    arg4 = (complex float *) array_data(out3);
+    arg3 = dims3;
+    arg4 = (complex float *) array_data(swig_obj[2]);
   }
   {
-    long dims[16];
-    
     arr5 = obj_to_array_fortran_allow_conversion(swig_obj[3],
       NPY_COMPLEX64,
       &is_new_object5);
     
     if (!arr5) SWIG_fail;
     
-    for (int i = 0; i < 16; i++) dims[i] = (long) array_size(arr5, i);
+    if (array_numdims(arr5) > 16) {
+      PyErr_SetString(PyExc_ValueError, "Array must have at most 16 dimensions");
+      SWIG_fail;
+    }
+    
+    for (int i = 0; i < 16; i++)
+    dims5[i] = (i < array_numdims(arr5)) ? (long) array_size(arr5, i) : 1;
     
-    arg5 = dims;
+    arg5 = dims5;
     arg6 = array_data(arr5);
   }
   {
-    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
-    wrap_pseudo_inv(arg1,arg2,arg3,arg4,arg5,(float complex const *)arg6);
-    SWIG_PYTHON_THREAD_END_ALLOW;
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      wrap_pseudo_inv_into(arg1,arg2,arg3,arg4,arg5,(float complex const *)arg6);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+    if (PyErr_Occurred()) SWIG_fail;
   }
   resultobj = SWIG_Py_Void();
   {
-    resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)out3);
+    if (is_new_object5 && arr5) {
+      Py_DECREF(arr5); 
+    }
   }
   return resultobj;
 fail:
+  {
+    if (is_new_object5 && arr5) {
+      Py_DECREF(arr5); 
+    }
+  }
   return NULL;
 }
 
@@ -4162,7 +5020,7 @@ SWIGINTERN PyObject *_wrap_forward_unchecked(PyObject *SWIGUNUSEDPARM(self), PyO
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
-  PyObject *arr3 = NULL ;
+  PyArrayObject *arr3 = NULL ;
   int is_new_object3 = 0 ;
   PyObject *swig_obj[3] ;
   
@@ -4192,8 +5050,18 @@ SWIGINTERN PyObject *_wrap_forward_unchecked(PyObject *SWIGUNUSEDPARM(self), PyO
     SWIG_PYTHON_THREAD_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
+  {
+    if (is_new_object3 && arr3) {
+      Py_DECREF(arr3); 
+    }
+  }
   return resultobj;
 fail:
+  {
+    if (is_new_object3 && arr3) {
+      Py_DECREF(arr3); 
+    }
+  }
   return NULL;
 }
 
@@ -4207,7 +5075,7 @@ SWIGINTERN PyObject *_wrap_adjoint_unchecked(PyObject *SWIGUNUSEDPARM(self), PyO
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
-  PyObject *arr3 = NULL ;
+  PyArrayObject *arr3 = NULL ;
   int is_new_object3 = 0 ;
   PyObject *swig_obj[3] ;
   
@@ -4237,8 +5105,18 @@ SWIGINTERN PyObject *_wrap_adjoint_unchecked(PyObject *SWIGUNUSEDPARM(self), PyO
     SWIG_PYTHON_THREAD_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
+  {
+    if (is_new_object3 && arr3) {
+      Py_DECREF(arr3); 
+    }
+  }
   return resultobj;
 fail:
+  {
+    if (is_new_object3 && arr3) {
+      Py_DECREF(arr3); 
+    }
+  }
   return NULL;
 }
 
@@ -4252,7 +5130,7 @@ SWIGINTERN PyObject *_wrap_normal_unchecked(PyObject *SWIGUNUSEDPARM(self), PyOb
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
-  PyObject *arr3 = NULL ;
+  PyArrayObject *arr3 = NULL ;
   int is_new_object3 = 0 ;
   PyObject *swig_obj[3] ;
   
@@ -4282,8 +5160,18 @@ SWIGINTERN PyObject *_wrap_normal_unchecked(PyObject *SWIGUNUSEDPARM(self), PyOb
     SWIG_PYTHON_THREAD_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
+  {
+    if (is_new_object3 && arr3) {
+      Py_DECREF(arr3); 
+    }
+  }
   return resultobj;
 fail:
+  {
+    if (is_new_object3 && arr3) {
+      Py_DECREF(arr3); 
+    }
+  }
   return NULL;
 }
 
@@ -4300,7 +5188,7 @@ SWIGINTERN PyObject *_wrap_norm_inv_unchecked(PyObject *SWIGUNUSEDPARM(self), Py
   int ecode2 = 0 ;
   void *argp3 = 0 ;
   int res3 = 0 ;
-  PyObject *arr4 = NULL ;
+  PyArrayObject *arr4 = NULL ;
   int is_new_object4 = 0 ;
   PyObject *swig_obj[4] ;
   
@@ -4335,8 +5223,18 @@ SWIGINTERN PyObject *_wrap_norm_inv_unchecked(PyObject *SWIGUNUSEDPARM(self), Py
     SWIG_PYTHON_THREAD_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
+  }
   return resultobj;
 fail:
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
+  }
   return NULL;
 }
 
@@ -4860,7 +5758,7 @@ SWIGINTERN PyObject *_wrap_cdiag_create(PyObject *SWIGUNUSEDPARM(self), PyObject
   int is_new_object1 = 0 ;
   unsigned int val3 ;
   int ecode3 = 0 ;
-  PyObject *arr4 = NULL ;
+  PyArrayObject *arr4 = NULL ;
   int is_new_object4 = 0 ;
   PyObject *swig_obj[3] ;
   struct linop_s *result = 0 ;
@@ -4904,6 +5802,11 @@ SWIGINTERN PyObject *_wrap_cdiag_create(PyObject *SWIGUNUSEDPARM(self), PyObject
       Py_DECREF(array1); 
     }
   }
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
+  }
   return resultobj;
 fail:
   {
@@ -4912,6 +5815,11 @@ fail:
       Py_DECREF(array1); 
     }
   }
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
+  }
   return NULL;
 }
 
@@ -4926,7 +5834,7 @@ SWIGINTERN PyObject *_wrap_rdiag_create(PyObject *SWIGUNUSEDPARM(self), PyObject
   int is_new_object1 = 0 ;
   unsigned int val3 ;
   int ecode3 = 0 ;
-  PyObject *arr4 = NULL ;
+  PyArrayObject *arr4 = NULL ;
   int is_new_object4 = 0 ;
   PyObject *swig_obj[3] ;
   struct linop_s *result = 0 ;
@@ -4970,6 +5878,11 @@ SWIGINTERN PyObject *_wrap_rdiag_create(PyObject *SWIGUNUSEDPARM(self), PyObject
       Py_DECREF(array1); 
     }
   }
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
+  }
   return resultobj;
 fail:
   {
@@ -4978,6 +5891,11 @@ fail:
       Py_DECREF(array1); 
     }
   }
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
+  }
   return NULL;
 }
 
@@ -5589,6 +6507,12 @@ static PyMethodDef SwigMethods[] = {
 	 { "adjoint", _wrap_adjoint, METH_VARARGS, NULL},
 	 { "normal", _wrap_normal, METH_VARARGS, NULL},
 	 { "pseudo_inv", _wrap_pseudo_inv, METH_VARARGS, NULL},
+	 { "forward_strided", _wrap_forward_strided, METH_VARARGS, NULL},
+	 { "adjoint_strided", _wrap_adjoint_strided, METH_VARARGS, NULL},
+	 { "forward_into", _wrap_forward_into, METH_VARARGS, NULL},
+	 { "adjoint_into", _wrap_adjoint_into, METH_VARARGS, NULL},
+	 { "normal_into", _wrap_normal_into, METH_VARARGS, NULL},
+	 { "pseudo_inv_into", _wrap_pseudo_inv_into, METH_VARARGS, NULL},
 	 { "create", _wrap_create, METH_VARARGS, NULL},
 	 { "create2", _wrap_create2, METH_VARARGS, NULL},
 	 { "get_data", _wrap_get_data, METH_O, NULL},
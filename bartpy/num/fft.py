@@ -2,14 +2,34 @@
 import os
 os.environ["KMP_DUPLICATE_LIB_OK"] = "TRUE"
 
+# keep OpenMP inside the SWIG module within the process-wide thread budget
+from ..utils import extensions, threads
+threads.configure_openmp()
+
 
 import numpy as np
 
-from .fft_swig import *
-from .fft_swig import fft as _fft
-from .fft_swig import ifft as _ifft
+if extensions.available('fft'):
+    from .fft_swig import *
+    from .fft_swig import fft as _fft
+    from .fft_swig import ifft as _ifft
+    from .fft_swig import fft_strided as _fft_strided
+    from .fft_swig import ifft_strided as _ifft_strided
+    from .fft_swig import fft_into as _fft_into
+    from .fft_swig import ifft_into as _ifft_into
+else:
+    # without the extension, fft and ifft launch the bart fft tool
+    _fft = _ifft = _fft_strided = _ifft_strided = _fft_into = _ifft_into = None
+
+from ..utils.md_utils import check_out
+
+
+def _fft_tool(src, flags, inverse, out=None):
+    # the extension calls BART's un-centered fft, so the tool runs un-centered as well
+    from ..tools import fft as bart_fft
+    return bart_fft(src, flags, i=True if inverse else None, n=True, out=out)
 
-def fft(src, flags=0, unitary=False, centered=True):
+def fft(src, flags=0, unitary=False, centered=True, out=None):
     """
     Perform a Fast Fourier Transform
 
@@ -17,10 +37,15 @@ def fft(src, flags=0, unitary=False, centered=True):
     :param flags: flags
     :param unitary: Boolean values that toggles unitary FFT
     :param centered: Boolean value that toggles centered and uncentered FFT
+    :param out: writeable complex64 array in column-major order to write the result into, of the
+        shape of `src` up to trailing singleton dimensions; may be `src` itself to transform in place
 
-    :returns: Fourier-transformed data
+    :returns: Fourier-transformed data, or `out`
     """
 
+    if out is not None:
+        check_out(out, src.shape, src, in_place=True)
+
     dims = list(src.shape)
     singelton_dims = (16 - len(dims))
 
@@ -29,14 +54,24 @@ def fft(src, flags=0, unitary=False, centered=True):
     for i in range(singelton_dims):
         src = src[..., np.newaxis]
 
-    if centered:
-        result = _fft(dims, flags, np.asfortranarray(src))
-    else:
+    if not centered:
         raise NameError("Not yet implemented")
 
+    if _fft_strided is None:
+        result = _fft_tool(src, flags, inverse=False, out=out)
+    elif out is not None:
+        with threads.in_process():
+            _fft_into(out, flags, src)
+    else:
+        with threads.in_process():
+            result = _fft_strided(dims, flags, src)
+
+    if out is not None:
+        return out
+
     return result.squeeze()
 
-def ifft(src, flags=0, unitary=False, centered=True):
+def ifft(src, flags=0, unitary=False, centered=True, out=None):
     """
     Perform an inverse FFT
 
@@ -44,10 +79,15 @@ def ifft(src, flags=0, unitary=False, centered=True):
     :param flags: indicate active dimensions
     :param unitary: Boolean value that toggles unitary FFT
     :param centered: Boolean value that toggles centering
+    :param out: writeable complex64 array in column-major order to write the result into, of the
+        shape of `src` up to trailing singleton dimensions; may be `src` itself to transform in place
 
-    :returns: Inverse-FFT'd data.
+    :returns: Inverse-FFT'd data, or `out`.
     """
 
+    if out is not None:
+        check_out(out, src.shape, src, in_place=True)
+
     dims = list(src.shape)
     singelton_dims = (16 - len(dims))
 
@@ -56,9 +96,19 @@ def ifft(src, flags=0, unitary=False, centered=True):
     for i in range(singelton_dims):
         src = src[..., np.newaxis]
 
-    if centered:
-        result = _ifft(dims, flags, np.asfortranarray(src))
-    else:
+    if not centered:
         raise NameError("Not yet implemented")
 
+    if _ifft_strided is None:
+        result = _fft_tool(src, flags, inverse=True, out=out)
+    elif out is not None:
+        with threads.in_process():
+            _ifft_into(out, flags, src)
+    else:
+        with threads.in_process():
+            result = _ifft_strided(dims, flags, src)
+
+    if out is not None:
+        return out
+
     return result.squeeze()
\ No newline at end of file
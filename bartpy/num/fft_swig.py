@@ -83,6 +83,18 @@ def fft(dimensions, flags, src):
 def ifft(dimensions, flags, src):
     return _fft_swig.ifft(dimensions, flags, src)
 
+def fft_strided(dimensions, flags, sdims):
+    return _fft_swig.fft_strided(dimensions, flags, sdims)
+
+def ifft_strided(dimensions, flags, sdims):
+    return _fft_swig.ifft_strided(dimensions, flags, sdims)
+
+def fft_into(odims, flags, sdims):
+    return _fft_swig.fft_into(odims, flags, sdims)
+
+def ifft_into(odims, flags, sdims):
+    return _fft_swig.ifft_into(odims, flags, sdims)
+
 def fftc(D, dimensions, flags, dst, src):
     return _fft_swig.fftc(D, dimensions, flags, dst, src)
 
@@ -2708,8 +2708,8 @@ static swig_module_info swig_module = {swig_types, 3, 0, 0, 0, 0};
 		#include <complex.h>
 		#include <stdbool.h>
 
-		#include "/Users/malits/bart_work/bart/src/num/fft.h"
-        #include "/Users/malits/bart_work/bart/src/num/init.h"
+		#include "num/fft.h"
+        #include "num/init.h"
 
 
 #ifndef SWIG_FILE_WITH_INIT
@@ -3405,6 +3405,87 @@ SWIG_AsVal_long (PyObject *obj, long* val)
   return SWIG_TypeError;
 }
 
+
+    // arrays BART can read in place: aligned native complex64 with at most 16
+    // dimensions and no negative strides
+    static int borrowable(PyObject* obj)
+    {
+        if (!is_array(obj) || array_type(obj) != NPY_COMPLEX64 || array_numdims(obj) > 16)
+            return 0;
+
+        if (!PyArray_ISALIGNED((PyArrayObject*) obj) || !PyArray_ISNOTSWAPPED((PyArrayObject*) obj))
+            return 0;
+
+        for (int i = 0; i < array_numdims(obj); i++)
+            if (array_stride(obj, i) < 0)
+                return 0;
+
+        return 1;
+    }
+
+    // byte strides of a column-major complex float array
+    static void fortran_strides(long strs[16], const long dims[16])
+    {
+        long str = sizeof(complex float);
+
+        for (int i = 0; i < 16; i++) {
+            strs[i] = str;
+            str *= dims[i];
+        }
+    }
+
+    static int same_dims(const long a[16], const long b[16])
+    {
+        for (int i = 0; i < 16; i++)
+            if (a[i] != b[i])
+                return 0;
+
+        return 1;
+    }
+
+    // raise from a wrapper that runs with the GIL released; the
+    // interface file checks PyErr_Occurred() after the call with %exception
+    static void raise_value_error(const char* msg)
+    {
+        SWIG_PYTHON_THREAD_BEGIN_BLOCK;
+        PyErr_SetString(PyExc_ValueError, msg);
+        SWIG_PYTHON_THREAD_END_BLOCK;
+    }
+
+
+void wrap_fft_strided(long dimensions[16], complex float* dst, long flags, long sdims[16], long sstrs[16], complex float* src) {
+	long ostrs[16];
+
+	if (!same_dims(dimensions, sdims)) {
+		raise_value_error("Output dimensions must match the input");
+		return;
+	}
+
+	fortran_strides(ostrs, dimensions);
+	fft2(16, dimensions, flags, ostrs, dst, sstrs, src);
+}
+
+void wrap_ifft_strided(long dimensions[16], complex float* dst, long flags, long sdims[16], long sstrs[16], complex float* src) {
+	long ostrs[16];
+
+	if (!same_dims(dimensions, sdims)) {
+		raise_value_error("Output dimensions must match the input");
+		return;
+	}
+
+	fortran_strides(ostrs, dimensions);
+	ifft2(16, dimensions, flags, ostrs, dst, sstrs, src);
+}
+
+// FFT into a column-major array, which may be the input itself for an in-place FFT
+void wrap_fft_into(long odims[16], complex float* out, long flags, long sdims[16], long sstrs[16], complex float* src) {
+	wrap_fft_strided(odims, out, flags, sdims, sstrs, src);
+}
+
+void wrap_ifft_into(long odims[16], complex float* out, long flags, long sdims[16], long sstrs[16], complex float* src) {
+	wrap_ifft_strided(odims, out, flags, sdims, sstrs, src);
+}
+
 #ifdef __cplusplus
 extern "C" {
 #endif
@@ -3423,7 +3504,7 @@ SWIGINTERN PyObject *_wrap_fftmod(PyObject *SWIGUNUSEDPARM(self), PyObject *args
   int ecode3 = 0 ;
   void *argp4 = 0 ;
   int res4 = 0 ;
-  PyObject *arr5 = NULL ;
+  PyArrayObject *arr5 = NULL ;
   int is_new_object5 = 0 ;
   PyObject *swig_obj[5] ;
   
@@ -3463,8 +3544,18 @@ SWIGINTERN PyObject *_wrap_fftmod(PyObject *SWIGUNUSEDPARM(self), PyObject *args
     SWIG_PYTHON_THREAD_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
+  {
+    if (is_new_object5 && arr5) {
+      Py_DECREF(arr5); 
+    }
+  }
   return resultobj;
 fail:
+  {
+    if (is_new_object5 && arr5) {
+      Py_DECREF(arr5); 
+    }
+  }
   return NULL;
 }
 
@@ -3484,7 +3575,7 @@ SWIGINTERN PyObject *_wrap_ifftmod(PyObject *SWIGUNUSEDPARM(self), PyObject *arg
   int ecode3 = 0 ;
   void *argp4 = 0 ;
   int res4 = 0 ;
-  PyObject *arr5 = NULL ;
+  PyArrayObject *arr5 = NULL ;
   int is_new_object5 = 0 ;
   PyObject *swig_obj[5] ;
   
@@ -3524,8 +3615,18 @@ SWIGINTERN PyObject *_wrap_ifftmod(PyObject *SWIGUNUSEDPARM(self), PyObject *arg
     SWIG_PYTHON_THREAD_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
+  {
+    if (is_new_object5 && arr5) {
+      Py_DECREF(arr5); 
+    }
+  }
   return resultobj;
 fail:
+  {
+    if (is_new_object5 && arr5) {
+      Py_DECREF(arr5); 
+    }
+  }
   return NULL;
 }
 
@@ -3545,7 +3646,7 @@ SWIGINTERN PyObject *_wrap_fftscale(PyObject *SWIGUNUSEDPARM(self), PyObject *ar
   int ecode3 = 0 ;
   void *argp4 = 0 ;
   int res4 = 0 ;
-  PyObject *arr5 = NULL ;
+  PyArrayObject *arr5 = NULL ;
   int is_new_object5 = 0 ;
   PyObject *swig_obj[5] ;
   
@@ -3585,8 +3686,18 @@ SWIGINTERN PyObject *_wrap_fftscale(PyObject *SWIGUNUSEDPARM(self), PyObject *ar
     SWIG_PYTHON_THREAD_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
+  {
+    if (is_new_object5 && arr5) {
+      Py_DECREF(arr5); 
+    }
+  }
   return resultobj;
 fail:
+  {
+    if (is_new_object5 && arr5) {
+      Py_DECREF(arr5); 
+    }
+  }
   return NULL;
 }
 
@@ -3606,7 +3717,7 @@ SWIGINTERN PyObject *_wrap_fftshift(PyObject *SWIGUNUSEDPARM(self), PyObject *ar
   int ecode3 = 0 ;
   void *argp4 = 0 ;
   int res4 = 0 ;
-  PyObject *arr5 = NULL ;
+  PyArrayObject *arr5 = NULL ;
   int is_new_object5 = 0 ;
   PyObject *swig_obj[5] ;
   
@@ -3646,8 +3757,18 @@ SWIGINTERN PyObject *_wrap_fftshift(PyObject *SWIGUNUSEDPARM(self), PyObject *ar
     SWIG_PYTHON_THREAD_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
+  {
+    if (is_new_object5 && arr5) {
+      Py_DECREF(arr5); 
+    }
+  }
   return resultobj;
 fail:
+  {
+    if (is_new_object5 && arr5) {
+      Py_DECREF(arr5); 
+    }
+  }
   return NULL;
 }
 
@@ -3667,7 +3788,7 @@ SWIGINTERN PyObject *_wrap_ifftshift(PyObject *SWIGUNUSEDPARM(self), PyObject *a
   int ecode3 = 0 ;
   void *argp4 = 0 ;
   int res4 = 0 ;
-  PyObject *arr5 = NULL ;
+  PyArrayObject *arr5 = NULL ;
   int is_new_object5 = 0 ;
   PyObject *swig_obj[5] ;
   
@@ -3707,8 +3828,18 @@ SWIGINTERN PyObject *_wrap_ifftshift(PyObject *SWIGUNUSEDPARM(self), PyObject *a
     SWIG_PYTHON_THREAD_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
+  {
+    if (is_new_object5 && arr5) {
+      Py_DECREF(arr5); 
+    }
+  }
   return resultobj;
 fail:
+  {
+    if (is_new_object5 && arr5) {
+      Py_DECREF(arr5); 
+    }
+  }
   return NULL;
 }
 
@@ -3719,12 +3850,13 @@ SWIGINTERN PyObject *_wrap_fft(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   float complex *arg2 = (float complex *) 0 ;
   long arg3 ;
   float complex *arg4 = (float complex *) 0 ;
-  PyObject *out1 = NULL ;
+  PyArrayObject *out1 = NULL ;
   PyArrayObject *in_dims1 = NULL ;
   int is_new_object1 = 0 ;
+  long odims1[16] ;
   long val3 ;
   int ecode3 = 0 ;
-  PyObject *arr4 = NULL ;
+  PyArrayObject *arr4 = NULL ;
   int is_new_object4 = 0 ;
   PyObject *swig_obj[3] ;
   
@@ -3737,21 +3869,27 @@ SWIGINTERN PyObject *_wrap_fft(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
       &is_new_object1);
     
     
-    if (!in_dims1 || !require_dimensions(in_dims1, 1)) SWIG_fail; // check dims not greater than 16
+    if (!in_dims1 || !require_dimensions(in_dims1, 1)) SWIG_fail;
     
     int N = array_size(in_dims1, 0);
     
+    if (N > 16) {
+      PyErr_SetString(PyExc_ValueError, "At most 16 dimensions are supported");
+      SWIG_fail;
+    }
+    
     long * dim_data_in = (long *) array_data(in_dims1);
     
-    for (int i = 0; i < N; i++) 
-    dims[i] = (npy_intp) dim_data_in[i];
+    for (int i = 0; i < 16; i++) {
+      odims1[i] = (i < N) ? dim_data_in[i] : 1;
+      dims[i] = (npy_intp) odims1[i];
+    }
     
-    for (int i = N; i < 16; i++)
-    dims[i] = 1;
+    out1 = (PyArrayObject*) PyArray_EMPTY(16, dims, NPY_CFLOAT, 1);
     
-    out1 = PyArray_SimpleNew(16, dims, NPY_CFLOAT);
+    if (!out1) SWIG_fail;
     
-    arg1 = (long *) array_data(in_dims1);
+    arg1 = odims1;
     arg2 = (complex float *) array_data(out1);
   }
   ecode3 = SWIG_AsVal_long(swig_obj[1], &val3);
@@ -3776,9 +3914,32 @@ SWIGINTERN PyObject *_wrap_fft(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
   resultobj = SWIG_Py_Void();
   {
     resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)out1);
+    out1 = NULL;
+  }
+  {
+    if (is_new_object1 && in_dims1) {
+      Py_DECREF(in_dims1); 
+    }
+    Py_XDECREF(out1);
+  }
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
   }
   return resultobj;
 fail:
+  {
+    if (is_new_object1 && in_dims1) {
+      Py_DECREF(in_dims1); 
+    }
+    Py_XDECREF(out1);
+  }
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
+  }
   return NULL;
 }
 
@@ -3789,12 +3950,13 @@ SWIGINTERN PyObject *_wrap_ifft(PyObject *SWIGUNUSEDPARM(self), PyObject *args)
   float complex *arg2 = (float complex *) 0 ;
   long arg3 ;
   float complex *arg4 = (float complex *) 0 ;
-  PyObject *out1 = NULL ;
+  PyArrayObject *out1 = NULL ;
   PyArrayObject *in_dims1 = NULL ;
   int is_new_object1 = 0 ;
+  long odims1[16] ;
   long val3 ;
   int ecode3 = 0 ;
-  PyObject *arr4 = NULL ;
+  PyArrayObject *arr4 = NULL ;
   int is_new_object4 = 0 ;
   PyObject *swig_obj[3] ;
   
@@ -3807,21 +3969,27 @@ SWIGINTERN PyObject *_wrap_ifft(PyObject *SWIGUNUSEDPARM(self), PyObject *args)
       &is_new_object1);
     
     
-    if (!in_dims1 || !require_dimensions(in_dims1, 1)) SWIG_fail; // check dims not greater than 16
+    if (!in_dims1 || !require_dimensions(in_dims1, 1)) SWIG_fail;
     
     int N = array_size(in_dims1, 0);
     
+    if (N > 16) {
+      PyErr_SetString(PyExc_ValueError, "At most 16 dimensions are supported");
+      SWIG_fail;
+    }
+    
     long * dim_data_in = (long *) array_data(in_dims1);
     
-    for (int i = 0; i < N; i++) 
-    dims[i] = (npy_intp) dim_data_in[i];
+    for (int i = 0; i < 16; i++) {
+      odims1[i] = (i < N) ? dim_data_in[i] : 1;
+      dims[i] = (npy_intp) odims1[i];
+    }
     
-    for (int i = N; i < 16; i++)
-    dims[i] = 1;
+    out1 = (PyArrayObject*) PyArray_EMPTY(16, dims, NPY_CFLOAT, 1);
     
-    out1 = PyArray_SimpleNew(16, dims, NPY_CFLOAT);
+    if (!out1) SWIG_fail;
     
-    arg1 = (long *) array_data(in_dims1);
+    arg1 = odims1;
     arg2 = (complex float *) array_data(out1);
   }
   ecode3 = SWIG_AsVal_long(swig_obj[1], &val3);
@@ -3846,9 +4014,454 @@ SWIGINTERN PyObject *_wrap_ifft(PyObject *SWIGUNUSEDPARM(self), PyObject *args)
   resultobj = SWIG_Py_Void();
   {
     resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)out1);
+    out1 = NULL;
+  }
+  {
+    if (is_new_object1 && in_dims1) {
+      Py_DECREF(in_dims1); 
+    }
+    Py_XDECREF(out1);
+  }
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
+  }
+  return resultobj;
+fail:
+  {
+    if (is_new_object1 && in_dims1) {
+      Py_DECREF(in_dims1); 
+    }
+    Py_XDECREF(out1);
+  }
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
+  }
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_fft_strided(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  long *arg1 ;
+  float complex *arg2 = (float complex *) 0 ;
+  long arg3 ;
+  long *arg4 ;
+  long *arg5 ;
+  float complex *arg6 = (float complex *) 0 ;
+  PyArrayObject *out1 = NULL ;
+  PyArrayObject *in_dims1 = NULL ;
+  int is_new_object1 = 0 ;
+  long odims1[16] ;
+  long val3 ;
+  int ecode3 = 0 ;
+  PyArrayObject *arr4 = NULL ;
+  int is_new_object4 = 0 ;
+  long dims4[16] ;
+  long strs4[16] ;
+  PyObject *swig_obj[3] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "fft_strided", 3, 3, swig_obj)) SWIG_fail;
+  {
+    npy_intp dims[16];
+    
+    in_dims1 = obj_to_array_fortran_allow_conversion(swig_obj[0], 
+      NPY_LONG,
+      &is_new_object1);
+    
+    
+    if (!in_dims1 || !require_dimensions(in_dims1, 1)) SWIG_fail;
+    
+    int N = array_size(in_dims1, 0);
+    
+    if (N > 16) {
+      PyErr_SetString(PyExc_ValueError, "At most 16 dimensions are supported");
+      SWIG_fail;
+    }
+    
+    long * dim_data_in = (long *) array_data(in_dims1);
+    
+    for (int i = 0; i < 16; i++) {
+      odims1[i] = (i < N) ? dim_data_in[i] : 1;
+      dims[i] = (npy_intp) odims1[i];
+    }
+    
+    out1 = (PyArrayObject*) PyArray_EMPTY(16, dims, NPY_CFLOAT, 1);
+    
+    if (!out1) SWIG_fail;
+    
+    arg1 = odims1;
+    arg2 = (complex float *) array_data(out1);
+  }
+  ecode3 = SWIG_AsVal_long(swig_obj[1], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "fft_strided" "', argument " "3"" of type '" "long""'");
+  } 
+  arg3 = (long)(val3);
+  {
+    if (borrowable(swig_obj[2])) {
+      arr4 = (PyArrayObject*) swig_obj[2];
+    } else {
+      arr4 = obj_to_array_fortran_allow_conversion(swig_obj[2],
+        NPY_COMPLEX64,
+        &is_new_object4);
+      
+      if (!arr4) SWIG_fail;
+      
+      if (array_numdims(arr4) > 16) {
+        PyErr_SetString(PyExc_ValueError, "Array must have at most 16 dimensions");
+        SWIG_fail;
+      }
+    }
+    
+    for (int i = 0; i < 16; i++) {
+      dims4[i] = (i < array_numdims(arr4)) ? (long) array_size(arr4, i) : 1;
+      strs4[i] = (i < array_numdims(arr4)) ? (long) array_stride(arr4, i) : 0;
+    }
+    
+    arg4 = dims4;
+    arg5 = strs4;
+    arg6 = (complex float *) array_data(arr4);
+  }
+  {
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      wrap_fft_strided(arg1,arg2,arg3,arg4,arg5,arg6);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+    if (PyErr_Occurred()) SWIG_fail;
+  }
+  resultobj = SWIG_Py_Void();
+  {
+    resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)out1);
+    out1 = NULL;
+  }
+  {
+    if (is_new_object1 && in_dims1) {
+      Py_DECREF(in_dims1); 
+    }
+    Py_XDECREF(out1);
+  }
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
+  }
+  return resultobj;
+fail:
+  {
+    if (is_new_object1 && in_dims1) {
+      Py_DECREF(in_dims1); 
+    }
+    Py_XDECREF(out1);
+  }
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
+  }
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_ifft_strided(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  long *arg1 ;
+  float complex *arg2 = (float complex *) 0 ;
+  long arg3 ;
+  long *arg4 ;
+  long *arg5 ;
+  float complex *arg6 = (float complex *) 0 ;
+  PyArrayObject *out1 = NULL ;
+  PyArrayObject *in_dims1 = NULL ;
+  int is_new_object1 = 0 ;
+  long odims1[16] ;
+  long val3 ;
+  int ecode3 = 0 ;
+  PyArrayObject *arr4 = NULL ;
+  int is_new_object4 = 0 ;
+  long dims4[16] ;
+  long strs4[16] ;
+  PyObject *swig_obj[3] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "ifft_strided", 3, 3, swig_obj)) SWIG_fail;
+  {
+    npy_intp dims[16];
+    
+    in_dims1 = obj_to_array_fortran_allow_conversion(swig_obj[0], 
+      NPY_LONG,
+      &is_new_object1);
+    
+    
+    if (!in_dims1 || !require_dimensions(in_dims1, 1)) SWIG_fail;
+    
+    int N = array_size(in_dims1, 0);
+    
+    if (N > 16) {
+      PyErr_SetString(PyExc_ValueError, "At most 16 dimensions are supported");
+      SWIG_fail;
+    }
+    
+    long * dim_data_in = (long *) array_data(in_dims1);
+    
+    for (int i = 0; i < 16; i++) {
+      odims1[i] = (i < N) ? dim_data_in[i] : 1;
+      dims[i] = (npy_intp) odims1[i];
+    }
+    
+    out1 = (PyArrayObject*) PyArray_EMPTY(16, dims, NPY_CFLOAT, 1);
+    
+    if (!out1) SWIG_fail;
+    
+    arg1 = odims1;
+    arg2 = (complex float *) array_data(out1);
+  }
+  ecode3 = SWIG_AsVal_long(swig_obj[1], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "ifft_strided" "', argument " "3"" of type '" "long""'");
+  } 
+  arg3 = (long)(val3);
+  {
+    if (borrowable(swig_obj[2])) {
+      arr4 = (PyArrayObject*) swig_obj[2];
+    } else {
+      arr4 = obj_to_array_fortran_allow_conversion(swig_obj[2],
+        NPY_COMPLEX64,
+        &is_new_object4);
+      
+      if (!arr4) SWIG_fail;
+      
+      if (array_numdims(arr4) > 16) {
+        PyErr_SetString(PyExc_ValueError, "Array must have at most 16 dimensions");
+        SWIG_fail;
+      }
+    }
+    
+    for (int i = 0; i < 16; i++) {
+      dims4[i] = (i < array_numdims(arr4)) ? (long) array_size(arr4, i) : 1;
+      strs4[i] = (i < array_numdims(arr4)) ? (long) array_stride(arr4, i) : 0;
+    }
+    
+    arg4 = dims4;
+    arg5 = strs4;
+    arg6 = (complex float *) array_data(arr4);
+  }
+  {
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      wrap_ifft_strided(arg1,arg2,arg3,arg4,arg5,arg6);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+    if (PyErr_Occurred()) SWIG_fail;
+  }
+  resultobj = SWIG_Py_Void();
+  {
+    resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)out1);
+    out1 = NULL;
+  }
+  {
+    if (is_new_object1 && in_dims1) {
+      Py_DECREF(in_dims1); 
+    }
+    Py_XDECREF(out1);
+  }
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
+  }
+  return resultobj;
+fail:
+  {
+    if (is_new_object1 && in_dims1) {
+      Py_DECREF(in_dims1); 
+    }
+    Py_XDECREF(out1);
+  }
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
+  }
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_fft_into(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  long *arg1 ;
+  float complex *arg2 = (float complex *) 0 ;
+  long arg3 ;
+  long *arg4 ;
+  long *arg5 ;
+  float complex *arg6 = (float complex *) 0 ;
+  long dims1[16] ;
+  long val3 ;
+  int ecode3 = 0 ;
+  PyArrayObject *arr4 = NULL ;
+  int is_new_object4 = 0 ;
+  long dims4[16] ;
+  long strs4[16] ;
+  PyObject *swig_obj[3] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "fft_into", 3, 3, swig_obj)) SWIG_fail;
+  {
+    if (!is_array(swig_obj[0]) || array_type(swig_obj[0]) != NPY_COMPLEX64 || array_numdims(swig_obj[0]) > 16
+      || !array_is_fortran(swig_obj[0]) || !PyArray_ISWRITEABLE((PyArrayObject*) swig_obj[0])
+      || !PyArray_ISALIGNED((PyArrayObject*) swig_obj[0]) || !PyArray_ISNOTSWAPPED((PyArrayObject*) swig_obj[0])) {
+      PyErr_SetString(PyExc_ValueError, "out must be a writeable complex64 array in column-major order "
+        "with at most 16 dimensions");
+      SWIG_fail;
+    }
+    
+    for (int i = 0; i < 16; i++)
+    dims1[i] = (i < array_numdims(swig_obj[0])) ? (long) array_size(swig_obj[0], i) : 1;
+    
+    arg1 = dims1;
+    arg2 = (complex float *) array_data(swig_obj[0]);
+  }
+  ecode3 = SWIG_AsVal_long(swig_obj[1], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "fft_into" "', argument " "3"" of type '" "long""'");
+  } 
+  arg3 = (long)(val3);
+  {
+    if (borrowable(swig_obj[2])) {
+      arr4 = (PyArrayObject*) swig_obj[2];
+    } else {
+      arr4 = obj_to_array_fortran_allow_conversion(swig_obj[2],
+        NPY_COMPLEX64,
+        &is_new_object4);
+      
+      if (!arr4) SWIG_fail;
+      
+      if (array_numdims(arr4) > 16) {
+        PyErr_SetString(PyExc_ValueError, "Array must have at most 16 dimensions");
+        SWIG_fail;
+      }
+    }
+    
+    for (int i = 0; i < 16; i++) {
+      dims4[i] = (i < array_numdims(arr4)) ? (long) array_size(arr4, i) : 1;
+      strs4[i] = (i < array_numdims(arr4)) ? (long) array_stride(arr4, i) : 0;
+    }
+    
+    arg4 = dims4;
+    arg5 = strs4;
+    arg6 = (complex float *) array_data(arr4);
+  }
+  {
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      wrap_fft_into(arg1,arg2,arg3,arg4,arg5,arg6);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+    if (PyErr_Occurred()) SWIG_fail;
+  }
+  resultobj = SWIG_Py_Void();
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
   }
   return resultobj;
 fail:
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
+  }
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_ifft_into(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *resultobj = 0;
+  long *arg1 ;
+  float complex *arg2 = (float complex *) 0 ;
+  long arg3 ;
+  long *arg4 ;
+  long *arg5 ;
+  float complex *arg6 = (float complex *) 0 ;
+  long dims1[16] ;
+  long val3 ;
+  int ecode3 = 0 ;
+  PyArrayObject *arr4 = NULL ;
+  int is_new_object4 = 0 ;
+  long dims4[16] ;
+  long strs4[16] ;
+  PyObject *swig_obj[3] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "ifft_into", 3, 3, swig_obj)) SWIG_fail;
+  {
+    if (!is_array(swig_obj[0]) || array_type(swig_obj[0]) != NPY_COMPLEX64 || array_numdims(swig_obj[0]) > 16
+      || !array_is_fortran(swig_obj[0]) || !PyArray_ISWRITEABLE((PyArrayObject*) swig_obj[0])
+      || !PyArray_ISALIGNED((PyArrayObject*) swig_obj[0]) || !PyArray_ISNOTSWAPPED((PyArrayObject*) swig_obj[0])) {
+      PyErr_SetString(PyExc_ValueError, "out must be a writeable complex64 array in column-major order "
+        "with at most 16 dimensions");
+      SWIG_fail;
+    }
+    
+    for (int i = 0; i < 16; i++)
+    dims1[i] = (i < array_numdims(swig_obj[0])) ? (long) array_size(swig_obj[0], i) : 1;
+    
+    arg1 = dims1;
+    arg2 = (complex float *) array_data(swig_obj[0]);
+  }
+  ecode3 = SWIG_AsVal_long(swig_obj[1], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "ifft_into" "', argument " "3"" of type '" "long""'");
+  } 
+  arg3 = (long)(val3);
+  {
+    if (borrowable(swig_obj[2])) {
+      arr4 = (PyArrayObject*) swig_obj[2];
+    } else {
+      arr4 = obj_to_array_fortran_allow_conversion(swig_obj[2],
+        NPY_COMPLEX64,
+        &is_new_object4);
+      
+      if (!arr4) SWIG_fail;
+      
+      if (array_numdims(arr4) > 16) {
+        PyErr_SetString(PyExc_ValueError, "Array must have at most 16 dimensions");
+        SWIG_fail;
+      }
+    }
+    
+    for (int i = 0; i < 16; i++) {
+      dims4[i] = (i < array_numdims(arr4)) ? (long) array_size(arr4, i) : 1;
+      strs4[i] = (i < array_numdims(arr4)) ? (long) array_stride(arr4, i) : 0;
+    }
+    
+    arg4 = dims4;
+    arg5 = strs4;
+    arg6 = (complex float *) array_data(arr4);
+  }
+  {
+    {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      wrap_ifft_into(arg1,arg2,arg3,arg4,arg5,arg6);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+    if (PyErr_Occurred()) SWIG_fail;
+  }
+  resultobj = SWIG_Py_Void();
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
+  }
+  return resultobj;
+fail:
+  {
+    if (is_new_object4 && arr4) {
+      Py_DECREF(arr4); 
+    }
+  }
   return NULL;
 }
 
@@ -3868,7 +4481,7 @@ SWIGINTERN PyObject *_wrap_fftc(PyObject *SWIGUNUSEDPARM(self), PyObject *args)
   int ecode3 = 0 ;
   void *argp4 = 0 ;
   int res4 = 0 ;
-  PyObject *arr5 = NULL ;
+  PyArrayObject *arr5 = NULL ;
   int is_new_object5 = 0 ;
   PyObject *swig_obj[5] ;
   
@@ -3908,8 +4521,18 @@ SWIGINTERN PyObject *_wrap_fftc(PyObject *SWIGUNUSEDPARM(self), PyObject *args)
     SWIG_PYTHON_THREAD_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
+  {
+    if (is_new_object5 && arr5) {
+      Py_DECREF(arr5); 
+    }
+  }
   return resultobj;
 fail:
+  {
+    if (is_new_object5 && arr5) {
+      Py_DECREF(arr5); 
+    }
+  }
   return NULL;
 }
 
@@ -3929,7 +4552,7 @@ SWIGINTERN PyObject *_wrap_ifftc(PyObject *SWIGUNUSEDPARM(self), PyObject *args)
   int ecode3 = 0 ;
   void *argp4 = 0 ;
   int res4 = 0 ;
-  PyObject *arr5 = NULL ;
+  PyArrayObject *arr5 = NULL ;
   int is_new_object5 = 0 ;
   PyObject *swig_obj[5] ;
   
@@ -3969,8 +4592,18 @@ SWIGINTERN PyObject *_wrap_ifftc(PyObject *SWIGUNUSEDPARM(self), PyObject *args)
     SWIG_PYTHON_THREAD_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
+  {
+    if (is_new_object5 && arr5) {
+      Py_DECREF(arr5); 
+    }
+  }
   return resultobj;
 fail:
+  {
+    if (is_new_object5 && arr5) {
+      Py_DECREF(arr5); 
+    }
+  }
   return NULL;
 }
 
@@ -3990,7 +4623,7 @@ SWIGINTERN PyObject *_wrap_fftu(PyObject *SWIGUNUSEDPARM(self), PyObject *args)
   int ecode3 = 0 ;
   void *argp4 = 0 ;
   int res4 = 0 ;
-  PyObject *arr5 = NULL ;
+  PyArrayObject *arr5 = NULL ;
   int is_new_object5 = 0 ;
   PyObject *swig_obj[5] ;
   
@@ -4030,8 +4663,18 @@ SWIGINTERN PyObject *_wrap_fftu(PyObject *SWIGUNUSEDPARM(self), PyObject *args)
     SWIG_PYTHON_THREAD_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
+  {
+    if (is_new_object5 && arr5) {
+      Py_DECREF(arr5); 
+    }
+  }
   return resultobj;
 fail:
+  {
+    if (is_new_object5 && arr5) {
+      Py_DECREF(arr5); 
+    }
+  }
   return NULL;
 }
 
@@ -4051,7 +4694,7 @@ SWIGINTERN PyObject *_wrap_ifftu(PyObject *SWIGUNUSEDPARM(self), PyObject *args)
   int ecode3 = 0 ;
   void *argp4 = 0 ;
   int res4 = 0 ;
-  PyObject *arr5 = NULL ;
+  PyArrayObject *arr5 = NULL ;
   int is_new_object5 = 0 ;
   PyObject *swig_obj[5] ;
   
@@ -4091,8 +4734,18 @@ SWIGINTERN PyObject *_wrap_ifftu(PyObject *SWIGUNUSEDPARM(self), PyObject *args)
     SWIG_PYTHON_THREAD_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
+  {
+    if (is_new_object5 && arr5) {
+      Py_DECREF(arr5); 
+    }
+  }
   return resultobj;
 fail:
+  {
+    if (is_new_object5 && arr5) {
+      Py_DECREF(arr5); 
+    }
+  }
   return NULL;
 }
 
@@ -4112,7 +4765,7 @@ SWIGINTERN PyObject *_wrap_fftuc(PyObject *SWIGUNUSEDPARM(self), PyObject *args)
   int ecode3 = 0 ;
   void *argp4 = 0 ;
   int res4 = 0 ;
-  PyObject *arr5 = NULL ;
+  PyArrayObject *arr5 = NULL ;
   int is_new_object5 = 0 ;
   PyObject *swig_obj[5] ;
   
@@ -4152,8 +4805,18 @@ SWIGINTERN PyObject *_wrap_fftuc(PyObject *SWIGUNUSEDPARM(self), PyObject *args)
     SWIG_PYTHON_THREAD_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
+  {
+    if (is_new_object5 && arr5) {
+      Py_DECREF(arr5); 
+    }
+  }
   return resultobj;
 fail:
+  {
+    if (is_new_object5 && arr5) {
+      Py_DECREF(arr5); 
+    }
+  }
   return NULL;
 }
 
@@ -4173,7 +4836,7 @@ SWIGINTERN PyObject *_wrap_ifftuc(PyObject *SWIGUNUSEDPARM(self), PyObject *args
   int ecode3 = 0 ;
   void *argp4 = 0 ;
   int res4 = 0 ;
-  PyObject *arr5 = NULL ;
+  PyArrayObject *arr5 = NULL ;
   int is_new_object5 = 0 ;
   PyObject *swig_obj[5] ;
   
@@ -4213,8 +4876,18 @@ SWIGINTERN PyObject *_wrap_ifftuc(PyObject *SWIGUNUSEDPARM(self), PyObject *args
     SWIG_PYTHON_THREAD_END_ALLOW;
   }
   resultobj = SWIG_Py_Void();
+  {
+    if (is_new_object5 && arr5) {
+      Py_DECREF(arr5); 
+    }
+  }
   return resultobj;
 fail:
+  {
+    if (is_new_object5 && arr5) {
+      Py_DECREF(arr5); 
+    }
+  }
   return NULL;
 }
 
@@ -4228,6 +4901,10 @@ static PyMethodDef SwigMethods[] = {
 	 { "ifftshift", _wrap_ifftshift, METH_VARARGS, NULL},
 	 { "fft", _wrap_fft, METH_VARARGS, NULL},
 	 { "ifft", _wrap_ifft, METH_VARARGS, NULL},
+	 { "fft_strided", _wrap_fft_strided, METH_VARARGS, NULL},
+	 { "ifft_strided", _wrap_ifft_strided, METH_VARARGS, NULL},
+	 { "fft_into", _wrap_fft_into, METH_VARARGS, NULL},
+	 { "ifft_into", _wrap_ifft_into, METH_VARARGS, NULL},
 	 { "fftc", _wrap_fftc, METH_VARARGS, NULL},
 	 { "ifftc", _wrap_ifftc, METH_VARARGS, NULL},
 	 { "fftu", _wrap_fftu, METH_VARARGS, NULL},
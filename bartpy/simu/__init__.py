@@ -1 +1,4 @@
-## need to remove first if-statement in generated python file
\ No newline at end of file
+from ..utils import extensions
+extensions.require('simu')
+
+from .phantom import phantom
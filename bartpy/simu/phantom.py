@@ -1,5 +1,6 @@
 import numpy as np
 
+from ..utils import threads
 from .simu_swig import calc_bart, calc_phantom, calc_geo_phantom, calc_circ, calc_ring, calc_star
 
 # TODO: Add support for multiple channels
@@ -13,7 +14,6 @@ def phantom(dims, ksp=False, d3=False, ptype="shepp"):
     :param ptype: 'shepp', 'geo', 'circ', 'ring', 'star', 'bart'
     """
 
-    # Stopgap solution while I figure out GIL issue
     dims = list(dims)
 
     if len(dims) > 16 or len(dims) < 0:
@@ -21,23 +21,24 @@ def phantom(dims, ksp=False, d3=False, ptype="shepp"):
 
     dims += [1] * (16 - len(dims))
 
-    if ptype == 'shepp':
-        phantom = calc_phantom(dims, d3, ksp)
+    with threads.in_process():
+        if ptype == 'shepp':
+            phantom = calc_phantom(dims, d3, ksp)
 
-    elif ptype == 'geo':
-        phantom = calc_geo_phantom(dims, d3, ksp)
+        elif ptype == 'geo':
+            phantom = calc_geo_phantom(dims, d3, ksp)
 
-    elif ptype == 'circ':
-        phantom = calc_circ(dims, d3, ksp)
+        elif ptype == 'circ':
+            phantom = calc_circ(dims, d3, ksp)
 
-    elif ptype == 'ring':
-        phantom = calc_ring(dims, ksp)
+        elif ptype == 'ring':
+            phantom = calc_ring(dims, ksp)
 
-    elif ptype == 'star':
-        phantom = calc_star(dims, ksp)
+        elif ptype == 'star':
+            phantom = calc_star(dims, ksp)
 
-    elif ptype == 'bart':
-        phantom = calc_bart(dims, ksp)
+        elif ptype == 'bart':
+            phantom = calc_bart(dims, ksp)
 
     return phantom.squeeze()
 
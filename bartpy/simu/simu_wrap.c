@@ -2709,8 +2709,8 @@ static swig_module_info swig_module = {swig_types, 4, 0, 0, 0, 0};
 		#include <complex.h>
 		#include <stdbool.h>
 
-		#include "/Users/malits/bart_work/bart/src/simu/phantom.h"
-        #include "/Users/malits/bart_work/bart/src/num/init.h"
+		#include "simu/phantom.h"
+        #include "num/init.h"
 
 
 #ifndef SWIG_FILE_WITH_INIT
@@ -3370,9 +3370,10 @@ SWIGINTERN PyObject *_wrap_calc_sens(PyObject *SWIGUNUSEDPARM(self), PyObject *a
   PyObject *resultobj = 0;
   long *arg1 ;
   float complex *arg2 = (float complex *) 0 ;
-  PyObject *out1 = NULL ;
+  PyArrayObject *out1 = NULL ;
   PyArrayObject *in_dims1 = NULL ;
   int is_new_object1 = 0 ;
+  long odims1[16] ;
   PyObject *swig_obj[1] ;
   
   if (!args) SWIG_fail;
@@ -3385,21 +3386,27 @@ SWIGINTERN PyObject *_wrap_calc_sens(PyObject *SWIGUNUSEDPARM(self), PyObject *a
       &is_new_object1);
     
     
-    if (!in_dims1 || !require_dimensions(in_dims1, 1)) SWIG_fail; // check dims not greater than 16
+    if (!in_dims1 || !require_dimensions(in_dims1, 1)) SWIG_fail;
     
     int N = array_size(in_dims1, 0);
     
+    if (N > 16) {
+      PyErr_SetString(PyExc_ValueError, "At most 16 dimensions are supported");
+      SWIG_fail;
+    }
+    
     long * dim_data_in = (long *) array_data(in_dims1);
     
-    for (int i = 0; i < N; i++) 
-    dims[i] = (npy_intp) dim_data_in[i];
+    for (int i = 0; i < 16; i++) {
+      odims1[i] = (i < N) ? dim_data_in[i] : 1;
+      dims[i] = (npy_intp) odims1[i];
+    }
     
-    for (int i = N; i < 16; i++)
-    dims[i] = 1;
+    out1 = (PyArrayObject*) PyArray_EMPTY(16, dims, NPY_CFLOAT, 1);
     
-    out1 = PyArray_SimpleNew(16, dims, NPY_CFLOAT);
+    if (!out1) SWIG_fail;
     
-    arg1 = (long *) array_data(in_dims1);
+    arg1 = odims1;
     arg2 = (complex float *) array_data(out1);
   }
   {
@@ -3410,9 +3417,22 @@ SWIGINTERN PyObject *_wrap_calc_sens(PyObject *SWIGUNUSEDPARM(self), PyObject *a
   resultobj = SWIG_Py_Void();
   {
     resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)out1);
+    out1 = NULL;
+  }
+  {
+    if (is_new_object1 && in_dims1) {
+      Py_DECREF(in_dims1); 
+    }
+    Py_XDECREF(out1);
   }
   return resultobj;
 fail:
+  {
+    if (is_new_object1 && in_dims1) {
+      Py_DECREF(in_dims1); 
+    }
+    Py_XDECREF(out1);
+  }
   return NULL;
 }
 
@@ -3425,20 +3445,20 @@ SWIGINTERN PyObject *_wrap_calc_geo_phantom(PyObject *SWIGUNUSEDPARM(self), PyOb
   int arg4 ;
   long *arg5 ;
   float complex *arg6 = (float complex *) 0 ;
-  PyObject *out1 = NULL ;
+  PyArrayObject *out1 = NULL ;
   PyArrayObject *in_dims1 = NULL ;
   int is_new_object1 = 0 ;
+  long odims1[16] ;
   int bool_var3 ;
   int val4 ;
   int ecode4 = 0 ;
+  long strs5[16] ;
   PyObject *swig_obj[3] ;
   
   {
-    long strs[16] = {
-      0 
-    };
+    for (int i = 0; i < 16; i++) strs5[i] = 0;
     
-    arg5 = strs;
+    arg5 = strs5;
     arg6 = NULL; 
   }
   if (!SWIG_Python_UnpackTuple(args, "calc_geo_phantom", 3, 3, swig_obj)) SWIG_fail;
@@ -3450,21 +3470,27 @@ SWIGINTERN PyObject *_wrap_calc_geo_phantom(PyObject *SWIGUNUSEDPARM(self), PyOb
       &is_new_object1);
     
     
-    if (!in_dims1 || !require_dimensions(in_dims1, 1)) SWIG_fail; // check dims not greater than 16
+    if (!in_dims1 || !require_dimensions(in_dims1, 1)) SWIG_fail;
     
     int N = array_size(in_dims1, 0);
     
+    if (N > 16) {
+      PyErr_SetString(PyExc_ValueError, "At most 16 dimensions are supported");
+      SWIG_fail;
+    }
+    
     long * dim_data_in = (long *) array_data(in_dims1);
     
-    for (int i = 0; i < N; i++) 
-    dims[i] = (npy_intp) dim_data_in[i];
+    for (int i = 0; i < 16; i++) {
+      odims1[i] = (i < N) ? dim_data_in[i] : 1;
+      dims[i] = (npy_intp) odims1[i];
+    }
     
-    for (int i = N; i < 16; i++)
-    dims[i] = 1;
+    out1 = (PyArrayObject*) PyArray_EMPTY(16, dims, NPY_CFLOAT, 1);
     
-    out1 = PyArray_SimpleNew(16, dims, NPY_CFLOAT);
+    if (!out1) SWIG_fail;
     
-    arg1 = (long *) array_data(in_dims1);
+    arg1 = odims1;
     arg2 = (complex float *) array_data(out1);
   }
   {
@@ -3484,9 +3510,22 @@ SWIGINTERN PyObject *_wrap_calc_geo_phantom(PyObject *SWIGUNUSEDPARM(self), PyOb
   resultobj = SWIG_Py_Void();
   {
     resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)out1);
+    out1 = NULL;
+  }
+  {
+    if (is_new_object1 && in_dims1) {
+      Py_DECREF(in_dims1); 
+    }
+    Py_XDECREF(out1);
   }
   return resultobj;
 fail:
+  {
+    if (is_new_object1 && in_dims1) {
+      Py_DECREF(in_dims1); 
+    }
+    Py_XDECREF(out1);
+  }
   return NULL;
 }
 
@@ -3499,19 +3538,19 @@ SWIGINTERN PyObject *_wrap_calc_phantom(PyObject *SWIGUNUSEDPARM(self), PyObject
   bool arg4 ;
   long *arg5 ;
   float complex *arg6 = (float complex *) 0 ;
-  PyObject *out1 = NULL ;
+  PyArrayObject *out1 = NULL ;
   PyArrayObject *in_dims1 = NULL ;
   int is_new_object1 = 0 ;
+  long odims1[16] ;
   int bool_var3 ;
   int bool_var4 ;
+  long strs5[16] ;
   PyObject *swig_obj[3] ;
   
   {
-    long strs[16] = {
-      0 
-    };
+    for (int i = 0; i < 16; i++) strs5[i] = 0;
     
-    arg5 = strs;
+    arg5 = strs5;
     arg6 = NULL; 
   }
   if (!SWIG_Python_UnpackTuple(args, "calc_phantom", 3, 3, swig_obj)) SWIG_fail;
@@ -3523,21 +3562,27 @@ SWIGINTERN PyObject *_wrap_calc_phantom(PyObject *SWIGUNUSEDPARM(self), PyObject
       &is_new_object1);
     
     
-    if (!in_dims1 || !require_dimensions(in_dims1, 1)) SWIG_fail; // check dims not greater than 16
+    if (!in_dims1 || !require_dimensions(in_dims1, 1)) SWIG_fail;
     
     int N = array_size(in_dims1, 0);
     
+    if (N > 16) {
+      PyErr_SetString(PyExc_ValueError, "At most 16 dimensions are supported");
+      SWIG_fail;
+    }
+    
     long * dim_data_in = (long *) array_data(in_dims1);
     
-    for (int i = 0; i < N; i++) 
-    dims[i] = (npy_intp) dim_data_in[i];
+    for (int i = 0; i < 16; i++) {
+      odims1[i] = (i < N) ? dim_data_in[i] : 1;
+      dims[i] = (npy_intp) odims1[i];
+    }
     
-    for (int i = N; i < 16; i++)
-    dims[i] = 1;
+    out1 = (PyArrayObject*) PyArray_EMPTY(16, dims, NPY_CFLOAT, 1);
     
-    out1 = PyArray_SimpleNew(16, dims, NPY_CFLOAT);
+    if (!out1) SWIG_fail;
     
-    arg1 = (long *) array_data(in_dims1);
+    arg1 = odims1;
     arg2 = (complex float *) array_data(out1);
   }
   {
@@ -3556,9 +3601,22 @@ SWIGINTERN PyObject *_wrap_calc_phantom(PyObject *SWIGUNUSEDPARM(self), PyObject
   resultobj = SWIG_Py_Void();
   {
     resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)out1);
+    out1 = NULL;
+  }
+  {
+    if (is_new_object1 && in_dims1) {
+      Py_DECREF(in_dims1); 
+    }
+    Py_XDECREF(out1);
   }
   return resultobj;
 fail:
+  {
+    if (is_new_object1 && in_dims1) {
+      Py_DECREF(in_dims1); 
+    }
+    Py_XDECREF(out1);
+  }
   return NULL;
 }
 
@@ -3571,19 +3629,19 @@ SWIGINTERN PyObject *_wrap_calc_circ(PyObject *SWIGUNUSEDPARM(self), PyObject *a
   bool arg4 ;
   long *arg5 ;
   float complex *arg6 = (float complex *) 0 ;
-  PyObject *out1 = NULL ;
+  PyArrayObject *out1 = NULL ;
   PyArrayObject *in_dims1 = NULL ;
   int is_new_object1 = 0 ;
+  long odims1[16] ;
   int bool_var3 ;
   int bool_var4 ;
+  long strs5[16] ;
   PyObject *swig_obj[3] ;
   
   {
-    long strs[16] = {
-      0 
-    };
+    for (int i = 0; i < 16; i++) strs5[i] = 0;
     
-    arg5 = strs;
+    arg5 = strs5;
     arg6 = NULL; 
   }
   if (!SWIG_Python_UnpackTuple(args, "calc_circ", 3, 3, swig_obj)) SWIG_fail;
@@ -3595,21 +3653,27 @@ SWIGINTERN PyObject *_wrap_calc_circ(PyObject *SWIGUNUSEDPARM(self), PyObject *a
       &is_new_object1);
     
     
-    if (!in_dims1 || !require_dimensions(in_dims1, 1)) SWIG_fail; // check dims not greater than 16
+    if (!in_dims1 || !require_dimensions(in_dims1, 1)) SWIG_fail;
     
     int N = array_size(in_dims1, 0);
     
+    if (N > 16) {
+      PyErr_SetString(PyExc_ValueError, "At most 16 dimensions are supported");
+      SWIG_fail;
+    }
+    
     long * dim_data_in = (long *) array_data(in_dims1);
     
-    for (int i = 0; i < N; i++) 
-    dims[i] = (npy_intp) dim_data_in[i];
+    for (int i = 0; i < 16; i++) {
+      odims1[i] = (i < N) ? dim_data_in[i] : 1;
+      dims[i] = (npy_intp) odims1[i];
+    }
     
-    for (int i = N; i < 16; i++)
-    dims[i] = 1;
+    out1 = (PyArrayObject*) PyArray_EMPTY(16, dims, NPY_CFLOAT, 1);
     
-    out1 = PyArray_SimpleNew(16, dims, NPY_CFLOAT);
+    if (!out1) SWIG_fail;
     
-    arg1 = (long *) array_data(in_dims1);
+    arg1 = odims1;
     arg2 = (complex float *) array_data(out1);
   }
   {
@@ -3628,9 +3692,22 @@ SWIGINTERN PyObject *_wrap_calc_circ(PyObject *SWIGUNUSEDPARM(self), PyObject *a
   resultobj = SWIG_Py_Void();
   {
     resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)out1);
+    out1 = NULL;
+  }
+  {
+    if (is_new_object1 && in_dims1) {
+      Py_DECREF(in_dims1); 
+    }
+    Py_XDECREF(out1);
   }
   return resultobj;
 fail:
+  {
+    if (is_new_object1 && in_dims1) {
+      Py_DECREF(in_dims1); 
+    }
+    Py_XDECREF(out1);
+  }
   return NULL;
 }
 
@@ -3642,18 +3719,18 @@ SWIGINTERN PyObject *_wrap_calc_ring(PyObject *SWIGUNUSEDPARM(self), PyObject *a
   bool arg3 ;
   long *arg4 ;
   float complex *arg5 = (float complex *) 0 ;
-  PyObject *out1 = NULL ;
+  PyArrayObject *out1 = NULL ;
   PyArrayObject *in_dims1 = NULL ;
   int is_new_object1 = 0 ;
+  long odims1[16] ;
   int bool_var3 ;
+  long strs4[16] ;
   PyObject *swig_obj[2] ;
   
   {
-    long strs[16] = {
-      0 
-    };
+    for (int i = 0; i < 16; i++) strs4[i] = 0;
     
-    arg4 = strs;
+    arg4 = strs4;
     arg5 = NULL; 
   }
   if (!SWIG_Python_UnpackTuple(args, "calc_ring", 2, 2, swig_obj)) SWIG_fail;
@@ -3665,21 +3742,27 @@ SWIGINTERN PyObject *_wrap_calc_ring(PyObject *SWIGUNUSEDPARM(self), PyObject *a
       &is_new_object1);
     
     
-    if (!in_dims1 || !require_dimensions(in_dims1, 1)) SWIG_fail; // check dims not greater than 16
+    if (!in_dims1 || !require_dimensions(in_dims1, 1)) SWIG_fail;
     
     int N = array_size(in_dims1, 0);
     
+    if (N > 16) {
+      PyErr_SetString(PyExc_ValueError, "At most 16 dimensions are supported");
+      SWIG_fail;
+    }
+    
     long * dim_data_in = (long *) array_data(in_dims1);
     
-    for (int i = 0; i < N; i++) 
-    dims[i] = (npy_intp) dim_data_in[i];
+    for (int i = 0; i < 16; i++) {
+      odims1[i] = (i < N) ? dim_data_in[i] : 1;
+      dims[i] = (npy_intp) odims1[i];
+    }
     
-    for (int i = N; i < 16; i++)
-    dims[i] = 1;
+    out1 = (PyArrayObject*) PyArray_EMPTY(16, dims, NPY_CFLOAT, 1);
     
-    out1 = PyArray_SimpleNew(16, dims, NPY_CFLOAT);
+    if (!out1) SWIG_fail;
     
-    arg1 = (long *) array_data(in_dims1);
+    arg1 = odims1;
     arg2 = (complex float *) array_data(out1);
   }
   {
@@ -3694,9 +3777,22 @@ SWIGINTERN PyObject *_wrap_calc_ring(PyObject *SWIGUNUSEDPARM(self), PyObject *a
   resultobj = SWIG_Py_Void();
   {
     resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)out1);
+    out1 = NULL;
+  }
+  {
+    if (is_new_object1 && in_dims1) {
+      Py_DECREF(in_dims1); 
+    }
+    Py_XDECREF(out1);
   }
   return resultobj;
 fail:
+  {
+    if (is_new_object1 && in_dims1) {
+      Py_DECREF(in_dims1); 
+    }
+    Py_XDECREF(out1);
+  }
   return NULL;
 }
 
@@ -3708,18 +3804,18 @@ SWIGINTERN PyObject *_wrap_calc_moving_circ(PyObject *SWIGUNUSEDPARM(self), PyOb
   bool arg3 ;
   long *arg4 ;
   float complex *arg5 = (float complex *) 0 ;
-  PyObject *out1 = NULL ;
+  PyArrayObject *out1 = NULL ;
   PyArrayObject *in_dims1 = NULL ;
   int is_new_object1 = 0 ;
+  long odims1[16] ;
   int bool_var3 ;
+  long strs4[16] ;
   PyObject *swig_obj[2] ;
   
   {
-    long strs[16] = {
-      0 
-    };
+    for (int i = 0; i < 16; i++) strs4[i] = 0;
     
-    arg4 = strs;
+    arg4 = strs4;
     arg5 = NULL; 
   }
   if (!SWIG_Python_UnpackTuple(args, "calc_moving_circ", 2, 2, swig_obj)) SWIG_fail;
@@ -3731,21 +3827,27 @@ SWIGINTERN PyObject *_wrap_calc_moving_circ(PyObject *SWIGUNUSEDPARM(self), PyOb
       &is_new_object1);
     
     
-    if (!in_dims1 || !require_dimensions(in_dims1, 1)) SWIG_fail; // check dims not greater than 16
+    if (!in_dims1 || !require_dimensions(in_dims1, 1)) SWIG_fail;
     
     int N = array_size(in_dims1, 0);
     
+    if (N > 16) {
+      PyErr_SetString(PyExc_ValueError, "At most 16 dimensions are supported");
+      SWIG_fail;
+    }
+    
     long * dim_data_in = (long *) array_data(in_dims1);
     
-    for (int i = 0; i < N; i++) 
-    dims[i] = (npy_intp) dim_data_in[i];
+    for (int i = 0; i < 16; i++) {
+      odims1[i] = (i < N) ? dim_data_in[i] : 1;
+      dims[i] = (npy_intp) odims1[i];
+    }
     
-    for (int i = N; i < 16; i++)
-    dims[i] = 1;
+    out1 = (PyArrayObject*) PyArray_EMPTY(16, dims, NPY_CFLOAT, 1);
     
-    out1 = PyArray_SimpleNew(16, dims, NPY_CFLOAT);
+    if (!out1) SWIG_fail;
     
-    arg1 = (long *) array_data(in_dims1);
+    arg1 = odims1;
     arg2 = (complex float *) array_data(out1);
   }
   {
@@ -3760,9 +3862,22 @@ SWIGINTERN PyObject *_wrap_calc_moving_circ(PyObject *SWIGUNUSEDPARM(self), PyOb
   resultobj = SWIG_Py_Void();
   {
     resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)out1);
+    out1 = NULL;
+  }
+  {
+    if (is_new_object1 && in_dims1) {
+      Py_DECREF(in_dims1); 
+    }
+    Py_XDECREF(out1);
   }
   return resultobj;
 fail:
+  {
+    if (is_new_object1 && in_dims1) {
+      Py_DECREF(in_dims1); 
+    }
+    Py_XDECREF(out1);
+  }
   return NULL;
 }
 
@@ -3774,19 +3889,19 @@ SWIGINTERN PyObject *_wrap_calc_phantom_tubes(PyObject *SWIGUNUSEDPARM(self), Py
   bool arg3 ;
   long *arg4 ;
   float complex *arg5 = (float complex *) 0 ;
-  PyObject *out1 = NULL ;
+  PyArrayObject *out1 = NULL ;
   PyArrayObject *in_dims1 = NULL ;
   int is_new_object1 = 0 ;
+  long odims1[16] ;
   bool val3 ;
   int ecode3 = 0 ;
+  long strs4[16] ;
   PyObject *swig_obj[2] ;
   
   {
-    long strs[16] = {
-      0 
-    };
+    for (int i = 0; i < 16; i++) strs4[i] = 0;
     
-    arg4 = strs;
+    arg4 = strs4;
     arg5 = NULL; 
   }
   if (!SWIG_Python_UnpackTuple(args, "calc_phantom_tubes", 2, 2, swig_obj)) SWIG_fail;
@@ -3798,21 +3913,27 @@ SWIGINTERN PyObject *_wrap_calc_phantom_tubes(PyObject *SWIGUNUSEDPARM(self), Py
       &is_new_object1);
     
     
-    if (!in_dims1 || !require_dimensions(in_dims1, 1)) SWIG_fail; // check dims not greater than 16
+    if (!in_dims1 || !require_dimensions(in_dims1, 1)) SWIG_fail;
     
     int N = array_size(in_dims1, 0);
     
+    if (N > 16) {
+      PyErr_SetString(PyExc_ValueError, "At most 16 dimensions are supported");
+      SWIG_fail;
+    }
+    
     long * dim_data_in = (long *) array_data(in_dims1);
     
-    for (int i = 0; i < N; i++) 
-    dims[i] = (npy_intp) dim_data_in[i];
+    for (int i = 0; i < 16; i++) {
+      odims1[i] = (i < N) ? dim_data_in[i] : 1;
+      dims[i] = (npy_intp) odims1[i];
+    }
     
-    for (int i = N; i < 16; i++)
-    dims[i] = 1;
+    out1 = (PyArrayObject*) PyArray_EMPTY(16, dims, NPY_CFLOAT, 1);
     
-    out1 = PyArray_SimpleNew(16, dims, NPY_CFLOAT);
+    if (!out1) SWIG_fail;
     
-    arg1 = (long *) array_data(in_dims1);
+    arg1 = odims1;
     arg2 = (complex float *) array_data(out1);
   }
   ecode3 = SWIG_AsVal_bool(swig_obj[1], &val3);
@@ -3828,9 +3949,22 @@ SWIGINTERN PyObject *_wrap_calc_phantom_tubes(PyObject *SWIGUNUSEDPARM(self), Py
   resultobj = SWIG_Py_Void();
   {
     resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)out1);
+    out1 = NULL;
+  }
+  {
+    if (is_new_object1 && in_dims1) {
+      Py_DECREF(in_dims1); 
+    }
+    Py_XDECREF(out1);
   }
   return resultobj;
 fail:
+  {
+    if (is_new_object1 && in_dims1) {
+      Py_DECREF(in_dims1); 
+    }
+    Py_XDECREF(out1);
+  }
   return NULL;
 }
 
@@ -3848,19 +3982,19 @@ SWIGINTERN PyObject *_wrap_calc_phantom_arb(PyObject *SWIGUNUSEDPARM(self), PyOb
   int ecode1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
-  PyObject *out3 = NULL ;
+  PyArrayObject *out3 = NULL ;
   PyArrayObject *in_dims3 = NULL ;
   int is_new_object3 = 0 ;
+  long odims3[16] ;
   bool val5 ;
   int ecode5 = 0 ;
+  long strs6[16] ;
   PyObject *swig_obj[4] ;
   
   {
-    long strs[16] = {
-      0 
-    };
+    for (int i = 0; i < 16; i++) strs6[i] = 0;
     
-    arg6 = strs;
+    arg6 = strs6;
     arg7 = NULL; 
   }
   if (!SWIG_Python_UnpackTuple(args, "calc_phantom_arb", 4, 4, swig_obj)) SWIG_fail;
@@ -3882,21 +4016,27 @@ SWIGINTERN PyObject *_wrap_calc_phantom_arb(PyObject *SWIGUNUSEDPARM(self), PyOb
       &is_new_object3);
     
     
-    if (!in_dims3 || !require_dimensions(in_dims3, 1)) SWIG_fail; // check dims not greater than 16
+    if (!in_dims3 || !require_dimensions(in_dims3, 1)) SWIG_fail;
     
     int N = array_size(in_dims3, 0);
     
+    if (N > 16) {
+      PyErr_SetString(PyExc_ValueError, "At most 16 dimensions are supported");
+      SWIG_fail;
+    }
+    
     long * dim_data_in = (long *) array_data(in_dims3);
     
-    for (int i = 0; i < N; i++) 
-    dims[i] = (npy_intp) dim_data_in[i];
+    for (int i = 0; i < 16; i++) {
+      odims3[i] = (i < N) ? dim_data_in[i] : 1;
+      dims[i] = (npy_intp) odims3[i];
+    }
     
-    for (int i = N; i < 16; i++)
-    dims[i] = 1;
+    out3 = (PyArrayObject*) PyArray_EMPTY(16, dims, NPY_CFLOAT, 1);
     
-    out3 = PyArray_SimpleNew(16, dims, NPY_CFLOAT);
+    if (!out3) SWIG_fail;
     
-    arg3 = (long *) array_data(in_dims3);
+    arg3 = odims3;
     arg4 = (complex float *) array_data(out3);
   }
   ecode5 = SWIG_AsVal_bool(swig_obj[3], &val5);
@@ -3912,9 +4052,22 @@ SWIGINTERN PyObject *_wrap_calc_phantom_arb(PyObject *SWIGUNUSEDPARM(self), PyOb
   resultobj = SWIG_Py_Void();
   {
     resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)out3);
+    out3 = NULL;
+  }
+  {
+    if (is_new_object3 && in_dims3) {
+      Py_DECREF(in_dims3); 
+    }
+    Py_XDECREF(out3);
   }
   return resultobj;
 fail:
+  {
+    if (is_new_object3 && in_dims3) {
+      Py_DECREF(in_dims3); 
+    }
+    Py_XDECREF(out3);
+  }
   return NULL;
 }
 
@@ -3926,19 +4079,19 @@ SWIGINTERN PyObject *_wrap_calc_star(PyObject *SWIGUNUSEDPARM(self), PyObject *a
   bool arg3 ;
   long *arg4 ;
   float complex *arg5 = (float complex *) 0 ;
-  PyObject *out1 = NULL ;
+  PyArrayObject *out1 = NULL ;
   PyArrayObject *in_dims1 = NULL ;
   int is_new_object1 = 0 ;
+  long odims1[16] ;
   bool val3 ;
   int ecode3 = 0 ;
+  long strs4[16] ;
   PyObject *swig_obj[2] ;
   
   {
-    long strs[16] = {
-      0 
-    };
+    for (int i = 0; i < 16; i++) strs4[i] = 0;
     
-    arg4 = strs;
+    arg4 = strs4;
     arg5 = NULL; 
   }
   if (!SWIG_Python_UnpackTuple(args, "calc_star", 2, 2, swig_obj)) SWIG_fail;
@@ -3950,21 +4103,27 @@ SWIGINTERN PyObject *_wrap_calc_star(PyObject *SWIGUNUSEDPARM(self), PyObject *a
       &is_new_object1);
     
     
-    if (!in_dims1 || !require_dimensions(in_dims1, 1)) SWIG_fail; // check dims not greater than 16
+    if (!in_dims1 || !require_dimensions(in_dims1, 1)) SWIG_fail;
     
     int N = array_size(in_dims1, 0);
     
+    if (N > 16) {
+      PyErr_SetString(PyExc_ValueError, "At most 16 dimensions are supported");
+      SWIG_fail;
+    }
+    
     long * dim_data_in = (long *) array_data(in_dims1);
     
-    for (int i = 0; i < N; i++) 
-    dims[i] = (npy_intp) dim_data_in[i];
+    for (int i = 0; i < 16; i++) {
+      odims1[i] = (i < N) ? dim_data_in[i] : 1;
+      dims[i] = (npy_intp) odims1[i];
+    }
     
-    for (int i = N; i < 16; i++)
-    dims[i] = 1;
+    out1 = (PyArrayObject*) PyArray_EMPTY(16, dims, NPY_CFLOAT, 1);
     
-    out1 = PyArray_SimpleNew(16, dims, NPY_CFLOAT);
+    if (!out1) SWIG_fail;
     
-    arg1 = (long *) array_data(in_dims1);
+    arg1 = odims1;
     arg2 = (complex float *) array_data(out1);
   }
   ecode3 = SWIG_AsVal_bool(swig_obj[1], &val3);
@@ -3980,9 +4139,22 @@ SWIGINTERN PyObject *_wrap_calc_star(PyObject *SWIGUNUSEDPARM(self), PyObject *a
   resultobj = SWIG_Py_Void();
   {
     resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)out1);
+    out1 = NULL;
+  }
+  {
+    if (is_new_object1 && in_dims1) {
+      Py_DECREF(in_dims1); 
+    }
+    Py_XDECREF(out1);
   }
   return resultobj;
 fail:
+  {
+    if (is_new_object1 && in_dims1) {
+      Py_DECREF(in_dims1); 
+    }
+    Py_XDECREF(out1);
+  }
   return NULL;
 }
 
@@ -3994,19 +4166,19 @@ SWIGINTERN PyObject *_wrap_calc_bart(PyObject *SWIGUNUSEDPARM(self), PyObject *a
   bool arg3 ;
   long *arg4 ;
   float complex *arg5 = (float complex *) 0 ;
-  PyObject *out1 = NULL ;
+  PyArrayObject *out1 = NULL ;
   PyArrayObject *in_dims1 = NULL ;
   int is_new_object1 = 0 ;
+  long odims1[16] ;
   bool val3 ;
   int ecode3 = 0 ;
+  long strs4[16] ;
   PyObject *swig_obj[2] ;
   
   {
-    long strs[16] = {
-      0 
-    };
+    for (int i = 0; i < 16; i++) strs4[i] = 0;
     
-    arg4 = strs;
+    arg4 = strs4;
     arg5 = NULL; 
   }
   if (!SWIG_Python_UnpackTuple(args, "calc_bart", 2, 2, swig_obj)) SWIG_fail;
@@ -4018,21 +4190,27 @@ SWIGINTERN PyObject *_wrap_calc_bart(PyObject *SWIGUNUSEDPARM(self), PyObject *a
       &is_new_object1);
     
     
-    if (!in_dims1 || !require_dimensions(in_dims1, 1)) SWIG_fail; // check dims not greater than 16
+    if (!in_dims1 || !require_dimensions(in_dims1, 1)) SWIG_fail;
     
     int N = array_size(in_dims1, 0);
     
+    if (N > 16) {
+      PyErr_SetString(PyExc_ValueError, "At most 16 dimensions are supported");
+      SWIG_fail;
+    }
+    
     long * dim_data_in = (long *) array_data(in_dims1);
     
-    for (int i = 0; i < N; i++) 
-    dims[i] = (npy_intp) dim_data_in[i];
+    for (int i = 0; i < 16; i++) {
+      odims1[i] = (i < N) ? dim_data_in[i] : 1;
+      dims[i] = (npy_intp) odims1[i];
+    }
     
-    for (int i = N; i < 16; i++)
-    dims[i] = 1;
+    out1 = (PyArrayObject*) PyArray_EMPTY(16, dims, NPY_CFLOAT, 1);
     
-    out1 = PyArray_SimpleNew(16, dims, NPY_CFLOAT);
+    if (!out1) SWIG_fail;
     
-    arg1 = (long *) array_data(in_dims1);
+    arg1 = odims1;
     arg2 = (complex float *) array_data(out1);
   }
   ecode3 = SWIG_AsVal_bool(swig_obj[1], &val3);
@@ -4048,9 +4226,22 @@ SWIGINTERN PyObject *_wrap_calc_bart(PyObject *SWIGUNUSEDPARM(self), PyObject *a
   resultobj = SWIG_Py_Void();
   {
     resultobj = SWIG_Python_AppendOutput(resultobj,(PyObject*)out1);
+    out1 = NULL;
+  }
+  {
+    if (is_new_object1 && in_dims1) {
+      Py_DECREF(in_dims1); 
+    }
+    Py_XDECREF(out1);
   }
   return resultobj;
 fail:
+  {
+    if (is_new_object1 && in_dims1) {
+      Py_DECREF(in_dims1); 
+    }
+    Py_XDECREF(out1);
+  }
   return NULL;
 }
 
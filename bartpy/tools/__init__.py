@@ -1 +1,2 @@
-from .tools import *
\ No newline at end of file
+from .tools import *
+from .parallel import map_dim
@@ -0,0 +1,6238 @@
+from ..utils import cfl, launch, scratch
+import os
+
+BART_PATH=os.environ['TOOLBOX_PATH'] + '/bart'
+DEBUG=False
+
+def set_debug(status):
+    global DEBUG
+    DEBUG=status
+
+
+async def avg(input, bitmask, w=None, lazy=False, out=None, backend=None):
+    """
+    Calculates (weighted) average along dimensions specified by bitmask.
+
+    :param bitmask int:
+    :param input array:
+    :param w bool: weighted average
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "vg [-w] bitmask input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'avg']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if w is not None:
+            flag_args += ['-w']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(bitmask), await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def bench(T=None, S=None, s=None, lazy=False, out=None, backend=None):
+    """
+    Performs a series of micro-benchmarks.
+
+    :param T bool: varying number of threads
+    :param S bool: varying problem size
+    :param s long: select benchmarks
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "bench [-T] [-S] [-s d] [output]"
+
+    async with scratch.anamespace(backend=backend) as NAME:
+        argv = [BART_PATH, 'bench']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if T is not None:
+            flag_args += ['-T']
+
+        if S is not None:
+            flag_args += ['-S']
+
+        if s is not None:
+            flag_args += ['-s', str(s)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def bin(label, src, l=None, o=None, R=None, C=None, r=None, c=None, a=None, A=None, O=None, x=None, M=None, lazy=False, out=None, backend=None):
+    """
+    Binning
+
+    :param label array:
+    :param src array:
+    :param l int: Bin according to labels: Specify cluster dimension
+    :param o bool: Reorder according to labels
+    :param R int: Quadrature Binning: Number of respiratory labels
+    :param C int: Quadrature Binning: Number of cardiac labels
+    :param r VEC2: (Respiration: Eigenvector index)
+    :param c VEC2: (Cardiac motion: Eigenvector index)
+    :param a int: Quadrature Binning: Moving average
+    :param A int: (Quadrature Binning: Cardiac moving average window)
+    :param O FLOAT_VEC2: Quadrature Binning: Angle offset for resp and card.
+    :param x STRING: (Output filtered cardiac EOFs)
+    :param M bool: Amplitude binning
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "bin [-l d] [-o] [-R d] [-C d] [-a d] [-O f:f] [-M] label src dst"
+
+    async with scratch.anamespace(label, src, backend=backend) as NAME:
+        staged = await scratch.astage_all(NAME, {'label': label, 'src': src})
+
+        argv = [BART_PATH, 'bin']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if l is not None:
+            flag_args += ['-l', str(l)]
+
+        if o is not None:
+            flag_args += ['-o']
+
+        if R is not None:
+            flag_args += ['-R', str(R)]
+
+        if C is not None:
+            flag_args += ['-C', str(C)]
+
+        if r is not None:
+            flag_args += ['-r', str(r)]
+
+        if c is not None:
+            flag_args += ['-c', str(c)]
+
+        if a is not None:
+            flag_args += ['-a', str(a)]
+
+        if A is not None:
+            flag_args += ['-A', str(A)]
+
+        if O is not None:
+            flag_args += ['-O', str(O)]
+
+        if x is not None:
+            flag_args += ['-x', str(x)]
+
+        if M is not None:
+            flag_args += ['-M']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['label'], staged['src'], NAME + 'dst']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'dst', lazy, out)
+        return outputs
+
+async def bitmask(dim=None, b=None):
+    """
+    Convert between a bitmask and set of dimensions.
+
+    :param dim tuple: None
+    :param b bool: dimensions from bitmask use with exactly one argument
+
+    """
+    usage_string = "bitmask [-b] [dim1 ... dimN ]"
+
+    async with scratch.anamespace() as NAME:
+        argv = [BART_PATH, 'bitmask']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if dim != None:
+            opt_args += [str(arg) for arg in dim]
+
+        if b is not None:
+            flag_args += ['-b']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+
+        val = (await launch.aoutput(argv)).decode('utf-8').strip()
+
+        return [int(d) for d in val.split()] if len(val.split()) > 1 else int(val)
+
+async def cabs(input, lazy=False, out=None, backend=None):
+    """
+    Absolute value of array (|<input>|).
+
+    :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "cabs input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'cabs']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def caldir(input, cal_size, lazy=False, out=None, backend=None):
+    """
+    Estimates coil sensitivities from the k-space center using
+a direct method (McKenzie et al.). The size of the fully-sampled
+calibration region is automatically determined but limited by
+{cal_size} (e.g. in the readout direction).
+
+    :param cal_size int:
+    :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "caldir cal_size input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'caldir']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(cal_size), await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def calmat(kspace, k=None, K=None, r=None, R=None, C=None, lazy=False, out=None, backend=None):
+    """
+    Compute calibration matrix.
+
+    :param kspace array:
+    :param k list: kernel size
+    :param K list: ()
+    :param r list: Limits the size of the calibration region.
+    :param R list: ()
+    :param C bool: ()
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "calmat [-k d:d:d] [-r d:d:d] kspace calibration_matrix"
+
+    async with scratch.anamespace(kspace, backend=backend) as NAME:
+        argv = [BART_PATH, 'calmat']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if k is not None:
+            flag_args += ['-k', ":".join([str(x) for x in k])]
+
+        if K is not None:
+            flag_args += ['-K', ":".join([str(x) for x in K])]
+
+        if r is not None:
+            flag_args += ['-r', ":".join([str(x) for x in r])]
+
+        if R is not None:
+            flag_args += ['-R', ":".join([str(x) for x in R])]
+
+        if C is not None:
+            flag_args += ['-C']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'kspace', kspace), NAME + 'calibration_matrix']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'calibration_matrix', lazy, out)
+        return outputs
+
+async def carg(input, lazy=False, out=None, backend=None):
+    """
+    Argument (phase angle).
+
+    :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "carg input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'carg']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def casorati(input, dim, kern, lazy=False, out=None, backend=None):
+    """
+    Casorati matrix with kernel (kern1, ..., kernN) along dimensions (dim1, ..., dimN).
+
+    :param dim multituple:
+    :param kern multituple:
+    :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "casorati dim1 kern1 ... dimN kernN input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'casorati']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        multituples.append(dim)
+    
+        multituples.append(kern)
+    
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def cc(kspace, p=None, M=None, r=None, R=None, A=None, S=None, G=None, E=None, lazy=False, out=None, backend=None):
+    """
+    Performs coil compression.
+
+    :param kspace array:
+    :param p long: perform compression to N virtual channels
+    :param M bool: output compression matrix
+    :param r list: size of calibration region
+    :param R list: (size of calibration region)
+    :param A bool: use all data to compute coefficients
+    :param S bool: type: SVD
+    :param G bool: type: Geometric
+    :param E bool: type: ESPIRiT
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "cc [-p d] [-M] [-r d:d:d] [-A] [-S] [-G] [-E] kspace coeff|proj_kspace"
+
+    async with scratch.anamespace(kspace, backend=backend) as NAME:
+        argv = [BART_PATH, 'cc']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if p is not None:
+            flag_args += ['-p', str(p)]
+
+        if M is not None:
+            flag_args += ['-M']
+
+        if r is not None:
+            flag_args += ['-r', ":".join([str(x) for x in r])]
+
+        if R is not None:
+            flag_args += ['-R', ":".join([str(x) for x in R])]
+
+        if A is not None:
+            flag_args += ['-A']
+
+        if S is not None:
+            flag_args += ['-S']
+
+        if G is not None:
+            flag_args += ['-G']
+
+        if E is not None:
+            flag_args += ['-E']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'kspace', kspace), NAME + 'coeff_proj_kspace']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'coeff_proj_kspace', lazy, out)
+        return outputs
+
+async def ccapply(kspace, cc_matrix, p=None, u=None, t=None, S=None, G=None, E=None, lazy=False, out=None, backend=None):
+    """
+    Apply coil compression forward/inverse operation.
+
+    :param kspace array:
+    :param cc_matrix array:
+    :param p long: perform compression to N virtual channels
+    :param u bool: apply inverse operation
+    :param t bool: don't apply FFT in readout
+    :param S bool: type: SVD
+    :param G bool: type: Geometric
+    :param E bool: type: ESPIRiT
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "ccapply [-p d] [-u] [-t] [-S] [-G] [-E] kspace cc_matrix proj_kspace"
+
+    async with scratch.anamespace(kspace, cc_matrix, backend=backend) as NAME:
+        staged = await scratch.astage_all(NAME, {'kspace': kspace, 'cc_matrix': cc_matrix})
+
+        argv = [BART_PATH, 'ccapply']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if p is not None:
+            flag_args += ['-p', str(p)]
+
+        if u is not None:
+            flag_args += ['-u']
+
+        if t is not None:
+            flag_args += ['-t']
+
+        if S is not None:
+            flag_args += ['-S']
+
+        if G is not None:
+            flag_args += ['-G']
+
+        if E is not None:
+            flag_args += ['-E']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['kspace'], staged['cc_matrix'], NAME + 'proj_kspace']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'proj_kspace', lazy, out)
+        return outputs
+
+async def cdf97(input, bitmask, i=None, lazy=False, out=None, backend=None):
+    """
+    Perform a wavelet (cdf97) transform.
+
+    :param bitmask int:
+    :param input array:
+    :param i bool: inverse
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "cdf97 [-i] bitmask input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'cdf97']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if i is not None:
+            flag_args += ['-i']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(bitmask), await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def circshift(input, dim, shift, lazy=False, out=None, backend=None):
+    """
+    Perform circular shift along {dim} by {shift} elements.
+
+    :param dim int:
+    :param shift int:
+    :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "circshift dim shift input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'circshift']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(dim), str(shift), await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def conj(input, lazy=False, out=None, backend=None):
+    """
+    Compute complex conjugate.
+
+    :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "conj input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'conj']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def conv(input, kernel, bitmask, lazy=False, out=None, backend=None):
+    """
+    Performs a convolution along selected dimensions.
+
+    :param bitmask int:
+    :param input array:
+    :param kernel array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "conv bitmask input kernel output"
+
+    async with scratch.anamespace(input, kernel, backend=backend) as NAME:
+        staged = await scratch.astage_all(NAME, {'input': input, 'kernel': kernel})
+
+        argv = [BART_PATH, 'conv']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(bitmask), staged['input'], staged['kernel'], NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def conway(input, P=None, n=None, lazy=False, out=None, backend=None):
+    """
+    Conway's game of life.
+
+    :param input array:
+    :param P bool: periodic boundary conditions
+    :param n int: nr. of iterations
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "conway [-P] [-n d] input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'conway']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if P is not None:
+            flag_args += ['-P']
+
+        if n is not None:
+            flag_args += ['-n', str(n)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def copy(input, output, dim=None, pos=None):
+    """
+    Copy an array (to a given position in the output file - which then must exist).
+
+    :param input array:
+    :param output INOUTFILE:
+    :param dim multituple: None
+    :param pos multituple: None
+
+    """
+    usage_string = "copy [dim1 pos1 ... dimN posN ] input output"
+
+    async with scratch.anamespace(input) as NAME:
+        argv = [BART_PATH, 'copy']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if dim != None:
+            multituples.append(dim) 
+
+        if pos != None:
+            multituples.append(pos) 
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'input', input), str(output)]
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+async def cpyphs(input, lazy=False, out=None, backend=None):
+    """
+    Copy phase from <input> to <output>.
+
+    :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "cpyphs input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'cpyphs']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def creal(input, lazy=False, out=None, backend=None):
+    """
+    Real value.
+
+    :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "creal input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'creal']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def crop(input, dimension, size, lazy=False, out=None, backend=None):
+    """
+    Extracts a sub-array corresponding to the central part of {size} along {dimension}
+
+    :param dimension int:
+    :param size int:
+    :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "crop dimension size input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'crop']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(dimension), str(size), await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def delta(dims, flags, size, lazy=False, out=None, backend=None):
+    """
+    Kronecker delta.
+
+    :param dims int:
+    :param flags int:
+    :param size long:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "delta dims flags size out"
+
+    async with scratch.anamespace(backend=backend) as NAME:
+        argv = [BART_PATH, 'delta']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(dims), str(flags), str(size), NAME + 'out']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'out', lazy, out)
+        return outputs
+
+async def ecalib(kspace, t=None, c=None, k=None, K=None, r=None, R=None, m=None, S=None, W=None, I=None, _1=None, P=None, O=None, orthiter=None, b=None, V=None, C=None, g=None, p=None, n=None, v=None, a=None, d=None, lazy=False, out=None, backend=None):
+    """
+    Estimate coil sensitivities using ESPIRiT calibration.
+Optionally outputs the eigenvalue maps.
+
+    :param kspace array:
+    :param t float: This determined the size of the null-space.
+    :param c float: Crop the sensitivities if the eigenvalue is smaller than crop_value.
+    :param k list: kernel size
+    :param K list: ()
+    :param r list: Limits the size of the calibration region.
+    :param R list: ()
+    :param m int: Number of maps to compute.
+    :param S bool: create maps with smooth transitions (Soft-SENSE).
+    :param W bool: soft-weighting of the singular vectors.
+    :param I bool: intensity correction
+    :param _1 bool: perform only first part of the calibration
+    :param P bool: Do not rotate the phase with respect to the first principal component
+    :param O bool: ()
+    :param orthiter int: ()
+    :param b float: ()
+    :param V bool: ()
+    :param C bool: ()
+    :param g bool: ()
+    :param p float: ()
+    :param n int: ()
+    :param v float: Variance of noise in data.
+    :param a bool: Automatically pick thresholds.
+    :param d int: Debug level
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "calib [-t f] [-c f] [-k d:d:d] [-r d:d:d] [-m d] [-S] [-W] [-I] [-1] [-P] [-v f] [-a] [-d d] kspace sensitivities [ev-maps]"
+
+    async with scratch.anamespace(kspace, backend=backend) as NAME:
+        argv = [BART_PATH, 'ecalib']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if t is not None:
+            flag_args += ['-t', str(t)]
+
+        if c is not None:
+            flag_args += ['-c', str(c)]
+
+        if k is not None:
+            flag_args += ['-k', ":".join([str(x) for x in k])]
+
+        if K is not None:
+            flag_args += ['-K', ":".join([str(x) for x in K])]
+
+        if r is not None:
+            flag_args += ['-r', ":".join([str(x) for x in r])]
+
+        if R is not None:
+            flag_args += ['-R', ":".join([str(x) for x in R])]
+
+        if m is not None:
+            flag_args += ['-m', str(m)]
+
+        if S is not None:
+            flag_args += ['-S']
+
+        if W is not None:
+            flag_args += ['-W']
+
+        if I is not None:
+            flag_args += ['-I']
+
+        if _1 is not None:
+            flag_args += ['-1']
+
+        if P is not None:
+            flag_args += ['-P']
+
+        if O is not None:
+            flag_args += ['-O']
+
+        if orthiter is not None:
+            flag_args += ['--orthiter', str(orthiter)]
+
+        if b is not None:
+            flag_args += ['-b', str(b)]
+
+        if V is not None:
+            flag_args += ['-V']
+
+        if C is not None:
+            flag_args += ['-C']
+
+        if g is not None:
+            flag_args += ['-g']
+
+        if p is not None:
+            flag_args += ['-p', str(p)]
+
+        if n is not None:
+            flag_args += ['-n', str(n)]
+
+        if v is not None:
+            flag_args += ['-v', str(v)]
+
+        if a is not None:
+            flag_args += ['-a']
+
+        if d is not None:
+            flag_args += ['-d', str(d)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'kspace', kspace), NAME + 'sensitivities', NAME + 'ev_maps']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch_all([NAME + 'sensitivities', NAME + 'ev_maps'], lazy, out)
+        return outputs
+
+async def ecaltwo(input, x, y, z, c=None, m=None, S=None, O=None, g=None, lazy=False, out=None, backend=None):
+    """
+    Second part of ESPIRiT calibration.
+Optionally outputs the eigenvalue maps.
+
+    :param x long:
+    :param y long:
+    :param z long:
+    :param input array:
+    :param c float: Crop the sensitivities if the eigenvalue is smaller than crop_value.
+    :param m long: Number of maps to compute.
+    :param S bool: Create maps with smooth transitions (Soft-SENSE).
+    :param O bool: ()
+    :param g bool: ()
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "caltwo [-c f] [-m d] [-S] x y z input sensitivities [ev-maps]"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'ecaltwo']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if c is not None:
+            flag_args += ['-c', str(c)]
+
+        if m is not None:
+            flag_args += ['-m', str(m)]
+
+        if S is not None:
+            flag_args += ['-S']
+
+        if O is not None:
+            flag_args += ['-O']
+
+        if g is not None:
+            flag_args += ['-g']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(x), str(y), str(z), await scratch.astage(NAME + 'input', input), NAME + 'sensitivities', NAME + 'ev_maps']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch_all([NAME + 'sensitivities', NAME + 'ev_maps'], lazy, out)
+        return outputs
+
+async def epg(C=None, M=None, H=None, F=None, S=None, B=None, _1=None, _2=None, b=None, o=None, r=None, e=None, f=None, s=None, n=None, u=None, v=None, lazy=False, out=None, backend=None):
+    """
+    Simulate MR pulse sequence based on Extended Phase Graphs (EPG)
+
+    :param C bool: CPMG
+    :param M bool: fmSSFP
+    :param H bool: Hyperecho
+    :param F bool: FLASH
+    :param S bool: Spinecho
+    :param B bool: bSSFP
+    :param _1 float: T1 [units of time]
+    :param _2 float: T2 [units of time]
+    :param b float: relative B1 [unitless]
+    :param o float: off-resonance [units of inverse time]
+    :param r float: repetition time [units of time]
+    :param e float: echo time [units of time]
+    :param f float: flip angle [degrees]
+    :param s long: spoiling (0: ideal 1: conventional RF 2: random RF)
+    :param n long: number of pulses
+    :param u long: unknowns as bitmask (0: T1 1: T2 2: B1 3: off-res)
+    :param v long: verbosity level
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "pg [-C] [-M] [-H] [-F] [-S] [-B] [-1 f] [-2 f] [-b f] [-o f] [-r f] [-e f] [-f f] [-s d] [-n d] [-u d] [-v d] signal intensity [configuration states] [(rel.) signal derivatives] [configuration derivatives]"
+
+    async with scratch.anamespace(backend=backend) as NAME:
+        argv = [BART_PATH, 'epg']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if C is not None:
+            flag_args += ['-C']
+
+        if M is not None:
+            flag_args += ['-M']
+
+        if H is not None:
+            flag_args += ['-H']
+
+        if F is not None:
+            flag_args += ['-F']
+
+        if S is not None:
+            flag_args += ['-S']
+
+        if B is not None:
+            flag_args += ['-B']
+
+        if _1 is not None:
+            flag_args += ['-1', str(_1)]
+
+        if _2 is not None:
+            flag_args += ['-2', str(_2)]
+
+        if b is not None:
+            flag_args += ['-b', str(b)]
+
+        if o is not None:
+            flag_args += ['-o', str(o)]
+
+        if r is not None:
+            flag_args += ['-r', str(r)]
+
+        if e is not None:
+            flag_args += ['-e', str(e)]
+
+        if f is not None:
+            flag_args += ['-f', str(f)]
+
+        if s is not None:
+            flag_args += ['-s', str(s)]
+
+        if n is not None:
+            flag_args += ['-n', str(n)]
+
+        if u is not None:
+            flag_args += ['-u', str(u)]
+
+        if v is not None:
+            flag_args += ['-v', str(v)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [NAME + 'signal_intensity', NAME + 'configuration_states', NAME + '_rel___signal_derivatives', NAME + 'configuration_derivatives']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch_all([NAME + 'signal_intensity', NAME + 'configuration_states', NAME + '_rel___signal_derivatives', NAME + 'configuration_derivatives'], lazy, out)
+        return outputs
+
+async def estdelay(trajectory, data, R=None, p=None, n=None, r=None, lazy=False, out=None, backend=None):
+    """
+    Estimate gradient delays from radial data.
+
+    :param trajectory array:
+    :param data array:
+    :param R bool: RING method
+    :param p int: [RING] Padding
+    :param n int: [RING] Number of intersecting spokes
+    :param r float: [RING] Central region size
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "tdelay [-R] [-p d] [-n d] [-r f] trajectory data [qf]"
+
+    async with scratch.anamespace(trajectory, data, backend=backend) as NAME:
+        staged = await scratch.astage_all(NAME, {'trajectory': trajectory, 'data': data})
+
+        argv = [BART_PATH, 'estdelay']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if R is not None:
+            flag_args += ['-R']
+
+        if p is not None:
+            flag_args += ['-p', str(p)]
+
+        if n is not None:
+            flag_args += ['-n', str(n)]
+
+        if r is not None:
+            flag_args += ['-r', str(r)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['trajectory'], staged['data'], NAME + 'qf']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'qf', lazy, out)
+        return outputs
+
+async def estdims(traj):
+    """
+    Estimate image dimension from non-Cartesian trajectory.
+Assume trajectory scaled to -DIM/2 to DIM/2 (ie dk=1/FOV=1)
+
+    :param traj array:
+
+    """
+    usage_string = "tdims traj"
+
+    async with scratch.anamespace(traj) as NAME:
+        argv = [BART_PATH, 'estdims']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'traj', traj)]
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+async def estshift(arg1, arg2, flags):
+    """
+    Estimate sub-pixel shift.
+
+    :param flags int:
+    :param arg1 array:
+    :param arg2 array:
+
+    """
+    usage_string = "tshift flags arg1 arg2"
+
+    async with scratch.anamespace(arg1, arg2) as NAME:
+        staged = await scratch.astage_all(NAME, {'arg1': arg1, 'arg2': arg2})
+
+        argv = [BART_PATH, 'estshift']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(flags), staged['arg1'], staged['arg2']]
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+async def estvar(kspace, k=None, K=None, r=None, R=None):
+    """
+    Estimate the noise variance assuming white Gaussian noise.
+
+    :param kspace array:
+    :param k list: kernel size
+    :param K list: ()
+    :param r list: Limits the size of the calibration region.
+    :param R list: ()
+
+    """
+    usage_string = "tvar [-k d:d:d] [-r d:d:d] kspace"
+
+    async with scratch.anamespace(kspace) as NAME:
+        argv = [BART_PATH, 'estvar']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if k is not None:
+            flag_args += ['-k', ":".join([str(x) for x in k])]
+
+        if K is not None:
+            flag_args += ['-K', ":".join([str(x) for x in K])]
+
+        if r is not None:
+            flag_args += ['-r', ":".join([str(x) for x in r])]
+
+        if R is not None:
+            flag_args += ['-R', ":".join([str(x) for x in R])]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'kspace', kspace)]
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+async def extract(input, dim, start, end, lazy=False, out=None, backend=None):
+    """
+    Extracts a sub-array along dims from index start to (not including) end.
+
+    :param dim multituple:
+    :param start multituple:
+    :param end multituple:
+    :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "xtract dim1 start1 end1 ... dimN startN endN input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'extract']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        multituples.append(dim)
+    
+        multituples.append(start)
+    
+        multituples.append(end)
+    
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def fakeksp(image, kspace, sens, r=None, lazy=False, out=None, backend=None):
+    """
+    Recreate k-space from image and sensitivities.
+
+    :param image array:
+    :param kspace array:
+    :param sens array:
+    :param r bool: replace measured samples with original values
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "fakeksp [-r] image kspace sens output"
+
+    async with scratch.anamespace(image, kspace, sens, backend=backend) as NAME:
+        staged = await scratch.astage_all(NAME, {'image': image, 'kspace': kspace, 'sens': sens})
+
+        argv = [BART_PATH, 'fakeksp']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if r is not None:
+            flag_args += ['-r']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['image'], staged['kspace'], staged['sens'], NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def fft(input, bitmask, u=None, i=None, n=None, lazy=False, out=None, backend=None):
+    """
+    Performs a fast Fourier transform (FFT) along selected dimensions.
+
+    :param bitmask long:
+    :param input array:
+    :param u bool: unitary
+    :param i bool: inverse
+    :param n bool: un-centered
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "fft [-u] [-i] [-n] bitmask input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'fft']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if u is not None:
+            flag_args += ['-u']
+
+        if i is not None:
+            flag_args += ['-i']
+
+        if n is not None:
+            flag_args += ['-n']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(bitmask), await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def fftmod(input, bitmask, b=None, i=None, lazy=False, out=None, backend=None):
+    """
+    Apply 1 -1 modulation along dimensions selected by the {bitmask}.
+
+    :param bitmask long:
+    :param input array:
+    :param b bool: (deprecated)
+    :param i bool: inverse
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "fftmod [-i] bitmask input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'fftmod']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if b is not None:
+            flag_args += ['-b']
+
+        if i is not None:
+            flag_args += ['-i']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(bitmask), await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def fftrot(input, dim1, dim2, theta, lazy=False, out=None, backend=None):
+    """
+    Performs a rotation using Fourier transform (FFT) along selected dimensions.
+
+    :param dim1 int:
+    :param dim2 int:
+    :param theta float:
+    :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "fftrot dim1 dim2 theta input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'fftrot']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(dim1), str(dim2), str(theta), await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def fftshift(input, bitmask, b=None, lazy=False, out=None, backend=None):
+    """
+    Apply fftshift along dimensions selected by the {bitmask}.
+
+    :param bitmask long:
+    :param input array:
+    :param b bool: apply ifftshift
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "fftshift [-b] bitmask input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'fftshift']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if b is not None:
+            flag_args += ['-b']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(bitmask), await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def filter(input, m=None, l=None, G=None, a=None, lazy=False, out=None, backend=None):
+    """
+    Apply filter.
+
+    :param input array:
+    :param m int: median filter along dimension dim
+    :param l int: length of filter
+    :param G bool: geometric median
+    :param a int: Moving average filter along dimension dim
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "filter [-m d] [-l d] [-G] [-a d] input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'filter']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if m is not None:
+            flag_args += ['-m', str(m)]
+
+        if l is not None:
+            flag_args += ['-l', str(l)]
+
+        if G is not None:
+            flag_args += ['-G']
+
+        if a is not None:
+            flag_args += ['-a', str(a)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def flatten(input, lazy=False, out=None, backend=None):
+    """
+    Flatten array to one dimension.
+
+    :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "flatten input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'flatten']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def flip(input, bitmask, lazy=False, out=None, backend=None):
+    """
+    Flip (reverse) dimensions specified by the {bitmask}.
+
+    :param bitmask long:
+    :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "flip bitmask input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'flip']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(bitmask), await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def fmac(input1, input2=None, A=None, C=None, s=None, lazy=False, out=None, backend=None):
+    """
+    Multiply <input1> and <input2> and accumulate in <output>.
+If <input2> is not specified, assume all-ones.
+
+    :param input1 array:
+    :param input2 array: None
+    :param A bool: add to existing output (instead of overwriting)
+    :param C bool: conjugate input2
+    :param s long: squash dimensions selected by bitmask b
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "fmac [-A] [-C] [-s d] input1 [input2] output"
+
+    async with scratch.anamespace(input1, input2, backend=backend) as NAME:
+        staged = await scratch.astage_all(NAME, {'input1': input1, 'input2': input2})
+
+        argv = [BART_PATH, 'fmac']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        opt_inputs = []
+
+        if not isinstance(input2, type(None)):
+            opt_inputs += [staged['input2']]
+
+        if A is not None:
+            flag_args += ['-A']
+
+        if C is not None:
+            flag_args += ['-C']
+
+        if s is not None:
+            flag_args += ['-s', str(s)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['input1'], *opt_inputs, NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def fovshift(input, t=None, s=None, lazy=False, out=None, backend=None):
+    """
+    Shifts FOV.
+
+    :param input array:
+    :param t array: k-space trajectory
+    :param s FLOAT_VEC3: FOV shift
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "fovshift [-t file] [-s f:f:f] input output"
+
+    async with scratch.anamespace(input, t, backend=backend) as NAME:
+        staged = await scratch.astage_all(NAME, {'input': input, 't': t})
+
+        argv = [BART_PATH, 'fovshift']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if not isinstance(t, type(None)):
+            flag_args += ['-t', staged['t']]
+
+        if s is not None:
+            flag_args += ['-s', str(s)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['input'], NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def homodyne(input, dim, fraction, r=None, I=None, C=None, P=None, n=None, lazy=False, out=None, backend=None):
+    """
+    Perform homodyne reconstruction along dimension dim.
+
+    :param dim int:
+    :param fraction float:
+    :param input array:
+    :param r float: Offset of ramp filter between 0 and 1. alpha=0 is a full ramp alpha=1 is a horizontal line
+    :param I bool: Input is in image domain
+    :param C bool: Clear unacquired portion of kspace
+    :param P array: Use <phase_ref> as phase reference
+    :param n bool: use uncentered ffts
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "homodyne [-r f] [-I] [-C] [-P file] [-n] dim fraction input output"
+
+    async with scratch.anamespace(input, P, backend=backend) as NAME:
+        staged = await scratch.astage_all(NAME, {'input': input, 'P': P})
+
+        argv = [BART_PATH, 'homodyne']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if r is not None:
+            flag_args += ['-r', str(r)]
+
+        if I is not None:
+            flag_args += ['-I']
+
+        if C is not None:
+            flag_args += ['-C']
+
+        if not isinstance(P, type(None)):
+            flag_args += ['-P', staged['P']]
+
+        if n is not None:
+            flag_args += ['-n']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(dim), str(fraction), staged['input'], NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+#def ictv(input, llambda, flags, flags, i=None, u=None):
+async def ictv(input, llambda, flags, i=None, u=None, lazy=False, out=None, backend=None):
+    """
+    Infimal convolution of total variation along dims specified by flags.
+
+    :param llambda float:
+    :param flags int:
+    :param flags int:
+    :param input array:
+    :param i int: max. iterations
+    :param u float: rho in ADMM
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "ictv [-i d] [-u f] lambda flags flags input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'ictv']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if i is not None:
+            flag_args += ['-i', str(i)]
+
+        if u is not None:
+            flag_args += ['-u', str(u)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(llambda), str(flags), str(flags), await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def index(dim, size, lazy=False, out=None, backend=None):
+    """
+    Create an array counting from 0 to {size-1} in dimensions {dim}.
+
+    :param dim int:
+    :param size int:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "index dim size name"
+
+    async with scratch.anamespace(backend=backend) as NAME:
+        argv = [BART_PATH, 'index']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(dim), str(size), NAME + 'name']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'name', lazy, out)
+        return outputs
+
+async def invert(input, lazy=False, out=None, backend=None):
+    """
+    Invert array (1 / <input>). The output is set to zero in case of divide by zero.
+
+    :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "invert input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'invert']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def itsense(sensitivities, kspace, pattern, alpha, lazy=False, out=None, backend=None):
+    """
+    A simplified implementation of iterative sense reconstruction
+with l2-regularization.
+
+    :param alpha float:
+    :param sensitivities array:
+    :param kspace array:
+    :param pattern array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "itsense alpha sensitivities kspace pattern output"
+
+    async with scratch.anamespace(sensitivities, kspace, pattern, backend=backend) as NAME:
+        staged = await scratch.astage_all(NAME, {'sensitivities': sensitivities, 'kspace': kspace, 'pattern': pattern})
+
+        argv = [BART_PATH, 'itsense']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(alpha), staged['sensitivities'], staged['kspace'], staged['pattern'], NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def join(dimension, input, output, a=None):
+    """
+    Join input files along {dimensions}. All other dimensions must have the same size.
+     Example 1: join 0 slice_001 slice_002 slice_003 full_data
+     Example 2: join 0 `seq -f "slice_%%03g" 0 255` full_data
+
+    :param dimension int:
+    :param input tuple:
+    :param output INOUTFILE:
+    :param a bool: append - only works for cfl files!
+
+    """
+    usage_string = "join [-a] dimension input1 ... inputN output"
+
+    async with scratch.anamespace() as NAME:
+        argv = [BART_PATH, 'join']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if a is not None:
+            flag_args += ['-a']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(dimension), *[str(arg) for arg in input], str(output)]
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+async def looklocker(input, t=None, D=None, lazy=False, out=None, backend=None):
+    """
+    Compute T1 map from M_0, M_ss, and R_1*.
+
+    :param input array:
+    :param t float: Pixels with M0 values smaller than threshold are set to zero.
+    :param D float: Time between the middle of inversion pulse and the first excitation.
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "looklocker [-t f] [-D f] input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'looklocker']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if t is not None:
+            flag_args += ['-t', str(t)]
+
+        if D is not None:
+            flag_args += ['-D', str(D)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def lrmatrix(input, d=None, i=None, m=None, f=None, j=None, k=None, N=None, s=None, l=None, u=None, v=None, H=None, p=None, n=None, g=None, lazy=False, out=None, backend=None):
+    """
+    Perform (multi-scale) low rank matrix completion
+
+    :param input array:
+    :param o OUTFILE:
+    :param d bool: perform decomposition instead ie fully sampled
+    :param i int: maximum iterations.
+    :param m long: which dimensions are reshaped to matrix columns.
+    :param f long: which dimensions to perform multi-scale partition.
+    :param j int: block size scaling from one scale to the next one.
+    :param k long: smallest block size
+    :param N bool: add noise scale to account for Gaussian noise.
+    :param s bool: perform low rank + sparse matrix completion.
+    :param l long: perform locally low rank soft thresholding with specified block size.
+    :param u bool: ()
+    :param v bool: ()
+    :param H bool: (hogwild)
+    :param p float: (rho)
+    :param n bool: (no randshift)
+    :param g bool: (use GPU)
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "lrmatrix [-d] [-i d] [-m d] [-f d] [-j d] [-k d] [-N] [-s] [-l d] [-o file] input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'lrmatrix']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if d is not None:
+            flag_args += ['-d']
+
+        if i is not None:
+            flag_args += ['-i', str(i)]
+
+        if m is not None:
+            flag_args += ['-m', str(m)]
+
+        if f is not None:
+            flag_args += ['-f', str(f)]
+
+        if j is not None:
+            flag_args += ['-j', str(j)]
+
+        if k is not None:
+            flag_args += ['-k', str(k)]
+
+        if N is not None:
+            flag_args += ['-N']
+
+        if s is not None:
+            flag_args += ['-s']
+
+        if l is not None:
+            flag_args += ['-l', str(l)]
+
+        if u is not None:
+            flag_args += ['-u']
+
+        if v is not None:
+            flag_args += ['-v']
+
+        if H is not None:
+            flag_args += ['-H']
+
+        if p is not None:
+            flag_args += ['-p', str(p)]
+
+        if n is not None:
+            flag_args += ['-n']
+
+        if g is not None:
+            flag_args += ['-g']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'input', input), NAME + 'output', NAME + 'o']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def mandelbrot(s=None, n=None, t=None, z=None, r=None, i=None, lazy=False, out=None, backend=None):
+    """
+    Compute mandelbrot set.
+
+    :param s int: image size
+    :param n int: nr. of iterations
+    :param t float: threshold for divergence
+    :param z float: zoom
+    :param r float: offset real
+    :param i float: offset imag
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "mandelbrot [-s d] [-n d] [-t f] [-z f] [-r f] [-i f] output"
+
+    async with scratch.anamespace(backend=backend) as NAME:
+        argv = [BART_PATH, 'mandelbrot']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if s is not None:
+            flag_args += ['-s', str(s)]
+
+        if n is not None:
+            flag_args += ['-n', str(n)]
+
+        if t is not None:
+            flag_args += ['-t', str(t)]
+
+        if z is not None:
+            flag_args += ['-z', str(z)]
+
+        if r is not None:
+            flag_args += ['-r', str(r)]
+
+        if i is not None:
+            flag_args += ['-i', str(i)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def measure(reference, input, mse=None, mse_mag=None, ssim=None, psnr=None, lazy=False, out=None, backend=None):
+    """
+    
+
+    :param reference array:
+    :param input array:
+    :param mse bool: mse
+    :param mse_mag bool: mse of rss (over coil dim)
+    :param ssim bool: ssim of rss (over coil dim) and mean over other dims
+    :param psnr bool: psnr of rss (over coil dim) and mean over other dims
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "measure [--mse] [--mse-mag] [--ssim] [--psnr] reference input [output]"
+
+    async with scratch.anamespace(reference, input, backend=backend) as NAME:
+        staged = await scratch.astage_all(NAME, {'reference': reference, 'input': input})
+
+        argv = [BART_PATH, 'measure']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if mse is not None:
+            flag_args += ['--mse']
+
+        if mse_mag is not None:
+            flag_args += ['--mse-mag']
+
+        if ssim is not None:
+            flag_args += ['--ssim']
+
+        if psnr is not None:
+            flag_args += ['--psnr']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['reference'], staged['input'], NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def mip(input, bitmask, m=None, a=None, lazy=False, out=None, backend=None):
+    """
+    Maximum (minimum) intensity projection (MIP) along dimensions specified by bitmask.
+
+    :param bitmask int:
+    :param input array:
+    :param m bool: minimum
+    :param a bool: do absolute value first
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "mip [-m] [-a] bitmask input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'mip']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if m is not None:
+            flag_args += ['-m']
+
+        if a is not None:
+            flag_args += ['-a']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(bitmask), await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def mnist(input, weights, ref_output, apply=None, train=None, gpu=None):
+    """
+    Trains or applies a MNIST network.
+This network is to demonstrate how a neural network can be implemented in BART.
+
+    :param input array:
+    :param weights INOUTFILE:
+    :param ref_output INOUTFILE:
+    :param apply bool: apply nnet
+    :param train bool: trains network
+    :param gpu bool: run on gpu
+
+    """
+    usage_string = "mnist [-a,--apply] [-t,--train] [-g,--gpu] input weights ref/output"
+
+    async with scratch.anamespace(input) as NAME:
+        argv = [BART_PATH, 'mnist']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if apply is not None:
+            flag_args += ['--apply']
+
+        if train is not None:
+            flag_args += ['--train']
+
+        if gpu is not None:
+            flag_args += ['--gpu']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'input', input), str(weights), str(ref_output)]
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+async def moba(kspace, TI_TE, r=None, L=None, P=None, F=None, G=None, bloch=None, m=None, l=None, i=None, reduction=None, T=None, j=None, u=None, C=None, s=None, B=None, b=None, d=None, N=None, f=None, p=None, J=None, M=None, O=None, g=None, multi_gpu=None, I=None, t=None, o=None, img_dims=None, k=None, kfilter_1=None, kfilter_2=None, e=None, n=None, no_alpha_min_exp_decay=None, sobolev_a=None, sobolev_b=None, fat_spec_0=None, scale_data=None, scale_psf=None, normalize_scaling=None, seq=None, sim=None, other=None, lazy=False, out=None, backend=None):
+    """
+    Model-based nonlinear inverse reconstruction
+
+    :param kspace array:
+    :param TI_TE array:
+    :param r SPECIAL: generalized regularization options (-rh for help)
+    :param L bool: T1 mapping using model-based look-locker
+    :param P bool: T1 mapping using reparameterized (M0 R1 alpha) model-based look-locker (TR required!)
+    :param F bool: T2 mapping using model-based Fast Spin Echo
+    :param G bool: T2* mapping using model-based multiple gradient echo
+    :param bloch bool: Bloch model-based reconstruction
+    :param m int: Select the MGRE model from enum  WF = 0 WFR2S WF2R2S R2S PHASEDIFF  [default: WFR2S]
+    :param l int: toggle l1-wavelet or l2 regularization.
+    :param i int: Number of Newton steps
+    :param reduction float: reduction factor
+    :param T float: damping on temporal frames
+    :param j float: Minimum regularization parameter
+    :param u float: ADMM rho [default: 0.01]
+    :param C int: inner iterations
+    :param s float: step size
+    :param B float: lower bound for relaxation
+    :param b FLOAT_VEC2: B0 field: spatial smooth level; scaling [default: 222.; 1.]
+    :param d int: Debug level
+    :param N bool: (normalize)
+    :param f float: 
+    :param p array: 
+    :param J bool: Stack frames for joint recon
+    :param M bool: Simultaneous Multi-Slice reconstruction
+    :param O bool: (Output original maps from reconstruction without post processing)
+    :param g bool: use gpu
+    :param multi_gpu int: number of gpus to use
+    :param I array: File for initialization
+    :param t array: K-space trajectory
+    :param o float: Oversampling factor for gridding [default: 1.]
+    :param img_dims list: dimensions
+    :param k bool: k-space edge filter for non-Cartesian trajectories
+    :param kfilter_1 bool: k-space edge filter 1
+    :param kfilter_2 bool: k-space edge filter 2
+    :param e float: strength for k-space edge filter [default: 2e-3]
+    :param n bool: (disable normalization of parameter maps for thresholding)
+    :param no_alpha_min_exp_decay bool: (Use hard minimum instead of exponential decay towards alpha_min)
+    :param sobolev_a float: (a in 1 + a * \Laplace^-b/2)
+    :param sobolev_b float: (b in 1 + a * \Laplace^-b/2)
+    :param fat_spec_0 bool: select fat spectrum from ISMRM fat-water tool
+    :param scale_data float: scaling factor for data
+    :param scale_psf float: (scaling factor for PSF)
+    :param normalize_scaling bool: (normalize scaling by data / PSF)
+    :param seq SUBOPT: configure sequence parameters
+    :param sim SUBOPT: configure simulation parameters
+    :param other SUBOPT: configure other parameters
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "moba [-r ...] [-L] [-P] [-F] [-G] [--bloch] [-m d] [-l d] [-i d] [-R,--reduction f] [-T f] [-j f] [-u f] [-C d] [-s f] [-B f] [-b f:f] [-d d] [-f f] [-p file] [-J] [-M] [-g] [--multi-gpu d] [-I file] [-t file] [-o f] [--img_dims d:d:d] [-k] [--kfilter-1] [--kfilter-2] [-e f] [--fat_spec_0] [--scale_data f] [--seq ...] [--sim ...] [--other ...] kspace TI/TE output [sensitivities]"
+
+    async with scratch.anamespace(kspace, TI_TE, p, I, t, backend=backend) as NAME:
+        staged = await scratch.astage_all(NAME, {'kspace': kspace, 'TI_TE': TI_TE, 'p': p, 'I': I, 't': t})
+
+        argv = [BART_PATH, 'moba']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if r is not None:
+            flag_args += ['-r', str(r)]
+
+        if L is not None:
+            flag_args += ['-L']
+
+        if P is not None:
+            flag_args += ['-P']
+
+        if F is not None:
+            flag_args += ['-F']
+
+        if G is not None:
+            flag_args += ['-G']
+
+        if bloch is not None:
+            flag_args += ['--bloch']
+
+        if m is not None:
+            flag_args += ['-m', str(m)]
+
+        if l is not None:
+            flag_args += ['-l', str(l)]
+
+        if i is not None:
+            flag_args += ['-i', str(i)]
+
+        if reduction is not None:
+            flag_args += ['--reduction', str(reduction)]
+
+        if T is not None:
+            flag_args += ['-T', str(T)]
+
+        if j is not None:
+            flag_args += ['-j', str(j)]
+
+        if u is not None:
+            flag_args += ['-u', str(u)]
+
+        if C is not None:
+            flag_args += ['-C', str(C)]
+
+        if s is not None:
+            flag_args += ['-s', str(s)]
+
+        if B is not None:
+            flag_args += ['-B', str(B)]
+
+        if b is not None:
+            flag_args += ['-b', str(b)]
+
+        if d is not None:
+            flag_args += ['-d', str(d)]
+
+        if N is not None:
+            flag_args += ['-N']
+
+        if f is not None:
+            flag_args += ['-f', str(f)]
+
+        if not isinstance(p, type(None)):
+            flag_args += ['-p', staged['p']]
+
+        if J is not None:
+            flag_args += ['-J']
+
+        if M is not None:
+            flag_args += ['-M']
+
+        if O is not None:
+            flag_args += ['-O']
+
+        if g is not None:
+            flag_args += ['-g']
+
+        if multi_gpu is not None:
+            flag_args += ['--multi-gpu', str(multi_gpu)]
+
+        if not isinstance(I, type(None)):
+            flag_args += ['-I', staged['I']]
+
+        if not isinstance(t, type(None)):
+            flag_args += ['-t', staged['t']]
+
+        if o is not None:
+            flag_args += ['-o', str(o)]
+
+        if img_dims is not None:
+            flag_args += ['--img_dims', ":".join([str(x) for x in img_dims])]
+
+        if k is not None:
+            flag_args += ['-k']
+
+        if kfilter_1 is not None:
+            flag_args += ['--kfilter-1']
+
+        if kfilter_2 is not None:
+            flag_args += ['--kfilter-2']
+
+        if e is not None:
+            flag_args += ['-e', str(e)]
+
+        if n is not None:
+            flag_args += ['-n']
+
+        if no_alpha_min_exp_decay is not None:
+            flag_args += ['--no_alpha_min_exp_decay']
+
+        if sobolev_a is not None:
+            flag_args += ['--sobolev_a', str(sobolev_a)]
+
+        if sobolev_b is not None:
+            flag_args += ['--sobolev_b', str(sobolev_b)]
+
+        if fat_spec_0 is not None:
+            flag_args += ['--fat_spec_0']
+
+        if scale_data is not None:
+            flag_args += ['--scale_data', str(scale_data)]
+
+        if scale_psf is not None:
+            flag_args += ['--scale_psf', str(scale_psf)]
+
+        if normalize_scaling is not None:
+            flag_args += ['--normalize_scaling']
+
+        if seq is not None:
+            flag_args += ['--seq', str(seq)]
+
+        if sim is not None:
+            flag_args += ['--sim', str(sim)]
+
+        if other is not None:
+            flag_args += ['--other', str(other)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['kspace'], staged['TI_TE'], NAME + 'output', NAME + 'sensitivities']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch_all([NAME + 'output', NAME + 'sensitivities'], lazy, out)
+        return outputs
+
+async def mobafit(enc, echo_contrast_images, T=None, G=None, D=None, m=None, i=None, p=None, g=None, lazy=False, out=None, backend=None):
+    """
+    Pixel-wise fitting of physical signal models.
+
+    :param enc array:
+    :param echo_contrast_images array:
+    :param T bool: TSE
+    :param G bool: MGRE
+    :param D bool: diffusion
+    :param m int: Select the MGRE model from enum  WF = 0 WFR2S WF2R2S R2S PHASEDIFF  [default: WFR2S]
+    :param i int: Number of IRGNM steps
+    :param p list: (patch size)
+    :param g bool: use gpu
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "mobafit [-T] [-G] [-D] [-m d] [-i d] [-g] enc echo/contrast images [coefficients]"
+
+    async with scratch.anamespace(enc, echo_contrast_images, backend=backend) as NAME:
+        staged = await scratch.astage_all(NAME, {'enc': enc, 'echo_contrast_images': echo_contrast_images})
+
+        argv = [BART_PATH, 'mobafit']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if T is not None:
+            flag_args += ['-T']
+
+        if G is not None:
+            flag_args += ['-G']
+
+        if D is not None:
+            flag_args += ['-D']
+
+        if m is not None:
+            flag_args += ['-m', str(m)]
+
+        if i is not None:
+            flag_args += ['-i', str(i)]
+
+        if p is not None:
+            flag_args += ['-p', ":".join([str(x) for x in p])]
+
+        if g is not None:
+            flag_args += ['-g']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['enc'], staged['echo_contrast_images'], NAME + 'coefficients']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'coefficients', lazy, out)
+        return outputs
+
+async def morphop(binary_input, mask_size, e=None, d=None, o=None, c=None, lazy=False, out=None, backend=None):
+    """
+    Perform morphological operators on binary data with odd mask sizes.
+
+    :param mask_size int:
+    :param binary_input array:
+    :param e bool: EROSION (default)
+    :param d bool: DILATION
+    :param o bool: OPENING
+    :param c bool: CLOSING
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "morphop [-e] [-d] [-o] [-c] mask_size binary input [binary output]"
+
+    async with scratch.anamespace(binary_input, backend=backend) as NAME:
+        argv = [BART_PATH, 'morphop']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if e is not None:
+            flag_args += ['-e']
+
+        if d is not None:
+            flag_args += ['-d']
+
+        if o is not None:
+            flag_args += ['-o']
+
+        if c is not None:
+            flag_args += ['-c']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(mask_size), await scratch.astage(NAME + 'binary_input', binary_input), NAME + 'binary_output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'binary_output', lazy, out)
+        return outputs
+
+async def multicfl(cfl, s=None):
+    """
+    Combine/Split multiple cfl files to one multi-cfl file.
+In normal usage, the last argument is the combined multi-cfl,
+with '-s', the first argument is the multi-cfl that is split up
+
+    :param cfl tuple:
+    :param s bool: separate
+
+    """
+    usage_string = "multicfl [-s] cfl1 ... cflN"
+
+    async with scratch.anamespace() as NAME:
+        argv = [BART_PATH, 'multicfl']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if s is not None:
+            flag_args += ['-s']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [*[str(arg) for arg in cfl]]
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+async def nlinv(kspace, i=None, R=None, M=None, d=None, c=None, N=None, m=None, U=None, f=None, p=None, t=None, I=None, g=None, S=None, s=None, a=None, b=None, P=None, n=None, w=None, lowmem=None, lazy=False, out=None, backend=None):
+    """
+    Jointly estimate image and sensitivities with nonlinear
+inversion using {iter} iteration steps. Optionally outputs
+the sensitivities.
+
+    :param kspace array:
+    :param i int: Number of Newton steps
+    :param R float: (reduction factor)
+    :param M float: (minimum for regularization)
+    :param d int: Debug level
+    :param c bool: Real-value constraint
+    :param N bool: Do not normalize image with coil sensitivities
+    :param m int: Number of ENLIVE maps to use in reconstruction
+    :param U bool: Do not combine ENLIVE maps in output
+    :param f float: restrict FOV
+    :param p array: pattern / transfer function
+    :param t array: kspace trajectory
+    :param I array: File for initialization
+    :param g bool: use gpu
+    :param S bool: Re-scale image after reconstruction
+    :param s int: (dimensions with constant sensitivities)
+    :param a float: (a in 1 + a * \Laplace^-b/2)
+    :param b float: (b in 1 + a * \Laplace^-b/2)
+    :param P bool: (supplied psf is different for each coil)
+    :param n bool: (non-Cartesian)
+    :param w float: (inverse scaling of the data)
+    :param lowmem bool: Use low-mem mode of the nuFFT
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "nlinv [-i d] [-d d] [-c] [-N] [-m d] [-U] [-f f] [-p file] [-t file] [-I file] [-g] [-S] [--lowmem] kspace output [sensitivities]"
+
+    async with scratch.anamespace(kspace, p, t, I, backend=backend) as NAME:
+        staged = await scratch.astage_all(NAME, {'kspace': kspace, 'p': p, 't': t, 'I': I})
+
+        argv = [BART_PATH, 'nlinv']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if i is not None:
+            flag_args += ['-i', str(i)]
+
+        if R is not None:
+            flag_args += ['-R', str(R)]
+
+        if M is not None:
+            flag_args += ['-M', str(M)]
+
+        if d is not None:
+            flag_args += ['-d', str(d)]
+
+        if c is not None:
+            flag_args += ['-c']
+
+        if N is not None:
+            flag_args += ['-N']
+
+        if m is not None:
+            flag_args += ['-m', str(m)]
+
+        if U is not None:
+            flag_args += ['-U']
+
+        if f is not None:
+            flag_args += ['-f', str(f)]
+
+        if not isinstance(p, type(None)):
+            flag_args += ['-p', staged['p']]
+
+        if not isinstance(t, type(None)):
+            flag_args += ['-t', staged['t']]
+
+        if not isinstance(I, type(None)):
+            flag_args += ['-I', staged['I']]
+
+        if g is not None:
+            flag_args += ['-g']
+
+        if S is not None:
+            flag_args += ['-S']
+
+        if s is not None:
+            flag_args += ['-s', str(s)]
+
+        if a is not None:
+            flag_args += ['-a', str(a)]
+
+        if b is not None:
+            flag_args += ['-b', str(b)]
+
+        if P is not None:
+            flag_args += ['-P']
+
+        if n is not None:
+            flag_args += ['-n']
+
+        if w is not None:
+            flag_args += ['-w', str(w)]
+
+        if lowmem is not None:
+            flag_args += ['--lowmem']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['kspace'], NAME + 'output', NAME + 'sensitivities']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch_all([NAME + 'output', NAME + 'sensitivities'], lazy, out)
+        return outputs
+
+async def nnet(input, weights, ref_output, apply=None, eval=None, train=None, gpu=None, batch_size=None, load=None, network=None, unet_segm=None, train_loss=None, valid_loss=None, valid_data=None, train_algo=None, adam=None, load_memory=None, export_graph=None):
+    """
+    Trains or applies a neural network.
+
+    :param input array:
+    :param weights INOUTFILE:
+    :param ref_output INOUTFILE:
+    :param apply bool: apply nnet
+    :param eval bool: evaluate nnet
+    :param train bool: trains network
+    :param gpu bool: run on gpu
+    :param batch_size long: size of mini batches
+    :param load array: load weights for continuing training
+    :param network SUBOPT: select neural network
+    :param unet_segm SUBOPT: configure U-Net for segmentation
+    :param train_loss SUBOPT: configure the training loss
+    :param valid_loss SUBOPT: configure the validation loss
+    :param valid_data SUBOPT: provide validation data
+    :param train_algo SUBOPT: configure general training parmeters
+    :param adam SUBOPT: configure Adam
+    :param load_memory bool: load files into memory
+    :param export_graph STRING: export graph for visualization
+
+    """
+    usage_string = "nnet [-a,--apply] [-e,--eval] [-t,--train] [-g,--gpu] [-b,--batch-size d] [-l,--load file] [-N,--network ...] [-U,--unet-segm ...] [--train-loss ...] [--valid-loss ...] [--valid-data ...] [-T,--train-algo ...] [--adam ...] [--load-memory] [--export-graph string] input weights ref/output"
+
+    async with scratch.anamespace(input, load) as NAME:
+        staged = await scratch.astage_all(NAME, {'input': input, 'load': load})
+
+        argv = [BART_PATH, 'nnet']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if apply is not None:
+            flag_args += ['--apply']
+
+        if eval is not None:
+            flag_args += ['--eval']
+
+        if train is not None:
+            flag_args += ['--train']
+
+        if gpu is not None:
+            flag_args += ['--gpu']
+
+        if batch_size is not None:
+            flag_args += ['--batch-size', str(batch_size)]
+
+        if not isinstance(load, type(None)):
+            flag_args += ['--load', staged['load']]
+
+        if network is not None:
+            flag_args += ['--network', str(network)]
+
+        if unet_segm is not None:
+            flag_args += ['--unet-segm', str(unet_segm)]
+
+        if train_loss is not None:
+            flag_args += ['--train-loss', str(train_loss)]
+
+        if valid_loss is not None:
+            flag_args += ['--valid-loss', str(valid_loss)]
+
+        if valid_data is not None:
+            flag_args += ['--valid-data', str(valid_data)]
+
+        if train_algo is not None:
+            flag_args += ['--train-algo', str(train_algo)]
+
+        if adam is not None:
+            flag_args += ['--adam', str(adam)]
+
+        if load_memory is not None:
+            flag_args += ['--load-memory']
+
+        if export_graph is not None:
+            flag_args += ['--export-graph', str(export_graph)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['input'], str(weights), str(ref_output)]
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+async def noise(input, s=None, S=None, r=None, n=None, lazy=False, out=None, backend=None):
+    """
+    Add noise with selected variance to input.
+
+    :param input array:
+    :param s int: random seed initialization
+    :param S float: ()
+    :param r bool: real-valued input
+    :param n float: DEFAULT: 1.0
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "noise [-s d] [-r] [-n f] input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'noise']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if s is not None:
+            flag_args += ['-s', str(s)]
+
+        if S is not None:
+            flag_args += ['-S', str(S)]
+
+        if r is not None:
+            flag_args += ['-r']
+
+        if n is not None:
+            flag_args += ['-n', str(n)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def normalize(input, flags, b=None, lazy=False, out=None, backend=None):
+    """
+    Normalize along selected dimensions.
+
+    :param flags int:
+    :param input array:
+    :param b bool: l1
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "normalize [-b] flags input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'normalize']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if b is not None:
+            flag_args += ['-b']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(flags), await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def nrmse(reference, input, t=None, s=None):
+    """
+    Output normalized root mean square error (NRMSE),
+i.e. norm(input - ref) / norm(ref)
+
+    :param reference array:
+    :param input array:
+    :param t float: compare to eps
+    :param s bool: automatic (complex) scaling
+
+    """
+    usage_string = "nrmse [-t f] [-s] reference input"
+
+    async with scratch.anamespace(reference, input) as NAME:
+        staged = await scratch.astage_all(NAME, {'reference': reference, 'input': input})
+
+        argv = [BART_PATH, 'nrmse']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if t is not None:
+            flag_args += ['-t', str(t)]
+
+        if s is not None:
+            flag_args += ['-s']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['reference'], staged['input']]
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+async def nufft(traj, input, a=None, i=None, d=None, D=None, t=None, r=None, c=None, l=None, m=None, P=None, s=None, g=None, _1=None, lowmem=None, lazy=False, out=None, backend=None):
+    """
+    Perform non-uniform Fast Fourier Transform.
+
+    :param traj array:
+    :param input array:
+    :param a bool: adjoint
+    :param i bool: inverse
+    :param d list: dimensions
+    :param D list: ()
+    :param t bool: Toeplitz embedding for inverse NUFFT
+    :param r bool: turn-off Toeplitz embedding for inverse NUFFT
+    :param c bool: Preconditioning for inverse NUFFT
+    :param l float: l2 regularization
+    :param m int: ()
+    :param P bool: periodic k-space
+    :param s bool: DFT
+    :param g bool: GPU (only inverse)
+    :param _1 bool: use/return oversampled grid
+    :param lowmem bool: Use low-mem mode of the nuFFT
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "nufft [-a] [-i] [-d d:d:d] [-t] [-r] [-c] [-l f] [-P] [-s] [-g] [-1] [--lowmem] traj input output"
+
+    async with scratch.anamespace(traj, input, backend=backend) as NAME:
+        staged = await scratch.astage_all(NAME, {'traj': traj, 'input': input})
+
+        argv = [BART_PATH, 'nufft']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if a is not None:
+            flag_args += ['-a']
+
+        if i is not None:
+            flag_args += ['-i']
+
+        if d is not None:
+            flag_args += ['-d', ":".join([str(x) for x in d])]
+
+        if D is not None:
+            flag_args += ['-D', ":".join([str(x) for x in D])]
+
+        if t is not None:
+            flag_args += ['-t']
+
+        if r is not None:
+            flag_args += ['-r']
+
+        if c is not None:
+            flag_args += ['-c']
+
+        if l is not None:
+            flag_args += ['-l', str(l)]
+
+        if m is not None:
+            flag_args += ['-m', str(m)]
+
+        if P is not None:
+            flag_args += ['-P']
+
+        if s is not None:
+            flag_args += ['-s']
+
+        if g is not None:
+            flag_args += ['-g']
+
+        if _1 is not None:
+            flag_args += ['-1']
+
+        if lowmem is not None:
+            flag_args += ['--lowmem']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['traj'], staged['input'], NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def onehotenc(input, r=None, i=None, lazy=False, out=None, backend=None):
+    """
+    Transforms class labels to one-hot-encoded classes
+
+
+    :param input array:
+    :param r bool: get class label by maximum entry
+    :param i int: select dimension
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "onehotenc [-r] [-i d] input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'onehotenc']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if r is not None:
+            flag_args += ['-r']
+
+        if i is not None:
+            flag_args += ['-i', str(i)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def ones(dims, dim, lazy=False, out=None, backend=None):
+    """
+    Create an array filled with ones with {dims} dimensions of size {dim1} to {dimn}.
+
+    :param dims long:
+    :param dim tuple:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "ones dims dim1 ... dimN output"
+
+    async with scratch.anamespace(backend=backend) as NAME:
+        argv = [BART_PATH, 'ones']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(dims), *[str(arg) for arg in dim], NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def pattern(kspace, s=None, lazy=False, out=None, backend=None):
+    """
+    Compute sampling pattern from kspace
+
+    :param kspace array:
+    :param s int: Squash dimensions selected by bitmask
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "pattern [-s d] kspace pattern"
+
+    async with scratch.anamespace(kspace, backend=backend) as NAME:
+        argv = [BART_PATH, 'pattern']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if s is not None:
+            flag_args += ['-s', str(s)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'kspace', kspace), NAME + 'pattern']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'pattern', lazy, out)
+        return outputs
+
+async def phantom(s=None, S=None, k=None, t=None, c=None, a=None, m=None, G=None, T=None, NIST=None, SONAR=None, N=None, B=None, x=None, g=None, _3=None, b=None, r=None, rotation_angle=None, rotation_steps=None, lazy=False, out=None, backend=None):
+    """
+    Image and k-space domain phantoms.
+
+    :param s int: nc sensitivities
+    :param S int: Output nc sensitivities
+    :param k bool: k-space
+    :param t array: trajectory
+    :param c bool: ()
+    :param a bool: ()
+    :param m bool: ()
+    :param G bool: geometric object phantom
+    :param T bool: tubes phantom
+    :param NIST bool: NIST phantom (T2 sphere)
+    :param SONAR bool: Diagnostic Sonar phantom
+    :param N int: Random tubes phantom and number
+    :param B bool: BART logo
+    :param x int: dimensions in y and z
+    :param g int: select geometry for object phantom
+    :param _3 bool: 3D
+    :param b bool: basis functions for geometry
+    :param r int: random seed initialization
+    :param rotation_angle float: Angle of Rotation
+    :param rotation_steps int: Number of rotation steps
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "phantom [-s d] [-S d] [-k] [-t file] [-G] [-T] [--NIST] [--SONAR] [-N d] [-B] [-x d] [-g d] [-3] [-b] [-r d] [--rotation-angle f] [--rotation-steps d] output"
+
+    async with scratch.anamespace(t, backend=backend) as NAME:
+        argv = [BART_PATH, 'phantom']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if s is not None:
+            flag_args += ['-s', str(s)]
+
+        if S is not None:
+            flag_args += ['-S', str(S)]
+
+        if k is not None:
+            flag_args += ['-k']
+
+        if not isinstance(t, type(None)):
+            flag_args += ['-t', await scratch.astage(NAME + 't', t)]
+
+        if c is not None:
+            flag_args += ['-c']
+
+        if a is not None:
+            flag_args += ['-a']
+
+        if m is not None:
+            flag_args += ['-m']
+
+        if G is not None:
+            flag_args += ['-G']
+
+        if T is not None:
+            flag_args += ['-T']
+
+        if NIST is not None:
+            flag_args += ['--NIST']
+
+        if SONAR is not None:
+            flag_args += ['--SONAR']
+
+        if N is not None:
+            flag_args += ['-N', str(N)]
+
+        if B is not None:
+            flag_args += ['-B']
+
+        if x is not None:
+            flag_args += ['-x', str(x)]
+
+        if g is not None:
+            flag_args += ['-g', str(g)]
+
+        if _3 is not None:
+            flag_args += ['-3']
+
+        if b is not None:
+            flag_args += ['-b']
+
+        if r is not None:
+            flag_args += ['-r', str(r)]
+
+        if rotation_angle is not None:
+            flag_args += ['--rotation-angle', str(rotation_angle)]
+
+        if rotation_steps is not None:
+            flag_args += ['--rotation-steps', str(rotation_steps)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def pics(kspace, sensitivities, l=None, r=None, R=None, c=None, s=None, i=None, t=None, n=None, N=None, g=None, G=None, p=None, I=None, b=None, e=None, H=None, D=None, F=None, J=None, T=None, W=None, d=None, O=None, o=None, u=None, C=None, q=None, f=None, m=None, w=None, S=None, L=None, K=None, B=None, P=None, a=None, M=None, lowmem=None, psf_import=None, wavelet=None, lazy=False, out=None, backend=None):
+    """
+    Parallel-imaging compressed-sensing reconstruction.
+
+
+    :param kspace array:
+    :param sensitivities array:
+    :param psf_export OUTFILE:
+    :param l SPECIAL: toggle l1-wavelet or l2 regularization.
+    :param r float: regularization parameter
+    :param R SPECIAL: generalized regularization options (-Rh for help)
+    :param c bool: real-value constraint
+    :param s float: iteration stepsize
+    :param i int: max. number of iterations
+    :param t array: k-space trajectory
+    :param n bool: disable random wavelet cycle spinning
+    :param N bool: do fully overlapping LLR blocks
+    :param g bool: use GPU
+    :param G int: use GPU device gpun
+    :param p array: pattern or weights
+    :param I bool: select IST
+    :param b int: Lowrank block size
+    :param e bool: Scale stepsize based on max. eigenvalue
+    :param H bool: (hogwild)
+    :param D bool: (ADMM dynamic step size)
+    :param F bool: (fast)
+    :param J bool: (ADMM residual balancing)
+    :param T array: (truth file)
+    :param W array: Warm start with <img>
+    :param d int: Debug level
+    :param O int: (reweighting)
+    :param o float: (reweighting)
+    :param u float: ADMM rho
+    :param C int: ADMM max. CG iterations
+    :param q float: (cclambda)
+    :param f float: restrict FOV
+    :param m bool: select ADMM
+    :param w float: inverse scaling of the data
+    :param S bool: re-scale the image after reconstruction
+    :param L int: batch-mode
+    :param K bool: randshift for NUFFT
+    :param B array: temporal (or other) basis
+    :param P float: Basis Pursuit formulation || y- Ax ||_2 <= eps
+    :param a bool: select Primal Dual
+    :param M bool: Simultaneous Multi-Slice reconstruction
+    :param lowmem bool: Use low-mem mode of the nuFFT
+    :param psf_import array: Import PSF from file
+    :param wavelet STRING: wavelet type (haar dau2 cdf44)
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "pics [-l ...] [-r f] [-R ...] [-c] [-s f] [-i d] [-t file] [-n] [-N] [-g] [-G d] [-p file] [-I] [-b d] [-e] [-W file] [-d d] [-u f] [-C d] [-f f] [-m] [-w f] [-S] [-L d] [-K] [-B file] [-P f] [-a] [-M] [-U,--lowmem] [--psf_export file] [--psf_import file] [--wavelet string] kspace sensitivities output"
+
+    async with scratch.anamespace(kspace, sensitivities, t, p, T, W, B, psf_import, backend=backend) as NAME:
+        staged = await scratch.astage_all(NAME, {'kspace': kspace, 'sensitivities': sensitivities, 't': t, 'p': p, 'T': T, 'W': W, 'B': B, 'psf_import': psf_import})
+
+        argv = [BART_PATH, 'pics']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if l is not None:
+            flag_args += ['-l', str(l)]
+
+        if r is not None:
+            flag_args += ['-r', str(r)]
+
+        if R is not None:
+            flag_args += ['-R', str(R)]
+
+        if c is not None:
+            flag_args += ['-c']
+
+        if s is not None:
+            flag_args += ['-s', str(s)]
+
+        if i is not None:
+            flag_args += ['-i', str(i)]
+
+        if not isinstance(t, type(None)):
+            flag_args += ['-t', staged['t']]
+
+        if n is not None:
+            flag_args += ['-n']
+
+        if N is not None:
+            flag_args += ['-N']
+
+        if g is not None:
+            flag_args += ['-g']
+
+        if G is not None:
+            flag_args += ['-G', str(G)]
+
+        if not isinstance(p, type(None)):
+            flag_args += ['-p', staged['p']]
+
+        if I is not None:
+            flag_args += ['-I']
+
+        if b is not None:
+            flag_args += ['-b', str(b)]
+
+        if e is not None:
+            flag_args += ['-e']
+
+        if H is not None:
+            flag_args += ['-H']
+
+        if D is not None:
+            flag_args += ['-D']
+
+        if F is not None:
+            flag_args += ['-F']
+
+        if J is not None:
+            flag_args += ['-J']
+
+        if not isinstance(T, type(None)):
+            flag_args += ['-T', staged['T']]
+
+        if not isinstance(W, type(None)):
+            flag_args += ['-W', staged['W']]
+
+        if d is not None:
+            flag_args += ['-d', str(d)]
+
+        if O is not None:
+            flag_args += ['-O', str(O)]
+
+        if o is not None:
+            flag_args += ['-o', str(o)]
+
+        if u is not None:
+            flag_args += ['-u', str(u)]
+
+        if C is not None:
+            flag_args += ['-C', str(C)]
+
+        if q is not None:
+            flag_args += ['-q', str(q)]
+
+        if f is not None:
+            flag_args += ['-f', str(f)]
+
+        if m is not None:
+            flag_args += ['-m']
+
+        if w is not None:
+            flag_args += ['-w', str(w)]
+
+        if S is not None:
+            flag_args += ['-S']
+
+        if L is not None:
+            flag_args += ['-L', str(L)]
+
+        if K is not None:
+            flag_args += ['-K']
+
+        if not isinstance(B, type(None)):
+            flag_args += ['-B', staged['B']]
+
+        if P is not None:
+            flag_args += ['-P', str(P)]
+
+        if a is not None:
+            flag_args += ['-a']
+
+        if M is not None:
+            flag_args += ['-M']
+
+        if lowmem is not None:
+            flag_args += ['--lowmem']
+
+        if not isinstance(psf_import, type(None)):
+            flag_args += ['--psf_import', staged['psf_import']]
+
+        if wavelet is not None:
+            flag_args += ['--wavelet', str(wavelet)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['kspace'], staged['sensitivities'], NAME + 'output', NAME + 'psf_export']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def pocsense(kspace, sensitivities, i=None, r=None, l=None, g=None, o=None, m=None, lazy=False, out=None, backend=None):
+    """
+    Perform POCSENSE reconstruction.
+
+    :param kspace array:
+    :param sensitivities array:
+    :param i int: max. number of iterations
+    :param r float: regularization parameter
+    :param l int: toggle l1-wavelet or l2 regularization
+    :param g bool: ()
+    :param o float: ()
+    :param m float: ()
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "pocsense [-i d] [-r f] [-l d] kspace sensitivities output"
+
+    async with scratch.anamespace(kspace, sensitivities, backend=backend) as NAME:
+        staged = await scratch.astage_all(NAME, {'kspace': kspace, 'sensitivities': sensitivities})
+
+        argv = [BART_PATH, 'pocsense']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if i is not None:
+            flag_args += ['-i', str(i)]
+
+        if r is not None:
+            flag_args += ['-r', str(r)]
+
+        if l is not None:
+            flag_args += ['-l', str(l)]
+
+        if g is not None:
+            flag_args += ['-g']
+
+        if o is not None:
+            flag_args += ['-o', str(o)]
+
+        if m is not None:
+            flag_args += ['-m', str(m)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['kspace'], staged['sensitivities'], NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def poisson(Y=None, Z=None, y=None, z=None, C=None, v=None, V=None, e=None, D=None, T=None, m=None, R=None, s=None, lazy=False, out=None, backend=None):
+    """
+    Computes Poisson-disc sampling pattern.
+
+    :param Y int: size dimension 1
+    :param Z int: size dimension 2
+    :param y float: acceleration dim 1
+    :param z float: acceleration dim 2
+    :param C int: size of calibration region
+    :param v bool: variable density
+    :param V float: (variable density)
+    :param e bool: elliptical scanning
+    :param D float: ()
+    :param T int: ()
+    :param m bool: ()
+    :param R int: ()
+    :param s int: random seed
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "poisson [-Y d] [-Z d] [-y f] [-z f] [-C d] [-v] [-e] [-s d] output"
+
+    async with scratch.anamespace(backend=backend) as NAME:
+        argv = [BART_PATH, 'poisson']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if Y is not None:
+            flag_args += ['-Y', str(Y)]
+
+        if Z is not None:
+            flag_args += ['-Z', str(Z)]
+
+        if y is not None:
+            flag_args += ['-y', str(y)]
+
+        if z is not None:
+            flag_args += ['-z', str(z)]
+
+        if C is not None:
+            flag_args += ['-C', str(C)]
+
+        if v is not None:
+            flag_args += ['-v']
+
+        if V is not None:
+            flag_args += ['-V', str(V)]
+
+        if e is not None:
+            flag_args += ['-e']
+
+        if D is not None:
+            flag_args += ['-D', str(D)]
+
+        if T is not None:
+            flag_args += ['-T', str(T)]
+
+        if m is not None:
+            flag_args += ['-m']
+
+        if R is not None:
+            flag_args += ['-R', str(R)]
+
+        if s is not None:
+            flag_args += ['-s', str(s)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def pol2mask(poly, X=None, Y=None, lazy=False, out=None, backend=None):
+    """
+    Compute masks from polygons.
+
+    :param poly array:
+    :param X int: size dimension 0
+    :param Y int: size dimension 1
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "pol2mask [-X d] [-Y d] poly output"
+
+    async with scratch.anamespace(poly, backend=backend) as NAME:
+        argv = [BART_PATH, 'pol2mask']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if X is not None:
+            flag_args += ['-X', str(X)]
+
+        if Y is not None:
+            flag_args += ['-Y', str(Y)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'poly', poly), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def poly(L, N, a_, lazy=False, out=None, backend=None):
+    """
+    Evaluate polynomial p(x) = a_1 + a_2 x + a_3 x^2 ... a_(N+1) x^N at x = {0, 1, ... , L - 1} where a_i are floats.
+
+    :param L int:
+    :param N int:
+    :param a_ tuple:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "poly L N a_1 ... a_N output"
+
+    async with scratch.anamespace(backend=backend) as NAME:
+        argv = [BART_PATH, 'poly']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(L), str(N), *[str(arg) for arg in a_], NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def reconet(kspace, sensitivities, weights, ref_out, train=None, eval=None, apply=None, gpu=None, load=None, batch_size=None, iterations=None, normalize=None, network=None, resnet_block=None, varnet_block=None, unet=None, data_consistency=None, initial_reco=None, shared_weights=None, no_shared_weights=None, shared_lambda=None, no_shared_lambda=None, rss_norm=None, trajectory=None, pattern=None, adjoint=None, psf=None, export=None, mask=None, valid_data=None, train_loss=None, valid_loss=None, train_algo=None, adam=None, iPALM=None, load_memory=None, lowmem=None, test=None, export_graph=None, B=None):
+    """
+    Trains or appplies a neural network for reconstruction.
+
+    :param kspace array:
+    :param sensitivities array:
+    :param weights INOUTFILE:
+    :param ref_out INOUTFILE:
+    :param train bool: train reconet
+    :param eval bool: evaluate reconet
+    :param apply bool: apply reconet
+    :param gpu bool: run on gpu
+    :param load array: load weights for continuing training
+    :param batch_size long: size of mini batches
+    :param iterations long: number of unrolled iterations
+    :param normalize bool: normalize data with maximum magnitude of adjoint reconstruction
+    :param network SUBOPT: select neural network
+    :param resnet_block SUBOPT: configure residual block
+    :param varnet_block SUBOPT: configure variational block
+    :param unet SUBOPT: configure U-Net block
+    :param data_consistency SUBOPT: configure data-consistency method
+    :param initial_reco SUBOPT: configure initialization
+    :param shared_weights bool: share weights across iterations
+    :param no_shared_weights bool: share weights across iterations
+    :param shared_lambda bool: share lambda across iterations
+    :param no_shared_lambda bool: share lambda across iterations
+    :param rss_norm bool: scale output image to rss normalization
+    :param trajectory array: trajectory
+    :param pattern array: sampling pattern / psf in kspace
+    :param adjoint INOUTFILE: (validation data adjoint (load or export))
+    :param psf INOUTFILE: (psf (load or export))
+    :param export bool: (export psf and adjoint reconstruction)
+    :param mask array: mask for computation of loss
+    :param valid_data SUBOPT: provide validation data
+    :param train_loss SUBOPT: configure the training loss
+    :param valid_loss SUBOPT: configure the validation loss
+    :param train_algo SUBOPT: configure general training parmeters
+    :param adam SUBOPT: configure Adam
+    :param iPALM SUBOPT: configure iPALM
+    :param load_memory bool: copy training data into memory
+    :param lowmem bool: reduce memory usage by checkpointing
+    :param test bool: very small network for tests
+    :param export_graph STRING: export graph for visualization
+    :param B array: (temporal (or other) basis)
+
+    """
+    usage_string = "reconet [-t,--train] [-e,--eval] [-a,--apply] [-g,--gpu] [-l,--load file] [-b,--batch-size d] [-I,--iterations d] [-n,--normalize] [-N,--network ...] [--resnet-block ...] [--varnet-block ...] [--unet ...] [--data-consistency ...] [--initial-reco ...] [--shared-weights] [--no-shared-weights] [--shared-lambda] [--no-shared-lambda] [--rss-norm] [--trajectory file] [--pattern file] [--mask file] [--valid-data ...] [--train-loss ...] [--valid-loss ...] [-T,--train-algo ...] [--adam ...] [--iPALM ...] [--load-memory] [--lowmem] [--test] [--export-graph string] kspace sensitivities weights ref/out"
+
+    async with scratch.anamespace(kspace, sensitivities, load, trajectory, pattern, mask, B) as NAME:
+        staged = await scratch.astage_all(NAME, {'kspace': kspace, 'sensitivities': sensitivities, 'load': load, 'trajectory': trajectory, 'pattern': pattern, 'mask': mask, 'B': B})
+
+        argv = [BART_PATH, 'reconet']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if train is not None:
+            flag_args += ['--train']
+
+        if eval is not None:
+            flag_args += ['--eval']
+
+        if apply is not None:
+            flag_args += ['--apply']
+
+        if gpu is not None:
+            flag_args += ['--gpu']
+
+        if not isinstance(load, type(None)):
+            flag_args += ['--load', staged['load']]
+
+        if batch_size is not None:
+            flag_args += ['--batch-size', str(batch_size)]
+
+        if iterations is not None:
+            flag_args += ['--iterations', str(iterations)]
+
+        if normalize is not None:
+            flag_args += ['--normalize']
+
+        if network is not None:
+            flag_args += ['--network', str(network)]
+
+        if resnet_block is not None:
+            flag_args += ['--resnet-block', str(resnet_block)]
+
+        if varnet_block is not None:
+            flag_args += ['--varnet-block', str(varnet_block)]
+
+        if unet is not None:
+            flag_args += ['--unet', str(unet)]
+
+        if data_consistency is not None:
+            flag_args += ['--data-consistency', str(data_consistency)]
+
+        if initial_reco is not None:
+            flag_args += ['--initial-reco', str(initial_reco)]
+
+        if shared_weights is not None:
+            flag_args += ['--shared-weights']
+
+        if no_shared_weights is not None:
+            flag_args += ['--no-shared-weights']
+
+        if shared_lambda is not None:
+            flag_args += ['--shared-lambda']
+
+        if no_shared_lambda is not None:
+            flag_args += ['--no-shared-lambda']
+
+        if rss_norm is not None:
+            flag_args += ['--rss-norm']
+
+        if not isinstance(trajectory, type(None)):
+            flag_args += ['--trajectory', staged['trajectory']]
+
+        if not isinstance(pattern, type(None)):
+            flag_args += ['--pattern', staged['pattern']]
+
+        if adjoint is not None:
+            flag_args += ['--adjoint', str(adjoint)]
+
+        if psf is not None:
+            flag_args += ['--psf', str(psf)]
+
+        if export is not None:
+            flag_args += ['--export']
+
+        if not isinstance(mask, type(None)):
+            flag_args += ['--mask', staged['mask']]
+
+        if valid_data is not None:
+            flag_args += ['--valid-data', str(valid_data)]
+
+        if train_loss is not None:
+            flag_args += ['--train-loss', str(train_loss)]
+
+        if valid_loss is not None:
+            flag_args += ['--valid-loss', str(valid_loss)]
+
+        if train_algo is not None:
+            flag_args += ['--train-algo', str(train_algo)]
+
+        if adam is not None:
+            flag_args += ['--adam', str(adam)]
+
+        if iPALM is not None:
+            flag_args += ['--iPALM', str(iPALM)]
+
+        if load_memory is not None:
+            flag_args += ['--load-memory']
+
+        if lowmem is not None:
+            flag_args += ['--lowmem']
+
+        if test is not None:
+            flag_args += ['--test']
+
+        if export_graph is not None:
+            flag_args += ['--export-graph', str(export_graph)]
+
+        if not isinstance(B, type(None)):
+            flag_args += ['-B', staged['B']]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['kspace'], staged['sensitivities'], str(weights), str(ref_out)]
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+async def repmat(input, dimension, repetitions, lazy=False, out=None, backend=None):
+    """
+    Repeat input array multiple times along a certain dimension.
+
+    :param dimension int:
+    :param repetitions int:
+    :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "repmat dimension repetitions input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'repmat']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(dimension), str(repetitions), await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def reshape(input, flags, dim, lazy=False, out=None, backend=None):
+    """
+    Reshape selected dimensions.
+
+    :param flags long:
+    :param dim tuple:
+    :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "reshape flags dim1 ... dimN input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'reshape']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(flags), *[str(arg) for arg in dim], await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def resize(input, dim, size, c=None, lazy=False, out=None, backend=None):
+    """
+    Resizes an array along dimensions to sizes by truncating or zero-padding. Please see doc/resize.txt for examples.
+
+    :param dim multituple:
+    :param size multituple:
+    :param input array:
+    :param c bool: center
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "resize [-c] dim1 size1 ... dimN sizeN input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'resize']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if c is not None:
+            flag_args += ['-c']
+        argv += flag_args + opt_args
+
+        multituples.append(dim)
+    
+        multituples.append(size)
+    
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def rmfreq(traj, k, N=None, M=None, lazy=False, out=None, backend=None):
+    """
+    Remove angle-dependent frequency
+
+    :param traj array:
+    :param k array:
+    :param N int: Number of harmonics [Default: 5]
+    :param M STRING: Contrast modulation file
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "rmfreq [-N d] [-M string] traj k k_cor"
+
+    async with scratch.anamespace(traj, k, backend=backend) as NAME:
+        staged = await scratch.astage_all(NAME, {'traj': traj, 'k': k})
+
+        argv = [BART_PATH, 'rmfreq']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if N is not None:
+            flag_args += ['-N', str(N)]
+
+        if M is not None:
+            flag_args += ['-M', str(M)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['traj'], staged['k'], NAME + 'k_cor']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'k_cor', lazy, out)
+        return outputs
+
+async def rof(input, llambda, flags, lazy=False, out=None, backend=None):
+    """
+    Perform total variation denoising along dims <flags>.
+
+    :param llambda float:
+    :param flags int:
+    :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "rof lambda flags input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'rof']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(llambda), str(flags), await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def roistat(roi, input, b=None, C=None, S=None, M=None, D=None, E=None, V=None, lazy=False, out=None, backend=None):
+    """
+    Compute ROI statistics.
+
+    :param roi array:
+    :param input array:
+    :param b bool: Bessel's correction i.e. 1 / (n - 1)
+    :param C bool: voxel count
+    :param S bool: sum
+    :param M bool: mean
+    :param D bool: standard deviation
+    :param E bool: energy
+    :param V bool: variance
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "roistat [-b] [-C] [-S] [-M] [-D] [-E] [-V] roi input [output]"
+
+    async with scratch.anamespace(roi, input, backend=backend) as NAME:
+        staged = await scratch.astage_all(NAME, {'roi': roi, 'input': input})
+
+        argv = [BART_PATH, 'roistat']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if b is not None:
+            flag_args += ['-b']
+
+        if C is not None:
+            flag_args += ['-C']
+
+        if S is not None:
+            flag_args += ['-S']
+
+        if M is not None:
+            flag_args += ['-M']
+
+        if D is not None:
+            flag_args += ['-D']
+
+        if E is not None:
+            flag_args += ['-E']
+
+        if V is not None:
+            flag_args += ['-V']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['roi'], staged['input'], NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def rss(input, bitmask, lazy=False, out=None, backend=None):
+    """
+    Calculates root of sum of squares along selected dimensions.
+
+    :param bitmask int:
+    :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "rss bitmask input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'rss']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(bitmask), await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def rtnlinv(kspace, i=None, R=None, M=None, d=None, c=None, N=None, m=None, U=None, f=None, p=None, t=None, I=None, C=None, g=None, S=None, a=None, b=None, T=None, w=None, x=None, A=None, s=None, lazy=False, out=None, backend=None):
+    """
+    Jointly estimate a time-series of images and sensitivities with nonlinear
+inversion using {iter} iteration steps. Optionally outputs
+the sensitivities.
+
+    :param kspace array:
+    :param i int: Number of Newton steps
+    :param R float: (reduction factor)
+    :param M float: (minimum for regularization)
+    :param d int: Debug level
+    :param c bool: Real-value constraint
+    :param N bool: Do not normalize image with coil sensitivities
+    :param m int: Number of ENLIVE maps to use in reconstruction
+    :param U bool: Do not combine ENLIVE maps in output
+    :param f float: restrict FOV
+    :param p array: pattern / transfer function
+    :param t array: kspace trajectory
+    :param I array: File for initialization
+    :param C array: (File for initialization with image space sensitivities)
+    :param g bool: use gpu
+    :param S bool: Re-scale image after reconstruction
+    :param a float: (a in 1 + a * \Laplace^-b/2)
+    :param b float: (b in 1 + a * \Laplace^-b/2)
+    :param T float: temporal damping [default: 0.9]
+    :param w float: (inverse scaling of the data)
+    :param x list: Explicitly specify image dimensions
+    :param A bool: (Alternative scaling)
+    :param s bool: (Simultaneous Multi-Slice reconstruction)
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "rtnlinv [-i d] [-d d] [-c] [-N] [-m d] [-U] [-f f] [-p file] [-t file] [-I file] [-g] [-S] [-T f] [-x d:d:d] kspace output [sensitivities]"
+
+    async with scratch.anamespace(kspace, p, t, I, C, backend=backend) as NAME:
+        staged = await scratch.astage_all(NAME, {'kspace': kspace, 'p': p, 't': t, 'I': I, 'C': C})
+
+        argv = [BART_PATH, 'rtnlinv']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if i is not None:
+            flag_args += ['-i', str(i)]
+
+        if R is not None:
+            flag_args += ['-R', str(R)]
+
+        if M is not None:
+            flag_args += ['-M', str(M)]
+
+        if d is not None:
+            flag_args += ['-d', str(d)]
+
+        if c is not None:
+            flag_args += ['-c']
+
+        if N is not None:
+            flag_args += ['-N']
+
+        if m is not None:
+            flag_args += ['-m', str(m)]
+
+        if U is not None:
+            flag_args += ['-U']
+
+        if f is not None:
+            flag_args += ['-f', str(f)]
+
+        if not isinstance(p, type(None)):
+            flag_args += ['-p', staged['p']]
+
+        if not isinstance(t, type(None)):
+            flag_args += ['-t', staged['t']]
+
+        if not isinstance(I, type(None)):
+            flag_args += ['-I', staged['I']]
+
+        if not isinstance(C, type(None)):
+            flag_args += ['-C', staged['C']]
+
+        if g is not None:
+            flag_args += ['-g']
+
+        if S is not None:
+            flag_args += ['-S']
+
+        if a is not None:
+            flag_args += ['-a', str(a)]
+
+        if b is not None:
+            flag_args += ['-b', str(b)]
+
+        if T is not None:
+            flag_args += ['-T', str(T)]
+
+        if w is not None:
+            flag_args += ['-w', str(w)]
+
+        if x is not None:
+            flag_args += ['-x', ":".join([str(x) for x in x])]
+
+        if A is not None:
+            flag_args += ['-A']
+
+        if s is not None:
+            flag_args += ['-s']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['kspace'], NAME + 'output', NAME + 'sensitivities']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch_all([NAME + 'output', NAME + 'sensitivities'], lazy, out)
+        return outputs
+
+async def sake(kspace, i=None, s=None, o=None, lazy=False, out=None, backend=None):
+    """
+    Use SAKE algorithm to recover a full k-space from undersampled
+data using low-rank matrix completion.
+
+    :param kspace array:
+    :param i int: number of iterations
+    :param s float: rel. size of the signal subspace
+    :param o float: ()
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "ke [-i d] [-s f] kspace output"
+
+    async with scratch.anamespace(kspace, backend=backend) as NAME:
+        argv = [BART_PATH, 'sake']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if i is not None:
+            flag_args += ['-i', str(i)]
+
+        if s is not None:
+            flag_args += ['-s', str(s)]
+
+        if o is not None:
+            flag_args += ['-o', str(o)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'kspace', kspace), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def saxpy(input1, input2, scale, lazy=False, out=None, backend=None):
+    """
+    Multiply input1 with scale factor and add input2.
+
+    :param scale CFL:
+    :param input1 array:
+    :param input2 array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "xpy scale input1 input2 output"
+
+    async with scratch.anamespace(input1, input2, backend=backend) as NAME:
+        staged = await scratch.astage_all(NAME, {'input1': input1, 'input2': input2})
+
+        argv = [BART_PATH, 'saxpy']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(scale), staged['input1'], staged['input2'], NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def scale(input, factor, lazy=False, out=None, backend=None):
+    """
+    Scale array by {factor}. The scale factor can be a complex number.
+
+    :param factor CFL:
+    :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "cale factor input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'scale']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(factor), await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def sdot(input1, input2):
+    """
+    Compute dot product along selected dimensions.
+
+    :param input1 array:
+    :param input2 array:
+
+    """
+    usage_string = "dot input1 input2"
+
+    async with scratch.anamespace(input1, input2) as NAME:
+        staged = await scratch.astage_all(NAME, {'input1': input1, 'input2': input2})
+
+        argv = [BART_PATH, 'sdot']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['input1'], staged['input2']]
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+async def show(input, m=None, d=None, s=None, f=None):
+    """
+    Outputs values or meta data.
+
+    :param input array:
+    :param m bool: show meta data
+    :param d int: show size of dimension
+    :param s STRING: use <sep> as the separator
+    :param f STRING: use <format> as the format. Default: %%+.6e%%+.6ei
+
+    """
+    usage_string = "how [-m] [-d d] [-s string] [-f string] input"
+
+    async with scratch.anamespace(input) as NAME:
+        argv = [BART_PATH, 'show']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if m is not None:
+            flag_args += ['-m']
+
+        if d is not None:
+            flag_args += ['-d', str(d)]
+
+        if s is not None:
+            flag_args += ['-s', str(s)]
+
+        if f is not None:
+            flag_args += ['-f', str(f)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'input', input)]
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+async def signal(F=None, B=None, T=None, M=None, G=None, fat=None, I=None, s=None, _0=None, _1=None, _2=None, _3=None, r=None, e=None, f=None, t=None, n=None, b=None, av_spokes=None, lazy=False, out=None, backend=None):
+    """
+    Analytical simulation tool.
+
+    :param F bool: FLASH
+    :param B bool: bSSFP
+    :param T bool: TSE
+    :param M bool: MOLLI
+    :param G bool: MGRE
+    :param fat bool: Simulate additional fat component.
+    :param I bool: inversion recovery
+    :param s bool: inversion recovery starting from steady state
+    :param _0 FLOAT_VEC3: range of off-resonance frequency (Hz)
+    :param _1 FLOAT_VEC3: range of T1s (s)
+    :param _2 FLOAT_VEC3: range of T2s (s)
+    :param _3 FLOAT_VEC3: range of Mss
+    :param r float: repetition time
+    :param e float: echo time
+    :param f float: flip ange
+    :param t float: T1 relax period (second) for MOLLI
+    :param n long: number of measurements
+    :param b long: number of heart beats for MOLLI
+    :param av_spokes int: Number of averaged consecutive spokes
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "ignal [-F] [-B] [-T] [-M] [-G] [--fat] [-I] [-s] [-0 f:f:f] [-1 f:f:f] [-2 f:f:f] [-3 f:f:f] [-r f] [-e f] [-f f] [-t f] [-n d] [-b d] [--av-spokes d] basis-functions"
+
+    async with scratch.anamespace(backend=backend) as NAME:
+        argv = [BART_PATH, 'signal']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if F is not None:
+            flag_args += ['-F']
+
+        if B is not None:
+            flag_args += ['-B']
+
+        if T is not None:
+            flag_args += ['-T']
+
+        if M is not None:
+            flag_args += ['-M']
+
+        if G is not None:
+            flag_args += ['-G']
+
+        if fat is not None:
+            flag_args += ['--fat']
+
+        if I is not None:
+            flag_args += ['-I']
+
+        if s is not None:
+            flag_args += ['-s']
+
+        if _0 is not None:
+            flag_args += ['-0', str(_0)]
+
+        if _1 is not None:
+            flag_args += ['-1', str(_1)]
+
+        if _2 is not None:
+            flag_args += ['-2', str(_2)]
+
+        if _3 is not None:
+            flag_args += ['-3', str(_3)]
+
+        if r is not None:
+            flag_args += ['-r', str(r)]
+
+        if e is not None:
+            flag_args += ['-e', str(e)]
+
+        if f is not None:
+            flag_args += ['-f', str(f)]
+
+        if t is not None:
+            flag_args += ['-t', str(t)]
+
+        if n is not None:
+            flag_args += ['-n', str(n)]
+
+        if b is not None:
+            flag_args += ['-b', str(b)]
+
+        if av_spokes is not None:
+            flag_args += ['--av-spokes', str(av_spokes)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [NAME + 'basis_functions']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'basis_functions', lazy, out)
+        return outputs
+
+async def sim(dB1=None, T1=None, T2=None, ROT=None, ODE=None, STM=None, split_dim=None, seq=None, other=None, lazy=False, out=None, backend=None):
+    """
+    simulation tool
+
+    :param dB1 dM0: None
+    :param T1 FLOAT_VEC3: range of T1 values
+    :param T2 FLOAT_VEC3: range of T2 values
+    :param ROT bool: homogeneously discretized simulation based on rotational matrices
+    :param ODE bool: full ordinary differential equation solver based simulation (default)
+    :param STM bool: state-transition matrix based simulation
+    :param split_dim bool: Split output in x y and z dimensional parts
+    :param seq SUBOPT: configure sequence parameter
+    :param other SUBOPT: configure other parameters
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "im [-1,--T1 f:f:f] [-2,--T2 f:f:f] [--ROT] [--ODE] [--STM] [--split-dim] [--seq ...] [--other ...] signal: Mxy [Partial derivatives: dR1, dM0, dR2, dB1]"
+
+    async with scratch.anamespace(backend=backend) as NAME:
+        argv = [BART_PATH, 'sim']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if dB1 != None:
+            opt_args += [str(dB1)]
+
+        if T1 is not None:
+            flag_args += ['--T1', str(T1)]
+
+        if T2 is not None:
+            flag_args += ['--T2', str(T2)]
+
+        if ROT is not None:
+            flag_args += ['--ROT']
+
+        if ODE is not None:
+            flag_args += ['--ODE']
+
+        if STM is not None:
+            flag_args += ['--STM']
+
+        if split_dim is not None:
+            flag_args += ['--split-dim']
+
+        if seq is not None:
+            flag_args += ['--seq', str(seq)]
+
+        if other is not None:
+            flag_args += ['--other', str(other)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [NAME + 'signal__Mxy']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'signal__Mxy', lazy, out)
+        return outputs
+
+async def slice(input, dim, pos, lazy=False, out=None, backend=None):
+    """
+    Extracts a slice from positions along dimensions.
+
+    :param dim multituple:
+    :param pos multituple:
+    :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "lice dim1 pos1 ... dimN posN input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'slice']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        multituples.append(dim)
+    
+        multituples.append(pos)
+    
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def spow(input, exponent, lazy=False, out=None, backend=None):
+    """
+    Raise array to the power of {exponent}. The exponent can be a complex number.
+
+    :param exponent CFL:
+    :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "pow exponent input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'spow']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(exponent), await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def sqpics(kspace, sensitivities, l=None, r=None, R=None, s=None, i=None, t=None, n=None, g=None, p=None, I=None, b=None, e=None, H=None, F=None, T=None, W=None, d=None, u=None, C=None, f=None, m=None, w=None, S=None, lazy=False, out=None, backend=None):
+    """
+    Parallel-imaging compressed-sensing reconstruction.
+
+    :param kspace array:
+    :param sensitivities array:
+    :param l SPECIAL: toggle l1-wavelet or l2 regularization.
+    :param r float: regularization parameter
+    :param R SPECIAL: generalized regularization options (-Rh for help)
+    :param s float: iteration stepsize
+    :param i int: max. number of iterations
+    :param t array: k-space trajectory
+    :param n bool: disable random wavelet cycle spinning
+    :param g bool: use GPU
+    :param p array: pattern or weights
+    :param I bool: (select IST)
+    :param b int: Lowrank block size
+    :param e bool: Scale stepsize based on max. eigenvalue
+    :param H bool: (hogwild)
+    :param F bool: (fast)
+    :param T array: (truth file)
+    :param W array: Warm start with <img>
+    :param d int: Debug level
+    :param u float: ADMM rho
+    :param C int: ADMM max. CG iterations
+    :param f float: restrict FOV
+    :param m bool: Select ADMM
+    :param w float: scaling
+    :param S bool: Re-scale the image after reconstruction
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "qpics [-l ...] [-r f] [-R ...] [-s f] [-i d] [-t file] [-n] [-g] [-p file] [-b d] [-e] [-W file] [-d d] [-u f] [-C d] [-f f] [-m] [-w f] [-S] kspace sensitivities output"
+
+    async with scratch.anamespace(kspace, sensitivities, t, p, T, W, backend=backend) as NAME:
+        staged = await scratch.astage_all(NAME, {'kspace': kspace, 'sensitivities': sensitivities, 't': t, 'p': p, 'T': T, 'W': W})
+
+        argv = [BART_PATH, 'sqpics']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if l is not None:
+            flag_args += ['-l', str(l)]
+
+        if r is not None:
+            flag_args += ['-r', str(r)]
+
+        if R is not None:
+            flag_args += ['-R', str(R)]
+
+        if s is not None:
+            flag_args += ['-s', str(s)]
+
+        if i is not None:
+            flag_args += ['-i', str(i)]
+
+        if not isinstance(t, type(None)):
+            flag_args += ['-t', staged['t']]
+
+        if n is not None:
+            flag_args += ['-n']
+
+        if g is not None:
+            flag_args += ['-g']
+
+        if not isinstance(p, type(None)):
+            flag_args += ['-p', staged['p']]
+
+        if I is not None:
+            flag_args += ['-I']
+
+        if b is not None:
+            flag_args += ['-b', str(b)]
+
+        if e is not None:
+            flag_args += ['-e']
+
+        if H is not None:
+            flag_args += ['-H']
+
+        if F is not None:
+            flag_args += ['-F']
+
+        if not isinstance(T, type(None)):
+            flag_args += ['-T', staged['T']]
+
+        if not isinstance(W, type(None)):
+            flag_args += ['-W', staged['W']]
+
+        if d is not None:
+            flag_args += ['-d', str(d)]
+
+        if u is not None:
+            flag_args += ['-u', str(u)]
+
+        if C is not None:
+            flag_args += ['-C', str(C)]
+
+        if f is not None:
+            flag_args += ['-f', str(f)]
+
+        if m is not None:
+            flag_args += ['-m']
+
+        if w is not None:
+            flag_args += ['-w', str(w)]
+
+        if S is not None:
+            flag_args += ['-S']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['kspace'], staged['sensitivities'], NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def squeeze(input, lazy=False, out=None, backend=None):
+    """
+    Remove singleton dimensions of array.
+
+    :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "queeze input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'squeeze']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def ssa(src, w=None, z=None, m=None, n=None, r=None, g=None, lazy=False, out=None, backend=None):
+    """
+    Perform SSA-FARY or Singular Spectrum Analysis. <src>: [samples, coordinates]
+
+    :param src array:
+    :param w int: Window length
+    :param z bool: Zeropadding [Default: True]
+    :param m int: Remove mean [Default: True]
+    :param n int: Normalize [Default: False]
+    :param r int: Rank for backprojection. r < 0: Throw away first r components. r > 0: Use only first r components.
+    :param g long: Bitmask for Grouping (long value!)
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "[-w d] [-z] [-m d] [-n d] [-r d] [-g d] src EOF [S] [backprojection]"
+
+    async with scratch.anamespace(src, backend=backend) as NAME:
+        argv = [BART_PATH, 'ssa']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if w is not None:
+            flag_args += ['-w', str(w)]
+
+        if z is not None:
+            flag_args += ['-z']
+
+        if m is not None:
+            flag_args += ['-m', str(m)]
+
+        if n is not None:
+            flag_args += ['-n', str(n)]
+
+        if r is not None:
+            flag_args += ['-r', str(r)]
+
+        if g is not None:
+            flag_args += ['-g', str(g)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'src', src), NAME + 'EOF', NAME + 'S', NAME + 'backprojection']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch_all([NAME + 'EOF', NAME + 'S', NAME + 'backprojection'], lazy, out)
+        return outputs
+
+async def std(input, bitmask, lazy=False, out=None, backend=None):
+    """
+    Compute standard deviation along selected dimensions specified by the {bitmask}
+
+    :param bitmask long:
+    :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "td bitmask input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'std']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(bitmask), await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def svd(input, e=None, lazy=False, out=None, backend=None):
+    """
+    Compute singular-value-decomposition (SVD).
+
+    :param input array:
+    :param e bool: econ
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "vd [-e] input U S VH"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'svd']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if e is not None:
+            flag_args += ['-e']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'input', input), NAME + 'U', NAME + 'S', NAME + 'VH']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch_all([NAME + 'U', NAME + 'S', NAME + 'VH'], lazy, out)
+        return outputs
+
+async def tgv(input, llambda, flags, lazy=False, out=None, backend=None):
+    """
+    Perform total generalized variation denoising along dims specified by flags.
+
+    :param llambda float:
+    :param flags int:
+    :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "tgv lambda flags input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'tgv']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(llambda), str(flags), await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def threshold(input, llambda, H=None, W=None, L=None, D=None, B=None, j=None, b=None, lazy=False, out=None, backend=None):
+    """
+    Perform (soft) thresholding with parameter lambda.
+
+    :param llambda float:
+    :param input array:
+    :param H bool: hard thresholding
+    :param W bool: daubechies wavelet soft-thresholding
+    :param L bool: locally low rank soft-thresholding
+    :param D bool: divergence-free wavelet soft-thresholding
+    :param B bool: thresholding with binary output
+    :param j int: joint soft-thresholding
+    :param b int: locally low rank block size
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "threshold [-H] [-W] [-L] [-D] [-B] [-j d] [-b d] lambda input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'threshold']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if H is not None:
+            flag_args += ['-H']
+
+        if W is not None:
+            flag_args += ['-W']
+
+        if L is not None:
+            flag_args += ['-L']
+
+        if D is not None:
+            flag_args += ['-D']
+
+        if B is not None:
+            flag_args += ['-B']
+
+        if j is not None:
+            flag_args += ['-j', str(j)]
+
+        if b is not None:
+            flag_args += ['-b', str(b)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(llambda), await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def toimg(input, g=None, c=None, w=None, d=None, m=None, W=None, lazy=False, out=None, backend=None):
+    """
+    Create magnitude images as png or proto-dicom.
+The first two non-singleton dimensions will
+be used for the image, and the other dimensions
+will be looped over.
+
+    :param input array:
+    :param g float: gamma level
+    :param c float: contrast level
+    :param w float: window level
+    :param d bool: write to dicom format (deprecated use extension .dcm)
+    :param m bool: re-scale each image
+    :param W bool: use dynamic windowing
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "toimg [-g f] [-c f] [-w f] [-d] [-m] [-W] input output prefix"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'toimg']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if g is not None:
+            flag_args += ['-g', str(g)]
+
+        if c is not None:
+            flag_args += ['-c', str(c)]
+
+        if w is not None:
+            flag_args += ['-w', str(w)]
+
+        if d is not None:
+            flag_args += ['-d']
+
+        if m is not None:
+            flag_args += ['-m']
+
+        if W is not None:
+            flag_args += ['-W']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'input', input), NAME + 'output_prefix']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output_prefix', lazy, out)
+        return outputs
+
+async def traj(x=None, y=None, d=None, e=None, a=None, t=None, m=None, l=None, g=None, r=None, G=None, H=None, s=None, D=None, o=None, R=None, q=None, Q=None, O=None, _3=None, c=None, E=None, z=None, C=None, V=None, lazy=False, out=None, backend=None):
+    """
+    Computes k-space trajectories.
+
+    :param x int: readout samples
+    :param y int: phase encoding lines
+    :param d int: full readout samples
+    :param e int: number of echoes
+    :param a int: acceleration
+    :param t int: turns
+    :param m int: SMS multiband factor
+    :param l bool: aligned partition angle
+    :param g bool: golden angle in partition direction
+    :param r bool: radial
+    :param G bool: golden-ratio sampling
+    :param H bool: halfCircle golden-ratio sampling
+    :param s int: tiny golden angle
+    :param D bool: projection angle in [0 360°) else in [0 180°)
+    :param o float: oversampling factor
+    :param R float: rotate
+    :param q FLOAT_VEC3: gradient delays: x y xy
+    :param Q FLOAT_VEC3: (gradient delays: z xz yz)
+    :param O bool: correct transverse gradient error for radial tajectories
+    :param _3 bool: 3D
+    :param c bool: asymmetric trajectory [DC sampled]
+    :param E bool: multi-echo multi-spoke trajectory
+    :param z VEC2: Undersampling in z-direction.
+    :param C array: custom_angle file [phi + i * psi]
+    :param V array: (custom_gdelays)
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "traj [-x d] [-y d] [-d d] [-e d] [-a d] [-t d] [-m d] [-l] [-g] [-r] [-G] [-H] [-s d] [-D] [-o f] [-R f] [-q f:f:f] [-O] [-3] [-c] [-E] [-z d:d] [-C file] output"
+
+    async with scratch.anamespace(C, V, backend=backend) as NAME:
+        staged = await scratch.astage_all(NAME, {'C': C, 'V': V})
+
+        argv = [BART_PATH, 'traj']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if x is not None:
+            flag_args += ['-x', str(x)]
+
+        if y is not None:
+            flag_args += ['-y', str(y)]
+
+        if d is not None:
+            flag_args += ['-d', str(d)]
+
+        if e is not None:
+            flag_args += ['-e', str(e)]
+
+        if a is not None:
+            flag_args += ['-a', str(a)]
+
+        if t is not None:
+            flag_args += ['-t', str(t)]
+
+        if m is not None:
+            flag_args += ['-m', str(m)]
+
+        if l is not None:
+            flag_args += ['-l']
+
+        if g is not None:
+            flag_args += ['-g']
+
+        if r is not None:
+            flag_args += ['-r']
+
+        if G is not None:
+            flag_args += ['-G']
+
+        if H is not None:
+            flag_args += ['-H']
+
+        if s is not None:
+            flag_args += ['-s', str(s)]
+
+        if D is not None:
+            flag_args += ['-D']
+
+        if o is not None:
+            flag_args += ['-o', str(o)]
+
+        if R is not None:
+            flag_args += ['-R', str(R)]
+
+        if q is not None:
+            flag_args += ['-q', str(q)]
+
+        if Q is not None:
+            flag_args += ['-Q', str(Q)]
+
+        if O is not None:
+            flag_args += ['-O']
+
+        if _3 is not None:
+            flag_args += ['-3']
+
+        if c is not None:
+            flag_args += ['-c']
+
+        if E is not None:
+            flag_args += ['-E']
+
+        if z is not None:
+            flag_args += ['-z', str(z)]
+
+        if not isinstance(C, type(None)):
+            flag_args += ['-C', staged['C']]
+
+        if not isinstance(V, type(None)):
+            flag_args += ['-V', staged['V']]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def transpose(input, dim1, dim2, lazy=False, out=None, backend=None):
+    """
+    Transpose dimensions {dim1} and {dim2}.
+
+    :param dim1 int:
+    :param dim2 int:
+    :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "transpose dim1 dim2 input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'transpose']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(dim1), str(dim2), await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def twixread(dat_file, x=None, r=None, y=None, z=None, s=None, v=None, c=None, n=None, a=None, A=None, L=None, P=None, M=None, d=None, lazy=False, out=None, backend=None):
+    """
+    Read data from Siemens twix (.dat) files.
+
+    :param dat_file array:
+    :param x long: number of samples (read-out)
+    :param r long: radial lines
+    :param y long: phase encoding steps
+    :param z long: partition encoding steps
+    :param s long: number of slices
+    :param v long: number of averages
+    :param c long: number of channels
+    :param n long: number of repetitions
+    :param a long: total number of ADCs
+    :param A bool: automatic [guess dimensions]
+    :param L bool: use linectr offset
+    :param P bool: use partctr offset
+    :param M bool: MPI mode
+    :param d int: Debug level
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "twixread [-x d] [-r d] [-y d] [-z d] [-s d] [-v d] [-c d] [-n d] [-a d] [-A] [-L] [-P] [-M] [-d d] dat file output"
+
+    async with scratch.anamespace(dat_file, backend=backend) as NAME:
+        argv = [BART_PATH, 'twixread']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if x is not None:
+            flag_args += ['-x', str(x)]
+
+        if r is not None:
+            flag_args += ['-r', str(r)]
+
+        if y is not None:
+            flag_args += ['-y', str(y)]
+
+        if z is not None:
+            flag_args += ['-z', str(z)]
+
+        if s is not None:
+            flag_args += ['-s', str(s)]
+
+        if v is not None:
+            flag_args += ['-v', str(v)]
+
+        if c is not None:
+            flag_args += ['-c', str(c)]
+
+        if n is not None:
+            flag_args += ['-n', str(n)]
+
+        if a is not None:
+            flag_args += ['-a', str(a)]
+
+        if A is not None:
+            flag_args += ['-A']
+
+        if L is not None:
+            flag_args += ['-L']
+
+        if P is not None:
+            flag_args += ['-P']
+
+        if M is not None:
+            flag_args += ['-M']
+
+        if d is not None:
+            flag_args += ['-d', str(d)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'dat_file', dat_file), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def upat(Y=None, Z=None, y=None, z=None, c=None, lazy=False, out=None, backend=None):
+    """
+    Create a sampling pattern.
+
+    :param Y long: size Y
+    :param Z long: size Z
+    :param y int: undersampling y
+    :param z int: undersampling z
+    :param c int: size of k-space center
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "upat [-Y d] [-Z d] [-y d] [-z d] [-c d] output"
+
+    async with scratch.anamespace(backend=backend) as NAME:
+        argv = [BART_PATH, 'upat']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if Y is not None:
+            flag_args += ['-Y', str(Y)]
+
+        if Z is not None:
+            flag_args += ['-Z', str(Z)]
+
+        if y is not None:
+            flag_args += ['-y', str(y)]
+
+        if z is not None:
+            flag_args += ['-z', str(z)]
+
+        if c is not None:
+            flag_args += ['-c', str(c)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def var(input, bitmask, lazy=False, out=None, backend=None):
+    """
+    Compute variance along selected dimensions specified by the {bitmask}
+
+    :param bitmask long:
+    :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "var bitmask input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'var']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(bitmask), await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def vec(val, lazy=False, out=None, backend=None):
+    """
+    Create a vector of values.
+
+    :param val tuple:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "vec val1 ... valN output"
+
+    async with scratch.anamespace(backend=backend) as NAME:
+        argv = [BART_PATH, 'vec']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [*[str(arg) for arg in val], NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def version(t=None, V=None):
+    """
+    Print BART version. The version string is of the form
+TAG or TAG-COMMITS-SHA as produced by 'git describe'. It
+specifies the last release (TAG), and (if git is used)
+the number of commits (COMMITS) since this release and
+the abbreviated hash of the last commit (SHA). If there
+are local changes '-dirty' is added at the end.
+
+    :param t STRING: Check minimum version
+    :param V bool: Output verbose info
+
+    """
+    usage_string = "version [-t string] [-V]"
+
+    async with scratch.anamespace() as NAME:
+        argv = [BART_PATH, 'version']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if t is not None:
+            flag_args += ['-t', str(t)]
+
+        if V is not None:
+            flag_args += ['-V']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+async def walsh(input, r=None, R=None, b=None, B=None, lazy=False, out=None, backend=None):
+    """
+    Estimate coil sensitivities using walsh method (use with ecaltwo).
+
+    :param input array:
+    :param r list: Limits the size of the calibration region.
+    :param R list: ()
+    :param b list: Block size.
+    :param B list: ()
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "walsh [-r d:d:d] [-b d:d:d] input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'walsh']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if r is not None:
+            flag_args += ['-r', ":".join([str(x) for x in r])]
+
+        if R is not None:
+            flag_args += ['-R', ":".join([str(x) for x in R])]
+
+        if b is not None:
+            flag_args += ['-b', ":".join([str(x) for x in b])]
+
+        if B is not None:
+            flag_args += ['-B', ":".join([str(x) for x in B])]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def wave(maps, wave, kspace, r=None, b=None, i=None, s=None, c=None, t=None, e=None, g=None, f=None, H=None, v=None, w=None, l=None, lazy=False, out=None, backend=None):
+    """
+    Perform a wave-caipi reconstruction.
+
+Conventions:
+  * (sx, sy, sz) - Spatial dimensions.
+  * wx           - Extended FOV in READ_DIM due to
+                   wave's voxel spreading.
+  * (nc, md)     - Number of channels and ESPIRiT's 
+                   extended-SENSE model operator
+                   dimensions (or # of maps).
+Expected dimensions:
+  * maps    - ( sx, sy, sz, nc, md)
+  * wave    - ( wx, sy, sz,  1,  1)
+  * kspace  - ( wx, sy, sz, nc,  1)
+  * output  - ( sx, sy, sz,  1, md)
+
+    :param maps array:
+    :param wave array:
+    :param kspace array:
+    :param r float: Soft threshold lambda for wavelet or locally low rank.
+    :param b int: Block size for locally low rank.
+    :param i int: Maximum number of iterations.
+    :param s float: Step size for iterative method.
+    :param c float: Continuation value for IST/FISTA.
+    :param t float: Tolerance convergence condition for iterative method.
+    :param e float: Maximum eigenvalue of normal operator if known.
+    :param g bool: use GPU
+    :param f bool: Reconstruct using FISTA instead of IST.
+    :param H bool: Use hogwild in IST/FISTA.
+    :param v bool: Split result to real and imaginary components.
+    :param w bool: Use wavelet.
+    :param l bool: Use locally low rank across the real and imaginary components.
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "wave [-r f] [-b d] [-i d] [-s f] [-c f] [-t f] [-e f] [-g] [-f] [-H] [-v] [-w] [-l] maps wave kspace output"
+
+    async with scratch.anamespace(maps, wave, kspace, backend=backend) as NAME:
+        staged = await scratch.astage_all(NAME, {'maps': maps, 'wave': wave, 'kspace': kspace})
+
+        argv = [BART_PATH, 'wave']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if r is not None:
+            flag_args += ['-r', str(r)]
+
+        if b is not None:
+            flag_args += ['-b', str(b)]
+
+        if i is not None:
+            flag_args += ['-i', str(i)]
+
+        if s is not None:
+            flag_args += ['-s', str(s)]
+
+        if c is not None:
+            flag_args += ['-c', str(c)]
+
+        if t is not None:
+            flag_args += ['-t', str(t)]
+
+        if e is not None:
+            flag_args += ['-e', str(e)]
+
+        if g is not None:
+            flag_args += ['-g']
+
+        if f is not None:
+            flag_args += ['-f']
+
+        if H is not None:
+            flag_args += ['-H']
+
+        if v is not None:
+            flag_args += ['-v']
+
+        if w is not None:
+            flag_args += ['-w']
+
+        if l is not None:
+            flag_args += ['-l']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['maps'], staged['wave'], staged['kspace'], NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def wavelet(input, bitmask, dim=None, a=None, H=None, D=None, C=None, lazy=False, out=None, backend=None):
+    """
+    Perform wavelet transform.
+
+    :param bitmask int:
+    :param input array:
+    :param dim tuple: None
+    :param a bool: adjoint (specify dims)
+    :param H bool: type: Haar
+    :param D bool: type: Dau2
+    :param C bool: type: CDF44
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "wavelet [-a] [-H] [-D] [-C] bitmask [dim1 ... dimN ] input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'wavelet']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if dim != None:
+            opt_args += [str(arg) for arg in dim]
+
+        if a is not None:
+            flag_args += ['-a']
+
+        if H is not None:
+            flag_args += ['-H']
+
+        if D is not None:
+            flag_args += ['-D']
+
+        if C is not None:
+            flag_args += ['-C']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(bitmask), await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def wavepsf(c=None, x=None, y=None, r=None, a=None, t=None, g=None, s=None, n=None, lazy=False, out=None, backend=None):
+    """
+    Generate a wave PSF in hybrid space.
+- Assumes the first dimension is the readout dimension.
+- Only generates a 2 dimensional PSF.
+- Use reshape and fmac to generate a 3D PSF.
+
+3D PSF Example:
+bart wavepsf        -x 768 -y 128 -r 0.1 -a 3000 -t 0.00001 -g 0.8 -s 17000 -n 6 wY
+bart wavepsf -c -x 768 -y 128 -r 0.1 -a 3000 -t 0.00001 -g 0.8 -s 17000 -n 6 wZ
+bart reshape 7 wZ 768 1 128 wZ wZ
+bart fmac wY wZ wYZ
+
+    :param c bool: Set to use a cosine gradient wave
+    :param x int: Number of readout points
+    :param y int: Number of phase encode points
+    :param r float: Resolution of phase encode in cm
+    :param a int: Readout duration in microseconds.
+    :param t float: ADC sampling rate in seconds
+    :param g float: Maximum gradient amplitude in Gauss/cm
+    :param s float: Maximum gradient slew rate in Gauss/cm/second
+    :param n int: Number of cycles in the gradient wave
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "wavepsf [-c] [-x d] [-y d] [-r f] [-a d] [-t f] [-g f] [-s f] [-n d] output"
+
+    async with scratch.anamespace(backend=backend) as NAME:
+        argv = [BART_PATH, 'wavepsf']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if c is not None:
+            flag_args += ['-c']
+
+        if x is not None:
+            flag_args += ['-x', str(x)]
+
+        if y is not None:
+            flag_args += ['-y', str(y)]
+
+        if r is not None:
+            flag_args += ['-r', str(r)]
+
+        if a is not None:
+            flag_args += ['-a', str(a)]
+
+        if t is not None:
+            flag_args += ['-t', str(t)]
+
+        if g is not None:
+            flag_args += ['-g', str(g)]
+
+        if s is not None:
+            flag_args += ['-s', str(s)]
+
+        if n is not None:
+            flag_args += ['-n', str(n)]
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def whiten(input, ndata, o=None, c=None, n=None, lazy=False, out=None, backend=None):
+    """
+    Apply multi-channel noise pre-whitening on <input> using noise data <ndata>.
+Optionally output whitening matrix and noise covariance matrix
+
+    :param input array:
+    :param ndata array:
+    :param o array: use external whitening matrix <optmat_in>
+    :param c array: use external noise covariance matrix <covar_in>
+    :param n bool: normalize variance to 1 using noise data <ndata>
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "whiten [-o file] [-c file] [-n] input ndata output [optmat_out] [covar_out]"
+
+    async with scratch.anamespace(input, ndata, o, c, backend=backend) as NAME:
+        staged = await scratch.astage_all(NAME, {'input': input, 'ndata': ndata, 'o': o, 'c': c})
+
+        argv = [BART_PATH, 'whiten']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if not isinstance(o, type(None)):
+            flag_args += ['-o', staged['o']]
+
+        if not isinstance(c, type(None)):
+            flag_args += ['-c', staged['c']]
+
+        if n is not None:
+            flag_args += ['-n']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['input'], staged['ndata'], NAME + 'output', NAME + 'optmat_out', NAME + 'covar_out']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch_all([NAME + 'output', NAME + 'optmat_out', NAME + 'covar_out'], lazy, out)
+        return outputs
+
+async def window(input, flags, H=None, lazy=False, out=None, backend=None):
+    """
+    Apply Hamming (Hann) window to <input> along dimensions specified by flags
+
+    :param flags long:
+    :param input array:
+    :param H bool: Hann window
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "window [-H] flags input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'window']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if H is not None:
+            flag_args += ['-H']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(flags), await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def wshfl(maps, wave, phi, reorder, table, R=None, b=None, i=None, j=None, s=None, e=None, F=None, O=None, t=None, g=None, K=None, H=None, v=None, lazy=False, out=None, backend=None):
+    """
+    Perform a wave-shuffling reconstruction.
+
+Conventions:
+  * (sx, sy, sz) - Spatial dimensions.
+  * wx           - Extended FOV in READ_DIM due to
+                   wave's voxel spreading.
+  * (nc, md)     - Number of channels and ESPIRiT's 
+                   extended-SENSE model operator
+                   dimensions (or # of maps).
+  * (tf, tk)     - Turbo-factor and the rank
+                   of the temporal basis used in
+                   shuffling.
+  * ntr          - Number of TRs, or the number of
+                   (ky, kz) points acquired of one
+                   echo image.
+  * n            - Total number of (ky, kz) points
+                   acquired. This is equal to the
+                   product of ntr and tf.
+
+Descriptions:
+  * reorder is an (n by 3) index matrix such that
+    [ky, kz, t] = reorder(i, :) represents the
+    (ky, kz) kspace position of the readout line
+    acquired at echo number (t), and 0 <= ky < sy,
+    0 <= kz < sz, 0 <= t < tf).
+  * table is a (wx by nc by n) matrix such that
+    table(:, :, k) represents the kth multichannel
+    kspace line.
+
+Expected dimensions:
+  * maps    - (   sx, sy, sz, nc, md,  1,  1)
+  * wave    - (   wx, sy, sz,  1,  1,  1,  1)
+  * phi     - (    1,  1,  1,  1,  1, tf, tk)
+  * output  - (   sx, sy, sz,  1, md,  1, tk)
+  * reorder - (    n,  3,  1,  1,  1,  1,  1)
+  * table   - (   wx, nc,  n,  1,  1,  1,  1)
+
+    :param maps array:
+    :param wave array:
+    :param phi array:
+    :param reorder array:
+    :param table array:
+    :param R SPECIAL: Generalized regularization options. (-Rh for help)
+    :param b int: Block size for locally low rank.
+    :param i int: Maximum number of iterations.
+    :param j int: Maximum number of CG iterations in ADMM.
+    :param s float: ADMM Rho value.
+    :param e float: Eigenvalue to scale step size. (Optional.)
+    :param F array: Go from shfl-coeffs to data-table. Pass in coeffs path.
+    :param O array: Initialize reconstruction with guess.
+    :param t float: Tolerance convergence condition for FISTA.
+    :param g bool: Use GPU.
+    :param K bool: Go from data-table to shuffling basis k-space.
+    :param H bool: Use hogwild.
+    :param v bool: Split coefficients to real and imaginary components.
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "wshfl [-R ...] [-b d] [-i d] [-j d] [-s f] [-e f] [-F file] [-O file] [-t f] [-g] [-K] [-H] [-v] maps wave phi reorder table output"
+
+    async with scratch.anamespace(maps, wave, phi, reorder, table, F, O, backend=backend) as NAME:
+        staged = await scratch.astage_all(NAME, {'maps': maps, 'wave': wave, 'phi': phi, 'reorder': reorder, 'table': table, 'F': F, 'O': O})
+
+        argv = [BART_PATH, 'wshfl']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if R is not None:
+            flag_args += ['-R', str(R)]
+
+        if b is not None:
+            flag_args += ['-b', str(b)]
+
+        if i is not None:
+            flag_args += ['-i', str(i)]
+
+        if j is not None:
+            flag_args += ['-j', str(j)]
+
+        if s is not None:
+            flag_args += ['-s', str(s)]
+
+        if e is not None:
+            flag_args += ['-e', str(e)]
+
+        if not isinstance(F, type(None)):
+            flag_args += ['-F', staged['F']]
+
+        if not isinstance(O, type(None)):
+            flag_args += ['-O', staged['O']]
+
+        if t is not None:
+            flag_args += ['-t', str(t)]
+
+        if g is not None:
+            flag_args += ['-g']
+
+        if K is not None:
+            flag_args += ['-K']
+
+        if H is not None:
+            flag_args += ['-H']
+
+        if v is not None:
+            flag_args += ['-v']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['maps'], staged['wave'], staged['phi'], staged['reorder'], staged['table'], NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def zeros(dims, dim, lazy=False, out=None, backend=None):
+    """
+    Create a zero-filled array with {dims} dimensions of size {dim1} to {dimn}.
+
+    :param dims long:
+    :param dim tuple:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "zeros dims dim1 ... dimN output"
+
+    async with scratch.anamespace(backend=backend) as NAME:
+        argv = [BART_PATH, 'zeros']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(dims), *[str(arg) for arg in dim], NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
+async def zexp(input, i=None, lazy=False, out=None, backend=None):
+    """
+    Point-wise complex exponential.
+
+    :param input array:
+    :param i bool: imaginary
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
+
+    """
+    usage_string = "zexp [-i] input output"
+
+    async with scratch.anamespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'zexp']
+        flag_args = []
+
+        opt_args = []
+
+        multituples = []
+
+        if i is not None:
+            flag_args += ['-i']
+        argv += flag_args + opt_args
+
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [await scratch.astage(NAME + 'input', input), NAME + 'output']
+
+        if DEBUG:
+            print(' '.join(argv))
+
+
+        await launch.arun(argv)
+
+        outputs = await scratch.afetch(NAME + 'output', lazy, out)
+        return outputs
+
@@ -0,0 +1,215 @@
+# Opt-in on-disk memoization of deterministic BART tool calls
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import subprocess
+import threading
+import time
+
+import numpy as np
+
+from ..utils import cfl
+from ..utils.scratch import hash_array
+from .tools import BART_PATH
+
+INDEX_FILE = 'index.json'
+
+# access times updated by hits are written to the index at most once per this many hits, and by every `put`
+SAVE_EVERY_HITS = 64
+
+
+@functools.lru_cache(maxsize=None)
+def bart_version():
+    """
+    Version string of the installed BART, part of every cache key
+    """
+    out = subprocess.run([BART_PATH, 'version'], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    return out.stdout.decode('utf-8').strip()
+
+
+def canonicalize(value):
+    """
+    Convert a tool argument into a JSON-serializable form that is identical for equal arguments
+    """
+    if isinstance(value, (np.ndarray, cfl.LazyCfl)):
+        return {'array': hash_array(np.asarray(value))}
+    if isinstance(value, (list, tuple)):
+        return [canonicalize(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, complex):
+        return [value.real, value.imag]
+    return value
+
+
+def copy_into(outputs, out):
+    """
+    Copy cached outputs into the `out` arrays a tool call asked for
+    """
+    if isinstance(outputs, tuple):
+        return tuple(o if dst is None else copy_into(o, dst) for o, dst in zip(outputs, out))
+    np.copyto(out, outputs.reshape(out.shape))
+    return out
+
+
+class ToolCache:
+    """
+    Size-bounded on-disk store of tool outputs with LRU eviction
+
+    Only wrap tools whose outputs depend on nothing but their arguments,
+    e.g. `ecalib`, `traj`, `phantom`, `pattern`, or `poisson` with a fixed seed:
+
+        store = ToolCache('/path/to/cache', max_bytes=2**30)
+        ecalib = store.memoize(tools.ecalib)
+
+    Cached outputs are returned as arrays, also when `lazy=True` is passed,
+    and are copied into `out` when it is given.
+    """
+
+    def __init__(self, path, max_bytes=2**32):
+        """
+        :param path: cache directory, created if needed and shared by all tools wrapped by this cache
+        :param max_bytes: least recently used entries are evicted when the outputs exceed this size
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._unsaved_hits = 0
+        self._lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+        self._index = self._load_index()
+
+    def _load_index(self):
+        try:
+            with open(os.path.join(self.path, INDEX_FILE)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self):
+        self._unsaved_hits = 0
+        tmp_name = os.path.join(self.path, f'{INDEX_FILE}.{os.getpid()}.{threading.get_ident()}')
+        with open(tmp_name, 'w') as f:
+            json.dump(self._index, f)
+        os.replace(tmp_name, os.path.join(self.path, INDEX_FILE))
+
+    def _name(self, key, i):
+        return os.path.join(self.path, f'{key}_{i}')
+
+    def key(self, tool, *args, **kwargs):
+        """
+        Cache key combining the tool name, its canonicalized arguments and the BART version
+        """
+        bound = inspect.signature(tool).bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = {name: canonicalize(value) for name, value in bound.arguments.items() if name not in ('lazy', 'out', 'backend')}
+        key = json.dumps([tool.__name__, arguments, bart_version()], sort_keys=True)
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """
+        :returns: cached outputs for `key`, or None on a miss
+
+        Outputs are read without holding the cache lock, so concurrent hits do not queue up behind each other.
+        """
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+        try:
+            outputs = [cfl.readcfl(self._name(key, i)) for i in range(entry['outputs'])]
+        except (OSError, ValueError):
+            # evicted by another thread, or removed from the directory
+            with self._lock:
+                if self._index.get(key) is entry:
+                    self._remove(key)
+                self.misses += 1
+            return None
+        with self._lock:
+            entry['atime'] = time.time()
+            self.hits += 1
+            self._unsaved_hits += 1
+            if self._unsaved_hits >= SAVE_EVERY_HITS:
+                self._save_index()
+        return tuple(outputs) if entry['tuple'] else outputs[0]
+
+    def put(self, key, outputs):
+        """
+        Store the outputs of a call and evict least recently used entries beyond `max_bytes`
+
+        Outputs already stored by a concurrent call with the same key are kept, since hits may be reading them.
+        """
+        is_tuple = isinstance(outputs, tuple)
+        outputs = outputs if is_tuple else (outputs,)
+        with self._lock:
+            if key in self._index:
+                return
+            nbytes = 0
+            for i, output in enumerate(outputs):
+                cfl.writecfl(self._name(key, i), np.asarray(output))
+                nbytes += os.path.getsize(self._name(key, i) + '.cfl')
+            self._index[key] = {'outputs': len(outputs), 'tuple': is_tuple, 'bytes': nbytes, 'atime': time.time()}
+            self._evict()
+            self._save_index()
+
+    def _remove(self, key):
+        entry = self._index.pop(key)
+        for i in range(entry['outputs']):
+            for ext in ('.cfl', '.hdr'):
+                if os.path.isfile(self._name(key, i) + ext):
+                    os.remove(self._name(key, i) + ext)
+        return entry
+
+    def _evict(self):
+        total = sum(entry['bytes'] for entry in self._index.values())
+        for key in sorted(self._index, key=lambda k: self._index[k]['atime']):
+            if total <= self.max_bytes:
+                break
+            total -= self._remove(key)['bytes']
+            self.evictions += 1
+
+    def memoize(self, tool):
+        """
+        Wrap a function from `bartpy.tools` so that repeated calls with the same arguments are served from the cache
+        """
+        @functools.wraps(tool)
+        def cached_tool(*args, **kwargs):
+            key = self.key(tool, *args, **kwargs)
+            outputs = self.get(key)
+            if outputs is None:
+                outputs = tool(*args, **kwargs)
+                if outputs is not None:
+                    self.put(key, outputs)
+            elif kwargs.get('out') is not None:
+                outputs = copy_into(outputs, kwargs['out'])
+            return outputs
+
+        return cached_tool
+
+    def stats(self):
+        """
+        :returns: dictionary of hit/miss/eviction counts and the current size of the cache
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._index),
+                'bytes': sum(entry['bytes'] for entry in self._index.values()),
+            }
+
+    def clear(self):
+        """
+        Remove every entry from the cache
+        """
+        with self._lock:
+            for key in list(self._index):
+                self._remove(key)
+            self._save_index()
@@ -0,0 +1,75 @@
+# Run BART tools independently over the positions of one dimension
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from ..utils.cfl import trim_dims
+from ..utils import threads as thread_budget
+from ..utils.threads import limit
+
+
+def split_dim(array, dim, n):
+    """
+    Split `array` into `n` single positions along `dim`
+
+    Arrays of size 1 along `dim` (including those with fewer dimensions) are shared by every position.
+    """
+    array = np.asarray(array)
+    if array.ndim <= dim or array.shape[dim] == 1:
+        return [array] * n
+    index = (slice(None),) * dim
+    return [array[index + (slice(i, i + 1),)] for i in range(n)]
+
+
+def join_dim(arrays, dim):
+    """
+    Concatenate `arrays` along `dim`, like `bart join`
+
+    Trailing singleton dimensions trimmed by `readcfl` are restored first and trimmed again afterwards.
+    """
+    arrays = [np.asarray(a) for a in arrays]
+    arrays = [a.reshape(a.shape + (1,) * (dim + 1 - a.ndim)) for a in arrays]
+    joined = np.concatenate(arrays, axis=dim)
+    return joined.reshape(trim_dims(list(joined.shape)), order='F')
+
+
+def map_dim(tool, arrays, dim, workers=None, threads=None, **kwargs):
+    """
+    Apply a BART tool independently to every position along a dimension, in parallel
+
+    e.g., `map_dim(pics, (kspace, sensitivities), 13, workers=8, r=0.01)` reconstructs each slice separately.
+
+    :param tool: function from `bartpy.tools`
+    :param arrays: input array, or sequence of input arrays passed positionally to `tool`
+    :param dim: BART dimension to split along. Inputs of size 1 along `dim` are passed whole to every call
+    :param workers: number of concurrent calls. Defaults to the number of CPUs
+    :param threads: OpenMP threads per call. Defaults to an even share of the thread budget among the workers
+    :param kwargs: further arguments for `tool`
+
+    :returns: outputs of `tool` joined along `dim`
+    """
+    if isinstance(arrays, np.ndarray) or not isinstance(arrays, (list, tuple)):
+        arrays = (arrays,)
+
+    sizes = {np.shape(a)[dim] for a in arrays if np.ndim(a) > dim} - {1}
+    if len(sizes) > 1:
+        raise ValueError(f"Inputs have different sizes {sorted(sizes)} along dimension {dim}")
+    n = sizes.pop() if sizes else 1
+
+    workers = min(workers or os.cpu_count() or 1, n)
+    threads = threads or max(1, thread_budget.THREAD_BUDGET // workers)
+
+    splits = list(zip(*[split_dim(a, dim, n) for a in arrays]))
+
+    def call(split):
+        with limit(threads):
+            return tool(*split, **kwargs)
+
+    with ThreadPoolExecutor(workers) as pool:
+        results = list(pool.map(call, splits))
+
+    if isinstance(results[0], tuple):
+        return tuple(join_dim(outputs, dim) for outputs in zip(*results))
+    return join_dim(results, dim)
@@ -1,93 +1,97 @@
-from ..utils import cfl
+from ..utils import cfl, launch, scratch
 import os
-import subprocess
-import tempfile as tmp
 
 BART_PATH=os.environ['TOOLBOX_PATH'] + '/bart'
 DEBUG=False
-NAME=tmp.NamedTemporaryFile().name
 
 def set_debug(status):
     global DEBUG
     DEBUG=status
 
 
-def avg(input, bitmask, w=None):
+def avg(input, bitmask, w=None, lazy=False, out=None, backend=None):
     """
     Calculates (weighted) average along dimensions specified by bitmask.
 
     :param bitmask int:
     :param input array:
     :param w bool: weighted average
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "vg [-w] bitmask input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'avg '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'avg']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if w is not None:
-        flag_str += f'-w '
-    cmd_str += flag_str + opt_args + '  '
+        if w is not None:
+            flag_args += ['-w']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {bitmask} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(bitmask), scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def bench(T=None, S=None, s=None):
+def bench(T=None, S=None, s=None, lazy=False, out=None, backend=None):
     """
     Performs a series of micro-benchmarks.
 
     :param T bool: varying number of threads
     :param S bool: varying problem size
     :param s long: select benchmarks
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "bench [-T] [-S] [-s d] [output]"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'bench '
-    flag_str = ''
+    with scratch.namespace(backend=backend) as NAME:
+        argv = [BART_PATH, 'bench']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if T is not None:
-        flag_str += f'-T '
+        if T is not None:
+            flag_args += ['-T']
 
-    if S is not None:
-        flag_str += f'-S '
+        if S is not None:
+            flag_args += ['-S']
 
-    if s is not None:
-        flag_str += f'-s {s} '
-    cmd_str += flag_str + opt_args + '  '
+        if s is not None:
+            flag_args += ['-s', str(s)]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}output  "
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def bin(label, src, l=None, o=None, R=None, C=None, r=None, c=None, a=None, A=None, O=None, x=None, M=None):
+def bin(label, src, l=None, o=None, R=None, C=None, r=None, c=None, a=None, A=None, O=None, x=None, M=None, lazy=False, out=None, backend=None):
     """
     Binning
 
@@ -104,64 +108,68 @@ def bin(label, src, l=None, o=None, R=None, C=None, r=None, c=None, a=None, A=No
     :param O FLOAT_VEC2: Quadrature Binning: Angle offset for resp and card.
     :param x STRING: (Output filtered cardiac EOFs)
     :param M bool: Amplitude binning
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "bin [-l d] [-o] [-R d] [-C d] [-a d] [-O f:f] [-M] label src dst"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'bin '
-    flag_str = ''
+    with scratch.namespace(label, src, backend=backend) as NAME:
+        staged = scratch.stage_all(NAME, {'label': label, 'src': src})
 
-    opt_args = f''
+        argv = [BART_PATH, 'bin']
+        flag_args = []
 
-    multituples = []
+        opt_args = []
 
-    if l is not None:
-        flag_str += f'-l {l} '
+        multituples = []
 
-    if o is not None:
-        flag_str += f'-o '
+        if l is not None:
+            flag_args += ['-l', str(l)]
 
-    if R is not None:
-        flag_str += f'-R {R} '
+        if o is not None:
+            flag_args += ['-o']
 
-    if C is not None:
-        flag_str += f'-C {C} '
+        if R is not None:
+            flag_args += ['-R', str(R)]
 
-    if r is not None:
-        flag_str += f'-r {r} '
+        if C is not None:
+            flag_args += ['-C', str(C)]
 
-    if c is not None:
-        flag_str += f'-c {c} '
+        if r is not None:
+            flag_args += ['-r', str(r)]
 
-    if a is not None:
-        flag_str += f'-a {a} '
+        if c is not None:
+            flag_args += ['-c', str(c)]
 
-    if A is not None:
-        flag_str += f'-A {A} '
+        if a is not None:
+            flag_args += ['-a', str(a)]
 
-    if O is not None:
-        flag_str += f'-O {O} '
+        if A is not None:
+            flag_args += ['-A', str(A)]
 
-    if x is not None:
-        flag_str += f'-x {x} '
+        if O is not None:
+            flag_args += ['-O', str(O)]
 
-    if M is not None:
-        flag_str += f'-M '
-    cmd_str += flag_str + opt_args + '  '
+        if x is not None:
+            flag_args += ['-x', str(x)]
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}label {NAME}src {NAME}dst  "
-    cfl.writecfl(NAME + 'label', label)
-    cfl.writecfl(NAME + 'src', src)
+        if M is not None:
+            flag_args += ['-M']
+        argv += flag_args + opt_args
 
-    if DEBUG:
-        print(cmd_str)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['label'], staged['src'], NAME + 'dst']
 
+        if DEBUG:
+            print(' '.join(argv))
 
-    os.system(cmd_str)
 
-    outputs = cfl.readcfl(NAME + 'dst')
-    return outputs
+        launch.run(argv)
+
+        outputs = scratch.fetch(NAME + 'dst', lazy, out)
+        return outputs
 
 def bitmask(dim=None, b=None):
     """
@@ -173,58 +181,61 @@ def bitmask(dim=None, b=None):
     """
     usage_string = "bitmask [-b] [dim1 ... dimN ]"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'bitmask '
-    flag_str = ''
+    with scratch.namespace() as NAME:
+        argv = [BART_PATH, 'bitmask']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if dim != None:
-        opt_args += f"{' '.join([str(arg) for arg in dim])} "
+        if dim != None:
+            opt_args += [str(arg) for arg in dim]
 
-    if b is not None:
-        flag_str += f'-b '
-    cmd_str += flag_str + opt_args + '  '
+        if b is not None:
+            flag_args += ['-b']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()}  "
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
 
-    val = subprocess.Popen(cmd_str.split(), stdout=subprocess.PIPE).communicate()[0].decode('utf-8').strip()
+        val = launch.output(argv).decode('utf-8').strip()
 
-    return [int(d) for d in val.split()] if len(val.split()) > 1 else int(val)
+        return [int(d) for d in val.split()] if len(val.split()) > 1 else int(val)
 
-def cabs(input):
+def cabs(input, lazy=False, out=None, backend=None):
     """
     Absolute value of array (|<input>|).
 
     :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "cabs input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'cabs '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'cabs']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def caldir(input, cal_size):
+def caldir(input, cal_size, lazy=False, out=None, backend=None):
     """
     Estimates coil sensitivities from the k-space center using
 a direct method (McKenzie et al.). The size of the fully-sampled
@@ -233,32 +244,35 @@ calibration region is automatically determined but limited by
 
     :param cal_size int:
     :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "caldir cal_size input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'caldir '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'caldir']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {cal_size} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(cal_size), scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def calmat(kspace, k=None, K=None, r=None, R=None, C=None):
+def calmat(kspace, k=None, K=None, r=None, R=None, C=None, lazy=False, out=None, backend=None):
     """
     Compute calibration matrix.
 
@@ -268,113 +282,122 @@ def calmat(kspace, k=None, K=None, r=None, R=None, C=None):
     :param r list: Limits the size of the calibration region.
     :param R list: ()
     :param C bool: ()
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "calmat [-k d:d:d] [-r d:d:d] kspace calibration_matrix"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'calmat '
-    flag_str = ''
+    with scratch.namespace(kspace, backend=backend) as NAME:
+        argv = [BART_PATH, 'calmat']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if k is not None:
-        flag_str += f'-k {":".join([str(x) for x in k])} '
+        if k is not None:
+            flag_args += ['-k', ":".join([str(x) for x in k])]
 
-    if K is not None:
-        flag_str += f'-K {":".join([str(x) for x in K])} '
+        if K is not None:
+            flag_args += ['-K', ":".join([str(x) for x in K])]
 
-    if r is not None:
-        flag_str += f'-r {":".join([str(x) for x in r])} '
+        if r is not None:
+            flag_args += ['-r', ":".join([str(x) for x in r])]
 
-    if R is not None:
-        flag_str += f'-R {":".join([str(x) for x in R])} '
+        if R is not None:
+            flag_args += ['-R', ":".join([str(x) for x in R])]
 
-    if C is not None:
-        flag_str += f'-C '
-    cmd_str += flag_str + opt_args + '  '
+        if C is not None:
+            flag_args += ['-C']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}kspace {NAME}calibration_matrix  "
-    cfl.writecfl(NAME + 'kspace', kspace)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'kspace', kspace), NAME + 'calibration_matrix']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'calibration_matrix')
-    return outputs
+        outputs = scratch.fetch(NAME + 'calibration_matrix', lazy, out)
+        return outputs
 
-def carg(input):
+def carg(input, lazy=False, out=None, backend=None):
     """
     Argument (phase angle).
 
     :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "carg input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'carg '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'carg']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def casorati(input, dim, kern):
+def casorati(input, dim, kern, lazy=False, out=None, backend=None):
     """
     Casorati matrix with kernel (kern1, ..., kernN) along dimensions (dim1, ..., dimN).
 
     :param dim multituple:
     :param kern multituple:
     :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "casorati dim1 kern1 ... dimN kernN input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'casorati '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'casorati']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    multituples.append(dim)
+        multituples.append(dim)
     
-    multituples.append(kern)
+        multituples.append(kern)
     
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def cc(kspace, p=None, M=None, r=None, R=None, A=None, S=None, G=None, E=None):
+def cc(kspace, p=None, M=None, r=None, R=None, A=None, S=None, G=None, E=None, lazy=False, out=None, backend=None):
     """
     Performs coil compression.
 
@@ -387,56 +410,59 @@ def cc(kspace, p=None, M=None, r=None, R=None, A=None, S=None, G=None, E=None):
     :param S bool: type: SVD
     :param G bool: type: Geometric
     :param E bool: type: ESPIRiT
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "cc [-p d] [-M] [-r d:d:d] [-A] [-S] [-G] [-E] kspace coeff|proj_kspace"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'cc '
-    flag_str = ''
+    with scratch.namespace(kspace, backend=backend) as NAME:
+        argv = [BART_PATH, 'cc']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if p is not None:
-        flag_str += f'-p {p} '
+        if p is not None:
+            flag_args += ['-p', str(p)]
 
-    if M is not None:
-        flag_str += f'-M '
+        if M is not None:
+            flag_args += ['-M']
 
-    if r is not None:
-        flag_str += f'-r {":".join([str(x) for x in r])} '
+        if r is not None:
+            flag_args += ['-r', ":".join([str(x) for x in r])]
 
-    if R is not None:
-        flag_str += f'-R {":".join([str(x) for x in R])} '
+        if R is not None:
+            flag_args += ['-R', ":".join([str(x) for x in R])]
 
-    if A is not None:
-        flag_str += f'-A '
+        if A is not None:
+            flag_args += ['-A']
 
-    if S is not None:
-        flag_str += f'-S '
+        if S is not None:
+            flag_args += ['-S']
 
-    if G is not None:
-        flag_str += f'-G '
+        if G is not None:
+            flag_args += ['-G']
 
-    if E is not None:
-        flag_str += f'-E '
-    cmd_str += flag_str + opt_args + '  '
+        if E is not None:
+            flag_args += ['-E']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}kspace {NAME}coeff_proj_kspace  "
-    cfl.writecfl(NAME + 'kspace', kspace)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'kspace', kspace), NAME + 'coeff_proj_kspace']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'coeff_proj_kspace')
-    return outputs
+        outputs = scratch.fetch(NAME + 'coeff_proj_kspace', lazy, out)
+        return outputs
 
-def ccapply(kspace, cc_matrix, p=None, u=None, t=None, S=None, G=None, E=None):
+def ccapply(kspace, cc_matrix, p=None, u=None, t=None, S=None, G=None, E=None, lazy=False, out=None, backend=None):
     """
     Apply coil compression forward/inverse operation.
 
@@ -448,217 +474,237 @@ def ccapply(kspace, cc_matrix, p=None, u=None, t=None, S=None, G=None, E=None):
     :param S bool: type: SVD
     :param G bool: type: Geometric
     :param E bool: type: ESPIRiT
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "ccapply [-p d] [-u] [-t] [-S] [-G] [-E] kspace cc_matrix proj_kspace"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'ccapply '
-    flag_str = ''
+    with scratch.namespace(kspace, cc_matrix, backend=backend) as NAME:
+        staged = scratch.stage_all(NAME, {'kspace': kspace, 'cc_matrix': cc_matrix})
+
+        argv = [BART_PATH, 'ccapply']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if p is not None:
-        flag_str += f'-p {p} '
+        if p is not None:
+            flag_args += ['-p', str(p)]
 
-    if u is not None:
-        flag_str += f'-u '
+        if u is not None:
+            flag_args += ['-u']
 
-    if t is not None:
-        flag_str += f'-t '
+        if t is not None:
+            flag_args += ['-t']
 
-    if S is not None:
-        flag_str += f'-S '
+        if S is not None:
+            flag_args += ['-S']
 
-    if G is not None:
-        flag_str += f'-G '
+        if G is not None:
+            flag_args += ['-G']
 
-    if E is not None:
-        flag_str += f'-E '
-    cmd_str += flag_str + opt_args + '  '
+        if E is not None:
+            flag_args += ['-E']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}kspace {NAME}cc_matrix {NAME}proj_kspace  "
-    cfl.writecfl(NAME + 'kspace', kspace)
-    cfl.writecfl(NAME + 'cc_matrix', cc_matrix)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['kspace'], staged['cc_matrix'], NAME + 'proj_kspace']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'proj_kspace')
-    return outputs
+        outputs = scratch.fetch(NAME + 'proj_kspace', lazy, out)
+        return outputs
 
-def cdf97(input, bitmask, i=None):
+def cdf97(input, bitmask, i=None, lazy=False, out=None, backend=None):
     """
     Perform a wavelet (cdf97) transform.
 
     :param bitmask int:
     :param input array:
     :param i bool: inverse
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "cdf97 [-i] bitmask input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'cdf97 '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'cdf97']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if i is not None:
-        flag_str += f'-i '
-    cmd_str += flag_str + opt_args + '  '
+        if i is not None:
+            flag_args += ['-i']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {bitmask} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(bitmask), scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def circshift(input, dim, shift):
+def circshift(input, dim, shift, lazy=False, out=None, backend=None):
     """
     Perform circular shift along {dim} by {shift} elements.
 
     :param dim int:
     :param shift int:
     :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "circshift dim shift input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'circshift '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'circshift']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {dim} {shift} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(dim), str(shift), scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def conj(input):
+def conj(input, lazy=False, out=None, backend=None):
     """
     Compute complex conjugate.
 
     :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "conj input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'conj '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'conj']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def conv(input, kernel, bitmask):
+def conv(input, kernel, bitmask, lazy=False, out=None, backend=None):
     """
     Performs a convolution along selected dimensions.
 
     :param bitmask int:
     :param input array:
     :param kernel array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "conv bitmask input kernel output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'conv '
-    flag_str = ''
+    with scratch.namespace(input, kernel, backend=backend) as NAME:
+        staged = scratch.stage_all(NAME, {'input': input, 'kernel': kernel})
 
-    opt_args = f''
+        argv = [BART_PATH, 'conv']
+        flag_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        opt_args = []
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {bitmask} {NAME}input {NAME}kernel {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
-    cfl.writecfl(NAME + 'kernel', kernel)
+        multituples = []
+        argv += flag_args + opt_args
 
-    if DEBUG:
-        print(cmd_str)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(bitmask), staged['input'], staged['kernel'], NAME + 'output']
 
+        if DEBUG:
+            print(' '.join(argv))
 
-    os.system(cmd_str)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        launch.run(argv)
 
-def conway(input, P=None, n=None):
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
+
+def conway(input, P=None, n=None, lazy=False, out=None, backend=None):
     """
     Conway's game of life.
 
     :param input array:
     :param P bool: periodic boundary conditions
     :param n int: nr. of iterations
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "conway [-P] [-n d] input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'conway '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'conway']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if P is not None:
-        flag_str += f'-P '
+        if P is not None:
+            flag_args += ['-P']
 
-    if n is not None:
-        flag_str += f'-n {n} '
-    cmd_str += flag_str + opt_args + '  '
+        if n is not None:
+            flag_args += ['-n', str(n)]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
 def copy(input, output, dim=None, pos=None):
     """
@@ -672,154 +718,167 @@ def copy(input, output, dim=None, pos=None):
     """
     usage_string = "copy [dim1 pos1 ... dimN posN ] input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'copy '
-    flag_str = ''
+    with scratch.namespace(input) as NAME:
+        argv = [BART_PATH, 'copy']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if dim != None:
-        multituples.append(dim) 
+        if dim != None:
+            multituples.append(dim) 
 
-    if pos != None:
-        multituples.append(pos) 
-    cmd_str += flag_str + opt_args + '  '
+        if pos != None:
+            multituples.append(pos) 
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input {output}  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'input', input), str(output)]
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-def cpyphs(input):
+def cpyphs(input, lazy=False, out=None, backend=None):
     """
     Copy phase from <input> to <output>.
 
     :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "cpyphs input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'cpyphs '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'cpyphs']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def creal(input):
+def creal(input, lazy=False, out=None, backend=None):
     """
     Real value.
 
     :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "creal input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'creal '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'creal']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def crop(input, dimension, size):
+def crop(input, dimension, size, lazy=False, out=None, backend=None):
     """
     Extracts a sub-array corresponding to the central part of {size} along {dimension}
 
     :param dimension int:
     :param size int:
     :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "crop dimension size input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'crop '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'crop']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {dimension} {size} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(dimension), str(size), scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def delta(dims, flags, size):
+def delta(dims, flags, size, lazy=False, out=None, backend=None):
     """
     Kronecker delta.
 
     :param dims int:
     :param flags int:
     :param size long:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "delta dims flags size out"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'delta '
-    flag_str = ''
+    with scratch.namespace(backend=backend) as NAME:
+        argv = [BART_PATH, 'delta']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {dims} {flags} {size} {NAME}out  "
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(dims), str(flags), str(size), NAME + 'out']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'out')
-    return outputs
+        outputs = scratch.fetch(NAME + 'out', lazy, out)
+        return outputs
 
-def ecalib(kspace, t=None, c=None, k=None, K=None, r=None, R=None, m=None, S=None, W=None, I=None, _1=None, P=None, O=None, orthiter=None, b=None, V=None, C=None, g=None, p=None, n=None, v=None, a=None, d=None):
+def ecalib(kspace, t=None, c=None, k=None, K=None, r=None, R=None, m=None, S=None, W=None, I=None, _1=None, P=None, O=None, orthiter=None, b=None, V=None, C=None, g=None, p=None, n=None, v=None, a=None, d=None, lazy=False, out=None, backend=None):
     """
     Estimate coil sensitivities using ESPIRiT calibration.
 Optionally outputs the eigenvalue maps.
@@ -848,101 +907,104 @@ Optionally outputs the eigenvalue maps.
     :param v float: Variance of noise in data.
     :param a bool: Automatically pick thresholds.
     :param d int: Debug level
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "calib [-t f] [-c f] [-k d:d:d] [-r d:d:d] [-m d] [-S] [-W] [-I] [-1] [-P] [-v f] [-a] [-d d] kspace sensitivities [ev-maps]"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'ecalib '
-    flag_str = ''
+    with scratch.namespace(kspace, backend=backend) as NAME:
+        argv = [BART_PATH, 'ecalib']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if t is not None:
-        flag_str += f'-t {t} '
+        if t is not None:
+            flag_args += ['-t', str(t)]
 
-    if c is not None:
-        flag_str += f'-c {c} '
+        if c is not None:
+            flag_args += ['-c', str(c)]
 
-    if k is not None:
-        flag_str += f'-k {":".join([str(x) for x in k])} '
+        if k is not None:
+            flag_args += ['-k', ":".join([str(x) for x in k])]
 
-    if K is not None:
-        flag_str += f'-K {":".join([str(x) for x in K])} '
+        if K is not None:
+            flag_args += ['-K', ":".join([str(x) for x in K])]
 
-    if r is not None:
-        flag_str += f'-r {":".join([str(x) for x in r])} '
+        if r is not None:
+            flag_args += ['-r', ":".join([str(x) for x in r])]
 
-    if R is not None:
-        flag_str += f'-R {":".join([str(x) for x in R])} '
+        if R is not None:
+            flag_args += ['-R', ":".join([str(x) for x in R])]
 
-    if m is not None:
-        flag_str += f'-m {m} '
+        if m is not None:
+            flag_args += ['-m', str(m)]
 
-    if S is not None:
-        flag_str += f'-S '
+        if S is not None:
+            flag_args += ['-S']
 
-    if W is not None:
-        flag_str += f'-W '
+        if W is not None:
+            flag_args += ['-W']
 
-    if I is not None:
-        flag_str += f'-I '
+        if I is not None:
+            flag_args += ['-I']
 
-    if _1 is not None:
-        flag_str += f'-1 '
+        if _1 is not None:
+            flag_args += ['-1']
 
-    if P is not None:
-        flag_str += f'-P '
+        if P is not None:
+            flag_args += ['-P']
 
-    if O is not None:
-        flag_str += f'-O '
+        if O is not None:
+            flag_args += ['-O']
 
-    if orthiter is not None:
-        flag_str += f'--orthiter {orthiter} '
+        if orthiter is not None:
+            flag_args += ['--orthiter', str(orthiter)]
 
-    if b is not None:
-        flag_str += f'-b {b} '
+        if b is not None:
+            flag_args += ['-b', str(b)]
 
-    if V is not None:
-        flag_str += f'-V '
+        if V is not None:
+            flag_args += ['-V']
 
-    if C is not None:
-        flag_str += f'-C '
+        if C is not None:
+            flag_args += ['-C']
 
-    if g is not None:
-        flag_str += f'-g '
+        if g is not None:
+            flag_args += ['-g']
 
-    if p is not None:
-        flag_str += f'-p {p} '
+        if p is not None:
+            flag_args += ['-p', str(p)]
 
-    if n is not None:
-        flag_str += f'-n {n} '
+        if n is not None:
+            flag_args += ['-n', str(n)]
 
-    if v is not None:
-        flag_str += f'-v {v} '
+        if v is not None:
+            flag_args += ['-v', str(v)]
 
-    if a is not None:
-        flag_str += f'-a '
+        if a is not None:
+            flag_args += ['-a']
 
-    if d is not None:
-        flag_str += f'-d {d} '
-    cmd_str += flag_str + opt_args + '  '
+        if d is not None:
+            flag_args += ['-d', str(d)]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}kspace {NAME}sensitivities {NAME}ev_maps  "
-    cfl.writecfl(NAME + 'kspace', kspace)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'kspace', kspace), NAME + 'sensitivities', NAME + 'ev_maps']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'sensitivities'), cfl.readcfl(NAME + 'ev_maps')
-    return outputs
+        outputs = scratch.fetch_all([NAME + 'sensitivities', NAME + 'ev_maps'], lazy, out)
+        return outputs
 
-def ecaltwo(input, x, y, z, c=None, m=None, S=None, O=None, g=None):
+def ecaltwo(input, x, y, z, c=None, m=None, S=None, O=None, g=None, lazy=False, out=None, backend=None):
     """
     Second part of ESPIRiT calibration.
 Optionally outputs the eigenvalue maps.
@@ -956,47 +1018,50 @@ Optionally outputs the eigenvalue maps.
     :param S bool: Create maps with smooth transitions (Soft-SENSE).
     :param O bool: ()
     :param g bool: ()
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "caltwo [-c f] [-m d] [-S] x y z input sensitivities [ev-maps]"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'ecaltwo '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'ecaltwo']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if c is not None:
-        flag_str += f'-c {c} '
+        if c is not None:
+            flag_args += ['-c', str(c)]
 
-    if m is not None:
-        flag_str += f'-m {m} '
+        if m is not None:
+            flag_args += ['-m', str(m)]
 
-    if S is not None:
-        flag_str += f'-S '
+        if S is not None:
+            flag_args += ['-S']
 
-    if O is not None:
-        flag_str += f'-O '
+        if O is not None:
+            flag_args += ['-O']
 
-    if g is not None:
-        flag_str += f'-g '
-    cmd_str += flag_str + opt_args + '  '
+        if g is not None:
+            flag_args += ['-g']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {x} {y} {z} {NAME}input {NAME}sensitivities {NAME}ev_maps  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(x), str(y), str(z), scratch.stage(NAME + 'input', input), NAME + 'sensitivities', NAME + 'ev_maps']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'sensitivities'), cfl.readcfl(NAME + 'ev_maps')
-    return outputs
+        outputs = scratch.fetch_all([NAME + 'sensitivities', NAME + 'ev_maps'], lazy, out)
+        return outputs
 
-def epg(C=None, M=None, H=None, F=None, S=None, B=None, _1=None, _2=None, b=None, o=None, r=None, e=None, f=None, s=None, n=None, u=None, v=None):
+def epg(C=None, M=None, H=None, F=None, S=None, B=None, _1=None, _2=None, b=None, o=None, r=None, e=None, f=None, s=None, n=None, u=None, v=None, lazy=False, out=None, backend=None):
     """
     Simulate MR pulse sequence based on Extended Phase Graphs (EPG)
 
@@ -1017,82 +1082,86 @@ def epg(C=None, M=None, H=None, F=None, S=None, B=None, _1=None, _2=None, b=None
     :param n long: number of pulses
     :param u long: unknowns as bitmask (0: T1 1: T2 2: B1 3: off-res)
     :param v long: verbosity level
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "pg [-C] [-M] [-H] [-F] [-S] [-B] [-1 f] [-2 f] [-b f] [-o f] [-r f] [-e f] [-f f] [-s d] [-n d] [-u d] [-v d] signal intensity [configuration states] [(rel.) signal derivatives] [configuration derivatives]"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'epg '
-    flag_str = ''
+    with scratch.namespace(backend=backend) as NAME:
+        argv = [BART_PATH, 'epg']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if C is not None:
-        flag_str += f'-C '
+        if C is not None:
+            flag_args += ['-C']
 
-    if M is not None:
-        flag_str += f'-M '
+        if M is not None:
+            flag_args += ['-M']
 
-    if H is not None:
-        flag_str += f'-H '
+        if H is not None:
+            flag_args += ['-H']
 
-    if F is not None:
-        flag_str += f'-F '
+        if F is not None:
+            flag_args += ['-F']
 
-    if S is not None:
-        flag_str += f'-S '
+        if S is not None:
+            flag_args += ['-S']
 
-    if B is not None:
-        flag_str += f'-B '
+        if B is not None:
+            flag_args += ['-B']
 
-    if _1 is not None:
-        flag_str += f'-1 {_1} '
+        if _1 is not None:
+            flag_args += ['-1', str(_1)]
 
-    if _2 is not None:
-        flag_str += f'-2 {_2} '
+        if _2 is not None:
+            flag_args += ['-2', str(_2)]
 
-    if b is not None:
-        flag_str += f'-b {b} '
+        if b is not None:
+            flag_args += ['-b', str(b)]
 
-    if o is not None:
-        flag_str += f'-o {o} '
+        if o is not None:
+            flag_args += ['-o', str(o)]
 
-    if r is not None:
-        flag_str += f'-r {r} '
+        if r is not None:
+            flag_args += ['-r', str(r)]
 
-    if e is not None:
-        flag_str += f'-e {e} '
+        if e is not None:
+            flag_args += ['-e', str(e)]
 
-    if f is not None:
-        flag_str += f'-f {f} '
+        if f is not None:
+            flag_args += ['-f', str(f)]
 
-    if s is not None:
-        flag_str += f'-s {s} '
+        if s is not None:
+            flag_args += ['-s', str(s)]
 
-    if n is not None:
-        flag_str += f'-n {n} '
+        if n is not None:
+            flag_args += ['-n', str(n)]
 
-    if u is not None:
-        flag_str += f'-u {u} '
+        if u is not None:
+            flag_args += ['-u', str(u)]
 
-    if v is not None:
-        flag_str += f'-v {v} '
-    cmd_str += flag_str + opt_args + '  '
+        if v is not None:
+            flag_args += ['-v', str(v)]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}signal_intensity {NAME}configuration_states {NAME}_rel___signal_derivatives {NAME}configuration_derivatives  "
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [NAME + 'signal_intensity', NAME + 'configuration_states', NAME + '_rel___signal_derivatives', NAME + 'configuration_derivatives']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'signal_intensity'), cfl.readcfl(NAME + 'configuration_states'), cfl.readcfl(NAME + '_rel___signal_derivatives'), cfl.readcfl(NAME + 'configuration_derivatives')
-    return outputs
+        outputs = scratch.fetch_all([NAME + 'signal_intensity', NAME + 'configuration_states', NAME + '_rel___signal_derivatives', NAME + 'configuration_derivatives'], lazy, out)
+        return outputs
 
-def estdelay(trajectory, data, R=None, p=None, n=None, r=None):
+def estdelay(trajectory, data, R=None, p=None, n=None, r=None, lazy=False, out=None, backend=None):
     """
     Estimate gradient delays from radial data.
 
@@ -1102,43 +1171,47 @@ def estdelay(trajectory, data, R=None, p=None, n=None, r=None):
     :param p int: [RING] Padding
     :param n int: [RING] Number of intersecting spokes
     :param r float: [RING] Central region size
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "tdelay [-R] [-p d] [-n d] [-r f] trajectory data [qf]"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'estdelay '
-    flag_str = ''
+    with scratch.namespace(trajectory, data, backend=backend) as NAME:
+        staged = scratch.stage_all(NAME, {'trajectory': trajectory, 'data': data})
+
+        argv = [BART_PATH, 'estdelay']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if R is not None:
-        flag_str += f'-R '
+        if R is not None:
+            flag_args += ['-R']
 
-    if p is not None:
-        flag_str += f'-p {p} '
+        if p is not None:
+            flag_args += ['-p', str(p)]
 
-    if n is not None:
-        flag_str += f'-n {n} '
+        if n is not None:
+            flag_args += ['-n', str(n)]
 
-    if r is not None:
-        flag_str += f'-r {r} '
-    cmd_str += flag_str + opt_args + '  '
+        if r is not None:
+            flag_args += ['-r', str(r)]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}trajectory {NAME}data {NAME}qf  "
-    cfl.writecfl(NAME + 'trajectory', trajectory)
-    cfl.writecfl(NAME + 'data', data)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['trajectory'], staged['data'], NAME + 'qf']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'qf')
-    return outputs
+        outputs = scratch.fetch(NAME + 'qf', lazy, out)
+        return outputs
 
 def estdims(traj):
     """
@@ -1150,23 +1223,23 @@ Assume trajectory scaled to -DIM/2 to DIM/2 (ie dk=1/FOV=1)
     """
     usage_string = "tdims traj"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'estdims '
-    flag_str = ''
+    with scratch.namespace(traj) as NAME:
+        argv = [BART_PATH, 'estdims']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}traj  "
-    cfl.writecfl(NAME + 'traj', traj)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'traj', traj)]
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
 def estshift(arg1, arg2, flags):
     """
@@ -1179,24 +1252,25 @@ def estshift(arg1, arg2, flags):
     """
     usage_string = "tshift flags arg1 arg2"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'estshift '
-    flag_str = ''
+    with scratch.namespace(arg1, arg2) as NAME:
+        staged = scratch.stage_all(NAME, {'arg1': arg1, 'arg2': arg2})
 
-    opt_args = f''
+        argv = [BART_PATH, 'estshift']
+        flag_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        opt_args = []
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {flags} {NAME}arg1 {NAME}arg2  "
-    cfl.writecfl(NAME + 'arg1', arg1)
-    cfl.writecfl(NAME + 'arg2', arg2)
+        multituples = []
+        argv += flag_args + opt_args
 
-    if DEBUG:
-        print(cmd_str)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(flags), staged['arg1'], staged['arg2']]
 
+        if DEBUG:
+            print(' '.join(argv))
 
-    os.system(cmd_str)
+
+        launch.run(argv)
 
 def estvar(kspace, k=None, K=None, r=None, R=None):
     """
@@ -1211,37 +1285,37 @@ def estvar(kspace, k=None, K=None, r=None, R=None):
     """
     usage_string = "tvar [-k d:d:d] [-r d:d:d] kspace"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'estvar '
-    flag_str = ''
+    with scratch.namespace(kspace) as NAME:
+        argv = [BART_PATH, 'estvar']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if k is not None:
-        flag_str += f'-k {":".join([str(x) for x in k])} '
+        if k is not None:
+            flag_args += ['-k', ":".join([str(x) for x in k])]
 
-    if K is not None:
-        flag_str += f'-K {":".join([str(x) for x in K])} '
+        if K is not None:
+            flag_args += ['-K', ":".join([str(x) for x in K])]
 
-    if r is not None:
-        flag_str += f'-r {":".join([str(x) for x in r])} '
+        if r is not None:
+            flag_args += ['-r', ":".join([str(x) for x in r])]
 
-    if R is not None:
-        flag_str += f'-R {":".join([str(x) for x in R])} '
-    cmd_str += flag_str + opt_args + '  '
+        if R is not None:
+            flag_args += ['-R', ":".join([str(x) for x in R])]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}kspace  "
-    cfl.writecfl(NAME + 'kspace', kspace)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'kspace', kspace)]
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-def extract(input, dim, start, end):
+def extract(input, dim, start, end, lazy=False, out=None, backend=None):
     """
     Extracts a sub-array along dims from index start to (not including) end.
 
@@ -1249,38 +1323,41 @@ def extract(input, dim, start, end):
     :param start multituple:
     :param end multituple:
     :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "xtract dim1 start1 end1 ... dimN startN endN input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'extract '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'extract']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    multituples.append(dim)
+        multituples.append(dim)
     
-    multituples.append(start)
+        multituples.append(start)
     
-    multituples.append(end)
+        multituples.append(end)
     
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def fakeksp(image, kspace, sens, r=None):
+def fakeksp(image, kspace, sens, r=None, lazy=False, out=None, backend=None):
     """
     Recreate k-space from image and sensitivities.
 
@@ -1288,37 +1365,40 @@ def fakeksp(image, kspace, sens, r=None):
     :param kspace array:
     :param sens array:
     :param r bool: replace measured samples with original values
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "fakeksp [-r] image kspace sens output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'fakeksp '
-    flag_str = ''
+    with scratch.namespace(image, kspace, sens, backend=backend) as NAME:
+        staged = scratch.stage_all(NAME, {'image': image, 'kspace': kspace, 'sens': sens})
+
+        argv = [BART_PATH, 'fakeksp']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if r is not None:
-        flag_str += f'-r '
-    cmd_str += flag_str + opt_args + '  '
+        if r is not None:
+            flag_args += ['-r']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}image {NAME}kspace {NAME}sens {NAME}output  "
-    cfl.writecfl(NAME + 'image', image)
-    cfl.writecfl(NAME + 'kspace', kspace)
-    cfl.writecfl(NAME + 'sens', sens)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['image'], staged['kspace'], staged['sens'], NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def fft(input, bitmask, u=None, i=None, n=None):
+def fft(input, bitmask, u=None, i=None, n=None, lazy=False, out=None, backend=None):
     """
     Performs a fast Fourier transform (FFT) along selected dimensions.
 
@@ -1327,41 +1407,44 @@ def fft(input, bitmask, u=None, i=None, n=None):
     :param u bool: unitary
     :param i bool: inverse
     :param n bool: un-centered
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "fft [-u] [-i] [-n] bitmask input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'fft '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'fft']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if u is not None:
-        flag_str += f'-u '
+        if u is not None:
+            flag_args += ['-u']
 
-    if i is not None:
-        flag_str += f'-i '
+        if i is not None:
+            flag_args += ['-i']
 
-    if n is not None:
-        flag_str += f'-n '
-    cmd_str += flag_str + opt_args + '  '
+        if n is not None:
+            flag_args += ['-n']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {bitmask} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(bitmask), scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def fftmod(input, bitmask, b=None, i=None):
+def fftmod(input, bitmask, b=None, i=None, lazy=False, out=None, backend=None):
     """
     Apply 1 -1 modulation along dimensions selected by the {bitmask}.
 
@@ -1369,38 +1452,41 @@ def fftmod(input, bitmask, b=None, i=None):
     :param input array:
     :param b bool: (deprecated)
     :param i bool: inverse
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "fftmod [-i] bitmask input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'fftmod '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'fftmod']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if b is not None:
-        flag_str += f'-b '
+        if b is not None:
+            flag_args += ['-b']
 
-    if i is not None:
-        flag_str += f'-i '
-    cmd_str += flag_str + opt_args + '  '
+        if i is not None:
+            flag_args += ['-i']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {bitmask} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(bitmask), scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def fftrot(input, dim1, dim2, theta):
+def fftrot(input, dim1, dim2, theta, lazy=False, out=None, backend=None):
     """
     Performs a rotation using Fourier transform (FFT) along selected dimensions.
 
@@ -1408,67 +1494,73 @@ def fftrot(input, dim1, dim2, theta):
     :param dim2 int:
     :param theta float:
     :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "fftrot dim1 dim2 theta input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'fftrot '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'fftrot']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {dim1} {dim2} {theta} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(dim1), str(dim2), str(theta), scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def fftshift(input, bitmask, b=None):
+def fftshift(input, bitmask, b=None, lazy=False, out=None, backend=None):
     """
     Apply fftshift along dimensions selected by the {bitmask}.
 
     :param bitmask long:
     :param input array:
     :param b bool: apply ifftshift
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "fftshift [-b] bitmask input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'fftshift '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'fftshift']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if b is not None:
-        flag_str += f'-b '
-    cmd_str += flag_str + opt_args + '  '
+        if b is not None:
+            flag_args += ['-b']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {bitmask} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(bitmask), scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def filter(input, m=None, l=None, G=None, a=None):
+def filter(input, m=None, l=None, G=None, a=None, lazy=False, out=None, backend=None):
     """
     Apply filter.
 
@@ -1477,105 +1569,114 @@ def filter(input, m=None, l=None, G=None, a=None):
     :param l int: length of filter
     :param G bool: geometric median
     :param a int: Moving average filter along dimension dim
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "filter [-m d] [-l d] [-G] [-a d] input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'filter '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'filter']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if m is not None:
-        flag_str += f'-m {m} '
+        if m is not None:
+            flag_args += ['-m', str(m)]
 
-    if l is not None:
-        flag_str += f'-l {l} '
+        if l is not None:
+            flag_args += ['-l', str(l)]
 
-    if G is not None:
-        flag_str += f'-G '
+        if G is not None:
+            flag_args += ['-G']
 
-    if a is not None:
-        flag_str += f'-a {a} '
-    cmd_str += flag_str + opt_args + '  '
+        if a is not None:
+            flag_args += ['-a', str(a)]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def flatten(input):
+def flatten(input, lazy=False, out=None, backend=None):
     """
     Flatten array to one dimension.
 
     :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "flatten input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'flatten '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'flatten']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def flip(input, bitmask):
+def flip(input, bitmask, lazy=False, out=None, backend=None):
     """
     Flip (reverse) dimensions specified by the {bitmask}.
 
     :param bitmask long:
     :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "flip bitmask input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'flip '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'flip']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {bitmask} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(bitmask), scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def fmac(input1, input2=None, A=None, C=None, s=None):
+def fmac(input1, input2=None, A=None, C=None, s=None, lazy=False, out=None, backend=None):
     """
     Multiply <input1> and <input2> and accumulate in <output>.
 If <input2> is not specified, assume all-ones.
@@ -1585,83 +1686,94 @@ If <input2> is not specified, assume all-ones.
     :param A bool: add to existing output (instead of overwriting)
     :param C bool: conjugate input2
     :param s long: squash dimensions selected by bitmask b
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "fmac [-A] [-C] [-s d] input1 [input2] output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'fmac '
-    flag_str = ''
+    with scratch.namespace(input1, input2, backend=backend) as NAME:
+        staged = scratch.stage_all(NAME, {'input1': input1, 'input2': input2})
+
+        argv = [BART_PATH, 'fmac']
+        flag_args = []
+
+        opt_args = []
 
-    opt_args = f''
+        multituples = []
 
-    multituples = []
+        opt_inputs = []
 
-    if not isinstance(input2, type(None)):
-        opt_args += 'NAME + {input2}'
+        if not isinstance(input2, type(None)):
+            opt_inputs += [staged['input2']]
 
-    if A is not None:
-        flag_str += f'-A '
+        if A is not None:
+            flag_args += ['-A']
 
-    if C is not None:
-        flag_str += f'-C '
+        if C is not None:
+            flag_args += ['-C']
 
-    if s is not None:
-        flag_str += f'-s {s} '
-    cmd_str += flag_str + opt_args + '  '
+        if s is not None:
+            flag_args += ['-s', str(s)]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input1 {NAME}output  "
-    cfl.writecfl(NAME + 'input1', input1)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['input1'], *opt_inputs, NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def fovshift(input, t=None, s=None):
+def fovshift(input, t=None, s=None, lazy=False, out=None, backend=None):
     """
     Shifts FOV.
 
     :param input array:
     :param t array: k-space trajectory
     :param s FLOAT_VEC3: FOV shift
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "fovshift [-t file] [-s f:f:f] input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'fovshift '
-    flag_str = ''
+    with scratch.namespace(input, t, backend=backend) as NAME:
+        staged = scratch.stage_all(NAME, {'input': input, 't': t})
 
-    opt_args = f''
+        argv = [BART_PATH, 'fovshift']
+        flag_args = []
 
-    multituples = []
+        opt_args = []
 
-    if not isinstance(t, type(None)):
-        cfl.writecfl(NAME + 't', t)
-        flag_str += f'-t {NAME}t '
+        multituples = []
 
-    if s is not None:
-        flag_str += f'-s {s} '
-    cmd_str += flag_str + opt_args + '  '
+        if not isinstance(t, type(None)):
+            flag_args += ['-t', staged['t']]
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        if s is not None:
+            flag_args += ['-s', str(s)]
+        argv += flag_args + opt_args
 
-    if DEBUG:
-        print(cmd_str)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['input'], NAME + 'output']
 
+        if DEBUG:
+            print(' '.join(argv))
 
-    os.system(cmd_str)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        launch.run(argv)
 
-def homodyne(input, dim, fraction, r=None, I=None, C=None, P=None, n=None):
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
+
+def homodyne(input, dim, fraction, r=None, I=None, C=None, P=None, n=None, lazy=False, out=None, backend=None):
     """
     Perform homodyne reconstruction along dimension dim.
 
@@ -1673,49 +1785,53 @@ def homodyne(input, dim, fraction, r=None, I=None, C=None, P=None, n=None):
     :param C bool: Clear unacquired portion of kspace
     :param P array: Use <phase_ref> as phase reference
     :param n bool: use uncentered ffts
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "homodyne [-r f] [-I] [-C] [-P file] [-n] dim fraction input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'homodyne '
-    flag_str = ''
+    with scratch.namespace(input, P, backend=backend) as NAME:
+        staged = scratch.stage_all(NAME, {'input': input, 'P': P})
+
+        argv = [BART_PATH, 'homodyne']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if r is not None:
-        flag_str += f'-r {r} '
+        if r is not None:
+            flag_args += ['-r', str(r)]
 
-    if I is not None:
-        flag_str += f'-I '
+        if I is not None:
+            flag_args += ['-I']
 
-    if C is not None:
-        flag_str += f'-C '
+        if C is not None:
+            flag_args += ['-C']
 
-    if not isinstance(P, type(None)):
-        cfl.writecfl(NAME + 'P', P)
-        flag_str += f'-P {NAME}P '
+        if not isinstance(P, type(None)):
+            flag_args += ['-P', staged['P']]
 
-    if n is not None:
-        flag_str += f'-n '
-    cmd_str += flag_str + opt_args + '  '
+        if n is not None:
+            flag_args += ['-n']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {dim} {fraction} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(dim), str(fraction), staged['input'], NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
 #def ictv(input, llambda, flags, flags, i=None, u=None):
-def ictv(input, llambda, flags, i=None, u=None):
+def ictv(input, llambda, flags, i=None, u=None, lazy=False, out=None, backend=None):
     """
     Infimal convolution of total variation along dims specified by flags.
 
@@ -1725,98 +1841,108 @@ def ictv(input, llambda, flags, i=None, u=None):
     :param input array:
     :param i int: max. iterations
     :param u float: rho in ADMM
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "ictv [-i d] [-u f] lambda flags flags input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'ictv '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'ictv']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if i is not None:
-        flag_str += f'-i {i} '
+        if i is not None:
+            flag_args += ['-i', str(i)]
 
-    if u is not None:
-        flag_str += f'-u {u} '
-    cmd_str += flag_str + opt_args + '  '
+        if u is not None:
+            flag_args += ['-u', str(u)]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {llambda} {flags} {flags} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(llambda), str(flags), str(flags), scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def index(dim, size):
+def index(dim, size, lazy=False, out=None, backend=None):
     """
     Create an array counting from 0 to {size-1} in dimensions {dim}.
 
     :param dim int:
     :param size int:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "index dim size name"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'index '
-    flag_str = ''
+    with scratch.namespace(backend=backend) as NAME:
+        argv = [BART_PATH, 'index']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {dim} {size} {NAME}name  "
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(dim), str(size), NAME + 'name']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'name')
-    return outputs
+        outputs = scratch.fetch(NAME + 'name', lazy, out)
+        return outputs
 
-def invert(input):
+def invert(input, lazy=False, out=None, backend=None):
     """
     Invert array (1 / <input>). The output is set to zero in case of divide by zero.
 
     :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "invert input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'invert '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'invert']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def itsense(sensitivities, kspace, pattern, alpha):
+def itsense(sensitivities, kspace, pattern, alpha, lazy=False, out=None, backend=None):
     """
     A simplified implementation of iterative sense reconstruction
 with l2-regularization.
@@ -1825,32 +1951,35 @@ with l2-regularization.
     :param sensitivities array:
     :param kspace array:
     :param pattern array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "itsense alpha sensitivities kspace pattern output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'itsense '
-    flag_str = ''
+    with scratch.namespace(sensitivities, kspace, pattern, backend=backend) as NAME:
+        staged = scratch.stage_all(NAME, {'sensitivities': sensitivities, 'kspace': kspace, 'pattern': pattern})
 
-    opt_args = f''
+        argv = [BART_PATH, 'itsense']
+        flag_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        opt_args = []
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {alpha} {NAME}sensitivities {NAME}kspace {NAME}pattern {NAME}output  "
-    cfl.writecfl(NAME + 'sensitivities', sensitivities)
-    cfl.writecfl(NAME + 'kspace', kspace)
-    cfl.writecfl(NAME + 'pattern', pattern)
+        multituples = []
+        argv += flag_args + opt_args
 
-    if DEBUG:
-        print(cmd_str)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(alpha), staged['sensitivities'], staged['kspace'], staged['pattern'], NAME + 'output']
 
+        if DEBUG:
+            print(' '.join(argv))
 
-    os.system(cmd_str)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        launch.run(argv)
+
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
 def join(dimension, input, output, a=None):
     """
@@ -1866,65 +1995,69 @@ def join(dimension, input, output, a=None):
     """
     usage_string = "join [-a] dimension input1 ... inputN output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'join '
-    flag_str = ''
+    with scratch.namespace() as NAME:
+        argv = [BART_PATH, 'join']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if a is not None:
-        flag_str += f'-a '
-    cmd_str += flag_str + opt_args + '  '
+        if a is not None:
+            flag_args += ['-a']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {dimension} {' '.join([str(arg) for arg in input])} {output}  "
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(dimension), *[str(arg) for arg in input], str(output)]
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-def looklocker(input, t=None, D=None):
+def looklocker(input, t=None, D=None, lazy=False, out=None, backend=None):
     """
     Compute T1 map from M_0, M_ss, and R_1*.
 
     :param input array:
     :param t float: Pixels with M0 values smaller than threshold are set to zero.
     :param D float: Time between the middle of inversion pulse and the first excitation.
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "looklocker [-t f] [-D f] input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'looklocker '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'looklocker']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if t is not None:
-        flag_str += f'-t {t} '
+        if t is not None:
+            flag_args += ['-t', str(t)]
 
-    if D is not None:
-        flag_str += f'-D {D} '
-    cmd_str += flag_str + opt_args + '  '
+        if D is not None:
+            flag_args += ['-D', str(D)]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def lrmatrix(input, d=None, i=None, m=None, f=None, j=None, k=None, N=None, s=None, l=None, u=None, v=None, H=None, p=None, n=None, g=None):
+def lrmatrix(input, d=None, i=None, m=None, f=None, j=None, k=None, N=None, s=None, l=None, u=None, v=None, H=None, p=None, n=None, g=None, lazy=False, out=None, backend=None):
     """
     Perform (multi-scale) low rank matrix completion
 
@@ -1945,77 +2078,80 @@ def lrmatrix(input, d=None, i=None, m=None, f=None, j=None, k=None, N=None, s=No
     :param p float: (rho)
     :param n bool: (no randshift)
     :param g bool: (use GPU)
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "lrmatrix [-d] [-i d] [-m d] [-f d] [-j d] [-k d] [-N] [-s] [-l d] [-o file] input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'lrmatrix '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'lrmatrix']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if d is not None:
-        flag_str += f'-d '
+        if d is not None:
+            flag_args += ['-d']
 
-    if i is not None:
-        flag_str += f'-i {i} '
+        if i is not None:
+            flag_args += ['-i', str(i)]
 
-    if m is not None:
-        flag_str += f'-m {m} '
+        if m is not None:
+            flag_args += ['-m', str(m)]
 
-    if f is not None:
-        flag_str += f'-f {f} '
+        if f is not None:
+            flag_args += ['-f', str(f)]
 
-    if j is not None:
-        flag_str += f'-j {j} '
+        if j is not None:
+            flag_args += ['-j', str(j)]
 
-    if k is not None:
-        flag_str += f'-k {k} '
+        if k is not None:
+            flag_args += ['-k', str(k)]
 
-    if N is not None:
-        flag_str += f'-N '
+        if N is not None:
+            flag_args += ['-N']
 
-    if s is not None:
-        flag_str += f'-s '
+        if s is not None:
+            flag_args += ['-s']
 
-    if l is not None:
-        flag_str += f'-l {l} '
+        if l is not None:
+            flag_args += ['-l', str(l)]
 
-    if u is not None:
-        flag_str += f'-u '
+        if u is not None:
+            flag_args += ['-u']
 
-    if v is not None:
-        flag_str += f'-v '
+        if v is not None:
+            flag_args += ['-v']
 
-    if H is not None:
-        flag_str += f'-H '
+        if H is not None:
+            flag_args += ['-H']
 
-    if p is not None:
-        flag_str += f'-p {p} '
+        if p is not None:
+            flag_args += ['-p', str(p)]
 
-    if n is not None:
-        flag_str += f'-n '
+        if n is not None:
+            flag_args += ['-n']
 
-    if g is not None:
-        flag_str += f'-g '
-    cmd_str += flag_str + opt_args + '  '
+        if g is not None:
+            flag_args += ['-g']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input {NAME}output {NAME}o  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'input', input), NAME + 'output', NAME + 'o']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def mandelbrot(s=None, n=None, t=None, z=None, r=None, i=None):
+def mandelbrot(s=None, n=None, t=None, z=None, r=None, i=None, lazy=False, out=None, backend=None):
     """
     Compute mandelbrot set.
 
@@ -2025,49 +2161,53 @@ def mandelbrot(s=None, n=None, t=None, z=None, r=None, i=None):
     :param z float: zoom
     :param r float: offset real
     :param i float: offset imag
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "mandelbrot [-s d] [-n d] [-t f] [-z f] [-r f] [-i f] output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'mandelbrot '
-    flag_str = ''
+    with scratch.namespace(backend=backend) as NAME:
+        argv = [BART_PATH, 'mandelbrot']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if s is not None:
-        flag_str += f'-s {s} '
+        if s is not None:
+            flag_args += ['-s', str(s)]
 
-    if n is not None:
-        flag_str += f'-n {n} '
+        if n is not None:
+            flag_args += ['-n', str(n)]
 
-    if t is not None:
-        flag_str += f'-t {t} '
+        if t is not None:
+            flag_args += ['-t', str(t)]
 
-    if z is not None:
-        flag_str += f'-z {z} '
+        if z is not None:
+            flag_args += ['-z', str(z)]
 
-    if r is not None:
-        flag_str += f'-r {r} '
+        if r is not None:
+            flag_args += ['-r', str(r)]
 
-    if i is not None:
-        flag_str += f'-i {i} '
-    cmd_str += flag_str + opt_args + '  '
+        if i is not None:
+            flag_args += ['-i', str(i)]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}output  "
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def measure(reference, input, mse=None, mse_mag=None, ssim=None, psnr=None):
+def measure(reference, input, mse=None, mse_mag=None, ssim=None, psnr=None, lazy=False, out=None, backend=None):
     """
     
 
@@ -2077,45 +2217,49 @@ def measure(reference, input, mse=None, mse_mag=None, ssim=None, psnr=None):
     :param mse_mag bool: mse of rss (over coil dim)
     :param ssim bool: ssim of rss (over coil dim) and mean over other dims
     :param psnr bool: psnr of rss (over coil dim) and mean over other dims
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "measure [--mse] [--mse-mag] [--ssim] [--psnr] reference input [output]"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'measure '
-    flag_str = ''
+    with scratch.namespace(reference, input, backend=backend) as NAME:
+        staged = scratch.stage_all(NAME, {'reference': reference, 'input': input})
+
+        argv = [BART_PATH, 'measure']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if mse is not None:
-        flag_str += f'--mse '
+        if mse is not None:
+            flag_args += ['--mse']
 
-    if mse_mag is not None:
-        flag_str += f'--mse-mag '
+        if mse_mag is not None:
+            flag_args += ['--mse-mag']
 
-    if ssim is not None:
-        flag_str += f'--ssim '
+        if ssim is not None:
+            flag_args += ['--ssim']
 
-    if psnr is not None:
-        flag_str += f'--psnr '
-    cmd_str += flag_str + opt_args + '  '
+        if psnr is not None:
+            flag_args += ['--psnr']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}reference {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'reference', reference)
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['reference'], staged['input'], NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def mip(input, bitmask, m=None, a=None):
+def mip(input, bitmask, m=None, a=None, lazy=False, out=None, backend=None):
     """
     Maximum (minimum) intensity projection (MIP) along dimensions specified by bitmask.
 
@@ -2123,36 +2267,39 @@ def mip(input, bitmask, m=None, a=None):
     :param input array:
     :param m bool: minimum
     :param a bool: do absolute value first
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "mip [-m] [-a] bitmask input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'mip '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'mip']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if m is not None:
-        flag_str += f'-m '
+        if m is not None:
+            flag_args += ['-m']
 
-    if a is not None:
-        flag_str += f'-a '
-    cmd_str += flag_str + opt_args + '  '
+        if a is not None:
+            flag_args += ['-a']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {bitmask} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(bitmask), scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
 def mnist(input, weights, ref_output, apply=None, train=None, gpu=None):
     """
@@ -2169,34 +2316,34 @@ This network is to demonstrate how a neural network can be implemented in BART.
     """
     usage_string = "mnist [-a,--apply] [-t,--train] [-g,--gpu] input weights ref/output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'mnist '
-    flag_str = ''
+    with scratch.namespace(input) as NAME:
+        argv = [BART_PATH, 'mnist']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if apply is not None:
-        flag_str += f'--apply '
+        if apply is not None:
+            flag_args += ['--apply']
 
-    if train is not None:
-        flag_str += f'--train '
+        if train is not None:
+            flag_args += ['--train']
 
-    if gpu is not None:
-        flag_str += f'--gpu '
-    cmd_str += flag_str + opt_args + '  '
+        if gpu is not None:
+            flag_args += ['--gpu']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input {weights} {ref_output}  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'input', input), str(weights), str(ref_output)]
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-def moba(kspace, TI_TE, r=None, L=None, P=None, F=None, G=None, bloch=None, m=None, l=None, i=None, reduction=None, T=None, j=None, u=None, C=None, s=None, B=None, b=None, d=None, N=None, f=None, p=None, J=None, M=None, O=None, g=None, multi_gpu=None, I=None, t=None, o=None, img_dims=None, k=None, kfilter_1=None, kfilter_2=None, e=None, n=None, no_alpha_min_exp_decay=None, sobolev_a=None, sobolev_b=None, fat_spec_0=None, scale_data=None, scale_psf=None, normalize_scaling=None, seq=None, sim=None, other=None):
+def moba(kspace, TI_TE, r=None, L=None, P=None, F=None, G=None, bloch=None, m=None, l=None, i=None, reduction=None, T=None, j=None, u=None, C=None, s=None, B=None, b=None, d=None, N=None, f=None, p=None, J=None, M=None, O=None, g=None, multi_gpu=None, I=None, t=None, o=None, img_dims=None, k=None, kfilter_1=None, kfilter_2=None, e=None, n=None, no_alpha_min_exp_decay=None, sobolev_a=None, sobolev_b=None, fat_spec_0=None, scale_data=None, scale_psf=None, normalize_scaling=None, seq=None, sim=None, other=None, lazy=False, out=None, backend=None):
     """
     Model-based nonlinear inverse reconstruction
 
@@ -2247,171 +2394,172 @@ def moba(kspace, TI_TE, r=None, L=None, P=None, F=None, G=None, bloch=None, m=No
     :param seq SUBOPT: configure sequence parameters
     :param sim SUBOPT: configure simulation parameters
     :param other SUBOPT: configure other parameters
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "moba [-r ...] [-L] [-P] [-F] [-G] [--bloch] [-m d] [-l d] [-i d] [-R,--reduction f] [-T f] [-j f] [-u f] [-C d] [-s f] [-B f] [-b f:f] [-d d] [-f f] [-p file] [-J] [-M] [-g] [--multi-gpu d] [-I file] [-t file] [-o f] [--img_dims d:d:d] [-k] [--kfilter-1] [--kfilter-2] [-e f] [--fat_spec_0] [--scale_data f] [--seq ...] [--sim ...] [--other ...] kspace TI/TE output [sensitivities]"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'moba '
-    flag_str = ''
+    with scratch.namespace(kspace, TI_TE, p, I, t, backend=backend) as NAME:
+        staged = scratch.stage_all(NAME, {'kspace': kspace, 'TI_TE': TI_TE, 'p': p, 'I': I, 't': t})
 
-    opt_args = f''
+        argv = [BART_PATH, 'moba']
+        flag_args = []
 
-    multituples = []
+        opt_args = []
 
-    if r is not None:
-        flag_str += f'-r {r} '
+        multituples = []
 
-    if L is not None:
-        flag_str += f'-L '
+        if r is not None:
+            flag_args += ['-r', str(r)]
 
-    if P is not None:
-        flag_str += f'-P '
+        if L is not None:
+            flag_args += ['-L']
 
-    if F is not None:
-        flag_str += f'-F '
+        if P is not None:
+            flag_args += ['-P']
 
-    if G is not None:
-        flag_str += f'-G '
+        if F is not None:
+            flag_args += ['-F']
 
-    if bloch is not None:
-        flag_str += f'--bloch '
+        if G is not None:
+            flag_args += ['-G']
 
-    if m is not None:
-        flag_str += f'-m {m} '
+        if bloch is not None:
+            flag_args += ['--bloch']
 
-    if l is not None:
-        flag_str += f'-l {l} '
+        if m is not None:
+            flag_args += ['-m', str(m)]
 
-    if i is not None:
-        flag_str += f'-i {i} '
+        if l is not None:
+            flag_args += ['-l', str(l)]
 
-    if reduction is not None:
-        flag_str += f'--reduction {reduction} '
+        if i is not None:
+            flag_args += ['-i', str(i)]
 
-    if T is not None:
-        flag_str += f'-T {T} '
+        if reduction is not None:
+            flag_args += ['--reduction', str(reduction)]
 
-    if j is not None:
-        flag_str += f'-j {j} '
+        if T is not None:
+            flag_args += ['-T', str(T)]
 
-    if u is not None:
-        flag_str += f'-u {u} '
+        if j is not None:
+            flag_args += ['-j', str(j)]
 
-    if C is not None:
-        flag_str += f'-C {C} '
+        if u is not None:
+            flag_args += ['-u', str(u)]
 
-    if s is not None:
-        flag_str += f'-s {s} '
+        if C is not None:
+            flag_args += ['-C', str(C)]
 
-    if B is not None:
-        flag_str += f'-B {B} '
+        if s is not None:
+            flag_args += ['-s', str(s)]
 
-    if b is not None:
-        flag_str += f'-b {b} '
+        if B is not None:
+            flag_args += ['-B', str(B)]
 
-    if d is not None:
-        flag_str += f'-d {d} '
+        if b is not None:
+            flag_args += ['-b', str(b)]
 
-    if N is not None:
-        flag_str += f'-N '
+        if d is not None:
+            flag_args += ['-d', str(d)]
 
-    if f is not None:
-        flag_str += f'-f {f} '
+        if N is not None:
+            flag_args += ['-N']
 
-    if not isinstance(p, type(None)):
-        cfl.writecfl(NAME + 'p', p)
-        flag_str += f'-p {NAME}p '
+        if f is not None:
+            flag_args += ['-f', str(f)]
 
-    if J is not None:
-        flag_str += f'-J '
+        if not isinstance(p, type(None)):
+            flag_args += ['-p', staged['p']]
 
-    if M is not None:
-        flag_str += f'-M '
+        if J is not None:
+            flag_args += ['-J']
 
-    if O is not None:
-        flag_str += f'-O '
+        if M is not None:
+            flag_args += ['-M']
 
-    if g is not None:
-        flag_str += f'-g '
+        if O is not None:
+            flag_args += ['-O']
 
-    if multi_gpu is not None:
-        flag_str += f'--multi-gpu {multi_gpu} '
+        if g is not None:
+            flag_args += ['-g']
 
-    if not isinstance(I, type(None)):
-        cfl.writecfl(NAME + 'I', I)
-        flag_str += f'-I {NAME}I '
+        if multi_gpu is not None:
+            flag_args += ['--multi-gpu', str(multi_gpu)]
 
-    if not isinstance(t, type(None)):
-        cfl.writecfl(NAME + 't', t)
-        flag_str += f'-t {NAME}t '
+        if not isinstance(I, type(None)):
+            flag_args += ['-I', staged['I']]
 
-    if o is not None:
-        flag_str += f'-o {o} '
+        if not isinstance(t, type(None)):
+            flag_args += ['-t', staged['t']]
 
-    if img_dims is not None:
-        flag_str += f'--img_dims {":".join([str(x) for x in img_dims])} '
+        if o is not None:
+            flag_args += ['-o', str(o)]
 
-    if k is not None:
-        flag_str += f'-k '
+        if img_dims is not None:
+            flag_args += ['--img_dims', ":".join([str(x) for x in img_dims])]
 
-    if kfilter_1 is not None:
-        flag_str += f'--kfilter-1 '
+        if k is not None:
+            flag_args += ['-k']
 
-    if kfilter_2 is not None:
-        flag_str += f'--kfilter-2 '
+        if kfilter_1 is not None:
+            flag_args += ['--kfilter-1']
 
-    if e is not None:
-        flag_str += f'-e {e} '
+        if kfilter_2 is not None:
+            flag_args += ['--kfilter-2']
 
-    if n is not None:
-        flag_str += f'-n '
+        if e is not None:
+            flag_args += ['-e', str(e)]
 
-    if no_alpha_min_exp_decay is not None:
-        flag_str += f'--no_alpha_min_exp_decay '
+        if n is not None:
+            flag_args += ['-n']
 
-    if sobolev_a is not None:
-        flag_str += f'--sobolev_a {sobolev_a} '
+        if no_alpha_min_exp_decay is not None:
+            flag_args += ['--no_alpha_min_exp_decay']
 
-    if sobolev_b is not None:
-        flag_str += f'--sobolev_b {sobolev_b} '
+        if sobolev_a is not None:
+            flag_args += ['--sobolev_a', str(sobolev_a)]
 
-    if fat_spec_0 is not None:
-        flag_str += f'--fat_spec_0 '
+        if sobolev_b is not None:
+            flag_args += ['--sobolev_b', str(sobolev_b)]
 
-    if scale_data is not None:
-        flag_str += f'--scale_data {scale_data} '
+        if fat_spec_0 is not None:
+            flag_args += ['--fat_spec_0']
 
-    if scale_psf is not None:
-        flag_str += f'--scale_psf {scale_psf} '
+        if scale_data is not None:
+            flag_args += ['--scale_data', str(scale_data)]
 
-    if normalize_scaling is not None:
-        flag_str += f'--normalize_scaling '
+        if scale_psf is not None:
+            flag_args += ['--scale_psf', str(scale_psf)]
 
-    if seq is not None:
-        flag_str += f'--seq {seq} '
+        if normalize_scaling is not None:
+            flag_args += ['--normalize_scaling']
 
-    if sim is not None:
-        flag_str += f'--sim {sim} '
+        if seq is not None:
+            flag_args += ['--seq', str(seq)]
 
-    if other is not None:
-        flag_str += f'--other {other} '
-    cmd_str += flag_str + opt_args + '  '
+        if sim is not None:
+            flag_args += ['--sim', str(sim)]
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}kspace {NAME}TI_TE {NAME}output {NAME}sensitivities  "
-    cfl.writecfl(NAME + 'kspace', kspace)
-    cfl.writecfl(NAME + 'TI_TE', TI_TE)
+        if other is not None:
+            flag_args += ['--other', str(other)]
+        argv += flag_args + opt_args
 
-    if DEBUG:
-        print(cmd_str)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['kspace'], staged['TI_TE'], NAME + 'output', NAME + 'sensitivities']
 
+        if DEBUG:
+            print(' '.join(argv))
 
-    os.system(cmd_str)
 
-    outputs = cfl.readcfl(NAME + 'output'), cfl.readcfl(NAME + 'sensitivities')
-    return outputs
+        launch.run(argv)
 
-def mobafit(enc, echo_contrast_images, T=None, G=None, D=None, m=None, i=None, p=None, g=None):
+        outputs = scratch.fetch_all([NAME + 'output', NAME + 'sensitivities'], lazy, out)
+        return outputs
+
+def mobafit(enc, echo_contrast_images, T=None, G=None, D=None, m=None, i=None, p=None, g=None, lazy=False, out=None, backend=None):
     """
     Pixel-wise fitting of physical signal models.
 
@@ -2424,54 +2572,58 @@ def mobafit(enc, echo_contrast_images, T=None, G=None, D=None, m=None, i=None, p
     :param i int: Number of IRGNM steps
     :param p list: (patch size)
     :param g bool: use gpu
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "mobafit [-T] [-G] [-D] [-m d] [-i d] [-g] enc echo/contrast images [coefficients]"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'mobafit '
-    flag_str = ''
+    with scratch.namespace(enc, echo_contrast_images, backend=backend) as NAME:
+        staged = scratch.stage_all(NAME, {'enc': enc, 'echo_contrast_images': echo_contrast_images})
+
+        argv = [BART_PATH, 'mobafit']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if T is not None:
-        flag_str += f'-T '
+        if T is not None:
+            flag_args += ['-T']
 
-    if G is not None:
-        flag_str += f'-G '
+        if G is not None:
+            flag_args += ['-G']
 
-    if D is not None:
-        flag_str += f'-D '
+        if D is not None:
+            flag_args += ['-D']
 
-    if m is not None:
-        flag_str += f'-m {m} '
+        if m is not None:
+            flag_args += ['-m', str(m)]
 
-    if i is not None:
-        flag_str += f'-i {i} '
+        if i is not None:
+            flag_args += ['-i', str(i)]
 
-    if p is not None:
-        flag_str += f'-p {":".join([str(x) for x in p])} '
+        if p is not None:
+            flag_args += ['-p', ":".join([str(x) for x in p])]
 
-    if g is not None:
-        flag_str += f'-g '
-    cmd_str += flag_str + opt_args + '  '
+        if g is not None:
+            flag_args += ['-g']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}enc {NAME}echo_contrast_images {NAME}coefficients  "
-    cfl.writecfl(NAME + 'enc', enc)
-    cfl.writecfl(NAME + 'echo_contrast_images', echo_contrast_images)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['enc'], staged['echo_contrast_images'], NAME + 'coefficients']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'coefficients')
-    return outputs
+        outputs = scratch.fetch(NAME + 'coefficients', lazy, out)
+        return outputs
 
-def morphop(binary_input, mask_size, e=None, d=None, o=None, c=None):
+def morphop(binary_input, mask_size, e=None, d=None, o=None, c=None, lazy=False, out=None, backend=None):
     """
     Perform morphological operators on binary data with odd mask sizes.
 
@@ -2481,42 +2633,45 @@ def morphop(binary_input, mask_size, e=None, d=None, o=None, c=None):
     :param d bool: DILATION
     :param o bool: OPENING
     :param c bool: CLOSING
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "morphop [-e] [-d] [-o] [-c] mask_size binary input [binary output]"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'morphop '
-    flag_str = ''
+    with scratch.namespace(binary_input, backend=backend) as NAME:
+        argv = [BART_PATH, 'morphop']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if e is not None:
-        flag_str += f'-e '
+        if e is not None:
+            flag_args += ['-e']
 
-    if d is not None:
-        flag_str += f'-d '
+        if d is not None:
+            flag_args += ['-d']
 
-    if o is not None:
-        flag_str += f'-o '
+        if o is not None:
+            flag_args += ['-o']
 
-    if c is not None:
-        flag_str += f'-c '
-    cmd_str += flag_str + opt_args + '  '
+        if c is not None:
+            flag_args += ['-c']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {mask_size} {NAME}binary_input {NAME}binary_output  "
-    cfl.writecfl(NAME + 'binary_input', binary_input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(mask_size), scratch.stage(NAME + 'binary_input', binary_input), NAME + 'binary_output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'binary_output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'binary_output', lazy, out)
+        return outputs
 
 def multicfl(cfl, s=None):
     """
@@ -2530,27 +2685,28 @@ with '-s', the first argument is the multi-cfl that is split up
     """
     usage_string = "multicfl [-s] cfl1 ... cflN"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'multicfl '
-    flag_str = ''
+    with scratch.namespace() as NAME:
+        argv = [BART_PATH, 'multicfl']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if s is not None:
-        flag_str += f'-s '
-    cmd_str += flag_str + opt_args + '  '
+        if s is not None:
+            flag_args += ['-s']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {' '.join([str(arg) for arg in cfl])}  "
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [*[str(arg) for arg in cfl]]
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-def nlinv(kspace, i=None, R=None, M=None, d=None, c=None, N=None, m=None, U=None, f=None, p=None, t=None, I=None, g=None, S=None, s=None, a=None, b=None, P=None, n=None, w=None, lowmem=None):
+def nlinv(kspace, i=None, R=None, M=None, d=None, c=None, N=None, m=None, U=None, f=None, p=None, t=None, I=None, g=None, S=None, s=None, a=None, b=None, P=None, n=None, w=None, lowmem=None, lazy=False, out=None, backend=None):
     """
     Jointly estimate image and sensitivities with nonlinear
 inversion using {iter} iteration steps. Optionally outputs
@@ -2578,96 +2734,98 @@ the sensitivities.
     :param n bool: (non-Cartesian)
     :param w float: (inverse scaling of the data)
     :param lowmem bool: Use low-mem mode of the nuFFT
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "nlinv [-i d] [-d d] [-c] [-N] [-m d] [-U] [-f f] [-p file] [-t file] [-I file] [-g] [-S] [--lowmem] kspace output [sensitivities]"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'nlinv '
-    flag_str = ''
+    with scratch.namespace(kspace, p, t, I, backend=backend) as NAME:
+        staged = scratch.stage_all(NAME, {'kspace': kspace, 'p': p, 't': t, 'I': I})
 
-    opt_args = f''
+        argv = [BART_PATH, 'nlinv']
+        flag_args = []
 
-    multituples = []
+        opt_args = []
 
-    if i is not None:
-        flag_str += f'-i {i} '
+        multituples = []
 
-    if R is not None:
-        flag_str += f'-R {R} '
+        if i is not None:
+            flag_args += ['-i', str(i)]
 
-    if M is not None:
-        flag_str += f'-M {M} '
+        if R is not None:
+            flag_args += ['-R', str(R)]
 
-    if d is not None:
-        flag_str += f'-d {d} '
+        if M is not None:
+            flag_args += ['-M', str(M)]
 
-    if c is not None:
-        flag_str += f'-c '
+        if d is not None:
+            flag_args += ['-d', str(d)]
 
-    if N is not None:
-        flag_str += f'-N '
+        if c is not None:
+            flag_args += ['-c']
 
-    if m is not None:
-        flag_str += f'-m {m} '
+        if N is not None:
+            flag_args += ['-N']
 
-    if U is not None:
-        flag_str += f'-U '
+        if m is not None:
+            flag_args += ['-m', str(m)]
 
-    if f is not None:
-        flag_str += f'-f {f} '
+        if U is not None:
+            flag_args += ['-U']
 
-    if not isinstance(p, type(None)):
-        cfl.writecfl(NAME + 'p', p)
-        flag_str += f'-p {NAME}p '
+        if f is not None:
+            flag_args += ['-f', str(f)]
 
-    if not isinstance(t, type(None)):
-        cfl.writecfl(NAME + 't', t)
-        flag_str += f'-t {NAME}t '
+        if not isinstance(p, type(None)):
+            flag_args += ['-p', staged['p']]
 
-    if not isinstance(I, type(None)):
-        cfl.writecfl(NAME + 'I', I)
-        flag_str += f'-I {NAME}I '
+        if not isinstance(t, type(None)):
+            flag_args += ['-t', staged['t']]
 
-    if g is not None:
-        flag_str += f'-g '
+        if not isinstance(I, type(None)):
+            flag_args += ['-I', staged['I']]
 
-    if S is not None:
-        flag_str += f'-S '
+        if g is not None:
+            flag_args += ['-g']
 
-    if s is not None:
-        flag_str += f'-s {s} '
+        if S is not None:
+            flag_args += ['-S']
 
-    if a is not None:
-        flag_str += f'-a {a} '
+        if s is not None:
+            flag_args += ['-s', str(s)]
 
-    if b is not None:
-        flag_str += f'-b {b} '
+        if a is not None:
+            flag_args += ['-a', str(a)]
 
-    if P is not None:
-        flag_str += f'-P '
+        if b is not None:
+            flag_args += ['-b', str(b)]
 
-    if n is not None:
-        flag_str += f'-n '
+        if P is not None:
+            flag_args += ['-P']
 
-    if w is not None:
-        flag_str += f'-w {w} '
+        if n is not None:
+            flag_args += ['-n']
 
-    if lowmem is not None:
-        flag_str += f'--lowmem '
-    cmd_str += flag_str + opt_args + '  '
+        if w is not None:
+            flag_args += ['-w', str(w)]
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}kspace {NAME}output {NAME}sensitivities  "
-    cfl.writecfl(NAME + 'kspace', kspace)
+        if lowmem is not None:
+            flag_args += ['--lowmem']
+        argv += flag_args + opt_args
 
-    if DEBUG:
-        print(cmd_str)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['kspace'], NAME + 'output', NAME + 'sensitivities']
 
+        if DEBUG:
+            print(' '.join(argv))
 
-    os.system(cmd_str)
 
-    outputs = cfl.readcfl(NAME + 'output'), cfl.readcfl(NAME + 'sensitivities')
-    return outputs
+        launch.run(argv)
+
+        outputs = scratch.fetch_all([NAME + 'output', NAME + 'sensitivities'], lazy, out)
+        return outputs
 
 def nnet(input, weights, ref_output, apply=None, eval=None, train=None, gpu=None, batch_size=None, load=None, network=None, unet_segm=None, train_loss=None, valid_loss=None, valid_data=None, train_algo=None, adam=None, load_memory=None, export_graph=None):
     """
@@ -2695,71 +2853,72 @@ def nnet(input, weights, ref_output, apply=None, eval=None, train=None, gpu=None
     """
     usage_string = "nnet [-a,--apply] [-e,--eval] [-t,--train] [-g,--gpu] [-b,--batch-size d] [-l,--load file] [-N,--network ...] [-U,--unet-segm ...] [--train-loss ...] [--valid-loss ...] [--valid-data ...] [-T,--train-algo ...] [--adam ...] [--load-memory] [--export-graph string] input weights ref/output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'nnet '
-    flag_str = ''
+    with scratch.namespace(input, load) as NAME:
+        staged = scratch.stage_all(NAME, {'input': input, 'load': load})
+
+        argv = [BART_PATH, 'nnet']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if apply is not None:
-        flag_str += f'--apply '
+        if apply is not None:
+            flag_args += ['--apply']
 
-    if eval is not None:
-        flag_str += f'--eval '
+        if eval is not None:
+            flag_args += ['--eval']
 
-    if train is not None:
-        flag_str += f'--train '
+        if train is not None:
+            flag_args += ['--train']
 
-    if gpu is not None:
-        flag_str += f'--gpu '
+        if gpu is not None:
+            flag_args += ['--gpu']
 
-    if batch_size is not None:
-        flag_str += f'--batch-size {batch_size} '
+        if batch_size is not None:
+            flag_args += ['--batch-size', str(batch_size)]
 
-    if not isinstance(load, type(None)):
-        cfl.writecfl(NAME + 'load', load)
-        flag_str += f'--load {NAME}load '
+        if not isinstance(load, type(None)):
+            flag_args += ['--load', staged['load']]
 
-    if network is not None:
-        flag_str += f'--network {network} '
+        if network is not None:
+            flag_args += ['--network', str(network)]
 
-    if unet_segm is not None:
-        flag_str += f'--unet-segm {unet_segm} '
+        if unet_segm is not None:
+            flag_args += ['--unet-segm', str(unet_segm)]
 
-    if train_loss is not None:
-        flag_str += f'--train-loss {train_loss} '
+        if train_loss is not None:
+            flag_args += ['--train-loss', str(train_loss)]
 
-    if valid_loss is not None:
-        flag_str += f'--valid-loss {valid_loss} '
+        if valid_loss is not None:
+            flag_args += ['--valid-loss', str(valid_loss)]
 
-    if valid_data is not None:
-        flag_str += f'--valid-data {valid_data} '
+        if valid_data is not None:
+            flag_args += ['--valid-data', str(valid_data)]
 
-    if train_algo is not None:
-        flag_str += f'--train-algo {train_algo} '
+        if train_algo is not None:
+            flag_args += ['--train-algo', str(train_algo)]
 
-    if adam is not None:
-        flag_str += f'--adam {adam} '
+        if adam is not None:
+            flag_args += ['--adam', str(adam)]
 
-    if load_memory is not None:
-        flag_str += f'--load-memory '
+        if load_memory is not None:
+            flag_args += ['--load-memory']
 
-    if export_graph is not None:
-        flag_str += f'--export-graph {export_graph} '
-    cmd_str += flag_str + opt_args + '  '
+        if export_graph is not None:
+            flag_args += ['--export-graph', str(export_graph)]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input {weights} {ref_output}  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['input'], str(weights), str(ref_output)]
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-def noise(input, s=None, S=None, r=None, n=None):
+def noise(input, s=None, S=None, r=None, n=None, lazy=False, out=None, backend=None):
     """
     Add noise with selected variance to input.
 
@@ -2768,77 +2927,83 @@ def noise(input, s=None, S=None, r=None, n=None):
     :param S float: ()
     :param r bool: real-valued input
     :param n float: DEFAULT: 1.0
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "noise [-s d] [-r] [-n f] input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'noise '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'noise']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if s is not None:
-        flag_str += f'-s {s} '
+        if s is not None:
+            flag_args += ['-s', str(s)]
 
-    if S is not None:
-        flag_str += f'-S {S} '
+        if S is not None:
+            flag_args += ['-S', str(S)]
 
-    if r is not None:
-        flag_str += f'-r '
+        if r is not None:
+            flag_args += ['-r']
 
-    if n is not None:
-        flag_str += f'-n {n} '
-    cmd_str += flag_str + opt_args + '  '
+        if n is not None:
+            flag_args += ['-n', str(n)]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def normalize(input, flags, b=None):
+def normalize(input, flags, b=None, lazy=False, out=None, backend=None):
     """
     Normalize along selected dimensions.
 
     :param flags int:
     :param input array:
     :param b bool: l1
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "normalize [-b] flags input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'normalize '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'normalize']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if b is not None:
-        flag_str += f'-b '
-    cmd_str += flag_str + opt_args + '  '
+        if b is not None:
+            flag_args += ['-b']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {flags} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(flags), scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
 def nrmse(reference, input, t=None, s=None):
     """
@@ -2853,32 +3018,33 @@ i.e. norm(input - ref) / norm(ref)
     """
     usage_string = "nrmse [-t f] [-s] reference input"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'nrmse '
-    flag_str = ''
+    with scratch.namespace(reference, input) as NAME:
+        staged = scratch.stage_all(NAME, {'reference': reference, 'input': input})
 
-    opt_args = f''
+        argv = [BART_PATH, 'nrmse']
+        flag_args = []
 
-    multituples = []
+        opt_args = []
 
-    if t is not None:
-        flag_str += f'-t {t} '
+        multituples = []
 
-    if s is not None:
-        flag_str += f'-s '
-    cmd_str += flag_str + opt_args + '  '
+        if t is not None:
+            flag_args += ['-t', str(t)]
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}reference {NAME}input  "
-    cfl.writecfl(NAME + 'reference', reference)
-    cfl.writecfl(NAME + 'input', input)
+        if s is not None:
+            flag_args += ['-s']
+        argv += flag_args + opt_args
 
-    if DEBUG:
-        print(cmd_str)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['reference'], staged['input']]
 
+        if DEBUG:
+            print(' '.join(argv))
 
-    os.system(cmd_str)
 
-def nufft(traj, input, a=None, i=None, d=None, D=None, t=None, r=None, c=None, l=None, m=None, P=None, s=None, g=None, _1=None, lowmem=None):
+        launch.run(argv)
+
+def nufft(traj, input, a=None, i=None, d=None, D=None, t=None, r=None, c=None, l=None, m=None, P=None, s=None, g=None, _1=None, lowmem=None, lazy=False, out=None, backend=None):
     """
     Perform non-uniform Fast Fourier Transform.
 
@@ -2898,75 +3064,79 @@ def nufft(traj, input, a=None, i=None, d=None, D=None, t=None, r=None, c=None, l
     :param g bool: GPU (only inverse)
     :param _1 bool: use/return oversampled grid
     :param lowmem bool: Use low-mem mode of the nuFFT
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "nufft [-a] [-i] [-d d:d:d] [-t] [-r] [-c] [-l f] [-P] [-s] [-g] [-1] [--lowmem] traj input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'nufft '
-    flag_str = ''
+    with scratch.namespace(traj, input, backend=backend) as NAME:
+        staged = scratch.stage_all(NAME, {'traj': traj, 'input': input})
+
+        argv = [BART_PATH, 'nufft']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if a is not None:
-        flag_str += f'-a '
+        if a is not None:
+            flag_args += ['-a']
 
-    if i is not None:
-        flag_str += f'-i '
+        if i is not None:
+            flag_args += ['-i']
 
-    if d is not None:
-        flag_str += f'-d {":".join([str(x) for x in d])} '
+        if d is not None:
+            flag_args += ['-d', ":".join([str(x) for x in d])]
 
-    if D is not None:
-        flag_str += f'-D {":".join([str(x) for x in D])} '
+        if D is not None:
+            flag_args += ['-D', ":".join([str(x) for x in D])]
 
-    if t is not None:
-        flag_str += f'-t '
+        if t is not None:
+            flag_args += ['-t']
 
-    if r is not None:
-        flag_str += f'-r '
+        if r is not None:
+            flag_args += ['-r']
 
-    if c is not None:
-        flag_str += f'-c '
+        if c is not None:
+            flag_args += ['-c']
 
-    if l is not None:
-        flag_str += f'-l {l} '
+        if l is not None:
+            flag_args += ['-l', str(l)]
 
-    if m is not None:
-        flag_str += f'-m {m} '
+        if m is not None:
+            flag_args += ['-m', str(m)]
 
-    if P is not None:
-        flag_str += f'-P '
+        if P is not None:
+            flag_args += ['-P']
 
-    if s is not None:
-        flag_str += f'-s '
+        if s is not None:
+            flag_args += ['-s']
 
-    if g is not None:
-        flag_str += f'-g '
+        if g is not None:
+            flag_args += ['-g']
 
-    if _1 is not None:
-        flag_str += f'-1 '
+        if _1 is not None:
+            flag_args += ['-1']
 
-    if lowmem is not None:
-        flag_str += f'--lowmem '
-    cmd_str += flag_str + opt_args + '  '
+        if lowmem is not None:
+            flag_args += ['--lowmem']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}traj {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'traj', traj)
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['traj'], staged['input'], NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def onehotenc(input, r=None, i=None):
+def onehotenc(input, r=None, i=None, lazy=False, out=None, backend=None):
     """
     Transforms class labels to one-hot-encoded classes
 
@@ -2974,102 +3144,112 @@ def onehotenc(input, r=None, i=None):
     :param input array:
     :param r bool: get class label by maximum entry
     :param i int: select dimension
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "onehotenc [-r] [-i d] input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'onehotenc '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'onehotenc']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if r is not None:
-        flag_str += f'-r '
+        if r is not None:
+            flag_args += ['-r']
 
-    if i is not None:
-        flag_str += f'-i {i} '
-    cmd_str += flag_str + opt_args + '  '
+        if i is not None:
+            flag_args += ['-i', str(i)]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def ones(dims, dim):
+def ones(dims, dim, lazy=False, out=None, backend=None):
     """
     Create an array filled with ones with {dims} dimensions of size {dim1} to {dimn}.
 
     :param dims long:
     :param dim tuple:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "ones dims dim1 ... dimN output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'ones '
-    flag_str = ''
+    with scratch.namespace(backend=backend) as NAME:
+        argv = [BART_PATH, 'ones']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {dims} {' '.join([str(arg) for arg in dim])} {NAME}output  "
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(dims), *[str(arg) for arg in dim], NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def pattern(kspace, s=None):
+def pattern(kspace, s=None, lazy=False, out=None, backend=None):
     """
     Compute sampling pattern from kspace
 
     :param kspace array:
     :param s int: Squash dimensions selected by bitmask
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "pattern [-s d] kspace pattern"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'pattern '
-    flag_str = ''
+    with scratch.namespace(kspace, backend=backend) as NAME:
+        argv = [BART_PATH, 'pattern']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if s is not None:
-        flag_str += f'-s {s} '
-    cmd_str += flag_str + opt_args + '  '
+        if s is not None:
+            flag_args += ['-s', str(s)]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}kspace {NAME}pattern  "
-    cfl.writecfl(NAME + 'kspace', kspace)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'kspace', kspace), NAME + 'pattern']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'pattern')
-    return outputs
+        outputs = scratch.fetch(NAME + 'pattern', lazy, out)
+        return outputs
 
-def phantom(s=None, S=None, k=None, t=None, c=None, a=None, m=None, G=None, T=None, NIST=None, SONAR=None, N=None, B=None, x=None, g=None, _3=None, b=None, r=None, rotation_angle=None, rotation_steps=None):
+def phantom(s=None, S=None, k=None, t=None, c=None, a=None, m=None, G=None, T=None, NIST=None, SONAR=None, N=None, B=None, x=None, g=None, _3=None, b=None, r=None, rotation_angle=None, rotation_steps=None, lazy=False, out=None, backend=None):
     """
     Image and k-space domain phantoms.
 
@@ -3093,92 +3273,95 @@ def phantom(s=None, S=None, k=None, t=None, c=None, a=None, m=None, G=None, T=No
     :param r int: random seed initialization
     :param rotation_angle float: Angle of Rotation
     :param rotation_steps int: Number of rotation steps
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "phantom [-s d] [-S d] [-k] [-t file] [-G] [-T] [--NIST] [--SONAR] [-N d] [-B] [-x d] [-g d] [-3] [-b] [-r d] [--rotation-angle f] [--rotation-steps d] output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'phantom '
-    flag_str = ''
+    with scratch.namespace(t, backend=backend) as NAME:
+        argv = [BART_PATH, 'phantom']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if s is not None:
-        flag_str += f'-s {s} '
+        if s is not None:
+            flag_args += ['-s', str(s)]
 
-    if S is not None:
-        flag_str += f'-S {S} '
+        if S is not None:
+            flag_args += ['-S', str(S)]
 
-    if k is not None:
-        flag_str += f'-k '
+        if k is not None:
+            flag_args += ['-k']
 
-    if not isinstance(t, type(None)):
-        cfl.writecfl(NAME + 't', t)
-        flag_str += f'-t {NAME}t '
+        if not isinstance(t, type(None)):
+            flag_args += ['-t', scratch.stage(NAME + 't', t)]
 
-    if c is not None:
-        flag_str += f'-c '
+        if c is not None:
+            flag_args += ['-c']
 
-    if a is not None:
-        flag_str += f'-a '
+        if a is not None:
+            flag_args += ['-a']
 
-    if m is not None:
-        flag_str += f'-m '
+        if m is not None:
+            flag_args += ['-m']
 
-    if G is not None:
-        flag_str += f'-G '
+        if G is not None:
+            flag_args += ['-G']
 
-    if T is not None:
-        flag_str += f'-T '
+        if T is not None:
+            flag_args += ['-T']
 
-    if NIST is not None:
-        flag_str += f'--NIST '
+        if NIST is not None:
+            flag_args += ['--NIST']
 
-    if SONAR is not None:
-        flag_str += f'--SONAR '
+        if SONAR is not None:
+            flag_args += ['--SONAR']
 
-    if N is not None:
-        flag_str += f'-N {N} '
+        if N is not None:
+            flag_args += ['-N', str(N)]
 
-    if B is not None:
-        flag_str += f'-B '
+        if B is not None:
+            flag_args += ['-B']
 
-    if x is not None:
-        flag_str += f'-x {x} '
+        if x is not None:
+            flag_args += ['-x', str(x)]
 
-    if g is not None:
-        flag_str += f'-g {g} '
+        if g is not None:
+            flag_args += ['-g', str(g)]
 
-    if _3 is not None:
-        flag_str += f'-3 '
+        if _3 is not None:
+            flag_args += ['-3']
 
-    if b is not None:
-        flag_str += f'-b '
+        if b is not None:
+            flag_args += ['-b']
 
-    if r is not None:
-        flag_str += f'-r {r} '
+        if r is not None:
+            flag_args += ['-r', str(r)]
 
-    if rotation_angle is not None:
-        flag_str += f'--rotation-angle {rotation_angle} '
+        if rotation_angle is not None:
+            flag_args += ['--rotation-angle', str(rotation_angle)]
 
-    if rotation_steps is not None:
-        flag_str += f'--rotation-steps {rotation_steps} '
-    cmd_str += flag_str + opt_args + '  '
+        if rotation_steps is not None:
+            flag_args += ['--rotation-steps', str(rotation_steps)]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}output  "
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def pics(kspace, sensitivities, l=None, r=None, R=None, c=None, s=None, i=None, t=None, n=None, N=None, g=None, G=None, p=None, I=None, b=None, e=None, H=None, D=None, F=None, J=None, T=None, W=None, d=None, O=None, o=None, u=None, C=None, q=None, f=None, m=None, w=None, S=None, L=None, K=None, B=None, P=None, a=None, M=None, lowmem=None, psf_import=None, wavelet=None):
+def pics(kspace, sensitivities, l=None, r=None, R=None, c=None, s=None, i=None, t=None, n=None, N=None, g=None, G=None, p=None, I=None, b=None, e=None, H=None, D=None, F=None, J=None, T=None, W=None, d=None, O=None, o=None, u=None, C=None, q=None, f=None, m=None, w=None, S=None, L=None, K=None, B=None, P=None, a=None, M=None, lowmem=None, psf_import=None, wavelet=None, lazy=False, out=None, backend=None):
     """
     Parallel-imaging compressed-sensing reconstruction.
 
@@ -3226,159 +3409,157 @@ def pics(kspace, sensitivities, l=None, r=None, R=None, c=None, s=None, i=None,
     :param lowmem bool: Use low-mem mode of the nuFFT
     :param psf_import array: Import PSF from file
     :param wavelet STRING: wavelet type (haar dau2 cdf44)
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "pics [-l ...] [-r f] [-R ...] [-c] [-s f] [-i d] [-t file] [-n] [-N] [-g] [-G d] [-p file] [-I] [-b d] [-e] [-W file] [-d d] [-u f] [-C d] [-f f] [-m] [-w f] [-S] [-L d] [-K] [-B file] [-P f] [-a] [-M] [-U,--lowmem] [--psf_export file] [--psf_import file] [--wavelet string] kspace sensitivities output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'pics '
-    flag_str = ''
+    with scratch.namespace(kspace, sensitivities, t, p, T, W, B, psf_import, backend=backend) as NAME:
+        staged = scratch.stage_all(NAME, {'kspace': kspace, 'sensitivities': sensitivities, 't': t, 'p': p, 'T': T, 'W': W, 'B': B, 'psf_import': psf_import})
 
-    opt_args = f''
+        argv = [BART_PATH, 'pics']
+        flag_args = []
 
-    multituples = []
+        opt_args = []
 
-    if l is not None:
-        flag_str += f'-l {l} '
+        multituples = []
 
-    if r is not None:
-        flag_str += f'-r {r} '
+        if l is not None:
+            flag_args += ['-l', str(l)]
 
-    if R is not None:
-        flag_str += f'-R {R} '
+        if r is not None:
+            flag_args += ['-r', str(r)]
 
-    if c is not None:
-        flag_str += f'-c '
+        if R is not None:
+            flag_args += ['-R', str(R)]
 
-    if s is not None:
-        flag_str += f'-s {s} '
+        if c is not None:
+            flag_args += ['-c']
 
-    if i is not None:
-        flag_str += f'-i {i} '
+        if s is not None:
+            flag_args += ['-s', str(s)]
 
-    if not isinstance(t, type(None)):
-        cfl.writecfl(NAME + 't', t)
-        flag_str += f'-t {NAME}t '
+        if i is not None:
+            flag_args += ['-i', str(i)]
 
-    if n is not None:
-        flag_str += f'-n '
+        if not isinstance(t, type(None)):
+            flag_args += ['-t', staged['t']]
 
-    if N is not None:
-        flag_str += f'-N '
+        if n is not None:
+            flag_args += ['-n']
 
-    if g is not None:
-        flag_str += f'-g '
+        if N is not None:
+            flag_args += ['-N']
 
-    if G is not None:
-        flag_str += f'-G {G} '
+        if g is not None:
+            flag_args += ['-g']
 
-    if not isinstance(p, type(None)):
-        cfl.writecfl(NAME + 'p', p)
-        flag_str += f'-p {NAME}p '
+        if G is not None:
+            flag_args += ['-G', str(G)]
 
-    if I is not None:
-        flag_str += f'-I '
+        if not isinstance(p, type(None)):
+            flag_args += ['-p', staged['p']]
 
-    if b is not None:
-        flag_str += f'-b {b} '
+        if I is not None:
+            flag_args += ['-I']
 
-    if e is not None:
-        flag_str += f'-e '
+        if b is not None:
+            flag_args += ['-b', str(b)]
 
-    if H is not None:
-        flag_str += f'-H '
+        if e is not None:
+            flag_args += ['-e']
 
-    if D is not None:
-        flag_str += f'-D '
+        if H is not None:
+            flag_args += ['-H']
 
-    if F is not None:
-        flag_str += f'-F '
+        if D is not None:
+            flag_args += ['-D']
 
-    if J is not None:
-        flag_str += f'-J '
+        if F is not None:
+            flag_args += ['-F']
 
-    if not isinstance(T, type(None)):
-        cfl.writecfl(NAME + 'T', T)
-        flag_str += f'-T {NAME}T '
+        if J is not None:
+            flag_args += ['-J']
 
-    if not isinstance(W, type(None)):
-        cfl.writecfl(NAME + 'W', W)
-        flag_str += f'-W {NAME}W '
+        if not isinstance(T, type(None)):
+            flag_args += ['-T', staged['T']]
 
-    if d is not None:
-        flag_str += f'-d {d} '
+        if not isinstance(W, type(None)):
+            flag_args += ['-W', staged['W']]
 
-    if O is not None:
-        flag_str += f'-O {O} '
+        if d is not None:
+            flag_args += ['-d', str(d)]
 
-    if o is not None:
-        flag_str += f'-o {o} '
+        if O is not None:
+            flag_args += ['-O', str(O)]
 
-    if u is not None:
-        flag_str += f'-u {u} '
+        if o is not None:
+            flag_args += ['-o', str(o)]
 
-    if C is not None:
-        flag_str += f'-C {C} '
+        if u is not None:
+            flag_args += ['-u', str(u)]
 
-    if q is not None:
-        flag_str += f'-q {q} '
+        if C is not None:
+            flag_args += ['-C', str(C)]
 
-    if f is not None:
-        flag_str += f'-f {f} '
+        if q is not None:
+            flag_args += ['-q', str(q)]
 
-    if m is not None:
-        flag_str += f'-m '
+        if f is not None:
+            flag_args += ['-f', str(f)]
 
-    if w is not None:
-        flag_str += f'-w {w} '
+        if m is not None:
+            flag_args += ['-m']
 
-    if S is not None:
-        flag_str += f'-S '
+        if w is not None:
+            flag_args += ['-w', str(w)]
 
-    if L is not None:
-        flag_str += f'-L {L} '
+        if S is not None:
+            flag_args += ['-S']
 
-    if K is not None:
-        flag_str += f'-K '
+        if L is not None:
+            flag_args += ['-L', str(L)]
 
-    if not isinstance(B, type(None)):
-        cfl.writecfl(NAME + 'B', B)
-        flag_str += f'-B {NAME}B '
+        if K is not None:
+            flag_args += ['-K']
 
-    if P is not None:
-        flag_str += f'-P {P} '
+        if not isinstance(B, type(None)):
+            flag_args += ['-B', staged['B']]
 
-    if a is not None:
-        flag_str += f'-a '
+        if P is not None:
+            flag_args += ['-P', str(P)]
 
-    if M is not None:
-        flag_str += f'-M '
+        if a is not None:
+            flag_args += ['-a']
 
-    if lowmem is not None:
-        flag_str += f'--lowmem '
+        if M is not None:
+            flag_args += ['-M']
 
-    if not isinstance(psf_import, type(None)):
-        cfl.writecfl(NAME + 'psf_import', psf_import)
-        flag_str += f'--psf_import {NAME}psf_import '
+        if lowmem is not None:
+            flag_args += ['--lowmem']
 
-    if wavelet is not None:
-        flag_str += f'--wavelet {wavelet} '
-    cmd_str += flag_str + opt_args + '  '
+        if not isinstance(psf_import, type(None)):
+            flag_args += ['--psf_import', staged['psf_import']]
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}kspace {NAME}sensitivities {NAME}output {NAME}psf_export  "
-    cfl.writecfl(NAME + 'kspace', kspace)
-    cfl.writecfl(NAME + 'sensitivities', sensitivities)
+        if wavelet is not None:
+            flag_args += ['--wavelet', str(wavelet)]
+        argv += flag_args + opt_args
 
-    if DEBUG:
-        print(cmd_str)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['kspace'], staged['sensitivities'], NAME + 'output', NAME + 'psf_export']
 
+        if DEBUG:
+            print(' '.join(argv))
 
-    os.system(cmd_str)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        launch.run(argv)
 
-def pocsense(kspace, sensitivities, i=None, r=None, l=None, g=None, o=None, m=None):
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
+
+def pocsense(kspace, sensitivities, i=None, r=None, l=None, g=None, o=None, m=None, lazy=False, out=None, backend=None):
     """
     Perform POCSENSE reconstruction.
 
@@ -3390,51 +3571,55 @@ def pocsense(kspace, sensitivities, i=None, r=None, l=None, g=None, o=None, m=No
     :param g bool: ()
     :param o float: ()
     :param m float: ()
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "pocsense [-i d] [-r f] [-l d] kspace sensitivities output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'pocsense '
-    flag_str = ''
+    with scratch.namespace(kspace, sensitivities, backend=backend) as NAME:
+        staged = scratch.stage_all(NAME, {'kspace': kspace, 'sensitivities': sensitivities})
+
+        argv = [BART_PATH, 'pocsense']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if i is not None:
-        flag_str += f'-i {i} '
+        if i is not None:
+            flag_args += ['-i', str(i)]
 
-    if r is not None:
-        flag_str += f'-r {r} '
+        if r is not None:
+            flag_args += ['-r', str(r)]
 
-    if l is not None:
-        flag_str += f'-l {l} '
+        if l is not None:
+            flag_args += ['-l', str(l)]
 
-    if g is not None:
-        flag_str += f'-g '
+        if g is not None:
+            flag_args += ['-g']
 
-    if o is not None:
-        flag_str += f'-o {o} '
+        if o is not None:
+            flag_args += ['-o', str(o)]
 
-    if m is not None:
-        flag_str += f'-m {m} '
-    cmd_str += flag_str + opt_args + '  '
+        if m is not None:
+            flag_args += ['-m', str(m)]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}kspace {NAME}sensitivities {NAME}output  "
-    cfl.writecfl(NAME + 'kspace', kspace)
-    cfl.writecfl(NAME + 'sensitivities', sensitivities)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['kspace'], staged['sensitivities'], NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def poisson(Y=None, Z=None, y=None, z=None, C=None, v=None, V=None, e=None, D=None, T=None, m=None, R=None, s=None):
+def poisson(Y=None, Z=None, y=None, z=None, C=None, v=None, V=None, e=None, D=None, T=None, m=None, R=None, s=None, lazy=False, out=None, backend=None):
     """
     Computes Poisson-disc sampling pattern.
 
@@ -3451,137 +3636,148 @@ def poisson(Y=None, Z=None, y=None, z=None, C=None, v=None, V=None, e=None, D=No
     :param m bool: ()
     :param R int: ()
     :param s int: random seed
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "poisson [-Y d] [-Z d] [-y f] [-z f] [-C d] [-v] [-e] [-s d] output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'poisson '
-    flag_str = ''
+    with scratch.namespace(backend=backend) as NAME:
+        argv = [BART_PATH, 'poisson']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if Y is not None:
-        flag_str += f'-Y {Y} '
+        if Y is not None:
+            flag_args += ['-Y', str(Y)]
 
-    if Z is not None:
-        flag_str += f'-Z {Z} '
+        if Z is not None:
+            flag_args += ['-Z', str(Z)]
 
-    if y is not None:
-        flag_str += f'-y {y} '
+        if y is not None:
+            flag_args += ['-y', str(y)]
 
-    if z is not None:
-        flag_str += f'-z {z} '
+        if z is not None:
+            flag_args += ['-z', str(z)]
 
-    if C is not None:
-        flag_str += f'-C {C} '
+        if C is not None:
+            flag_args += ['-C', str(C)]
 
-    if v is not None:
-        flag_str += f'-v '
+        if v is not None:
+            flag_args += ['-v']
 
-    if V is not None:
-        flag_str += f'-V {V} '
+        if V is not None:
+            flag_args += ['-V', str(V)]
 
-    if e is not None:
-        flag_str += f'-e '
+        if e is not None:
+            flag_args += ['-e']
 
-    if D is not None:
-        flag_str += f'-D {D} '
+        if D is not None:
+            flag_args += ['-D', str(D)]
 
-    if T is not None:
-        flag_str += f'-T {T} '
+        if T is not None:
+            flag_args += ['-T', str(T)]
 
-    if m is not None:
-        flag_str += f'-m '
+        if m is not None:
+            flag_args += ['-m']
 
-    if R is not None:
-        flag_str += f'-R {R} '
+        if R is not None:
+            flag_args += ['-R', str(R)]
 
-    if s is not None:
-        flag_str += f'-s {s} '
-    cmd_str += flag_str + opt_args + '  '
+        if s is not None:
+            flag_args += ['-s', str(s)]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}output  "
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def pol2mask(poly, X=None, Y=None):
+def pol2mask(poly, X=None, Y=None, lazy=False, out=None, backend=None):
     """
     Compute masks from polygons.
 
     :param poly array:
     :param X int: size dimension 0
     :param Y int: size dimension 1
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "pol2mask [-X d] [-Y d] poly output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'pol2mask '
-    flag_str = ''
+    with scratch.namespace(poly, backend=backend) as NAME:
+        argv = [BART_PATH, 'pol2mask']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if X is not None:
-        flag_str += f'-X {X} '
+        if X is not None:
+            flag_args += ['-X', str(X)]
 
-    if Y is not None:
-        flag_str += f'-Y {Y} '
-    cmd_str += flag_str + opt_args + '  '
+        if Y is not None:
+            flag_args += ['-Y', str(Y)]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}poly {NAME}output  "
-    cfl.writecfl(NAME + 'poly', poly)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'poly', poly), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def poly(L, N, a_):
+def poly(L, N, a_, lazy=False, out=None, backend=None):
     """
     Evaluate polynomial p(x) = a_1 + a_2 x + a_3 x^2 ... a_(N+1) x^N at x = {0, 1, ... , L - 1} where a_i are floats.
 
     :param L int:
     :param N int:
     :param a_ tuple:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "poly L N a_1 ... a_N output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'poly '
-    flag_str = ''
+    with scratch.namespace(backend=backend) as NAME:
+        argv = [BART_PATH, 'poly']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {L} {N} {' '.join([str(arg) for arg in a_])} {NAME}output  "
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(L), str(N), *[str(arg) for arg in a_], NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
 def reconet(kspace, sensitivities, weights, ref_out, train=None, eval=None, apply=None, gpu=None, load=None, batch_size=None, iterations=None, normalize=None, network=None, resnet_block=None, varnet_block=None, unet=None, data_consistency=None, initial_reco=None, shared_weights=None, no_shared_weights=None, shared_lambda=None, no_shared_lambda=None, rss_norm=None, trajectory=None, pattern=None, adjoint=None, psf=None, export=None, mask=None, valid_data=None, train_loss=None, valid_loss=None, train_algo=None, adam=None, iPALM=None, load_memory=None, lowmem=None, test=None, export_graph=None, B=None):
     """
@@ -3631,203 +3827,205 @@ def reconet(kspace, sensitivities, weights, ref_out, train=None, eval=None, appl
     """
     usage_string = "reconet [-t,--train] [-e,--eval] [-a,--apply] [-g,--gpu] [-l,--load file] [-b,--batch-size d] [-I,--iterations d] [-n,--normalize] [-N,--network ...] [--resnet-block ...] [--varnet-block ...] [--unet ...] [--data-consistency ...] [--initial-reco ...] [--shared-weights] [--no-shared-weights] [--shared-lambda] [--no-shared-lambda] [--rss-norm] [--trajectory file] [--pattern file] [--mask file] [--valid-data ...] [--train-loss ...] [--valid-loss ...] [-T,--train-algo ...] [--adam ...] [--iPALM ...] [--load-memory] [--lowmem] [--test] [--export-graph string] kspace sensitivities weights ref/out"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'reconet '
-    flag_str = ''
+    with scratch.namespace(kspace, sensitivities, load, trajectory, pattern, mask, B) as NAME:
+        staged = scratch.stage_all(NAME, {'kspace': kspace, 'sensitivities': sensitivities, 'load': load, 'trajectory': trajectory, 'pattern': pattern, 'mask': mask, 'B': B})
 
-    opt_args = f''
+        argv = [BART_PATH, 'reconet']
+        flag_args = []
 
-    multituples = []
+        opt_args = []
 
-    if train is not None:
-        flag_str += f'--train '
+        multituples = []
 
-    if eval is not None:
-        flag_str += f'--eval '
+        if train is not None:
+            flag_args += ['--train']
 
-    if apply is not None:
-        flag_str += f'--apply '
+        if eval is not None:
+            flag_args += ['--eval']
 
-    if gpu is not None:
-        flag_str += f'--gpu '
+        if apply is not None:
+            flag_args += ['--apply']
 
-    if not isinstance(load, type(None)):
-        cfl.writecfl(NAME + 'load', load)
-        flag_str += f'--load {NAME}load '
+        if gpu is not None:
+            flag_args += ['--gpu']
 
-    if batch_size is not None:
-        flag_str += f'--batch-size {batch_size} '
+        if not isinstance(load, type(None)):
+            flag_args += ['--load', staged['load']]
 
-    if iterations is not None:
-        flag_str += f'--iterations {iterations} '
+        if batch_size is not None:
+            flag_args += ['--batch-size', str(batch_size)]
 
-    if normalize is not None:
-        flag_str += f'--normalize '
+        if iterations is not None:
+            flag_args += ['--iterations', str(iterations)]
 
-    if network is not None:
-        flag_str += f'--network {network} '
+        if normalize is not None:
+            flag_args += ['--normalize']
 
-    if resnet_block is not None:
-        flag_str += f'--resnet-block {resnet_block} '
+        if network is not None:
+            flag_args += ['--network', str(network)]
 
-    if varnet_block is not None:
-        flag_str += f'--varnet-block {varnet_block} '
+        if resnet_block is not None:
+            flag_args += ['--resnet-block', str(resnet_block)]
 
-    if unet is not None:
-        flag_str += f'--unet {unet} '
+        if varnet_block is not None:
+            flag_args += ['--varnet-block', str(varnet_block)]
 
-    if data_consistency is not None:
-        flag_str += f'--data-consistency {data_consistency} '
+        if unet is not None:
+            flag_args += ['--unet', str(unet)]
 
-    if initial_reco is not None:
-        flag_str += f'--initial-reco {initial_reco} '
+        if data_consistency is not None:
+            flag_args += ['--data-consistency', str(data_consistency)]
 
-    if shared_weights is not None:
-        flag_str += f'--shared-weights '
+        if initial_reco is not None:
+            flag_args += ['--initial-reco', str(initial_reco)]
 
-    if no_shared_weights is not None:
-        flag_str += f'--no-shared-weights '
+        if shared_weights is not None:
+            flag_args += ['--shared-weights']
 
-    if shared_lambda is not None:
-        flag_str += f'--shared-lambda '
+        if no_shared_weights is not None:
+            flag_args += ['--no-shared-weights']
 
-    if no_shared_lambda is not None:
-        flag_str += f'--no-shared-lambda '
+        if shared_lambda is not None:
+            flag_args += ['--shared-lambda']
 
-    if rss_norm is not None:
-        flag_str += f'--rss-norm '
+        if no_shared_lambda is not None:
+            flag_args += ['--no-shared-lambda']
 
-    if not isinstance(trajectory, type(None)):
-        cfl.writecfl(NAME + 'trajectory', trajectory)
-        flag_str += f'--trajectory {NAME}trajectory '
+        if rss_norm is not None:
+            flag_args += ['--rss-norm']
 
-    if not isinstance(pattern, type(None)):
-        cfl.writecfl(NAME + 'pattern', pattern)
-        flag_str += f'--pattern {NAME}pattern '
+        if not isinstance(trajectory, type(None)):
+            flag_args += ['--trajectory', staged['trajectory']]
 
-    if adjoint is not None:
-        flag_str += f'--adjoint {adjoint} '
+        if not isinstance(pattern, type(None)):
+            flag_args += ['--pattern', staged['pattern']]
 
-    if psf is not None:
-        flag_str += f'--psf {psf} '
+        if adjoint is not None:
+            flag_args += ['--adjoint', str(adjoint)]
 
-    if export is not None:
-        flag_str += f'--export '
+        if psf is not None:
+            flag_args += ['--psf', str(psf)]
 
-    if not isinstance(mask, type(None)):
-        cfl.writecfl(NAME + 'mask', mask)
-        flag_str += f'--mask {NAME}mask '
+        if export is not None:
+            flag_args += ['--export']
 
-    if valid_data is not None:
-        flag_str += f'--valid-data {valid_data} '
+        if not isinstance(mask, type(None)):
+            flag_args += ['--mask', staged['mask']]
 
-    if train_loss is not None:
-        flag_str += f'--train-loss {train_loss} '
+        if valid_data is not None:
+            flag_args += ['--valid-data', str(valid_data)]
 
-    if valid_loss is not None:
-        flag_str += f'--valid-loss {valid_loss} '
+        if train_loss is not None:
+            flag_args += ['--train-loss', str(train_loss)]
 
-    if train_algo is not None:
-        flag_str += f'--train-algo {train_algo} '
+        if valid_loss is not None:
+            flag_args += ['--valid-loss', str(valid_loss)]
 
-    if adam is not None:
-        flag_str += f'--adam {adam} '
+        if train_algo is not None:
+            flag_args += ['--train-algo', str(train_algo)]
 
-    if iPALM is not None:
-        flag_str += f'--iPALM {iPALM} '
+        if adam is not None:
+            flag_args += ['--adam', str(adam)]
 
-    if load_memory is not None:
-        flag_str += f'--load-memory '
+        if iPALM is not None:
+            flag_args += ['--iPALM', str(iPALM)]
 
-    if lowmem is not None:
-        flag_str += f'--lowmem '
+        if load_memory is not None:
+            flag_args += ['--load-memory']
 
-    if test is not None:
-        flag_str += f'--test '
+        if lowmem is not None:
+            flag_args += ['--lowmem']
 
-    if export_graph is not None:
-        flag_str += f'--export-graph {export_graph} '
+        if test is not None:
+            flag_args += ['--test']
 
-    if not isinstance(B, type(None)):
-        cfl.writecfl(NAME + 'B', B)
-        flag_str += f'-B {NAME}B '
-    cmd_str += flag_str + opt_args + '  '
+        if export_graph is not None:
+            flag_args += ['--export-graph', str(export_graph)]
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}kspace {NAME}sensitivities {weights} {ref_out}  "
-    cfl.writecfl(NAME + 'kspace', kspace)
-    cfl.writecfl(NAME + 'sensitivities', sensitivities)
+        if not isinstance(B, type(None)):
+            flag_args += ['-B', staged['B']]
+        argv += flag_args + opt_args
 
-    if DEBUG:
-        print(cmd_str)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['kspace'], staged['sensitivities'], str(weights), str(ref_out)]
 
+        if DEBUG:
+            print(' '.join(argv))
 
-    os.system(cmd_str)
 
-def repmat(input, dimension, repetitions):
+        launch.run(argv)
+
+def repmat(input, dimension, repetitions, lazy=False, out=None, backend=None):
     """
     Repeat input array multiple times along a certain dimension.
 
     :param dimension int:
     :param repetitions int:
     :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "repmat dimension repetitions input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'repmat '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'repmat']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {dimension} {repetitions} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(dimension), str(repetitions), scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def reshape(input, flags, dim):
+def reshape(input, flags, dim, lazy=False, out=None, backend=None):
     """
     Reshape selected dimensions.
 
     :param flags long:
     :param dim tuple:
     :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "reshape flags dim1 ... dimN input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'reshape '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'reshape']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {flags} {' '.join([str(arg) for arg in dim])} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(flags), *[str(arg) for arg in dim], scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def resize(input, dim, size, c=None):
+def resize(input, dim, size, c=None, lazy=False, out=None, backend=None):
     """
     Resizes an array along dimensions to sizes by truncating or zero-padding. Please see doc/resize.txt for examples.
 
@@ -3835,39 +4033,42 @@ def resize(input, dim, size, c=None):
     :param size multituple:
     :param input array:
     :param c bool: center
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "resize [-c] dim1 size1 ... dimN sizeN input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'resize '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'resize']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if c is not None:
-        flag_str += f'-c '
-    cmd_str += flag_str + opt_args + '  '
+        if c is not None:
+            flag_args += ['-c']
+        argv += flag_args + opt_args
 
-    multituples.append(dim)
+        multituples.append(dim)
     
-    multituples.append(size)
+        multituples.append(size)
     
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def rmfreq(traj, k, N=None, M=None):
+def rmfreq(traj, k, N=None, M=None, lazy=False, out=None, backend=None):
     """
     Remove angle-dependent frequency
 
@@ -3875,71 +4076,78 @@ def rmfreq(traj, k, N=None, M=None):
     :param k array:
     :param N int: Number of harmonics [Default: 5]
     :param M STRING: Contrast modulation file
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "rmfreq [-N d] [-M string] traj k k_cor"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'rmfreq '
-    flag_str = ''
+    with scratch.namespace(traj, k, backend=backend) as NAME:
+        staged = scratch.stage_all(NAME, {'traj': traj, 'k': k})
+
+        argv = [BART_PATH, 'rmfreq']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if N is not None:
-        flag_str += f'-N {N} '
+        if N is not None:
+            flag_args += ['-N', str(N)]
 
-    if M is not None:
-        flag_str += f'-M {M} '
-    cmd_str += flag_str + opt_args + '  '
+        if M is not None:
+            flag_args += ['-M', str(M)]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}traj {NAME}k {NAME}k_cor  "
-    cfl.writecfl(NAME + 'traj', traj)
-    cfl.writecfl(NAME + 'k', k)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['traj'], staged['k'], NAME + 'k_cor']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'k_cor')
-    return outputs
+        outputs = scratch.fetch(NAME + 'k_cor', lazy, out)
+        return outputs
 
-def rof(input, llambda, flags):
+def rof(input, llambda, flags, lazy=False, out=None, backend=None):
     """
     Perform total variation denoising along dims <flags>.
 
     :param llambda float:
     :param flags int:
     :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "rof lambda flags input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'rof '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'rof']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {llambda} {flags} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(llambda), str(flags), scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def roistat(roi, input, b=None, C=None, S=None, M=None, D=None, E=None, V=None):
+def roistat(roi, input, b=None, C=None, S=None, M=None, D=None, E=None, V=None, lazy=False, out=None, backend=None):
     """
     Compute ROI statistics.
 
@@ -3952,85 +4160,92 @@ def roistat(roi, input, b=None, C=None, S=None, M=None, D=None, E=None, V=None):
     :param D bool: standard deviation
     :param E bool: energy
     :param V bool: variance
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "roistat [-b] [-C] [-S] [-M] [-D] [-E] [-V] roi input [output]"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'roistat '
-    flag_str = ''
+    with scratch.namespace(roi, input, backend=backend) as NAME:
+        staged = scratch.stage_all(NAME, {'roi': roi, 'input': input})
 
-    opt_args = f''
+        argv = [BART_PATH, 'roistat']
+        flag_args = []
 
-    multituples = []
+        opt_args = []
 
-    if b is not None:
-        flag_str += f'-b '
+        multituples = []
 
-    if C is not None:
-        flag_str += f'-C '
+        if b is not None:
+            flag_args += ['-b']
 
-    if S is not None:
-        flag_str += f'-S '
+        if C is not None:
+            flag_args += ['-C']
 
-    if M is not None:
-        flag_str += f'-M '
+        if S is not None:
+            flag_args += ['-S']
 
-    if D is not None:
-        flag_str += f'-D '
+        if M is not None:
+            flag_args += ['-M']
 
-    if E is not None:
-        flag_str += f'-E '
+        if D is not None:
+            flag_args += ['-D']
 
-    if V is not None:
-        flag_str += f'-V '
-    cmd_str += flag_str + opt_args + '  '
+        if E is not None:
+            flag_args += ['-E']
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}roi {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'roi', roi)
-    cfl.writecfl(NAME + 'input', input)
+        if V is not None:
+            flag_args += ['-V']
+        argv += flag_args + opt_args
 
-    if DEBUG:
-        print(cmd_str)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['roi'], staged['input'], NAME + 'output']
 
+        if DEBUG:
+            print(' '.join(argv))
 
-    os.system(cmd_str)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        launch.run(argv)
 
-def rss(input, bitmask):
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
+
+def rss(input, bitmask, lazy=False, out=None, backend=None):
     """
     Calculates root of sum of squares along selected dimensions.
 
     :param bitmask int:
     :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "rss bitmask input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'rss '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'rss']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {bitmask} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(bitmask), scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def rtnlinv(kspace, i=None, R=None, M=None, d=None, c=None, N=None, m=None, U=None, f=None, p=None, t=None, I=None, C=None, g=None, S=None, a=None, b=None, T=None, w=None, x=None, A=None, s=None):
+def rtnlinv(kspace, i=None, R=None, M=None, d=None, c=None, N=None, m=None, U=None, f=None, p=None, t=None, I=None, C=None, g=None, S=None, a=None, b=None, T=None, w=None, x=None, A=None, s=None, lazy=False, out=None, backend=None):
     """
     Jointly estimate a time-series of images and sensitivities with nonlinear
 inversion using {iter} iteration steps. Optionally outputs
@@ -4059,102 +4274,103 @@ the sensitivities.
     :param x list: Explicitly specify image dimensions
     :param A bool: (Alternative scaling)
     :param s bool: (Simultaneous Multi-Slice reconstruction)
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "rtnlinv [-i d] [-d d] [-c] [-N] [-m d] [-U] [-f f] [-p file] [-t file] [-I file] [-g] [-S] [-T f] [-x d:d:d] kspace output [sensitivities]"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'rtnlinv '
-    flag_str = ''
+    with scratch.namespace(kspace, p, t, I, C, backend=backend) as NAME:
+        staged = scratch.stage_all(NAME, {'kspace': kspace, 'p': p, 't': t, 'I': I, 'C': C})
+
+        argv = [BART_PATH, 'rtnlinv']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if i is not None:
-        flag_str += f'-i {i} '
+        if i is not None:
+            flag_args += ['-i', str(i)]
 
-    if R is not None:
-        flag_str += f'-R {R} '
+        if R is not None:
+            flag_args += ['-R', str(R)]
 
-    if M is not None:
-        flag_str += f'-M {M} '
+        if M is not None:
+            flag_args += ['-M', str(M)]
 
-    if d is not None:
-        flag_str += f'-d {d} '
+        if d is not None:
+            flag_args += ['-d', str(d)]
 
-    if c is not None:
-        flag_str += f'-c '
+        if c is not None:
+            flag_args += ['-c']
 
-    if N is not None:
-        flag_str += f'-N '
+        if N is not None:
+            flag_args += ['-N']
 
-    if m is not None:
-        flag_str += f'-m {m} '
+        if m is not None:
+            flag_args += ['-m', str(m)]
 
-    if U is not None:
-        flag_str += f'-U '
+        if U is not None:
+            flag_args += ['-U']
 
-    if f is not None:
-        flag_str += f'-f {f} '
+        if f is not None:
+            flag_args += ['-f', str(f)]
 
-    if not isinstance(p, type(None)):
-        cfl.writecfl(NAME + 'p', p)
-        flag_str += f'-p {NAME}p '
+        if not isinstance(p, type(None)):
+            flag_args += ['-p', staged['p']]
 
-    if not isinstance(t, type(None)):
-        cfl.writecfl(NAME + 't', t)
-        flag_str += f'-t {NAME}t '
+        if not isinstance(t, type(None)):
+            flag_args += ['-t', staged['t']]
 
-    if not isinstance(I, type(None)):
-        cfl.writecfl(NAME + 'I', I)
-        flag_str += f'-I {NAME}I '
+        if not isinstance(I, type(None)):
+            flag_args += ['-I', staged['I']]
 
-    if not isinstance(C, type(None)):
-        cfl.writecfl(NAME + 'C', C)
-        flag_str += f'-C {NAME}C '
+        if not isinstance(C, type(None)):
+            flag_args += ['-C', staged['C']]
 
-    if g is not None:
-        flag_str += f'-g '
+        if g is not None:
+            flag_args += ['-g']
 
-    if S is not None:
-        flag_str += f'-S '
+        if S is not None:
+            flag_args += ['-S']
 
-    if a is not None:
-        flag_str += f'-a {a} '
+        if a is not None:
+            flag_args += ['-a', str(a)]
 
-    if b is not None:
-        flag_str += f'-b {b} '
+        if b is not None:
+            flag_args += ['-b', str(b)]
 
-    if T is not None:
-        flag_str += f'-T {T} '
+        if T is not None:
+            flag_args += ['-T', str(T)]
 
-    if w is not None:
-        flag_str += f'-w {w} '
+        if w is not None:
+            flag_args += ['-w', str(w)]
 
-    if x is not None:
-        flag_str += f'-x {":".join([str(x) for x in x])} '
+        if x is not None:
+            flag_args += ['-x', ":".join([str(x) for x in x])]
 
-    if A is not None:
-        flag_str += f'-A '
+        if A is not None:
+            flag_args += ['-A']
 
-    if s is not None:
-        flag_str += f'-s '
-    cmd_str += flag_str + opt_args + '  '
+        if s is not None:
+            flag_args += ['-s']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}kspace {NAME}output {NAME}sensitivities  "
-    cfl.writecfl(NAME + 'kspace', kspace)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['kspace'], NAME + 'output', NAME + 'sensitivities']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output'), cfl.readcfl(NAME + 'sensitivities')
-    return outputs
+        outputs = scratch.fetch_all([NAME + 'output', NAME + 'sensitivities'], lazy, out)
+        return outputs
 
-def sake(kspace, i=None, s=None, o=None):
+def sake(kspace, i=None, s=None, o=None, lazy=False, out=None, backend=None):
     """
     Use SAKE algorithm to recover a full k-space from undersampled
 data using low-rank matrix completion.
@@ -4163,103 +4379,113 @@ data using low-rank matrix completion.
     :param i int: number of iterations
     :param s float: rel. size of the signal subspace
     :param o float: ()
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "ke [-i d] [-s f] kspace output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'sake '
-    flag_str = ''
+    with scratch.namespace(kspace, backend=backend) as NAME:
+        argv = [BART_PATH, 'sake']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if i is not None:
-        flag_str += f'-i {i} '
+        if i is not None:
+            flag_args += ['-i', str(i)]
 
-    if s is not None:
-        flag_str += f'-s {s} '
+        if s is not None:
+            flag_args += ['-s', str(s)]
 
-    if o is not None:
-        flag_str += f'-o {o} '
-    cmd_str += flag_str + opt_args + '  '
+        if o is not None:
+            flag_args += ['-o', str(o)]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}kspace {NAME}output  "
-    cfl.writecfl(NAME + 'kspace', kspace)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'kspace', kspace), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def saxpy(input1, input2, scale):
+def saxpy(input1, input2, scale, lazy=False, out=None, backend=None):
     """
     Multiply input1 with scale factor and add input2.
 
     :param scale CFL:
     :param input1 array:
     :param input2 array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "xpy scale input1 input2 output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'saxpy '
-    flag_str = ''
+    with scratch.namespace(input1, input2, backend=backend) as NAME:
+        staged = scratch.stage_all(NAME, {'input1': input1, 'input2': input2})
 
-    opt_args = f''
+        argv = [BART_PATH, 'saxpy']
+        flag_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        opt_args = []
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {scale} {NAME}input1 {NAME}input2 {NAME}output  "
-    cfl.writecfl(NAME + 'input1', input1)
-    cfl.writecfl(NAME + 'input2', input2)
+        multituples = []
+        argv += flag_args + opt_args
 
-    if DEBUG:
-        print(cmd_str)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(scale), staged['input1'], staged['input2'], NAME + 'output']
 
+        if DEBUG:
+            print(' '.join(argv))
 
-    os.system(cmd_str)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        launch.run(argv)
 
-def scale(input, factor):
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
+
+def scale(input, factor, lazy=False, out=None, backend=None):
     """
     Scale array by {factor}. The scale factor can be a complex number.
 
     :param factor CFL:
     :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "cale factor input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'scale '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'scale']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {factor} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(factor), scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
 def sdot(input1, input2):
     """
@@ -4271,24 +4497,25 @@ def sdot(input1, input2):
     """
     usage_string = "dot input1 input2"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'sdot '
-    flag_str = ''
+    with scratch.namespace(input1, input2) as NAME:
+        staged = scratch.stage_all(NAME, {'input1': input1, 'input2': input2})
+
+        argv = [BART_PATH, 'sdot']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input1 {NAME}input2  "
-    cfl.writecfl(NAME + 'input1', input1)
-    cfl.writecfl(NAME + 'input2', input2)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['input1'], staged['input2']]
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
 def show(input, m=None, d=None, s=None, f=None):
     """
@@ -4303,37 +4530,37 @@ def show(input, m=None, d=None, s=None, f=None):
     """
     usage_string = "how [-m] [-d d] [-s string] [-f string] input"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'show '
-    flag_str = ''
+    with scratch.namespace(input) as NAME:
+        argv = [BART_PATH, 'show']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if m is not None:
-        flag_str += f'-m '
+        if m is not None:
+            flag_args += ['-m']
 
-    if d is not None:
-        flag_str += f'-d {d} '
+        if d is not None:
+            flag_args += ['-d', str(d)]
 
-    if s is not None:
-        flag_str += f'-s {s} '
+        if s is not None:
+            flag_args += ['-s', str(s)]
 
-    if f is not None:
-        flag_str += f'-f {f} '
-    cmd_str += flag_str + opt_args + '  '
+        if f is not None:
+            flag_args += ['-f', str(f)]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'input', input)]
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-def signal(F=None, B=None, T=None, M=None, G=None, fat=None, I=None, s=None, _0=None, _1=None, _2=None, _3=None, r=None, e=None, f=None, t=None, n=None, b=None, av_spokes=None):
+def signal(F=None, B=None, T=None, M=None, G=None, fat=None, I=None, s=None, _0=None, _1=None, _2=None, _3=None, r=None, e=None, f=None, t=None, n=None, b=None, av_spokes=None, lazy=False, out=None, backend=None):
     """
     Analytical simulation tool.
 
@@ -4356,88 +4583,92 @@ def signal(F=None, B=None, T=None, M=None, G=None, fat=None, I=None, s=None, _0=
     :param n long: number of measurements
     :param b long: number of heart beats for MOLLI
     :param av_spokes int: Number of averaged consecutive spokes
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "ignal [-F] [-B] [-T] [-M] [-G] [--fat] [-I] [-s] [-0 f:f:f] [-1 f:f:f] [-2 f:f:f] [-3 f:f:f] [-r f] [-e f] [-f f] [-t f] [-n d] [-b d] [--av-spokes d] basis-functions"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'signal '
-    flag_str = ''
+    with scratch.namespace(backend=backend) as NAME:
+        argv = [BART_PATH, 'signal']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if F is not None:
-        flag_str += f'-F '
+        if F is not None:
+            flag_args += ['-F']
 
-    if B is not None:
-        flag_str += f'-B '
+        if B is not None:
+            flag_args += ['-B']
 
-    if T is not None:
-        flag_str += f'-T '
+        if T is not None:
+            flag_args += ['-T']
 
-    if M is not None:
-        flag_str += f'-M '
+        if M is not None:
+            flag_args += ['-M']
 
-    if G is not None:
-        flag_str += f'-G '
+        if G is not None:
+            flag_args += ['-G']
 
-    if fat is not None:
-        flag_str += f'--fat '
+        if fat is not None:
+            flag_args += ['--fat']
 
-    if I is not None:
-        flag_str += f'-I '
+        if I is not None:
+            flag_args += ['-I']
 
-    if s is not None:
-        flag_str += f'-s '
+        if s is not None:
+            flag_args += ['-s']
 
-    if _0 is not None:
-        flag_str += f'-0 {_0} '
+        if _0 is not None:
+            flag_args += ['-0', str(_0)]
 
-    if _1 is not None:
-        flag_str += f'-1 {_1} '
+        if _1 is not None:
+            flag_args += ['-1', str(_1)]
 
-    if _2 is not None:
-        flag_str += f'-2 {_2} '
+        if _2 is not None:
+            flag_args += ['-2', str(_2)]
 
-    if _3 is not None:
-        flag_str += f'-3 {_3} '
+        if _3 is not None:
+            flag_args += ['-3', str(_3)]
 
-    if r is not None:
-        flag_str += f'-r {r} '
+        if r is not None:
+            flag_args += ['-r', str(r)]
 
-    if e is not None:
-        flag_str += f'-e {e} '
+        if e is not None:
+            flag_args += ['-e', str(e)]
 
-    if f is not None:
-        flag_str += f'-f {f} '
+        if f is not None:
+            flag_args += ['-f', str(f)]
 
-    if t is not None:
-        flag_str += f'-t {t} '
+        if t is not None:
+            flag_args += ['-t', str(t)]
 
-    if n is not None:
-        flag_str += f'-n {n} '
+        if n is not None:
+            flag_args += ['-n', str(n)]
 
-    if b is not None:
-        flag_str += f'-b {b} '
+        if b is not None:
+            flag_args += ['-b', str(b)]
 
-    if av_spokes is not None:
-        flag_str += f'--av-spokes {av_spokes} '
-    cmd_str += flag_str + opt_args + '  '
+        if av_spokes is not None:
+            flag_args += ['--av-spokes', str(av_spokes)]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}basis_functions  "
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [NAME + 'basis_functions']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'basis_functions')
-    return outputs
+        outputs = scratch.fetch(NAME + 'basis_functions', lazy, out)
+        return outputs
 
-def sim(dB1=None, T1=None, T2=None, ROT=None, ODE=None, STM=None, split_dim=None, seq=None, other=None):
+def sim(dB1=None, T1=None, T2=None, ROT=None, ODE=None, STM=None, split_dim=None, seq=None, other=None, lazy=False, out=None, backend=None):
     """
     simulation tool
 
@@ -4450,125 +4681,135 @@ def sim(dB1=None, T1=None, T2=None, ROT=None, ODE=None, STM=None, split_dim=None
     :param split_dim bool: Split output in x y and z dimensional parts
     :param seq SUBOPT: configure sequence parameter
     :param other SUBOPT: configure other parameters
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "im [-1,--T1 f:f:f] [-2,--T2 f:f:f] [--ROT] [--ODE] [--STM] [--split-dim] [--seq ...] [--other ...] signal: Mxy [Partial derivatives: dR1, dM0, dR2, dB1]"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'sim '
-    flag_str = ''
+    with scratch.namespace(backend=backend) as NAME:
+        argv = [BART_PATH, 'sim']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if dB1 != None:
-            opt_args += '{dB1}'
+        if dB1 != None:
+            opt_args += [str(dB1)]
 
-    if T1 is not None:
-        flag_str += f'--T1 {T1} '
+        if T1 is not None:
+            flag_args += ['--T1', str(T1)]
 
-    if T2 is not None:
-        flag_str += f'--T2 {T2} '
+        if T2 is not None:
+            flag_args += ['--T2', str(T2)]
 
-    if ROT is not None:
-        flag_str += f'--ROT '
+        if ROT is not None:
+            flag_args += ['--ROT']
 
-    if ODE is not None:
-        flag_str += f'--ODE '
+        if ODE is not None:
+            flag_args += ['--ODE']
 
-    if STM is not None:
-        flag_str += f'--STM '
+        if STM is not None:
+            flag_args += ['--STM']
 
-    if split_dim is not None:
-        flag_str += f'--split-dim '
+        if split_dim is not None:
+            flag_args += ['--split-dim']
 
-    if seq is not None:
-        flag_str += f'--seq {seq} '
+        if seq is not None:
+            flag_args += ['--seq', str(seq)]
 
-    if other is not None:
-        flag_str += f'--other {other} '
-    cmd_str += flag_str + opt_args + '  '
+        if other is not None:
+            flag_args += ['--other', str(other)]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}signal__Mxy  "
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [NAME + 'signal__Mxy']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'signal__Mxy')
-    return outputs
+        outputs = scratch.fetch(NAME + 'signal__Mxy', lazy, out)
+        return outputs
 
-def slice(input, dim, pos):
+def slice(input, dim, pos, lazy=False, out=None, backend=None):
     """
     Extracts a slice from positions along dimensions.
 
     :param dim multituple:
     :param pos multituple:
     :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "lice dim1 pos1 ... dimN posN input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'slice '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'slice']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    multituples.append(dim)
+        multituples.append(dim)
     
-    multituples.append(pos)
+        multituples.append(pos)
     
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def spow(input, exponent):
+def spow(input, exponent, lazy=False, out=None, backend=None):
     """
     Raise array to the power of {exponent}. The exponent can be a complex number.
 
     :param exponent CFL:
     :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "pow exponent input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'spow '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'spow']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {exponent} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(exponent), scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def sqpics(kspace, sensitivities, l=None, r=None, R=None, s=None, i=None, t=None, n=None, g=None, p=None, I=None, b=None, e=None, H=None, F=None, T=None, W=None, d=None, u=None, C=None, f=None, m=None, w=None, S=None):
+def sqpics(kspace, sensitivities, l=None, r=None, R=None, s=None, i=None, t=None, n=None, g=None, p=None, I=None, b=None, e=None, H=None, F=None, T=None, W=None, d=None, u=None, C=None, f=None, m=None, w=None, S=None, lazy=False, out=None, backend=None):
     """
     Parallel-imaging compressed-sensing reconstruction.
 
@@ -4597,136 +4838,139 @@ def sqpics(kspace, sensitivities, l=None, r=None, R=None, s=None, i=None, t=None
     :param m bool: Select ADMM
     :param w float: scaling
     :param S bool: Re-scale the image after reconstruction
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "qpics [-l ...] [-r f] [-R ...] [-s f] [-i d] [-t file] [-n] [-g] [-p file] [-b d] [-e] [-W file] [-d d] [-u f] [-C d] [-f f] [-m] [-w f] [-S] kspace sensitivities output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'sqpics '
-    flag_str = ''
+    with scratch.namespace(kspace, sensitivities, t, p, T, W, backend=backend) as NAME:
+        staged = scratch.stage_all(NAME, {'kspace': kspace, 'sensitivities': sensitivities, 't': t, 'p': p, 'T': T, 'W': W})
 
-    opt_args = f''
+        argv = [BART_PATH, 'sqpics']
+        flag_args = []
 
-    multituples = []
+        opt_args = []
 
-    if l is not None:
-        flag_str += f'-l {l} '
+        multituples = []
 
-    if r is not None:
-        flag_str += f'-r {r} '
+        if l is not None:
+            flag_args += ['-l', str(l)]
 
-    if R is not None:
-        flag_str += f'-R {R} '
+        if r is not None:
+            flag_args += ['-r', str(r)]
 
-    if s is not None:
-        flag_str += f'-s {s} '
+        if R is not None:
+            flag_args += ['-R', str(R)]
 
-    if i is not None:
-        flag_str += f'-i {i} '
+        if s is not None:
+            flag_args += ['-s', str(s)]
 
-    if not isinstance(t, type(None)):
-        cfl.writecfl(NAME + 't', t)
-        flag_str += f'-t {NAME}t '
+        if i is not None:
+            flag_args += ['-i', str(i)]
 
-    if n is not None:
-        flag_str += f'-n '
+        if not isinstance(t, type(None)):
+            flag_args += ['-t', staged['t']]
 
-    if g is not None:
-        flag_str += f'-g '
+        if n is not None:
+            flag_args += ['-n']
 
-    if not isinstance(p, type(None)):
-        cfl.writecfl(NAME + 'p', p)
-        flag_str += f'-p {NAME}p '
+        if g is not None:
+            flag_args += ['-g']
 
-    if I is not None:
-        flag_str += f'-I '
+        if not isinstance(p, type(None)):
+            flag_args += ['-p', staged['p']]
 
-    if b is not None:
-        flag_str += f'-b {b} '
+        if I is not None:
+            flag_args += ['-I']
 
-    if e is not None:
-        flag_str += f'-e '
+        if b is not None:
+            flag_args += ['-b', str(b)]
 
-    if H is not None:
-        flag_str += f'-H '
+        if e is not None:
+            flag_args += ['-e']
 
-    if F is not None:
-        flag_str += f'-F '
+        if H is not None:
+            flag_args += ['-H']
 
-    if not isinstance(T, type(None)):
-        cfl.writecfl(NAME + 'T', T)
-        flag_str += f'-T {NAME}T '
+        if F is not None:
+            flag_args += ['-F']
 
-    if not isinstance(W, type(None)):
-        cfl.writecfl(NAME + 'W', W)
-        flag_str += f'-W {NAME}W '
+        if not isinstance(T, type(None)):
+            flag_args += ['-T', staged['T']]
 
-    if d is not None:
-        flag_str += f'-d {d} '
+        if not isinstance(W, type(None)):
+            flag_args += ['-W', staged['W']]
 
-    if u is not None:
-        flag_str += f'-u {u} '
+        if d is not None:
+            flag_args += ['-d', str(d)]
 
-    if C is not None:
-        flag_str += f'-C {C} '
+        if u is not None:
+            flag_args += ['-u', str(u)]
 
-    if f is not None:
-        flag_str += f'-f {f} '
+        if C is not None:
+            flag_args += ['-C', str(C)]
 
-    if m is not None:
-        flag_str += f'-m '
+        if f is not None:
+            flag_args += ['-f', str(f)]
 
-    if w is not None:
-        flag_str += f'-w {w} '
+        if m is not None:
+            flag_args += ['-m']
 
-    if S is not None:
-        flag_str += f'-S '
-    cmd_str += flag_str + opt_args + '  '
+        if w is not None:
+            flag_args += ['-w', str(w)]
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}kspace {NAME}sensitivities {NAME}output  "
-    cfl.writecfl(NAME + 'kspace', kspace)
-    cfl.writecfl(NAME + 'sensitivities', sensitivities)
+        if S is not None:
+            flag_args += ['-S']
+        argv += flag_args + opt_args
 
-    if DEBUG:
-        print(cmd_str)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['kspace'], staged['sensitivities'], NAME + 'output']
 
+        if DEBUG:
+            print(' '.join(argv))
 
-    os.system(cmd_str)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        launch.run(argv)
 
-def squeeze(input):
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
+
+def squeeze(input, lazy=False, out=None, backend=None):
     """
     Remove singleton dimensions of array.
 
     :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "queeze input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'squeeze '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'squeeze']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def ssa(src, w=None, z=None, m=None, n=None, r=None, g=None):
+def ssa(src, w=None, z=None, m=None, n=None, r=None, g=None, lazy=False, out=None, backend=None):
     """
     Perform SSA-FARY or Singular Spectrum Analysis. <src>: [samples, coordinates]
 
@@ -4737,147 +4981,159 @@ def ssa(src, w=None, z=None, m=None, n=None, r=None, g=None):
     :param n int: Normalize [Default: False]
     :param r int: Rank for backprojection. r < 0: Throw away first r components. r > 0: Use only first r components.
     :param g long: Bitmask for Grouping (long value!)
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "[-w d] [-z] [-m d] [-n d] [-r d] [-g d] src EOF [S] [backprojection]"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'ssa '
-    flag_str = ''
+    with scratch.namespace(src, backend=backend) as NAME:
+        argv = [BART_PATH, 'ssa']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if w is not None:
-        flag_str += f'-w {w} '
+        if w is not None:
+            flag_args += ['-w', str(w)]
 
-    if z is not None:
-        flag_str += f'-z '
+        if z is not None:
+            flag_args += ['-z']
 
-    if m is not None:
-        flag_str += f'-m {m} '
+        if m is not None:
+            flag_args += ['-m', str(m)]
 
-    if n is not None:
-        flag_str += f'-n {n} '
+        if n is not None:
+            flag_args += ['-n', str(n)]
 
-    if r is not None:
-        flag_str += f'-r {r} '
+        if r is not None:
+            flag_args += ['-r', str(r)]
 
-    if g is not None:
-        flag_str += f'-g {g} '
-    cmd_str += flag_str + opt_args + '  '
+        if g is not None:
+            flag_args += ['-g', str(g)]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}src {NAME}EOF {NAME}S {NAME}backprojection  "
-    cfl.writecfl(NAME + 'src', src)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'src', src), NAME + 'EOF', NAME + 'S', NAME + 'backprojection']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'EOF'), cfl.readcfl(NAME + 'S'), cfl.readcfl(NAME + 'backprojection')
-    return outputs
+        outputs = scratch.fetch_all([NAME + 'EOF', NAME + 'S', NAME + 'backprojection'], lazy, out)
+        return outputs
 
-def std(input, bitmask):
+def std(input, bitmask, lazy=False, out=None, backend=None):
     """
     Compute standard deviation along selected dimensions specified by the {bitmask}
 
     :param bitmask long:
     :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "td bitmask input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'std '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'std']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {bitmask} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(bitmask), scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def svd(input, e=None):
+def svd(input, e=None, lazy=False, out=None, backend=None):
     """
     Compute singular-value-decomposition (SVD).
 
     :param input array:
     :param e bool: econ
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "vd [-e] input U S VH"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'svd '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'svd']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if e is not None:
-        flag_str += f'-e '
-    cmd_str += flag_str + opt_args + '  '
+        if e is not None:
+            flag_args += ['-e']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input {NAME}U {NAME}S {NAME}VH  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'input', input), NAME + 'U', NAME + 'S', NAME + 'VH']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'U'), cfl.readcfl(NAME + 'S'), cfl.readcfl(NAME + 'VH')
-    return outputs
+        outputs = scratch.fetch_all([NAME + 'U', NAME + 'S', NAME + 'VH'], lazy, out)
+        return outputs
 
-def tgv(input, llambda, flags):
+def tgv(input, llambda, flags, lazy=False, out=None, backend=None):
     """
     Perform total generalized variation denoising along dims specified by flags.
 
     :param llambda float:
     :param flags int:
     :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "tgv lambda flags input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'tgv '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'tgv']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {llambda} {flags} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(llambda), str(flags), scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def threshold(input, llambda, H=None, W=None, L=None, D=None, B=None, j=None, b=None):
+def threshold(input, llambda, H=None, W=None, L=None, D=None, B=None, j=None, b=None, lazy=False, out=None, backend=None):
     """
     Perform (soft) thresholding with parameter lambda.
 
@@ -4890,53 +5146,56 @@ def threshold(input, llambda, H=None, W=None, L=None, D=None, B=None, j=None, b=
     :param B bool: thresholding with binary output
     :param j int: joint soft-thresholding
     :param b int: locally low rank block size
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "threshold [-H] [-W] [-L] [-D] [-B] [-j d] [-b d] lambda input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'threshold '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'threshold']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if H is not None:
-        flag_str += f'-H '
+        if H is not None:
+            flag_args += ['-H']
 
-    if W is not None:
-        flag_str += f'-W '
+        if W is not None:
+            flag_args += ['-W']
 
-    if L is not None:
-        flag_str += f'-L '
+        if L is not None:
+            flag_args += ['-L']
 
-    if D is not None:
-        flag_str += f'-D '
+        if D is not None:
+            flag_args += ['-D']
 
-    if B is not None:
-        flag_str += f'-B '
+        if B is not None:
+            flag_args += ['-B']
 
-    if j is not None:
-        flag_str += f'-j {j} '
+        if j is not None:
+            flag_args += ['-j', str(j)]
 
-    if b is not None:
-        flag_str += f'-b {b} '
-    cmd_str += flag_str + opt_args + '  '
+        if b is not None:
+            flag_args += ['-b', str(b)]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {llambda} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(llambda), scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def toimg(input, g=None, c=None, w=None, d=None, m=None, W=None):
+def toimg(input, g=None, c=None, w=None, d=None, m=None, W=None, lazy=False, out=None, backend=None):
     """
     Create magnitude images as png or proto-dicom.
 The first two non-singleton dimensions will
@@ -4950,50 +5209,53 @@ will be looped over.
     :param d bool: write to dicom format (deprecated use extension .dcm)
     :param m bool: re-scale each image
     :param W bool: use dynamic windowing
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "toimg [-g f] [-c f] [-w f] [-d] [-m] [-W] input output prefix"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'toimg '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'toimg']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if g is not None:
-        flag_str += f'-g {g} '
+        if g is not None:
+            flag_args += ['-g', str(g)]
 
-    if c is not None:
-        flag_str += f'-c {c} '
+        if c is not None:
+            flag_args += ['-c', str(c)]
 
-    if w is not None:
-        flag_str += f'-w {w} '
+        if w is not None:
+            flag_args += ['-w', str(w)]
 
-    if d is not None:
-        flag_str += f'-d '
+        if d is not None:
+            flag_args += ['-d']
 
-    if m is not None:
-        flag_str += f'-m '
+        if m is not None:
+            flag_args += ['-m']
 
-    if W is not None:
-        flag_str += f'-W '
-    cmd_str += flag_str + opt_args + '  '
+        if W is not None:
+            flag_args += ['-W']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input {NAME}output_prefix  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'input', input), NAME + 'output_prefix']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output_prefix')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output_prefix', lazy, out)
+        return outputs
 
-def traj(x=None, y=None, d=None, e=None, a=None, t=None, m=None, l=None, g=None, r=None, G=None, H=None, s=None, D=None, o=None, R=None, q=None, Q=None, O=None, _3=None, c=None, E=None, z=None, C=None, V=None):
+def traj(x=None, y=None, d=None, e=None, a=None, t=None, m=None, l=None, g=None, r=None, G=None, H=None, s=None, D=None, o=None, R=None, q=None, Q=None, O=None, _3=None, c=None, E=None, z=None, C=None, V=None, lazy=False, out=None, backend=None):
     """
     Computes k-space trajectories.
 
@@ -5022,140 +5284,147 @@ def traj(x=None, y=None, d=None, e=None, a=None, t=None, m=None, l=None, g=None,
     :param z VEC2: Undersampling in z-direction.
     :param C array: custom_angle file [phi + i * psi]
     :param V array: (custom_gdelays)
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "traj [-x d] [-y d] [-d d] [-e d] [-a d] [-t d] [-m d] [-l] [-g] [-r] [-G] [-H] [-s d] [-D] [-o f] [-R f] [-q f:f:f] [-O] [-3] [-c] [-E] [-z d:d] [-C file] output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'traj '
-    flag_str = ''
+    with scratch.namespace(C, V, backend=backend) as NAME:
+        staged = scratch.stage_all(NAME, {'C': C, 'V': V})
+
+        argv = [BART_PATH, 'traj']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if x is not None:
-        flag_str += f'-x {x} '
+        if x is not None:
+            flag_args += ['-x', str(x)]
 
-    if y is not None:
-        flag_str += f'-y {y} '
+        if y is not None:
+            flag_args += ['-y', str(y)]
 
-    if d is not None:
-        flag_str += f'-d {d} '
+        if d is not None:
+            flag_args += ['-d', str(d)]
 
-    if e is not None:
-        flag_str += f'-e {e} '
+        if e is not None:
+            flag_args += ['-e', str(e)]
 
-    if a is not None:
-        flag_str += f'-a {a} '
+        if a is not None:
+            flag_args += ['-a', str(a)]
 
-    if t is not None:
-        flag_str += f'-t {t} '
+        if t is not None:
+            flag_args += ['-t', str(t)]
 
-    if m is not None:
-        flag_str += f'-m {m} '
+        if m is not None:
+            flag_args += ['-m', str(m)]
 
-    if l is not None:
-        flag_str += f'-l '
+        if l is not None:
+            flag_args += ['-l']
 
-    if g is not None:
-        flag_str += f'-g '
+        if g is not None:
+            flag_args += ['-g']
 
-    if r is not None:
-        flag_str += f'-r '
+        if r is not None:
+            flag_args += ['-r']
 
-    if G is not None:
-        flag_str += f'-G '
+        if G is not None:
+            flag_args += ['-G']
 
-    if H is not None:
-        flag_str += f'-H '
+        if H is not None:
+            flag_args += ['-H']
 
-    if s is not None:
-        flag_str += f'-s {s} '
+        if s is not None:
+            flag_args += ['-s', str(s)]
 
-    if D is not None:
-        flag_str += f'-D '
+        if D is not None:
+            flag_args += ['-D']
 
-    if o is not None:
-        flag_str += f'-o {o} '
+        if o is not None:
+            flag_args += ['-o', str(o)]
 
-    if R is not None:
-        flag_str += f'-R {R} '
+        if R is not None:
+            flag_args += ['-R', str(R)]
 
-    if q is not None:
-        flag_str += f'-q {q} '
+        if q is not None:
+            flag_args += ['-q', str(q)]
 
-    if Q is not None:
-        flag_str += f'-Q {Q} '
+        if Q is not None:
+            flag_args += ['-Q', str(Q)]
 
-    if O is not None:
-        flag_str += f'-O '
+        if O is not None:
+            flag_args += ['-O']
 
-    if _3 is not None:
-        flag_str += f'-3 '
+        if _3 is not None:
+            flag_args += ['-3']
 
-    if c is not None:
-        flag_str += f'-c '
+        if c is not None:
+            flag_args += ['-c']
 
-    if E is not None:
-        flag_str += f'-E '
+        if E is not None:
+            flag_args += ['-E']
 
-    if z is not None:
-        flag_str += f'-z {z} '
+        if z is not None:
+            flag_args += ['-z', str(z)]
 
-    if not isinstance(C, type(None)):
-        cfl.writecfl(NAME + 'C', C)
-        flag_str += f'-C {NAME}C '
+        if not isinstance(C, type(None)):
+            flag_args += ['-C', staged['C']]
 
-    if not isinstance(V, type(None)):
-        cfl.writecfl(NAME + 'V', V)
-        flag_str += f'-V {NAME}V '
-    cmd_str += flag_str + opt_args + '  '
+        if not isinstance(V, type(None)):
+            flag_args += ['-V', staged['V']]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}output  "
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def transpose(input, dim1, dim2):
+def transpose(input, dim1, dim2, lazy=False, out=None, backend=None):
     """
     Transpose dimensions {dim1} and {dim2}.
 
     :param dim1 int:
     :param dim2 int:
     :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "transpose dim1 dim2 input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'transpose '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'transpose']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {dim1} {dim2} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(dim1), str(dim2), scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def twixread(dat_file, x=None, r=None, y=None, z=None, s=None, v=None, c=None, n=None, a=None, A=None, L=None, P=None, M=None, d=None):
+def twixread(dat_file, x=None, r=None, y=None, z=None, s=None, v=None, c=None, n=None, a=None, A=None, L=None, P=None, M=None, d=None, lazy=False, out=None, backend=None):
     """
     Read data from Siemens twix (.dat) files.
 
@@ -5174,74 +5443,77 @@ def twixread(dat_file, x=None, r=None, y=None, z=None, s=None, v=None, c=None, n
     :param P bool: use partctr offset
     :param M bool: MPI mode
     :param d int: Debug level
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "twixread [-x d] [-r d] [-y d] [-z d] [-s d] [-v d] [-c d] [-n d] [-a d] [-A] [-L] [-P] [-M] [-d d] dat file output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'twixread '
-    flag_str = ''
+    with scratch.namespace(dat_file, backend=backend) as NAME:
+        argv = [BART_PATH, 'twixread']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if x is not None:
-        flag_str += f'-x {x} '
+        if x is not None:
+            flag_args += ['-x', str(x)]
 
-    if r is not None:
-        flag_str += f'-r {r} '
+        if r is not None:
+            flag_args += ['-r', str(r)]
 
-    if y is not None:
-        flag_str += f'-y {y} '
+        if y is not None:
+            flag_args += ['-y', str(y)]
 
-    if z is not None:
-        flag_str += f'-z {z} '
+        if z is not None:
+            flag_args += ['-z', str(z)]
 
-    if s is not None:
-        flag_str += f'-s {s} '
+        if s is not None:
+            flag_args += ['-s', str(s)]
 
-    if v is not None:
-        flag_str += f'-v {v} '
+        if v is not None:
+            flag_args += ['-v', str(v)]
 
-    if c is not None:
-        flag_str += f'-c {c} '
+        if c is not None:
+            flag_args += ['-c', str(c)]
 
-    if n is not None:
-        flag_str += f'-n {n} '
+        if n is not None:
+            flag_args += ['-n', str(n)]
 
-    if a is not None:
-        flag_str += f'-a {a} '
+        if a is not None:
+            flag_args += ['-a', str(a)]
 
-    if A is not None:
-        flag_str += f'-A '
+        if A is not None:
+            flag_args += ['-A']
 
-    if L is not None:
-        flag_str += f'-L '
+        if L is not None:
+            flag_args += ['-L']
 
-    if P is not None:
-        flag_str += f'-P '
+        if P is not None:
+            flag_args += ['-P']
 
-    if M is not None:
-        flag_str += f'-M '
+        if M is not None:
+            flag_args += ['-M']
 
-    if d is not None:
-        flag_str += f'-d {d} '
-    cmd_str += flag_str + opt_args + '  '
+        if d is not None:
+            flag_args += ['-d', str(d)]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}dat_file {NAME}output  "
-    cfl.writecfl(NAME + 'dat_file', dat_file)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'dat_file', dat_file), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def upat(Y=None, Z=None, y=None, z=None, c=None):
+def upat(Y=None, Z=None, y=None, z=None, c=None, lazy=False, out=None, backend=None):
     """
     Create a sampling pattern.
 
@@ -5250,104 +5522,115 @@ def upat(Y=None, Z=None, y=None, z=None, c=None):
     :param y int: undersampling y
     :param z int: undersampling z
     :param c int: size of k-space center
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "upat [-Y d] [-Z d] [-y d] [-z d] [-c d] output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'upat '
-    flag_str = ''
+    with scratch.namespace(backend=backend) as NAME:
+        argv = [BART_PATH, 'upat']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if Y is not None:
-        flag_str += f'-Y {Y} '
+        if Y is not None:
+            flag_args += ['-Y', str(Y)]
 
-    if Z is not None:
-        flag_str += f'-Z {Z} '
+        if Z is not None:
+            flag_args += ['-Z', str(Z)]
 
-    if y is not None:
-        flag_str += f'-y {y} '
+        if y is not None:
+            flag_args += ['-y', str(y)]
 
-    if z is not None:
-        flag_str += f'-z {z} '
+        if z is not None:
+            flag_args += ['-z', str(z)]
 
-    if c is not None:
-        flag_str += f'-c {c} '
-    cmd_str += flag_str + opt_args + '  '
+        if c is not None:
+            flag_args += ['-c', str(c)]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}output  "
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def var(input, bitmask):
+def var(input, bitmask, lazy=False, out=None, backend=None):
     """
     Compute variance along selected dimensions specified by the {bitmask}
 
     :param bitmask long:
     :param input array:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "var bitmask input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'var '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'var']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {bitmask} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(bitmask), scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def vec(val):
+def vec(val, lazy=False, out=None, backend=None):
     """
     Create a vector of values.
 
     :param val tuple:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "vec val1 ... valN output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'vec '
-    flag_str = ''
+    with scratch.namespace(backend=backend) as NAME:
+        argv = [BART_PATH, 'vec']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {' '.join([str(arg) for arg in val])} {NAME}output  "
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [*[str(arg) for arg in val], NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
 def version(t=None, V=None):
     """
@@ -5364,30 +5647,30 @@ are local changes '-dirty' is added at the end.
     """
     usage_string = "version [-t string] [-V]"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'version '
-    flag_str = ''
+    with scratch.namespace() as NAME:
+        argv = [BART_PATH, 'version']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if t is not None:
-        flag_str += f'-t {t} '
+        if t is not None:
+            flag_args += ['-t', str(t)]
 
-    if V is not None:
-        flag_str += f'-V '
-    cmd_str += flag_str + opt_args + '  '
+        if V is not None:
+            flag_args += ['-V']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()}  "
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-def walsh(input, r=None, R=None, b=None, B=None):
+def walsh(input, r=None, R=None, b=None, B=None, lazy=False, out=None, backend=None):
     """
     Estimate coil sensitivities using walsh method (use with ecaltwo).
 
@@ -5396,44 +5679,47 @@ def walsh(input, r=None, R=None, b=None, B=None):
     :param R list: ()
     :param b list: Block size.
     :param B list: ()
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "walsh [-r d:d:d] [-b d:d:d] input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'walsh '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'walsh']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if r is not None:
-        flag_str += f'-r {":".join([str(x) for x in r])} '
+        if r is not None:
+            flag_args += ['-r', ":".join([str(x) for x in r])]
 
-    if R is not None:
-        flag_str += f'-R {":".join([str(x) for x in R])} '
+        if R is not None:
+            flag_args += ['-R', ":".join([str(x) for x in R])]
 
-    if b is not None:
-        flag_str += f'-b {":".join([str(x) for x in b])} '
+        if b is not None:
+            flag_args += ['-b', ":".join([str(x) for x in b])]
 
-    if B is not None:
-        flag_str += f'-B {":".join([str(x) for x in B])} '
-    cmd_str += flag_str + opt_args + '  '
+        if B is not None:
+            flag_args += ['-B', ":".join([str(x) for x in B])]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def wave(maps, wave, kspace, r=None, b=None, i=None, s=None, c=None, t=None, e=None, g=None, f=None, H=None, v=None, w=None, l=None):
+def wave(maps, wave, kspace, r=None, b=None, i=None, s=None, c=None, t=None, e=None, g=None, f=None, H=None, v=None, w=None, l=None, lazy=False, out=None, backend=None):
     """
     Perform a wave-caipi reconstruction.
 
@@ -5466,73 +5752,76 @@ Expected dimensions:
     :param v bool: Split result to real and imaginary components.
     :param w bool: Use wavelet.
     :param l bool: Use locally low rank across the real and imaginary components.
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "wave [-r f] [-b d] [-i d] [-s f] [-c f] [-t f] [-e f] [-g] [-f] [-H] [-v] [-w] [-l] maps wave kspace output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'wave '
-    flag_str = ''
+    with scratch.namespace(maps, wave, kspace, backend=backend) as NAME:
+        staged = scratch.stage_all(NAME, {'maps': maps, 'wave': wave, 'kspace': kspace})
 
-    opt_args = f''
+        argv = [BART_PATH, 'wave']
+        flag_args = []
 
-    multituples = []
+        opt_args = []
 
-    if r is not None:
-        flag_str += f'-r {r} '
+        multituples = []
 
-    if b is not None:
-        flag_str += f'-b {b} '
+        if r is not None:
+            flag_args += ['-r', str(r)]
 
-    if i is not None:
-        flag_str += f'-i {i} '
+        if b is not None:
+            flag_args += ['-b', str(b)]
 
-    if s is not None:
-        flag_str += f'-s {s} '
+        if i is not None:
+            flag_args += ['-i', str(i)]
 
-    if c is not None:
-        flag_str += f'-c {c} '
+        if s is not None:
+            flag_args += ['-s', str(s)]
 
-    if t is not None:
-        flag_str += f'-t {t} '
+        if c is not None:
+            flag_args += ['-c', str(c)]
 
-    if e is not None:
-        flag_str += f'-e {e} '
+        if t is not None:
+            flag_args += ['-t', str(t)]
 
-    if g is not None:
-        flag_str += f'-g '
+        if e is not None:
+            flag_args += ['-e', str(e)]
 
-    if f is not None:
-        flag_str += f'-f '
+        if g is not None:
+            flag_args += ['-g']
 
-    if H is not None:
-        flag_str += f'-H '
+        if f is not None:
+            flag_args += ['-f']
 
-    if v is not None:
-        flag_str += f'-v '
+        if H is not None:
+            flag_args += ['-H']
 
-    if w is not None:
-        flag_str += f'-w '
+        if v is not None:
+            flag_args += ['-v']
 
-    if l is not None:
-        flag_str += f'-l '
-    cmd_str += flag_str + opt_args + '  '
+        if w is not None:
+            flag_args += ['-w']
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}maps {NAME}wave {NAME}kspace {NAME}output  "
-    cfl.writecfl(NAME + 'maps', maps)
-    cfl.writecfl(NAME + 'wave', wave)
-    cfl.writecfl(NAME + 'kspace', kspace)
+        if l is not None:
+            flag_args += ['-l']
+        argv += flag_args + opt_args
 
-    if DEBUG:
-        print(cmd_str)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['maps'], staged['wave'], staged['kspace'], NAME + 'output']
 
+        if DEBUG:
+            print(' '.join(argv))
 
-    os.system(cmd_str)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        launch.run(argv)
 
-def wavelet(input, bitmask, dim=None, a=None, H=None, D=None, C=None):
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
+
+def wavelet(input, bitmask, dim=None, a=None, H=None, D=None, C=None, lazy=False, out=None, backend=None):
     """
     Perform wavelet transform.
 
@@ -5543,47 +5832,50 @@ def wavelet(input, bitmask, dim=None, a=None, H=None, D=None, C=None):
     :param H bool: type: Haar
     :param D bool: type: Dau2
     :param C bool: type: CDF44
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "wavelet [-a] [-H] [-D] [-C] bitmask [dim1 ... dimN ] input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'wavelet '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'wavelet']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if dim != None:
-        opt_args += f"{' '.join([str(arg) for arg in dim])} "
+        if dim != None:
+            opt_args += [str(arg) for arg in dim]
 
-    if a is not None:
-        flag_str += f'-a '
+        if a is not None:
+            flag_args += ['-a']
 
-    if H is not None:
-        flag_str += f'-H '
+        if H is not None:
+            flag_args += ['-H']
 
-    if D is not None:
-        flag_str += f'-D '
+        if D is not None:
+            flag_args += ['-D']
 
-    if C is not None:
-        flag_str += f'-C '
-    cmd_str += flag_str + opt_args + '  '
+        if C is not None:
+            flag_args += ['-C']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {bitmask} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(bitmask), scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def wavepsf(c=None, x=None, y=None, r=None, a=None, t=None, g=None, s=None, n=None):
+def wavepsf(c=None, x=None, y=None, r=None, a=None, t=None, g=None, s=None, n=None, lazy=False, out=None, backend=None):
     """
     Generate a wave PSF in hybrid space.
 - Assumes the first dimension is the readout dimension.
@@ -5605,58 +5897,62 @@ bart fmac wY wZ wYZ
     :param g float: Maximum gradient amplitude in Gauss/cm
     :param s float: Maximum gradient slew rate in Gauss/cm/second
     :param n int: Number of cycles in the gradient wave
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "wavepsf [-c] [-x d] [-y d] [-r f] [-a d] [-t f] [-g f] [-s f] [-n d] output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'wavepsf '
-    flag_str = ''
+    with scratch.namespace(backend=backend) as NAME:
+        argv = [BART_PATH, 'wavepsf']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if c is not None:
-        flag_str += f'-c '
+        if c is not None:
+            flag_args += ['-c']
 
-    if x is not None:
-        flag_str += f'-x {x} '
+        if x is not None:
+            flag_args += ['-x', str(x)]
 
-    if y is not None:
-        flag_str += f'-y {y} '
+        if y is not None:
+            flag_args += ['-y', str(y)]
 
-    if r is not None:
-        flag_str += f'-r {r} '
+        if r is not None:
+            flag_args += ['-r', str(r)]
 
-    if a is not None:
-        flag_str += f'-a {a} '
+        if a is not None:
+            flag_args += ['-a', str(a)]
 
-    if t is not None:
-        flag_str += f'-t {t} '
+        if t is not None:
+            flag_args += ['-t', str(t)]
 
-    if g is not None:
-        flag_str += f'-g {g} '
+        if g is not None:
+            flag_args += ['-g', str(g)]
 
-    if s is not None:
-        flag_str += f'-s {s} '
+        if s is not None:
+            flag_args += ['-s', str(s)]
 
-    if n is not None:
-        flag_str += f'-n {n} '
-    cmd_str += flag_str + opt_args + '  '
+        if n is not None:
+            flag_args += ['-n', str(n)]
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}output  "
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def whiten(input, ndata, o=None, c=None, n=None):
+def whiten(input, ndata, o=None, c=None, n=None, lazy=False, out=None, backend=None):
     """
     Apply multi-channel noise pre-whitening on <input> using noise data <ndata>.
 Optionally output whitening matrix and noise covariance matrix
@@ -5666,79 +5962,84 @@ Optionally output whitening matrix and noise covariance matrix
     :param o array: use external whitening matrix <optmat_in>
     :param c array: use external noise covariance matrix <covar_in>
     :param n bool: normalize variance to 1 using noise data <ndata>
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "whiten [-o file] [-c file] [-n] input ndata output [optmat_out] [covar_out]"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'whiten '
-    flag_str = ''
+    with scratch.namespace(input, ndata, o, c, backend=backend) as NAME:
+        staged = scratch.stage_all(NAME, {'input': input, 'ndata': ndata, 'o': o, 'c': c})
+
+        argv = [BART_PATH, 'whiten']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if not isinstance(o, type(None)):
-        cfl.writecfl(NAME + 'o', o)
-        flag_str += f'-o {NAME}o '
+        if not isinstance(o, type(None)):
+            flag_args += ['-o', staged['o']]
 
-    if not isinstance(c, type(None)):
-        cfl.writecfl(NAME + 'c', c)
-        flag_str += f'-c {NAME}c '
+        if not isinstance(c, type(None)):
+            flag_args += ['-c', staged['c']]
 
-    if n is not None:
-        flag_str += f'-n '
-    cmd_str += flag_str + opt_args + '  '
+        if n is not None:
+            flag_args += ['-n']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input {NAME}ndata {NAME}output {NAME}optmat_out {NAME}covar_out  "
-    cfl.writecfl(NAME + 'input', input)
-    cfl.writecfl(NAME + 'ndata', ndata)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['input'], staged['ndata'], NAME + 'output', NAME + 'optmat_out', NAME + 'covar_out']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output'), cfl.readcfl(NAME + 'optmat_out'), cfl.readcfl(NAME + 'covar_out')
-    return outputs
+        outputs = scratch.fetch_all([NAME + 'output', NAME + 'optmat_out', NAME + 'covar_out'], lazy, out)
+        return outputs
 
-def window(input, flags, H=None):
+def window(input, flags, H=None, lazy=False, out=None, backend=None):
     """
     Apply Hamming (Hann) window to <input> along dimensions specified by flags
 
     :param flags long:
     :param input array:
     :param H bool: Hann window
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "window [-H] flags input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'window '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'window']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if H is not None:
-        flag_str += f'-H '
-    cmd_str += flag_str + opt_args + '  '
+        if H is not None:
+            flag_args += ['-H']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {flags} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(flags), scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def wshfl(maps, wave, phi, reorder, table, R=None, b=None, i=None, j=None, s=None, e=None, F=None, O=None, t=None, g=None, K=None, H=None, v=None):
+def wshfl(maps, wave, phi, reorder, table, R=None, b=None, i=None, j=None, s=None, e=None, F=None, O=None, t=None, g=None, K=None, H=None, v=None, lazy=False, out=None, backend=None):
     """
     Perform a wave-shuffling reconstruction.
 
@@ -5795,137 +6096,143 @@ Expected dimensions:
     :param K bool: Go from data-table to shuffling basis k-space.
     :param H bool: Use hogwild.
     :param v bool: Split coefficients to real and imaginary components.
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "wshfl [-R ...] [-b d] [-i d] [-j d] [-s f] [-e f] [-F file] [-O file] [-t f] [-g] [-K] [-H] [-v] maps wave phi reorder table output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'wshfl '
-    flag_str = ''
+    with scratch.namespace(maps, wave, phi, reorder, table, F, O, backend=backend) as NAME:
+        staged = scratch.stage_all(NAME, {'maps': maps, 'wave': wave, 'phi': phi, 'reorder': reorder, 'table': table, 'F': F, 'O': O})
+
+        argv = [BART_PATH, 'wshfl']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if R is not None:
-        flag_str += f'-R {R} '
+        if R is not None:
+            flag_args += ['-R', str(R)]
 
-    if b is not None:
-        flag_str += f'-b {b} '
+        if b is not None:
+            flag_args += ['-b', str(b)]
 
-    if i is not None:
-        flag_str += f'-i {i} '
+        if i is not None:
+            flag_args += ['-i', str(i)]
 
-    if j is not None:
-        flag_str += f'-j {j} '
+        if j is not None:
+            flag_args += ['-j', str(j)]
 
-    if s is not None:
-        flag_str += f'-s {s} '
+        if s is not None:
+            flag_args += ['-s', str(s)]
 
-    if e is not None:
-        flag_str += f'-e {e} '
+        if e is not None:
+            flag_args += ['-e', str(e)]
 
-    if not isinstance(F, type(None)):
-        cfl.writecfl(NAME + 'F', F)
-        flag_str += f'-F {NAME}F '
+        if not isinstance(F, type(None)):
+            flag_args += ['-F', staged['F']]
 
-    if not isinstance(O, type(None)):
-        cfl.writecfl(NAME + 'O', O)
-        flag_str += f'-O {NAME}O '
+        if not isinstance(O, type(None)):
+            flag_args += ['-O', staged['O']]
 
-    if t is not None:
-        flag_str += f'-t {t} '
+        if t is not None:
+            flag_args += ['-t', str(t)]
 
-    if g is not None:
-        flag_str += f'-g '
+        if g is not None:
+            flag_args += ['-g']
 
-    if K is not None:
-        flag_str += f'-K '
+        if K is not None:
+            flag_args += ['-K']
 
-    if H is not None:
-        flag_str += f'-H '
+        if H is not None:
+            flag_args += ['-H']
 
-    if v is not None:
-        flag_str += f'-v '
-    cmd_str += flag_str + opt_args + '  '
+        if v is not None:
+            flag_args += ['-v']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}maps {NAME}wave {NAME}phi {NAME}reorder {NAME}table {NAME}output  "
-    cfl.writecfl(NAME + 'maps', maps)
-    cfl.writecfl(NAME + 'wave', wave)
-    cfl.writecfl(NAME + 'phi', phi)
-    cfl.writecfl(NAME + 'reorder', reorder)
-    cfl.writecfl(NAME + 'table', table)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [staged['maps'], staged['wave'], staged['phi'], staged['reorder'], staged['table'], NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def zeros(dims, dim):
+def zeros(dims, dim, lazy=False, out=None, backend=None):
     """
     Create a zero-filled array with {dims} dimensions of size {dim1} to {dimn}.
 
     :param dims long:
     :param dim tuple:
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "zeros dims dim1 ... dimN output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'zeros '
-    flag_str = ''
+    with scratch.namespace(backend=backend) as NAME:
+        argv = [BART_PATH, 'zeros']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
-    cmd_str += flag_str + opt_args + '  '
+        multituples = []
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {dims} {' '.join([str(arg) for arg in dim])} {NAME}output  "
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [str(dims), *[str(arg) for arg in dim], NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
-def zexp(input, i=None):
+def zexp(input, i=None, lazy=False, out=None, backend=None):
     """
     Point-wise complex exponential.
 
     :param input array:
     :param i bool: imaginary
+    :param lazy bool: return lazy cfl handles instead of reading the outputs into memory
+    :param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs
+    :param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND
 
     """
     usage_string = "zexp [-i] input output"
 
-    cmd_str = f'{BART_PATH} '
-    cmd_str += 'zexp '
-    flag_str = ''
+    with scratch.namespace(input, backend=backend) as NAME:
+        argv = [BART_PATH, 'zexp']
+        flag_args = []
 
-    opt_args = f''
+        opt_args = []
 
-    multituples = []
+        multituples = []
 
-    if i is not None:
-        flag_str += f'-i '
-    cmd_str += flag_str + opt_args + '  '
+        if i is not None:
+            flag_args += ['-i']
+        argv += flag_args + opt_args
 
-    cmd_str += f"{' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()} {NAME}input {NAME}output  "
-    cfl.writecfl(NAME + 'input', input)
+        argv += [str(x) for arg in zip(*multituples) for x in arg]
+        argv += [scratch.stage(NAME + 'input', input), NAME + 'output']
 
-    if DEBUG:
-        print(cmd_str)
+        if DEBUG:
+            print(' '.join(argv))
 
 
-    os.system(cmd_str)
+        launch.run(argv)
 
-    outputs = cfl.readcfl(NAME + 'output')
-    return outputs
+        outputs = scratch.fetch(NAME + 'output', lazy, out)
+        return outputs
 
@@ -0,0 +1,171 @@
+# Index of the headers of a directory tree of cfl files, for planning without opening every file
+
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from . import cfl
+
+INDEX_FILE = '.cfl_catalog.json'
+
+
+def hash_file(path, block_bytes=2**24):
+    """
+    Content hash of a file, read in blocks
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_bytes), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def data_file(name):
+    """
+    :returns: the .cfl, or else .cflz, file that belongs to the header of `name`, or None
+    """
+    for ext in ('.cfl', '.cflz'):
+        if os.path.isfile(name + ext):
+            return name + ext
+    return None
+
+
+class Catalog:
+    """
+    Persistent index of the dims, sizes and modification times of all cfl files below `root`
+
+        catalog = Catalog('/data/scans')
+        catalog.update()
+        large = catalog.query(lambda dims: len(dims) > 13 and dims[13] > 100)
+
+    Updates only re-read headers whose files changed since the last update.
+    """
+
+    def __init__(self, root, index=None):
+        """
+        :param root: directory tree of cfl files
+        :param index: index file, defaults to `.cfl_catalog.json` in `root`
+        """
+        self.root = root
+        self.index = index or os.path.join(root, INDEX_FILE)
+        self._lock = threading.Lock()
+        self._entries = self._load_index()
+
+    def _load_index(self):
+        try:
+            with open(self.index) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self):
+        tmp_name = f'{self.index}.{os.getpid()}.{threading.get_ident()}'
+        with open(tmp_name, 'w') as f:
+            json.dump(self._entries, f, separators=(',', ':'))
+        os.replace(tmp_name, self.index)
+
+    def _scan(self):
+        # relative name -> (header stat, data file stat) of every cfl in the tree
+        found = {}
+        for directory, _, files in os.walk(self.root):
+            for f in files:
+                if not f.endswith('.hdr'):
+                    continue
+                name = os.path.join(directory, f[:-len('.hdr')])
+                data = data_file(name)
+                if data is not None:
+                    found[os.path.relpath(name, self.root)] = (os.stat(name + '.hdr'), os.stat(data))
+        return found
+
+    def _entry(self, name, hashes):
+        full_name = os.path.join(self.root, name)
+        data = data_file(full_name)
+        entry = {
+            'dims': cfl.readhdr(full_name),
+            'bytes': os.path.getsize(data),
+            'compressed': data.endswith('.cflz'),
+            'mtime': os.stat(data).st_mtime_ns,
+            'hdr_mtime': os.stat(full_name + '.hdr').st_mtime_ns,
+        }
+        if hashes:
+            entry['hash'] = hash_file(data)
+        return entry
+
+    def update(self, hashes=False, workers=None):
+        """
+        Bring the index up to date with the files below `root` and save it
+
+        Headers are read, and files hashed, on a thread pool, but only for new or modified files.
+
+        :param hashes: also store a content hash of every data file
+        :returns: dictionary with the numbers of added, updated and removed entries
+        """
+        found = self._scan()
+        with self._lock:
+            removed = [name for name in self._entries if name not in found]
+            changed = [name for name, (hdr, data) in found.items()
+                       if name not in self._entries
+                       or self._entries[name]['mtime'] != data.st_mtime_ns
+                       or self._entries[name]['hdr_mtime'] != hdr.st_mtime_ns
+                       or self._entries[name]['bytes'] != data.st_size
+                       or (hashes and 'hash' not in self._entries[name])]
+            added = sum(name not in self._entries for name in changed)
+
+        with ThreadPoolExecutor(workers or os.cpu_count() or 1) as pool:
+            entries = list(pool.map(lambda name: self._entry(name, hashes), changed))
+
+        with self._lock:
+            for name in removed:
+                del self._entries[name]
+            self._entries.update(zip(changed, entries))
+            self._save_index()
+        return {'added': added, 'updated': len(changed) - added, 'removed': len(removed)}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getitem__(self, name):
+        return self._entries[os.path.relpath(name, self.root)]
+
+    def query(self, predicate=None, shape=None, ndim=None, min_bytes=None, max_bytes=None):
+        """
+        Find the cfl files whose dims satisfy all given conditions
+
+        :param predicate: function of the header dims that returns True for files to include
+        :param shape: dims to match exactly, up to trailing singleton dimensions
+        :param ndim: number of dims after trimming trailing singleton dimensions
+        :param min_bytes: smallest data size, of the uncompressed data
+        :param max_bytes: largest data size, of the uncompressed data
+        :returns: sorted list of cfl names, without extension
+        """
+        names = []
+        with self._lock:
+            for name, entry in self._entries.items():
+                dims = entry['dims']
+                trimmed = cfl.trim_dims(dims) if dims else dims
+                nbytes = 8 * int(np.prod(dims))
+                if shape is not None and trimmed != cfl.trim_dims(list(shape)):
+                    continue
+                if ndim is not None and len(trimmed) != ndim:
+                    continue
+                if min_bytes is not None and nbytes < min_bytes:
+                    continue
+                if max_bytes is not None and nbytes > max_bytes:
+                    continue
+                if predicate is not None and not predicate(dims):
+                    continue
+                names.append(os.path.join(self.root, name))
+        return sorted(names)
+
+    def total_bytes(self, names=None):
+        """
+        :returns: uncompressed data size of `names`, or of all files in the catalog
+        """
+        with self._lock:
+            entries = self._entries.values() if names is None else [
+                self._entries[os.path.relpath(name, self.root)] for name in names]
+            return sum(8 * int(np.prod(entry['dims'])) for entry in entries)
@@ -7,35 +7,443 @@
 # 2015 Jonathan Tamir <jtamir@eecs.berkeley.edu>
 
 
+import lzma
+import mmap
+import os
+import shutil
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
-def readcfl(name):
+def readhdr(name):
     # get dims from .hdr
     h = open(name + ".hdr", "r")
     h.readline() # skip
     l = h.readline()
     h.close()
-    dims = [int(i) for i in l.split( )]
+    return [int(i) for i in l.split( )]
+
 
+def trim_dims(dims):
     # remove singleton dimensions from the end
+    n = len(dims)
+    while n > 1 and dims[n - 1] == 1:
+        n -= 1
+    return dims[:n]
+
+
+def _check_out(name, out, dims):
+    if out.dtype != np.complex64 or not out.flags.f_contiguous or not out.flags.writeable:
+        raise ValueError("out must be a writeable complex64 array in column-major order")
+    if trim_dims(list(out.shape)) != dims:
+        raise ValueError(f"out has shape {out.shape}, but {name} has dimensions {dims}")
+
+
+def readcfl(name, mmap=None, out=None):
+    """
+    Read a cfl file
+
+    Falls back to a compressed `.cflz` file written by `writecflz` if there is no `.cfl` file.
+
+    :param mmap: None to read the data into memory, 'r' for a read-only or 'c' for
+        a copy-on-write `np.memmap` that only reads the parts of the file that are accessed.
+        Ignored for compressed files
+    :param out: writeable complex64 array in column-major order to read the data into instead
+        of a new array. Its shape must match the header up to trailing singleton dimensions
+    """
+    dims = trim_dims(readhdr(name))
     n = np.prod(dims)
-    dims_prod = np.cumprod(dims)
-    dims = dims[:np.searchsorted(dims_prod, n)+1]
+
+    # compressed archives are read transparently
+    if not os.path.exists(name + ".cfl") and os.path.exists(name + ".cflz"):
+        return readcflz(name, out=out)
+
+    if out is not None:
+        _check_out(name, out, dims)
+        with open(name + ".cfl", "rb") as d:
+            if d.readinto(out.T) != out.nbytes:
+                raise ValueError(f"{name}.cfl is shorter than its dimensions {dims}")
+        return out
+
+    if mmap is not None and n > 0:
+        return np.memmap(name + ".cfl", dtype=np.complex64, mode=mmap, shape=tuple(dims), order='F')
 
     # load data and reshape into dims
-    d = open(name + ".cfl", "r")
+    d = open(name + ".cfl", "rb")
     a = np.fromfile(d, dtype=np.complex64, count=n);
     d.close()
     return a.reshape(dims, order='F') # column-major
 
 	
+def _advise(buf, advice, start, length):
+    # memory access hint for a byte range of a mapping, if the platform has it
+    if hasattr(buf, 'madvise') and hasattr(mmap, advice):
+        offset = start % mmap.PAGESIZE
+        buf.madvise(getattr(mmap, advice), start - offset, min(length + offset, len(buf) - start + offset))
+
+
+def iter_cfl(name, dim, chunk=1):
+    """
+    Iterate over a cfl file in blocks of `chunk` positions along BART dimension `dim`
+
+    The file is memory-mapped read-only, so only the blocks that are used are read.
+    When `dim` is the last non-singleton dimension, every block is a contiguous view:
+    the next block is then read ahead while the current one is processed.
+
+    :returns: generator of read-only arrays, with singleton dimensions after `dim` trimmed
+    """
+    dims = readhdr(name)
+    dims = dims + [1] * (dim + 1 - len(dims))
+    n = int(np.prod(dims))
+    if n == 0:
+        buf = None
+        data = np.zeros(dims, dtype=np.complex64, order='F')
+    else:
+        with open(name + ".cfl", "rb") as d:
+            buf = mmap.mmap(d.fileno(), n * 8, access=mmap.ACCESS_READ)
+        data = np.frombuffer(buf, dtype=np.complex64, count=n).reshape(dims, order='F')
+
+    contiguous = buf is not None and int(np.prod(dims[dim + 1:])) == 1
+    stride = int(np.prod(dims[:dim])) * 8
+    if contiguous:
+        _advise(buf, 'MADV_SEQUENTIAL', 0, n * 8)
+
+    for i in range(0, dims[dim], chunk):
+        k = min(chunk, dims[dim] - i)
+        if contiguous and i + k < dims[dim]:
+            _advise(buf, 'MADV_WILLNEED', (i + k) * stride, min(chunk, dims[dim] - i - k) * stride)
+        block_dims = dims[:dim] + [k] + dims[dim + 1:]
+        while len(block_dims) > dim + 1 and block_dims[-1] == 1:
+            block_dims.pop()
+        yield data[(slice(None),) * dim + (slice(i, i + k),)].reshape(block_dims, order='F')
+
+
+# arrays that need converting are written in pieces of at most this many bytes
+WRITE_CHUNK_BYTES = 2**26
+
+
+def _write_data(d, array):
+    # complex64 in column-major order is written straight from its buffer
+    if array.dtype == np.complex64 and array.flags.f_contiguous:
+        d.write(array.T)
+        return
+    if array.size * 8 <= WRITE_CHUNK_BYTES:
+        d.write(np.asfortranarray(array, dtype=np.complex64).T)
+        return
+    if array.shape[-1] == 1:
+        _write_data(d, array[..., 0])
+        return
+    # split along the slowest dimension in column-major order
+    step = max(1, WRITE_CHUNK_BYTES // (array[..., 0].size * 8))
+    for i in range(0, array.shape[-1], step):
+        _write_data(d, array[..., i:i + step])
+
+
 def writecfl(name, array):
+    if isinstance(array, LazyCfl):
+        # copy the files behind a handle instead of mapping them
+        if array.compressed:
+            decompress(array.name, name)
+        elif os.path.abspath(array.name) != os.path.abspath(name):
+            for ext in (".hdr", ".cfl"):
+                shutil.copyfile(array.name + ext, name + ext)
+        return
+    array = np.asarray(array)
     h = open(name + ".hdr", "w")
     h.write('# Dimensions\n')
     for i in (array.shape):
             h.write("%d " % i)
     h.write('\n')
     h.close()
-    d = open(name + ".cfl", "w")
-    array.T.astype(np.complex64).tofile(d) # tranpose for column-major order
-    d.close()
\ No newline at end of file
+    d = open(name + ".cfl", "wb")
+    _write_data(d, array)
+    d.close()
+
+
+def readmultihdr(name):
+    # get dims of every array from the .hdr of a multi-cfl file
+    sections = {}
+    with open(name + ".hdr", "r") as h:
+        for l in h:
+            if l.startswith('#'):
+                lines = sections.setdefault(l[1:].strip(), [])
+            elif l.strip():
+                lines.append([int(i) for i in l.split()])
+    if 'MultiDimensions' not in sections:
+        raise ValueError(f"{name}.hdr is not a multi-cfl header")
+    return sections['MultiDimensions']
+
+
+def readmulticfl(name, mmap='r'):
+    """
+    Read the arrays of a multi-cfl file, the layout written by `bart multicfl`
+
+    The file is mapped once and every array is a view into that mapping.
+
+    :param mmap: 'r' for read-only or 'c' for copy-on-write views
+    :returns: list of arrays
+    """
+    all_dims = [trim_dims(dims) for dims in readmultihdr(name)]
+    sizes = [int(np.prod(dims)) for dims in all_dims]
+    if sum(sizes) == 0:
+        return [np.zeros(dims, dtype=np.complex64, order='F') for dims in all_dims]
+
+    data = np.memmap(name + ".cfl", dtype=np.complex64, mode=mmap, shape=(sum(sizes),))
+    offsets = np.cumsum([0] + sizes)
+    return [data[o:o + n].reshape(dims, order='F') for o, n, dims in zip(offsets, sizes, all_dims)]
+
+
+def writemulticfl(name, arrays):
+    """
+    Write several arrays into a single multi-cfl file, the layout read by `bart multicfl -s`
+
+    The arrays are written one after the other through a single open file.
+    """
+    h = open(name + ".hdr", "w")
+    h.write('# Dimensions\n')
+    h.write("%d \n" % sum(array.size for array in arrays))
+    h.write('# SizesDimensions\n')
+    for array in arrays:
+        h.write("%d " % array.ndim)
+    h.write('\n')
+    h.write('# MultiDimensions\n')
+    for array in arrays:
+        for i in (array.shape):
+            h.write("%d " % i)
+        h.write('\n')
+    h.close()
+    d = open(name + ".cfl", "wb")
+    for array in arrays:
+        _write_data(d, array)
+    d.close()
+
+
+# Compressed cfl files (.cflz): the column-major complex64 data is split into chunks of
+# `chunk_bytes` that are compressed independently. A fixed header and an index of the
+# (offset, length) of every compressed chunk precede the chunks, so that any range of
+# the data can be read by decompressing only the chunks that overlap it.
+CFLZ_MAGIC = b'CFLZ'
+CFLZ_HEADER = struct.Struct('<4sBB2xQQQ')  # magic, version, codec, chunk bytes, data bytes, chunks
+CFLZ_ENTRY = struct.Struct('<QQ')
+CFLZ_CODECS = {'zlib': 1, 'lzma': 2}
+
+
+def _compress(codec, level, data):
+    if codec == 'lzma':
+        return lzma.compress(data, preset=6 if level is None else level)
+    return zlib.compress(data, -1 if level is None else level)
+
+
+def _decompress(codec, data):
+    if codec == CFLZ_CODECS['lzma']:
+        return lzma.decompress(data)
+    return zlib.decompress(data)
+
+
+def writecflz(name, array, codec='zlib', level=None, chunk_bytes=2**22, workers=None):
+    """
+    Write a compressed cfl file: a regular .hdr and the compressed data in .cflz
+
+    Chunks are compressed in parallel on a thread pool; zlib and lzma release the GIL.
+
+    :param codec: 'zlib' or 'lzma'
+    :param level: compression level of the codec, or None for its default
+    :param chunk_bytes: uncompressed size of a chunk, a multiple of 8
+    :param workers: compressing threads, defaults to the number of CPUs
+    """
+    if codec not in CFLZ_CODECS:
+        raise ValueError(f"Unknown codec {codec}, expected one of {sorted(CFLZ_CODECS)}")
+    chunk_bytes -= chunk_bytes % 8
+    workers = workers or os.cpu_count() or 1
+
+    h = open(name + ".hdr", "w")
+    h.write('# Dimensions\n')
+    for i in (array.shape):
+            h.write("%d " % i)
+    h.write('\n')
+    h.close()
+
+    data = memoryview(np.asfortranarray(array, dtype=np.complex64).T).cast('B')
+    starts = range(0, len(data), chunk_bytes)
+    index = []
+    with open(name + ".cflz", "wb") as d, ThreadPoolExecutor(workers) as pool:
+        d.write(CFLZ_HEADER.pack(CFLZ_MAGIC, 1, CFLZ_CODECS[codec], chunk_bytes, len(data), len(starts)))
+        d.write(b'\0' * CFLZ_ENTRY.size * len(starts))
+        offset = d.tell()
+        # compress a bounded window of chunks at a time and write them in order
+        for w in range(0, len(starts), 2 * workers):
+            window = starts[w:w + 2 * workers]
+            for chunk in pool.map(lambda start: _compress(codec, level, data[start:start + chunk_bytes]), window):
+                d.write(chunk)
+                index.append((offset, len(chunk)))
+                offset += len(chunk)
+        d.seek(CFLZ_HEADER.size)
+        d.write(b''.join(CFLZ_ENTRY.pack(*entry) for entry in index))
+
+
+def readcflz_index(name):
+    """
+    :returns: codec id, chunk bytes, data bytes and the list of (offset, length) of the compressed chunks
+    """
+    with open(name + ".cflz", "rb") as d:
+        magic, version, codec, chunk_bytes, nbytes, nchunks = CFLZ_HEADER.unpack(d.read(CFLZ_HEADER.size))
+        if magic != CFLZ_MAGIC or version != 1:
+            raise ValueError(f"{name}.cflz is not a compressed cfl file")
+        index = list(CFLZ_ENTRY.iter_unpack(d.read(CFLZ_ENTRY.size * nchunks)))
+    return codec, chunk_bytes, nbytes, index
+
+
+def _read_chunks(name, codec, index, chunks, pool):
+    # decompress the chunks with the given numbers on `pool`, returned in the same order
+    def read(i):
+        offset, length = index[i]
+        with open(name + ".cflz", "rb") as d:
+            d.seek(offset)
+            return _decompress(codec, d.read(length))
+
+    return list(pool.map(read, chunks))
+
+
+def _iter_chunks(name, codec, index, workers):
+    # decompress all chunks in order, a bounded window at a time, yielding (number, data)
+    with ThreadPoolExecutor(workers) as pool:
+        for w in range(0, len(index), 2 * workers):
+            window = range(w, min(w + 2 * workers, len(index)))
+            yield from zip(window, _read_chunks(name, codec, index, window, pool))
+
+
+def readcflz(name, dim=None, start=0, stop=None, out=None, workers=None):
+    """
+    Read a compressed cfl file, or only positions `start:stop` along BART dimension `dim`
+
+    Only the chunks that overlap the requested positions are decompressed, in parallel.
+
+    :param out: array to decompress the whole file into, see `readcfl`
+    :param workers: decompressing threads, defaults to the number of CPUs
+    """
+    dims = readhdr(name)
+    codec, chunk_bytes, nbytes, index = readcflz_index(name)
+    workers = workers or os.cpu_count() or 1
+
+    if dim is None:
+        if out is None:
+            out = np.empty(trim_dims(dims), dtype=np.complex64, order='F')
+        _check_out(name, out, trim_dims(dims))
+        buf = memoryview(out.T).cast('B')
+        # decompress straight into `out`
+        for i, chunk in _iter_chunks(name, codec, index, workers):
+            buf[i * chunk_bytes:i * chunk_bytes + len(chunk)] = chunk
+        return out
+
+    dims = dims + [1] * (dim + 1 - len(dims))
+    start = min(start, dims[dim])
+    stop = dims[dim] if stop is None else max(start, min(stop, dims[dim]))
+    inner = int(np.prod(dims[:dim])) * 8
+    outer = int(np.prod(dims[dim + 1:]))
+    # byte ranges of the block: one contiguous run per position of the outer dimensions
+    runs = [(j * dims[dim] * inner + start * inner, j * dims[dim] * inner + stop * inner) for j in range(outer)]
+    needed = sorted({i for a, b in runs if b > a for i in range(a // chunk_bytes, (b - 1) // chunk_bytes + 1)})
+    with ThreadPoolExecutor(workers) as pool:
+        chunks = dict(zip(needed, _read_chunks(name, codec, index, needed, pool)))
+
+    block = bytearray()
+    for a, b in runs:
+        for i in range(a // chunk_bytes, (b - 1) // chunk_bytes + 1) if b > a else ():
+            base = i * chunk_bytes
+            block += chunks[i][max(a, base) - base:min(b, base + chunk_bytes) - base]
+    block_dims = dims[:dim] + [stop - start] + dims[dim + 1:]
+    return np.frombuffer(block, dtype=np.complex64).reshape(trim_dims(block_dims), order='F')
+
+
+def decompress(name, dest, workers=None):
+    """
+    Decompress a compressed cfl file into the regular cfl file `dest`, chunk by chunk
+    """
+    with open(name + ".hdr", "r") as h, open(dest + ".hdr", "w") as g:
+        g.write(h.read())
+    codec, _, _, index = readcflz_index(name)
+    with open(dest + ".cfl", "wb") as d:
+        for _, chunk in _iter_chunks(name, codec, index, workers or os.cpu_count() or 1):
+            d.write(chunk)
+
+
+def backing_cfl(array):
+    """
+    Find the cfl file that `array` is a complete, unmodified memory map of, e.g. from `readcfl(name, mmap='r')`
+
+    Writeable maps are flushed first; copy-on-write maps never qualify, since they may differ from the file.
+
+    :returns: the cfl name, without extension, or None
+    """
+    if not isinstance(array, np.memmap) or array.mode not in ('r', 'r+', 'w+') or array.filename is None:
+        return None
+    if not array.filename.endswith('.cfl') or array.offset != 0:
+        return None
+    name = array.filename[:-len('.cfl')]
+    if array.dtype != np.complex64 or not array.flags.f_contiguous or not os.path.isfile(name + '.hdr'):
+        return None
+    # a contiguous view as large as the file covers all of it
+    if array.nbytes != os.path.getsize(array.filename) or trim_dims(readhdr(name)) != trim_dims(list(array.shape)):
+        return None
+    if array.mode != 'r':
+        array.flush()
+    return name
+
+
+class LazyCfl:
+    """
+    Handle to a cfl file that is only read into memory when NumPy needs its data
+
+    Passing a handle to a bartpy.tools function puts its file name on the
+    command line directly instead of writing the data out again.
+    The data is memory-mapped read-only; copy it to modify it.
+    Handles to compressed files are decompressed into the scratch space of the call instead.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.dims = readhdr(name)
+        self.compressed = not os.path.exists(name + ".cfl") and os.path.exists(name + ".cflz")
+        self._array = None
+
+    @property
+    def shape(self):
+        return tuple(trim_dims(self.dims))
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def size(self):
+        return int(np.prod(self.dims))
+
+    @property
+    def dtype(self):
+        return np.dtype(np.complex64)
+
+    def load(self):
+        """
+        Map the file, once, and return its data
+        """
+        if self._array is None:
+            self._array = readcfl(self.name, mmap='r')
+            self._array.flags.writeable = False
+        return self._array
+
+    def __array__(self, dtype=None, copy=None):
+        array = self.load()
+        if dtype is not None:
+            return array.astype(dtype)
+        return array.copy() if copy else array
+
+    def __getitem__(self, index):
+        return self.load()[index]
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __repr__(self):
+        return f"LazyCfl('{self.name}', shape={self.shape}, loaded={self._array is not None})"
@@ -0,0 +1,207 @@
+# Run BART tools inside this process through the embedding API of libbart
+
+import contextlib
+import ctypes
+import itertools
+import os
+import subprocess
+import threading
+import weakref
+
+import numpy as np
+
+from . import threads
+from .cfl import _check_out, trim_dims
+
+# Number of dimensions of BART arrays
+DIMS = 16
+
+# Argument names starting with this prefix refer to in-memory cfl arrays instead of files
+PREFIX = 'bartpy_mem_'
+
+# BART treats cfl names with this suffix as arrays in memory
+MEM_SUFFIX = '.mem'
+
+_lib = None
+_lib_lock = threading.Lock()
+
+# BART keeps global state such as the list of in-memory arrays, so commands run one at a time.
+# Reentrant, since garbage collection may release an output while the lock is held
+_command_lock = threading.RLock()
+
+_counter = itertools.count()
+
+# namespace prefix -> input arrays registered for it, kept alive until the namespace closes
+_registered = {}
+_registered_lock = threading.Lock()
+
+
+def library_path():
+    """
+    :returns: path of libbart: `BART_LIBRARY` if set, otherwise the first one found in `TOOLBOX_PATH`
+    """
+    if 'BART_LIBRARY' in os.environ:
+        return os.environ['BART_LIBRARY']
+    toolbox = os.environ.get('TOOLBOX_PATH', '')
+    for candidate in ('libbart.so', 'lib/libbart.so', 'libbart.dylib', 'lib/libbart.dylib'):
+        if os.path.isfile(os.path.join(toolbox, candidate)):
+            return os.path.join(toolbox, candidate)
+    return None
+
+
+def library():
+    """
+    Load libbart once and declare the functions of its embedding API
+
+    :raises OSError: if BART was not built as a shared library
+    """
+    global _lib
+    with _lib_lock:
+        if _lib is None:
+            path = library_path()
+            if path is None:
+                raise OSError("libbart not found: build BART as a shared library and set BART_LIBRARY "
+                              "or place libbart.so in TOOLBOX_PATH")
+            lib = ctypes.CDLL(path, mode=ctypes.RTLD_GLOBAL)
+            dims = ctypes.POINTER(ctypes.c_long)
+            lib.register_mem_cfl_non_managed.argtypes = [ctypes.c_char_p, ctypes.c_uint, dims, ctypes.c_void_p]
+            lib.register_mem_cfl_non_managed.restype = None
+            lib.load_mem_cfl.argtypes = [ctypes.c_char_p, ctypes.c_uint, dims]
+            lib.load_mem_cfl.restype = ctypes.c_void_p
+            lib.deallocate_mem_cfl.argtypes = [ctypes.c_void_p]
+            lib.deallocate_mem_cfl.restype = None
+            lib.bart_command.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.POINTER(ctypes.c_char_p)]
+            lib.bart_command.restype = ctypes.c_int
+            _lib = lib
+    return _lib
+
+
+def available():
+    """
+    :returns: True if libbart can be loaded
+    """
+    try:
+        library()
+    except OSError:
+        return False
+    return True
+
+
+def is_memory(name):
+    """
+    :returns: True if `name` belongs to an in-memory namespace
+    """
+    return name.startswith(PREFIX)
+
+
+def _dims(shape):
+    return (ctypes.c_long * DIMS)(*(list(shape) + [1] * (DIMS - len(shape))))
+
+
+def open_namespace():
+    """
+    :returns: a new name prefix for the in-memory arrays of a single tool call
+    """
+    prefix = f'{PREFIX}{os.getpid()}_{next(_counter)}_'
+    with _registered_lock:
+        _registered[prefix] = []
+    return prefix
+
+
+def close_namespace(prefix):
+    """
+    Unregister the inputs registered under `prefix`
+
+    Waits for a running BART command, since it shares BART's list of in-memory arrays.
+    """
+    with _registered_lock:
+        arrays = _registered.pop(prefix)
+    if arrays:
+        lib = library()
+        with _command_lock:
+            for array in arrays:
+                lib.deallocate_mem_cfl(array.ctypes.data)
+
+
+@contextlib.contextmanager
+def namespace():
+    """
+    Name prefix for the in-memory arrays of a single tool call
+
+    Inputs registered under the prefix are unregistered on exit.
+    """
+    prefix = open_namespace()
+    try:
+        yield prefix
+    finally:
+        close_namespace(prefix)
+
+
+def register(name, array):
+    """
+    Lend `array` to BART as the in-memory input `name`
+
+    Complex64 arrays in column-major order are borrowed without copying; others are converted first.
+
+    :returns: `name`
+    """
+    if np.ndim(array) > DIMS:
+        raise ValueError(f"BART arrays have at most {DIMS} dimensions, got {np.ndim(array)}")
+    array = np.asfortranarray(array, dtype=np.complex64)
+    lib = library()
+    with _command_lock:
+        lib.register_mem_cfl_non_managed((name + MEM_SUFFIX).encode('utf-8'), DIMS, _dims(array.shape),
+                                         array.ctypes.data)
+    with _registered_lock:
+        prefix = next(prefix for prefix in _registered if name.startswith(prefix))
+        _registered[prefix].append(array)
+    return name
+
+
+def run(argv):
+    """
+    Run a BART command in this process
+
+    Arguments in an in-memory namespace refer to registered inputs or to outputs that BART keeps in memory.
+
+    :raises subprocess.CalledProcessError: if the command fails
+    """
+    args = ['bart'] + [arg + MEM_SUFFIX if is_memory(arg) else arg for arg in argv[1:]]
+    c_args = (ctypes.c_char_p * len(args))(*[arg.encode('utf-8') for arg in args])
+    lib = library()
+    with threads.in_process(), _command_lock:
+        code = lib.bart_command(0, None, len(args), c_args)
+    if code != 0:
+        raise subprocess.CalledProcessError(code, argv)
+
+
+def fetch(name, out=None):
+    """
+    Take the in-memory output `name` that BART wrote
+
+    The returned array wraps BART's buffer without copying, and the buffer is
+    released once the array is garbage collected.
+
+    :param out: array to copy the output into instead, see `cfl.readcfl`; BART's buffer is released right away
+    """
+    lib = library()
+    dims = (ctypes.c_long * DIMS)()
+    with _command_lock:
+        ptr = lib.load_mem_cfl((name + MEM_SUFFIX).encode('utf-8'), DIMS, dims)
+    shape = trim_dims(list(dims))
+    size = int(np.prod(shape))
+    buffer = (ctypes.c_float * (2 * size)).from_address(ptr)
+    array = np.frombuffer(buffer, dtype=np.complex64).reshape(shape, order='F')
+
+    if out is not None:
+        _check_out(name, out, shape)
+        np.copyto(out, array.reshape(out.shape, order='F'))
+        _release(lib, ptr)
+        return out
+    weakref.finalize(buffer, _release, lib, ptr)
+    return array
+
+
+def _release(lib, ptr):
+    with _command_lock:
+        lib.deallocate_mem_cfl(ptr)
@@ -0,0 +1,57 @@
+# Probe for the compiled SWIG extension modules, which run BART functions in-process
+
+import importlib
+import threading
+
+# capability -> extension module
+EXTENSIONS = {
+    'fft': 'bartpy.num._fft_swig',
+    'linops': 'bartpy.linops._linop_swig',
+    'simu': 'bartpy.simu._simu_swig',
+    'italgos': 'bartpy.italgos._italgos',
+}
+
+# capability -> None if the extension loads, otherwise the reason it does not
+_probed = {}
+_probe_lock = threading.RLock()
+
+
+def probe(name):
+    """
+    Try to load the extension module of capability `name`, once
+
+    :returns: None if it loads, otherwise the error message
+    """
+    with _probe_lock:
+        if name not in _probed:
+            try:
+                importlib.import_module(EXTENSIONS[name])
+            except ImportError as e:
+                _probed[name] = str(e)
+            else:
+                _probed[name] = None
+        return _probed[name]
+
+
+def available(name):
+    """
+    :returns: True if the extension module of capability `name` is built and loads
+    """
+    return probe(name) is None
+
+
+def capabilities():
+    """
+    :returns: dictionary of all capabilities and whether their extension module is available
+    """
+    return {name: available(name) for name in EXTENSIONS}
+
+
+def require(name):
+    """
+    :raises ImportError: if the extension module of capability `name` is not available
+    """
+    error = probe(name)
+    if error is not None:
+        raise ImportError(f"bartpy was installed without its {name} extension ({error}); reinstall it "
+                          f"with TOOLBOX_PATH pointing to a BART build with static libraries in lib/")
@@ -0,0 +1,130 @@
+# Launch BART command-line tools without a shell
+
+import asyncio
+import contextlib
+import os
+import signal
+import subprocess
+
+from . import embed, threads
+
+# How tools run by default: 'subprocess' launches the bart executable, 'embed' runs in-process through libbart
+BACKEND = 'subprocess'
+BACKENDS = ('subprocess', 'embed')
+
+
+def set_backend(backend):
+    """
+    Choose how tool functions run when they are not given a backend
+
+    :param backend: 'subprocess' or 'embed'
+    """
+    global BACKEND
+    BACKEND = check_backend(backend)
+
+
+def check_backend(backend):
+    """
+    :returns: `backend`, or the default if it is None
+    :raises ValueError: for an unknown backend
+    """
+    backend = backend or BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend}, expected one of {BACKENDS}")
+    return backend
+
+
+def spawn(argv, env=None):
+    """
+    Start `argv[0]` with arguments `argv` and wait for it to finish
+
+    Uses posix_spawn, which avoids both the intermediate `/bin/sh` and copying
+    the page tables of a large Python process the way fork would.
+    If the wait is interrupted, e.g. by KeyboardInterrupt, the process is killed and reaped.
+
+    :param env: environment of the process, defaults to the current one
+    :returns: exit code of the process
+    """
+    env = os.environ if env is None else env
+    if not hasattr(os, 'posix_spawn'):
+        return subprocess.call(argv, env=env)
+    pid = os.posix_spawn(argv[0], argv, env)
+    try:
+        _, status = os.waitpid(pid, 0)
+    except BaseException:
+        with contextlib.suppress(ProcessLookupError, ChildProcessError):
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+        raise
+    return os.waitstatus_to_exitcode(status)
+
+
+def run(argv):
+    """
+    Run a BART command and check its exit code
+
+    The command gets its share of the process-wide thread budget as `OMP_NUM_THREADS`.
+    Commands on in-memory arrays of the embed backend run inside this process.
+
+    :param argv: list of the executable and its arguments
+    :raises subprocess.CalledProcessError: if the command exits with an error
+    """
+    if any(embed.is_memory(arg) for arg in argv):
+        embed.run(argv)
+        return
+    with threads.claim() as num_threads:
+        code = spawn(argv, threads.environment(num_threads))
+    if code != 0:
+        raise subprocess.CalledProcessError(code, argv)
+
+
+def output(argv):
+    """
+    Run a BART command, check its exit code and return what it printed
+
+    :returns: standard output as bytes
+    """
+    with threads.claim() as num_threads:
+        return subprocess.run(argv, stdout=subprocess.PIPE, check=True, env=threads.environment(num_threads)).stdout
+
+
+async def _wait(process, done):
+    # await `done` of `process`; a cancelled call kills and reaps the process before it propagates
+    try:
+        return await done
+    except asyncio.CancelledError:
+        with contextlib.suppress(ProcessLookupError):
+            process.kill()
+        await process.wait()
+        raise
+
+
+async def arun(argv):
+    """
+    Coroutine version of `run`
+
+    Cancelling the coroutine kills the command.
+    """
+    if any(embed.is_memory(arg) for arg in argv):
+        await asyncio.get_running_loop().run_in_executor(None, embed.run, argv)
+        return
+    async with threads.aclaim() as num_threads:
+        process = await asyncio.create_subprocess_exec(*argv, env=threads.environment(num_threads))
+        code = await _wait(process, process.wait())
+    if code != 0:
+        raise subprocess.CalledProcessError(code, argv)
+
+
+async def aoutput(argv):
+    """
+    Coroutine version of `output`
+
+    Cancelling the coroutine kills the command.
+    """
+    async with threads.aclaim() as num_threads:
+        process = await asyncio.create_subprocess_exec(*argv, stdout=asyncio.subprocess.PIPE,
+                                                       env=threads.environment(num_threads))
+        stdout, _ = await _wait(process, process.communicate())
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, argv, stdout)
+    return stdout
@@ -14,11 +14,33 @@ def expand_dims(dims):
 def expand_array(array):
     """
     Add singleton dimensions to array
+
+    The result is a view in the memory layout of `array` if it is complex64 already.
     """
-    array = np.asfortranarray(array, dtype=np.complex64)
+    array = np.asarray(array, dtype=np.complex64)
     ndims = array.ndim
     
     if ndims < 16: 
         array = np.expand_dims(array, axis=list(range(ndims, 16)))
         
-    return array
\ No newline at end of file
+    return array
+
+def check_out(out, dims, src=None, in_place=False):
+    """
+    Check that `out` can hold a result of dimensions `dims`
+
+    :param src: input of the operation, which `out` may only overlap if `in_place`
+    :param in_place: True if the operation can write into its input, in which case
+        `out` may be the same column-major array as `src`
+    :raises ValueError: if `out` is unsuitable
+    """
+    if out.dtype != np.complex64 or not out.flags.f_contiguous or not out.flags.writeable:
+        raise ValueError("out must be a writeable complex64 array in column-major order")
+    if len(out.shape) > 16 or expand_dims(out.shape) != expand_dims(dims):
+        raise ValueError(f"out has shape {out.shape}, but the result has dimensions {tuple(dims)}")
+    if src is None or not np.may_share_memory(out, src):
+        return
+    same = (out.ctypes.data == src.ctypes.data and src.flags.f_contiguous
+            and expand_dims(src.shape) == expand_dims(out.shape))
+    if not (in_place and same):
+        raise ValueError("out overlaps the input" + ("" if in_place else ", and this operation cannot run in place"))
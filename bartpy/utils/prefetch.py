@@ -0,0 +1,122 @@
+# Read upcoming cfl datasets in the background while the current one is processed
+
+import collections
+import mmap
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from . import cfl
+
+
+def list_cfl(directory):
+    """
+    :returns: sorted names (without extension) of the cfl datasets in `directory`
+    """
+    return sorted(os.path.join(directory, f[:-len('.hdr')]) for f in os.listdir(directory)
+                  if f.endswith('.hdr') and os.path.isfile(os.path.join(directory, f[:-len('.hdr')] + '.cfl')))
+
+
+def load(name, mmap_mode=None):
+    """
+    Read a cfl file, or map it and fault in all of its pages
+    """
+    array = cfl.readcfl(name, mmap=mmap_mode)
+    if mmap_mode is not None and array.size > 0:
+        # touch one byte per page
+        array.reshape(-1, order='F').view(np.uint8)[::mmap.PAGESIZE].sum()
+    return array
+
+
+class CflPrefetcher:
+    """
+    Iterate over cfl datasets in order, reading the next ones on a thread pool
+
+        for kspace in CflPrefetcher(list_cfl('/data/scans'), depth=2, max_bytes=2**32):
+            process(kspace)
+
+    At most `depth` datasets are read ahead, and only as long as their size stays within
+    `max_bytes`; a dataset larger than the budget is read when it is requested.
+    """
+
+    def __init__(self, names, depth=2, max_bytes=2**30, workers=None, mmap_mode=None):
+        """
+        :param names: cfl names, without extension, in the order they are processed
+        :param depth: number of datasets to read ahead of the current one
+        :param max_bytes: budget for the datasets read ahead but not yet handed out
+        :param workers: reading threads, defaults to `depth`
+        :param mmap_mode: None to read the datasets into memory, or the `readcfl` mmap
+            mode ('r' or 'c') to map them and fault in their pages ahead of use
+        """
+        self.names = list(names)
+        self.depth = depth
+        self.max_bytes = max_bytes
+        self.workers = workers or max(1, depth)
+        self.mmap_mode = mmap_mode
+        self.hits = 0
+        self.stalls = 0
+        self.stall_seconds = 0.0
+        self.bytes_read = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        pool = ThreadPoolExecutor(self.workers)
+        queue = collections.deque()
+        names = iter(self.names)
+        upcoming = None
+
+        def fill(requested):
+            # a requested dataset is always read, the ones after it only within the budget
+            nonlocal upcoming
+            while len(queue) < self.depth + 1:
+                if upcoming is None:
+                    name = next(names, None)
+                    if name is None:
+                        return
+                    upcoming = name, 8 * int(np.prod(cfl.readhdr(name)))
+                queued = sum(nbytes for _, nbytes, _ in queue)
+                if (queue or not requested) and queued + upcoming[1] > self.max_bytes:
+                    return
+                queue.append(upcoming + (pool.submit(load, upcoming[0], self.mmap_mode),))
+                upcoming = None
+
+        try:
+            while True:
+                fill(True)
+                if not queue:
+                    return
+                _, nbytes, future = queue.popleft()
+                ready = future.done()
+                start = time.perf_counter()
+                array = future.result()
+                with self._lock:
+                    if ready:
+                        self.hits += 1
+                    else:
+                        self.stalls += 1
+                        self.stall_seconds += time.perf_counter() - start
+                    self.bytes_read += nbytes
+                # start reading the next datasets before the current one is processed
+                fill(False)
+                yield array
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def stats(self):
+        """
+        :returns: dictionary of datasets that were ready when requested (hits), that had to
+            be waited for (stalls), the total waiting time and the bytes handed out
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'stalls': self.stalls,
+                'stall_seconds': self.stall_seconds,
+                'bytes': self.bytes_read,
+            }
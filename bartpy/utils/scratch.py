@@ -0,0 +1,671 @@
+# Scratch space for exchanging cfl files with BART command-line tools
+
+import asyncio
+import atexit
+import contextlib
+import collections
+import glob
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from . import cfl, embed, launch
+
+PREFIX = 'bartpy-'
+
+# Shared-memory (tmpfs) scratch is used when it exists and has room; otherwise files go to disk
+SHM_PATH = '/dev/shm'
+SCRATCH_DIR = None
+SHM_THRESHOLD = None
+SHM_MAX_FILL = 0.5
+
+# Bytes that the namespaces of running calls may reserve before new namespaces wait, or None for no limit
+SCRATCH_QUOTA = None
+
+# Outputs of at least this many bytes are returned as copy-on-write memory maps instead of being read
+MMAP_THRESHOLD = 2**26
+
+# Threads that write the inputs and read the outputs of a call concurrently
+IO_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+_io_pool = None
+_io_pool_lock = threading.Lock()
+
+# Active input deduplication sessions, innermost last
+_sessions = []
+
+# scratch directory -> bytes reserved for it, for every directory this process still owns
+_live = {}
+# the part of `_live` reserved by namespaces of running calls, which new namespaces wait for
+_running = {}
+_live_changed = threading.Condition()
+# futures of coroutines waiting in `anamespace` for room in the quota
+_async_waiters = []
+
+
+def set_scratch_dir(path):
+    """
+    Force all scratch files into `path`
+
+    :param path: directory for scratch files, or None to choose automatically
+    """
+    global SCRATCH_DIR
+    SCRATCH_DIR = path
+
+
+def set_shm_threshold(nbytes):
+    """
+    Stage calls whose scratch footprint exceeds `nbytes` on disk instead of in shared memory
+
+    :param nbytes: size threshold in bytes, or None to limit by free space only
+    """
+    global SHM_THRESHOLD
+    SHM_THRESHOLD = nbytes
+
+
+def set_mmap_threshold(nbytes):
+    """
+    Return tool outputs of at least `nbytes` as copy-on-write memory maps
+
+    A mapped output stays valid after its scratch files are removed, and only
+    the parts that are accessed are read. Pages that are written to are copied privately.
+
+    :param nbytes: size threshold in bytes, or None to always read outputs into memory
+    """
+    global MMAP_THRESHOLD
+    MMAP_THRESHOLD = nbytes
+
+
+def set_scratch_quota(nbytes):
+    """
+    Limit the scratch bytes reserved by the running calls of this process
+
+    A namespace reserves the estimate of `footprint` and waits until it fits in the quota
+    next to the reservations of the running calls. When a call's outputs are fetched, its
+    reservation grows to the bytes it actually wrote, so a call that writes more than estimated
+    holds up the following ones, but is not stopped itself: scratch in use stays within the
+    quota only as far as the estimates hold. Lazy outputs and session files count toward
+    `usage` but do not hold up new namespaces, since only the caller can release them.
+
+    :param nbytes: quota in bytes, or None for no limit
+    """
+    global SCRATCH_QUOTA
+    with _live_changed:
+        SCRATCH_QUOTA = nbytes
+        _notify()
+
+
+def usage():
+    """
+    :returns: scratch bytes currently reserved by this process
+    """
+    with _live_changed:
+        return sum(_live.values())
+
+
+def on_disk(array):
+    """
+    :returns: True if `array` is passed to BART by the name of a cfl file that already exists
+    """
+    if isinstance(array, cfl.LazyCfl):
+        return not array.compressed
+    return cfl.backing_cfl(array) is not None
+
+
+def footprint(*arrays):
+    """
+    Estimate the scratch bytes needed by a tool call on `arrays`
+
+    Inputs are written as complex64 and outputs are assumed to be about as large as the inputs.
+    """
+    nbytes = sum(np.size(a) for a in arrays if a is not None and not on_disk(a))
+    nbytes *= np.dtype(np.complex64).itemsize
+    return 2 * nbytes
+
+
+def shm_has_room(nbytes):
+    """
+    Check whether `nbytes` of scratch fit in shared memory
+    """
+    if not os.path.isdir(SHM_PATH) or not os.access(SHM_PATH, os.W_OK):
+        return False
+    if SHM_THRESHOLD is not None and nbytes > SHM_THRESHOLD:
+        return False
+    return nbytes <= shutil.disk_usage(SHM_PATH).free * SHM_MAX_FILL
+
+
+def scratch_dir(nbytes=0):
+    """
+    Choose the directory for a scratch namespace of `nbytes`
+
+    :returns: the forced scratch directory if set, shared memory if it has room, else the default temp directory
+    """
+    if SCRATCH_DIR is not None:
+        return SCRATCH_DIR
+    if shm_has_room(nbytes):
+        return SHM_PATH
+    return tempfile.gettempdir()
+
+
+def _fits(nbytes):
+    return SCRATCH_QUOTA is None or sum(_running.values()) + nbytes <= SCRATCH_QUOTA
+
+
+def _check_quota(nbytes):
+    if SCRATCH_QUOTA is not None and nbytes > SCRATCH_QUOTA:
+        raise ValueError(f"Scratch footprint of {nbytes} bytes exceeds the quota of {SCRATCH_QUOTA} bytes")
+
+
+def _wake(waiter):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+def _notify():
+    # wake the threads and coroutines waiting for the quota; call with `_live_changed` held
+    _live_changed.notify_all()
+    for waiter in _async_waiters:
+        if not waiter.done():
+            waiter.get_loop().call_soon_threadsafe(_wake, waiter)
+    _async_waiters.clear()
+
+
+def _make(nbytes, root, wait):
+    # create the directory and record its reservation; call with `_live_changed` held
+    path = tempfile.mkdtemp(prefix=f'{PREFIX}{os.getpid()}-', dir=root)
+    _live[path] = nbytes
+    if wait:
+        _running[path] = nbytes
+    return path
+
+
+def create(nbytes, root, wait=True):
+    """
+    Create a scratch directory in `root` and reserve `nbytes` for it
+
+    Directory names carry the process id so that `remove_orphans` can tell when their owner is gone.
+
+    :param wait: block until the reservation fits in the quota. Reservations made without
+        waiting, for outputs that are already written and session files, are not counted
+        against the quota, so that they cannot keep new namespaces waiting indefinitely
+    :raises ValueError: if `nbytes` alone exceeds the quota
+    """
+    with _live_changed:
+        if wait:
+            _check_quota(nbytes)
+            _live_changed.wait_for(lambda: _fits(nbytes))
+        return _make(nbytes, root, wait)
+
+
+async def acreate(nbytes, root):
+    """
+    Coroutine version of `create` that waits for the quota on the event loop
+
+    Waiting does not occupy an executor thread, which the calls holding the quota need to finish.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        with _live_changed:
+            _check_quota(nbytes)
+            if _fits(nbytes):
+                return _make(nbytes, root, True)
+            waiter = loop.create_future()
+            _async_waiters.append(waiter)
+        await waiter
+
+
+def settle(path):
+    """
+    Grow the reservation of a running namespace to the bytes its files take on disk
+
+    Outputs can be larger than `footprint` estimates, and tools without array inputs reserve nothing up front.
+    """
+    with _live_changed:
+        if path not in _running:
+            return
+    nbytes = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                nbytes += entry.stat().st_size
+            except FileNotFoundError:
+                # moved out by a concurrent lazy fetch
+                pass
+    with _live_changed:
+        if nbytes > _running.get(path, nbytes):
+            _live[path] = _running[path] = nbytes
+
+
+def remove(path):
+    """
+    Delete a scratch directory and release its reservation
+    """
+    shutil.rmtree(path, ignore_errors=True)
+    with _live_changed:
+        _live.pop(path, None)
+        _running.pop(path, None)
+        _notify()
+
+
+@atexit.register
+def remove_all():
+    """
+    Delete every scratch directory this process still owns; runs on interpreter exit
+    """
+    for path in list(_live):
+        remove(path)
+
+
+@contextlib.contextmanager
+def namespace(*arrays, backend=None):
+    """
+    Create a private scratch namespace for a single tool call
+
+    Each call gets its own directory, so concurrent calls never share file names.
+    The yielded prefix is joined with argument names, e.g. `{NAME}input`.
+    The directory and everything written to it are removed on exit.
+
+    :param arrays: input arrays of the call, used to choose between shared memory and disk
+    :param backend: 'embed' for a namespace of in-memory arrays instead of files, see `launch.set_backend`
+    """
+    if launch.check_backend(backend) == 'embed':
+        with embed.namespace() as prefix:
+            yield prefix
+        return
+    nbytes = footprint(*arrays)
+    path = create(nbytes, scratch_dir(nbytes))
+    try:
+        yield os.path.join(path, '')
+    finally:
+        release(path)
+        remove(path)
+
+
+@contextlib.asynccontextmanager
+async def anamespace(*arrays, backend=None):
+    """
+    Asynchronous version of `namespace`
+
+    Waiting for the quota happens on the event loop, and removing files or unregistering
+    in-memory inputs, which waits for running commands, on its default executor.
+    """
+    loop = asyncio.get_running_loop()
+    if launch.check_backend(backend) == 'embed':
+        prefix = embed.open_namespace()
+        try:
+            yield prefix
+        finally:
+            await loop.run_in_executor(None, embed.close_namespace, prefix)
+        return
+    nbytes = footprint(*arrays)
+    path = await acreate(nbytes, scratch_dir(nbytes))
+    try:
+        yield os.path.join(path, '')
+    finally:
+        release(path)
+        await loop.run_in_executor(None, remove, path)
+
+
+def pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def remove_orphans(roots=None):
+    """
+    Janitor: delete scratch directories left behind by processes that no longer exist
+
+    :param roots: directories to scan. Defaults to every location scratch files may be placed in
+    :returns: list of removed directories
+    """
+    if roots is None:
+        roots = {SHM_PATH, tempfile.gettempdir(), SCRATCH_DIR} - {None}
+    removed = []
+    for root in roots:
+        for path in glob.glob(os.path.join(root, PREFIX + '*')):
+            match = re.match(re.escape(PREFIX) + r'(\d+)-', os.path.basename(path))
+            if match and os.path.isdir(path) and not pid_alive(int(match.group(1))):
+                shutil.rmtree(path, ignore_errors=True)
+                removed.append(path)
+    return removed
+
+
+def start_janitor(interval=600, roots=None):
+    """
+    Run `remove_orphans` every `interval` seconds on a daemon thread
+
+    :returns: event that stops the janitor when set
+    """
+    stop = threading.Event()
+
+    def janitor():
+        while not stop.is_set():
+            remove_orphans(roots)
+            stop.wait(interval)
+
+    threading.Thread(target=janitor, name='bartpy-scratch-janitor', daemon=True).start()
+    return stop
+
+
+def stage(name, array):
+    """
+    Make `array` available to BART as a cfl file
+
+    Lazy handles and complete read-only memory maps of cfl files already live on disk and
+    are passed by their file name. Handles to compressed files are decompressed to `name`
+    without loading them whole. Inside a `Session`, arrays are written once per session.
+    In an in-memory namespace, arrays are lent to BART without writing them.
+    Anything else is written to `name`.
+
+    :returns: file name to put on the command line
+    """
+    if isinstance(array, cfl.LazyCfl) and not (array.compressed and embed.is_memory(name)):
+        if array.compressed:
+            cfl.decompress(array.name, name)
+            return name
+        return array.name
+    if embed.is_memory(name):
+        return embed.register(name, array)
+    existing = cfl.backing_cfl(array)
+    if existing is not None:
+        return existing
+    if _sessions and isinstance(array, np.ndarray):
+        return _sessions[-1].stage(name, array)
+    cfl.writecfl(name, array)
+    return name
+
+
+def fetch(name, lazy=False, out=None):
+    """
+    Collect the output that BART wrote to `name`
+
+    Outputs of at least `MMAP_THRESHOLD` bytes are memory-mapped copy-on-write rather than read.
+    The call's quota reservation is brought up to the bytes it wrote, see `settle`.
+
+    :param lazy: return a `cfl.LazyCfl` handle instead of reading the data.
+        The files are moved out of the call's namespace and removed once the handle is garbage collected.
+    :param out: array to read the data into, see `cfl.readcfl`. Takes precedence over `lazy`
+
+    Outputs of the embed backend are returned without copying, also when `lazy` is set.
+    """
+    if embed.is_memory(name):
+        return embed.fetch(name, out)
+    settle(os.path.dirname(name))
+    if out is not None:
+        return cfl.readcfl(name, out=out)
+    if not lazy:
+        large = MMAP_THRESHOLD is not None and os.path.getsize(name + '.cfl') >= MMAP_THRESHOLD
+        return cfl.readcfl(name, mmap='c' if large else None)
+
+    # the output is already written, so it is accounted for without waiting on the quota
+    nbytes = os.path.getsize(name + '.cfl')
+    path = create(nbytes, os.path.dirname(os.path.dirname(name)), wait=False)
+    kept = os.path.join(path, os.path.basename(name))
+    for ext in ('.hdr', '.cfl'):
+        os.rename(name + ext, kept + ext)
+    handle = cfl.LazyCfl(kept)
+    weakref.finalize(handle, remove, path)
+    return handle
+
+
+def io_pool():
+    """
+    :returns: the thread pool shared by all calls for concurrent staging and fetching
+    """
+    global _io_pool
+    with _io_pool_lock:
+        if _io_pool is None:
+            _io_pool = ThreadPoolExecutor(IO_WORKERS, thread_name_prefix='bartpy-io')
+    return _io_pool
+
+
+def stage_all(prefix, arrays):
+    """
+    Stage the inputs of one call concurrently; writing files releases the GIL
+
+    :param prefix: namespace of the call
+    :param arrays: dictionary of argument names to arrays, or None for optional inputs that are not given
+    :returns: dictionary of argument names to the file names to put on the command line
+    """
+    given = {arg: array for arg, array in arrays.items() if array is not None}
+    if len(given) <= 1:
+        return {arg: stage(prefix + arg, array) for arg, array in given.items()}
+    futures = {arg: io_pool().submit(stage, prefix + arg, array) for arg, array in given.items()}
+    return {arg: future.result() for arg, future in futures.items()}
+
+
+def _outputs(names, out):
+    # one `out` entry per output name, None for outputs that are not read into an array
+    if out is None:
+        return (None,) * len(names)
+    if not isinstance(out, (tuple, list)) or len(out) != len(names):
+        raise ValueError(f"out must be a tuple or list of {len(names)} arrays or None, one per output")
+    return out
+
+
+def fetch_all(names, lazy=False, out=None):
+    """
+    Collect several outputs of one call concurrently
+
+    :param out: tuple of arrays, or None, to read the outputs into, see `fetch`
+    :returns: tuple of outputs in the order of `names`
+    :raises ValueError: if `out` does not have one entry per output
+    """
+    out = _outputs(names, out)
+    futures = [io_pool().submit(fetch, name, lazy, o) for name, o in zip(names, out)]
+    return tuple(future.result() for future in futures)
+
+
+async def astage(name, array):
+    """
+    Coroutine version of `stage` that writes the file on the event loop's default executor
+    """
+    return await asyncio.get_running_loop().run_in_executor(None, stage, name, array)
+
+
+async def afetch(name, lazy=False, out=None):
+    """
+    Coroutine version of `fetch` that reads the output on the event loop's default executor
+    """
+    return await asyncio.get_running_loop().run_in_executor(None, fetch, name, lazy, out)
+
+
+async def astage_all(prefix, arrays):
+    """
+    Coroutine version of `stage_all`
+    """
+    loop = asyncio.get_running_loop()
+    given = {arg: array for arg, array in arrays.items() if array is not None}
+    names = await asyncio.gather(*[loop.run_in_executor(None, stage, prefix + arg, array)
+                                   for arg, array in given.items()])
+    return dict(zip(given, names))
+
+
+async def afetch_all(names, lazy=False, out=None):
+    """
+    Coroutine version of `fetch_all`
+    """
+    loop = asyncio.get_running_loop()
+    out = _outputs(names, out)
+    return tuple(await asyncio.gather(*[loop.run_in_executor(None, fetch, name, lazy, o)
+                                        for name, o in zip(names, out)]))
+
+
+def hash_array(array):
+    """
+    Fast content hash of an array, including its shape and dtype
+    """
+    array = np.ascontiguousarray(array)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f'{array.shape}{array.dtype.str}'.encode('utf-8'))
+    digest.update(memoryview(array).cast('B'))
+    return digest.hexdigest()
+
+
+def frozen(array):
+    """
+    :returns: True if neither `array` nor any array it is a view of can be written to
+
+    A read-only view of a writeable array still changes when its base is written.
+    """
+    while isinstance(array, np.ndarray):
+        if array.flags.writeable:
+            return False
+        array = array.base
+    if array is None:
+        return True
+    try:
+        return memoryview(array).readonly
+    except TypeError:
+        return False
+
+
+def release(path):
+    """
+    Release the session inputs used by the call with scratch directory `path`
+    """
+    for session in list(_sessions):
+        session.release(path)
+
+
+class Session:
+    """
+    Write each distinct input array only once while the session is active
+
+        with scratch.Session(max_bytes=2**34):
+            images = [pics(kspace, sensitivities, r=r) for r in (0.001, 0.01, 0.1)]
+
+    Arrays that cannot change, read-only arrays that are not views of writeable ones, are
+    recognized by identity, all others by a hash of their contents, which costs a read of
+    the array but is much cheaper than writing it again.
+    Session files are counted by the calls using them; unused files are removed, least
+    recently used first, when the session exceeds `max_bytes`, and all of them on exit.
+    Sessions apply to all threads of the process.
+    """
+
+    def __init__(self, max_bytes=None):
+        """
+        :param max_bytes: bytes of unused session files to keep, or None to keep all until exit
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # key -> entry, least recently used first
+        self._entries = collections.OrderedDict()
+        # scratch directory of a call -> keys of the entries it uses
+        self._calls = collections.defaultdict(list)
+
+    def __enter__(self):
+        _sessions.append(self)
+        return self
+
+    def __exit__(self, *exc):
+        _sessions.remove(self)
+        with self._lock:
+            for entry in self._entries.values():
+                remove(entry['path'])
+            self._entries.clear()
+
+    def key(self, array):
+        """
+        :returns: identity key for arrays that cannot change, see `frozen`, content hash for others
+        """
+        if frozen(array):
+            return f'id-{id(array)}'
+        return hash_array(array)
+
+    def stage(self, name, array):
+        """
+        Return the session file of `array`, writing it on first use
+        """
+        key = self.key(array)
+        call = os.path.dirname(name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry['array'] is not None and entry['array']() is not array:
+                # the identity of a collected array was reused
+                self._evict(key)
+                entry = None
+            if entry is None:
+                nbytes = np.size(array) * np.dtype(np.complex64).itemsize
+                path = create(nbytes, scratch_dir(nbytes), wait=False)
+                entry = {
+                    'path': path,
+                    'name': os.path.join(path, 'input'),
+                    'bytes': nbytes,
+                    'refs': 0,
+                    'ready': threading.Event(),
+                    'array': weakref.ref(array) if key.startswith('id-') else None,
+                }
+                self._entries[key] = entry
+                self.misses += 1
+                writer = True
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                writer = False
+            entry['refs'] += 1
+            self._calls[call].append(key)
+
+        if writer:
+            try:
+                cfl.writecfl(entry['name'], array)
+            except BaseException:
+                with self._lock:
+                    self._calls[call].remove(key)
+                    self._evict(key)
+                raise
+            finally:
+                entry['ready'].set()
+        else:
+            # another call may still be writing the file
+            entry['ready'].wait()
+            if not os.path.exists(entry['name'] + '.cfl'):
+                cfl.writecfl(name, array)
+                return name
+        return entry['name']
+
+    def release(self, call):
+        """
+        Drop the references of a finished call and trim unused files beyond `max_bytes`
+        """
+        with self._lock:
+            for key in self._calls.pop(os.path.normpath(call), ()):
+                if key in self._entries:
+                    self._entries[key]['refs'] -= 1
+            if self.max_bytes is None:
+                return
+            total = sum(entry['bytes'] for entry in self._entries.values())
+            for key in [k for k, entry in self._entries.items() if entry['refs'] == 0]:
+                if total <= self.max_bytes:
+                    break
+                total -= self._entries[key]['bytes']
+                self._evict(key)
+
+    def _evict(self, key):
+        entry = self._entries.pop(key)
+        remove(entry['path'])
+
+    def stats(self):
+        """
+        :returns: dictionary of hits, misses and the current number and size of session files
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'bytes': sum(entry['bytes'] for entry in self._entries.values()),
+            }
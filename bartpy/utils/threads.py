@@ -0,0 +1,168 @@
+# Process-wide budget of OpenMP threads shared by concurrent BART calls
+
+import contextlib
+import ctypes
+import ctypes.util
+import os
+import threading
+
+
+def default_budget():
+    """
+    :returns: `OMP_NUM_THREADS` of the calling environment if set, the number of CPUs otherwise
+    """
+    try:
+        return max(1, int(os.environ['OMP_NUM_THREADS'].split(',')[0]))
+    except (KeyError, ValueError):
+        return os.cpu_count() or 1
+
+
+# Total OpenMP threads that all concurrently running BART calls may use
+THREAD_BUDGET = default_budget()
+
+_lock = threading.Lock()
+_running = 0
+_local = threading.local()
+_omp_set_num_threads = None
+
+
+def set_thread_budget(num_threads):
+    """
+    Set the total number of OpenMP threads shared by all BART calls of this process
+
+    Also applies to the in-process SWIG modules (bartpy.num, bartpy.linops).
+
+    :param num_threads: thread budget, or None for the default
+    """
+    global THREAD_BUDGET
+    THREAD_BUDGET = num_threads or default_budget()
+    set_openmp_threads(THREAD_BUDGET)
+
+
+@contextlib.contextmanager
+def limit(num_threads):
+    """
+    Cap the OpenMP threads of BART calls made from the current thread inside the context
+
+    :param num_threads: thread count per call, or None for no cap
+    """
+    old = getattr(_local, 'limit', None)
+    _local.limit = num_threads
+    try:
+        yield
+    finally:
+        _local.limit = old
+
+
+def _share():
+    # threads for a call that starts now; call with `_lock` held
+    num_threads = max(1, THREAD_BUDGET // _running)
+    cap = getattr(_local, 'limit', None)
+    if cap is not None:
+        num_threads = min(num_threads, cap)
+    return num_threads
+
+
+@contextlib.contextmanager
+def claim():
+    """
+    Reserve threads for one BART call for as long as it runs
+
+    A call gets an even share of the budget among all running calls, and at least one thread.
+    Calls never wait for each other: a call that starts while others run gets a smaller
+    share, so the budget may be exceeded briefly until the calls that started earlier finish.
+    Use `limit` to bound the threads of calls that are known to run together, as `map_dim` does.
+    A claim nested in another one on the same thread reuses its threads.
+
+    :returns: number of OpenMP threads for the call
+    """
+    global _running
+    held = getattr(_local, 'held', None)
+    if held is not None:
+        cap = getattr(_local, 'limit', None)
+        yield held if cap is None else min(held, cap)
+        return
+    with _lock:
+        _running += 1
+        num_threads = _share()
+    _local.held = num_threads
+    try:
+        yield num_threads
+    finally:
+        _local.held = None
+        with _lock:
+            _running -= 1
+
+
+@contextlib.asynccontextmanager
+async def aclaim():
+    """
+    Coroutine version of `claim`
+
+    Coroutines share the thread of their event loop, so their claims are never treated as nested.
+    """
+    global _running
+    with _lock:
+        _running += 1
+        num_threads = _share()
+    try:
+        yield num_threads
+    finally:
+        with _lock:
+            _running -= 1
+
+
+def environment(num_threads):
+    """
+    :returns: copy of the process environment with `OMP_NUM_THREADS` set to `num_threads`
+    """
+    env = dict(os.environ)
+    env['OMP_NUM_THREADS'] = str(num_threads)
+    return env
+
+
+def _openmp_set_num_threads():
+    # omp_set_num_threads of the OpenMP runtime, looked up once
+    global _omp_set_num_threads
+    if _omp_set_num_threads is None:
+        _omp_set_num_threads = lambda num_threads: None
+        for name in ('gomp', 'omp', 'iomp5'):
+            path = ctypes.util.find_library(name)
+            if path is None:
+                continue
+            try:
+                _omp_set_num_threads = ctypes.CDLL(path).omp_set_num_threads
+            except (OSError, AttributeError):
+                continue
+            break
+    return _omp_set_num_threads
+
+
+def set_openmp_threads(num_threads):
+    """
+    Set the thread count of the OpenMP runtime loaded into this process, if any
+
+    OpenMP keeps the setting per thread, so it applies to parallel regions started by the calling thread.
+    """
+    _openmp_set_num_threads()(int(num_threads))
+
+
+@contextlib.contextmanager
+def in_process():
+    """
+    Reserve threads for one BART call that runs in this process, on the calling thread
+
+    :returns: number of OpenMP threads for the call
+    """
+    with claim() as num_threads:
+        set_openmp_threads(num_threads)
+        yield num_threads
+
+
+def configure_openmp():
+    """
+    Limit the in-process OpenMP runtime to the thread budget
+
+    Must run before a SWIG module initializes OpenMP; an `OMP_NUM_THREADS` set by the user takes precedence.
+    """
+    os.environ.setdefault('OMP_NUM_THREADS', str(THREAD_BUDGET))
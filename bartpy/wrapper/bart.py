@@ -7,10 +7,10 @@
 # 2018 Soumick Chatterjee <soumick.chatterjee@ovgu.de> , WSL Support
 
 import subprocess as sp
-import tempfile as tmp
-import cfl
 import os
-from wslsupport import PathCorrection
+
+from ..utils import cfl, scratch
+from .wslsupport import PathCorrection
 
 def bart(nargout, cmd, *args):
 
@@ -19,7 +19,7 @@ def bart(nargout, cmd, *args):
         return None
 
     try:
-        bart_path = os.environ['TOOLBOX_PATH'] + '/bart '
+        bart_path = os.environ['TOOLBOX_PATH']
     except:
         bart_path = None
     isWSL = False
@@ -37,47 +37,37 @@ def bart(nargout, cmd, *args):
             else:
                 raise Exception('Environment variable TOOLBOX_PATH is not set.')
 
-    name = tmp.NamedTemporaryFile().name
-
     nargin = len(args)
-    infiles = [name + 'in' + str(idx) for idx in range(nargin)]
-    in_str = ' '.join(infiles)
 
-    for idx in range(nargin):
-        cfl.writecfl(infiles[idx], args[idx])
+    # bart() exchanges files with the executable, whatever backend the tools use
+    with scratch.namespace(*args, backend='subprocess') as name:
+        infiles = [name + 'in' + str(idx) for idx in range(nargin)]
+        in_str = ' '.join(infiles)
 
-    outfiles = [name + 'out' + str(idx) for idx in range(nargout)]
-    out_str = ' '.join(outfiles)
+        for idx in range(nargin):
+            cfl.writecfl(infiles[idx], args[idx])
 
-    if os.name =='nt':
-        if isWSL:
-            #For WSL and modify paths
-            cmdWSL = PathCorrection(cmd)
-            in_strWSL = PathCorrection(in_str)
-            out_strWSL =  PathCorrection(out_str)	
-            ERR = os.system('wsl bart ' + cmdWSL + ' ' + in_strWSL + ' ' + out_strWSL)
-        else:
-            #For cygwin use bash and modify paths
-            ERR = os.system('bash.exe --login -c ' + bart_path + '"/bart ' + cmd.replace(os.path.sep, '/') + ' ' + in_str.replace(os.path.sep, '/') + ' ' + out_str.replace(os.path.sep, '/') + '"')
-            #TODO: Test with cygwin, this is just translation from matlab code
-    else:
-        ERR = os.system(bart_path + '/bart ' + cmd + ' ' + in_str + ' ' + out_str)
+        outfiles = [name + 'out' + str(idx) for idx in range(nargout)]
+        out_str = ' '.join(outfiles)
 
-    for elm in infiles:
-        if os.path.isfile(elm + '.cfl'):
-            os.remove(elm + '.cfl')
-        if os.path.isfile(elm + '.hdr'):
-            os.remove(elm + '.hdr')
+        if os.name =='nt':
+            if isWSL:
+                #For WSL and modify paths
+                cmdWSL = PathCorrection(cmd)
+                in_strWSL = PathCorrection(in_str)
+                out_strWSL =  PathCorrection(out_str)	
+                ERR = os.system('wsl bart ' + cmdWSL + ' ' + in_strWSL + ' ' + out_strWSL)
+            else:
+                #For cygwin use bash and modify paths
+                ERR = os.system('bash.exe --login -c ' + bart_path + '"/bart ' + cmd.replace(os.path.sep, '/') + ' ' + in_str.replace(os.path.sep, '/') + ' ' + out_str.replace(os.path.sep, '/') + '"')
+                #TODO: Test with cygwin, this is just translation from matlab code
+        else:
+            ERR = os.system(bart_path + '/bart ' + cmd + ' ' + in_str + ' ' + out_str)
 
-    output = []
-    for idx in range(nargout):
-        elm = outfiles[idx]
+        # scratch files are removed with the namespace
+        output = []
         if not ERR:
-            output.append(cfl.readcfl(elm))
-        if os.path.isfile(elm + '.cfl'):
-            os.remove(elm + '.cfl')
-        if os.path.isfile(elm + '.hdr'):
-            os.remove(elm + '.hdr')
+            output = [cfl.readcfl(elm) for elm in outfiles]
 
     if ERR:
         raise Exception("Command exited with an error.")
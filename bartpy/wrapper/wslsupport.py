@@ -0,0 +1,18 @@
+# Copyright 2018. The Regents of the University of California.
+# All rights reserved. Use of this source code is governed by
+# a BSD-style license which can be found in the LICENSE file.
+#
+# Authors:
+# 2018 Soumick Chatterjee <soumick.chatterjee@ovgu.de> , WSL Support
+
+import os
+import string
+
+def PathCorrection(inData):
+    # translate Windows paths into paths inside the Windows Subsystem for Linux
+    outData = inData
+    for i in string.ascii_lowercase:
+        outData = outData.replace(i + ':', '/mnt/' + i)  # drive letter in lowercase
+        outData = outData.replace(i.upper() + ':', '/mnt/' + i)  # drive letter in uppercase
+    outData = outData.replace(os.path.sep, '/')  # Windows to Linux path separators
+    return outData
@@ -0,0 +1,58 @@
+# Per-call launch overhead of BART tools on tiny arrays: shell (os.system) vs. posix_spawn
+#
+# Usage: TOOLBOX_PATH=/path/to/bart python benchmarks/bench_launch.py [--calls N] [--ballast GB]
+#
+# `--ballast` allocates and touches a large array first, to show how the cost of
+# forking grows with the size of the calling Python process.
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from bartpy.utils import cfl, launch, scratch
+
+BART_PATH = os.environ['TOOLBOX_PATH'] + '/bart'
+
+COMMANDS = {
+    'scale': ['scale', '2'],
+    'conj': ['conj'],
+}
+
+
+def shell(argv):
+    os.system(' '.join(argv))
+
+
+def best_time(launcher, argv, calls):
+    best = float('inf')
+    for _ in range(calls):
+        start = time.perf_counter()
+        launcher(argv)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare shell and posix_spawn launch overhead')
+    parser.add_argument('--calls', type=int, default=50)
+    parser.add_argument('--ballast', type=float, default=0, help='GB of memory to hold while launching')
+    args = parser.parse_args()
+
+    ballast = np.ones(int(args.ballast * 2**30) // 8)
+
+    print(f"{'tool':>8} {'os.system [ms]':>15} {'posix_spawn [ms]':>17}")
+    with scratch.namespace(backend='subprocess') as NAME:
+        cfl.writecfl(NAME + 'input', np.ones((1, 1), dtype=np.complex64))
+        for tool, command in COMMANDS.items():
+            argv = [BART_PATH] + command + [NAME + 'input', NAME + 'output']
+            before = best_time(shell, argv, args.calls)
+            after = best_time(launch.run, argv, args.calls)
+            print(f'{tool:>8} {1e3 * before:>15.2f} {1e3 * after:>17.2f}')
+
+    del ballast
+
+
+if __name__ == '__main__':
+    main()
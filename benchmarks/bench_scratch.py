@@ -0,0 +1,50 @@
+# Compare cfl exchange through disk-backed and shared-memory (tmpfs) scratch directories
+#
+# Usage: python benchmarks/bench_scratch.py [--disk DIR] [--shm DIR] [--sizes MB ...] [--repeat N]
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+
+from bartpy.utils import cfl, scratch
+
+
+def exchange(directory, array, repeat):
+    """
+    Time one write + read round trip of `array` through a scratch namespace in `directory`
+
+    :returns: best time in seconds over `repeat` runs
+    """
+    scratch.set_scratch_dir(directory)
+    best = float('inf')
+    for _ in range(repeat):
+        with scratch.namespace(array, backend='subprocess') as NAME:
+            start = time.perf_counter()
+            cfl.writecfl(NAME + 'input', array)
+            cfl.readcfl(NAME + 'input')
+            best = min(best, time.perf_counter() - start)
+    scratch.set_scratch_dir(None)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare disk and shared-memory cfl exchange')
+    parser.add_argument('--disk', default=tempfile.gettempdir(), help='disk-backed scratch directory')
+    parser.add_argument('--shm', default=scratch.SHM_PATH, help='shared-memory scratch directory')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 16, 128, 512, 1024], help='array sizes in MB')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'size [MB]':>10} {'disk [s]':>10} {'shm [s]':>10} {'speedup':>8}")
+    for size in args.sizes:
+        n = size * 2**20 // np.dtype(np.complex64).itemsize
+        array = np.ones(n, dtype=np.complex64)
+        disk = exchange(args.disk, array, args.repeat)
+        shm = exchange(args.shm, array, args.repeat)
+        print(f'{size:>10} {disk:>10.4f} {shm:>10.4f} {disk / shm:>8.2f}')
+
+
+if __name__ == '__main__':
+    main()
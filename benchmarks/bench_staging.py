@@ -0,0 +1,63 @@
+# End-to-end latency of multi-input BART tools with inputs staged one after another vs. concurrently
+#
+# Usage: TOOLBOX_PATH=/path/to/bart python benchmarks/bench_staging.py [--size MB] [--calls N]
+
+import argparse
+import time
+
+import numpy as np
+
+from bartpy.tools import pics, saxpy
+from bartpy.utils import scratch
+
+concurrent_stage_all = scratch.stage_all
+concurrent_fetch_all = scratch.fetch_all
+
+
+def sequential_stage_all(prefix, arrays):
+    return {arg: scratch.stage(prefix + arg, array) for arg, array in arrays.items() if array is not None}
+
+
+def sequential_fetch_all(names, lazy=False, out=None):
+    out = out or (None,) * len(names)
+    return tuple(scratch.fetch(name, lazy, o) for name, o in zip(names, out))
+
+
+def best_time(call, calls):
+    best = float('inf')
+    for _ in range(calls):
+        start = time.perf_counter()
+        call()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare sequential and concurrent staging of tool inputs')
+    parser.add_argument('--size', type=float, default=256, help='MB per input array')
+    parser.add_argument('--calls', type=int, default=5)
+    args = parser.parse_args()
+
+    n = int(args.size * 2**20) // 8
+    x = np.ones(n, dtype=np.complex64)
+    y = np.ones(n, dtype=np.complex64)
+    kspace = np.ones((n // 8, 1, 1, 8), dtype=np.complex64)
+    sensitivities = np.ones((n // 8, 1, 1, 8), dtype=np.complex64)
+    pattern = np.ones((n // 8,), dtype=np.complex64)
+
+    cases = {
+        'saxpy (2 inputs)': lambda: saxpy(x, y, 2),
+        'pics (3 inputs)': lambda: pics(kspace, sensitivities, p=pattern, i=1),
+    }
+
+    print(f"{'tool':>18} {'sequential [s]':>15} {'concurrent [s]':>15}")
+    for label, call in cases.items():
+        scratch.stage_all, scratch.fetch_all = sequential_stage_all, sequential_fetch_all
+        before = best_time(call, args.calls)
+        scratch.stage_all, scratch.fetch_all = concurrent_stage_all, concurrent_fetch_all
+        after = best_time(call, args.calls)
+        print(f'{label:>18} {before:>15.3f} {after:>15.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+# Scaling of independent in-process FFTs and linop applications over a thread pool
+#
+# Usage: TOOLBOX_PATH=/path/to/bart python benchmarks/bench_swig_threads.py [--calls N] [--size X]
+#
+# Needs the SWIG extensions (see setup.py). Every call runs with one OpenMP thread, so any
+# speedup over a single worker comes from the SWIG modules releasing the GIL.
+# `efficiency` is the speedup divided by the number of workers.
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from bartpy.utils import extensions, threads
+
+
+def throughput(apply, inputs, workers):
+    def call(x):
+        with threads.limit(1):
+            apply(x)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(workers) as pool:
+        list(pool.map(call, inputs))
+    return len(inputs) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Thread-pool scaling of in-process FFTs and linops')
+    parser.add_argument('--calls', type=int, default=64)
+    parser.add_argument('--size', type=int, default=256, help='edge length of the 2D inputs')
+    args = parser.parse_args()
+
+    for name in ('fft', 'linops'):
+        if not extensions.available(name):
+            sys.exit(f'the {name} extension is not built: {extensions.probe(name)}')
+
+    from bartpy.num import fft
+    from bartpy.linops import forward
+    from bartpy.linops.linop_swig import fft_create
+
+    shape = (args.size, args.size)
+    inputs = [np.random.randn(*shape).astype(np.complex64) for _ in range(args.calls)]
+    op = fft_create(list(shape) + [1] * 14, 3)
+    cases = {
+        'fft': lambda x: fft(x, 3),
+        'linop forward': lambda x: forward(op, shape, x),
+    }
+
+    cpus = os.cpu_count() or 1
+    workers = sorted({1, 2, 4, 8, cpus})
+    print(f'{cpus} CPUs, {args.calls} calls of {args.size}x{args.size}')
+    print(f"{'case':>14} {'workers':>8} {'calls/s':>9} {'speedup':>8} {'efficiency':>11}")
+    for name, apply in cases.items():
+        base = None
+        for n in workers:
+            rate = throughput(apply, inputs, n)
+            base = base or rate
+            print(f'{name:>14} {n:>8} {rate:>9.1f} {rate / base:>8.2f} {rate / base / n:>11.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+# Throughput of concurrent BART calls for combinations of concurrency and OpenMP threads per call
+#
+# Usage: TOOLBOX_PATH=/path/to/bart python benchmarks/bench_threads.py [--calls N] [--size X]
+#
+# The `auto` column leaves the thread count to the process-wide budget in bartpy.utils.threads.
+
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from bartpy.tools import fft
+from bartpy.utils import threads
+
+
+def throughput(x, calls, concurrency, num_threads):
+    def call(_):
+        with threads.limit(num_threads):
+            fft(x, 7)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        list(pool.map(call, range(calls)))
+    return calls / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sweep concurrency x OpenMP threads per BART call')
+    parser.add_argument('--calls', type=int, default=32)
+    parser.add_argument('--size', type=int, default=128, help='edge length of the 3D input')
+    args = parser.parse_args()
+
+    cpus = os.cpu_count() or 1
+    x = np.random.randn(args.size, args.size, args.size).astype(np.complex64)
+    thread_counts = sorted({1, 2, 4, cpus}) + [None]
+    concurrencies = sorted({1, 2, 4, 8, cpus})
+
+    print(f'{cpus} CPUs, thread budget {threads.THREAD_BUDGET}, throughput in calls/s')
+    print(f"{'concurrency':>11}" + ''.join(f'{t or "auto":>8}' for t in thread_counts))
+    for concurrency in concurrencies:
+        row = [throughput(x, args.calls, concurrency, t) for t in thread_counts]
+        print(f'{concurrency:>11}' + ''.join(f'{r:>8.2f}' for r in row))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+# Peak memory and throughput of writecfl for large arrays of different layouts
+#
+# Usage: python benchmarks/bench_writecfl.py [--sizes GB ...] [--dir PATH]
+#
+# Each case runs in a fresh interpreter so that its peak RSS can be measured.
+# `peak / array` is the peak resident memory of the process relative to the array size;
+# `copy` writes the way writecfl used to, with a full complex64 copy of the array.
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from bartpy.utils import cfl
+
+LAYOUTS = {
+    'complex64 F': lambda shape: np.ones(shape, dtype=np.complex64, order='F'),
+    'complex64 C': lambda shape: np.ones(shape, dtype=np.complex64, order='C'),
+    'complex128 F': lambda shape: np.ones(shape, dtype=np.complex128, order='F'),
+    'memmap': None,
+}
+
+WRITERS = {
+    'chunked': cfl.writecfl,
+    'copy': lambda name, array: array.T.astype(np.complex64).tofile(name + '.cfl'),
+}
+
+
+def shape_of(gigabytes):
+    return (256, 256, int(gigabytes * 2**30) // (256 * 256 * 8))
+
+
+def case(layout, writer, gigabytes, path):
+    name = os.path.join(path, 'bench')
+    shape = shape_of(gigabytes)
+    if layout == 'memmap':
+        # sparse file of zeros, mapped read-only
+        np.memmap(name + '_src', dtype=np.complex64, mode='w+', shape=shape, order='F').flush()
+        array = np.memmap(name + '_src', dtype=np.complex64, mode='r', shape=shape, order='F')
+    else:
+        array = LAYOUTS[layout](shape)
+    start = time.perf_counter()
+    WRITERS[writer](name, array)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    print(peak / array.nbytes, array.nbytes / elapsed / 2**30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure peak RSS and throughput of writecfl')
+    parser.add_argument('--sizes', type=float, nargs='+', default=[1, 2, 4, 8, 16], help='array sizes in GB')
+    parser.add_argument('--dir', default=None, help='directory for the output files')
+    parser.add_argument('--case', nargs=4, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        layout, writer, gigabytes, path = args.case
+        case(layout, writer, float(gigabytes), path)
+        return
+
+    print(f"{'GB':>5} {'layout':>13} {'writer':>8} {'peak / array':>13} {'GB/s':>6}")
+    for gigabytes in args.sizes:
+        for layout in LAYOUTS:
+            for writer in WRITERS:
+                with tempfile.TemporaryDirectory(dir=args.dir) as path:
+                    out = subprocess.run([sys.executable, __file__, '--case', layout, writer, str(gigabytes), path],
+                                         stdout=subprocess.PIPE, text=True)
+                if out.returncode != 0:
+                    print(f'{gigabytes:>5} {layout:>13} {writer:>8} {"failed":>13}')
+                    continue
+                peak, throughput = (float(x) for x in out.stdout.split())
+                print(f'{gigabytes:>5} {layout:>13} {writer:>8} {peak:>13.2f} {throughput:>6.2f}')
+
+
+if __name__ == '__main__':
+    main()
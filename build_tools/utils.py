@@ -10,12 +10,14 @@ import json
 import os
 import re
 import subprocess
+import textwrap
 
 # NOTE: `MULTITUPLE` refers to an argument of tuples that are passed in to the command line in alternating order
 # e.g., dim0 size0 ... dimN sizeN
 
 # Directory for writing the tools file, BART env variable
 TOOLS_PATH = 'bartpy/tools/tools.py'
+AIO_PATH = 'bartpy/tools/aio.py'
 BART_PATH = os.environ['TOOLBOX_PATH']
 
 # map arg names that are reserved in python (e.g., `lambda`) to python-friendly names
@@ -250,7 +252,7 @@ def parse_opt_args(opt_str: str):
     return opt_list
 
 
-def format_docstring(usage: str, arg_list, kwarg_dict):
+def format_docstring(usage: str, arg_list, kwarg_dict, has_output=False):
     """
     Use argument lists to create Python docstring
     """
@@ -264,6 +266,10 @@ def format_docstring(usage: str, arg_list, kwarg_dict):
         if 'help' not in kwarg:
             desc = None if 'desc' not in kwarg.keys() else kwarg['desc']
             docstring += f"\t:param {kwarg['name']} {kwarg['type']}: {desc}\n"
+    if has_output:
+        docstring += "\t:param lazy bool: return lazy cfl handles instead of reading the outputs into memory\n"
+        docstring += "\t:param out array: complex64 column-major array to read the output into, or a tuple of them for several outputs\n"
+        docstring += "\t:param backend str: 'subprocess' to launch the bart executable or 'embed' to run in-process through libbart, defaults to launch.BACKEND\n"
     return docstring
 
 def format_string(s):
@@ -279,7 +285,7 @@ def format_string(s):
     return formatted
 
 
-def create_arg_str(arg_dict, kwarg_dict):
+def create_arg_str(arg_dict, kwarg_dict, has_output=False):
     """
     Create argument tuple in the function signature
 
@@ -287,6 +293,7 @@ def create_arg_str(arg_dict, kwarg_dict):
 
     :param arg_dict: list of required arguments
     :param kwarg_dict: dictionary of keyword arguments
+    :param has_output: add the `lazy`, `out` and `backend` keywords for tools that write output files
     """
     arg_str = '('
     formatted_args = []
@@ -313,6 +320,9 @@ def create_arg_str(arg_dict, kwarg_dict):
         name = format_string(name)
         if 'help' not in name: # don't add help string as an arg
             arg_str += f'{name}=None, '
+
+    if has_output:
+        arg_str += 'lazy=False, out=None, backend=None, '
     
     arg_str = arg_str.rstrip(', ')
     arg_str += ')'
@@ -320,24 +330,33 @@ def create_arg_str(arg_dict, kwarg_dict):
     return arg_str
 
 
-def create_template(tool: str):
+def create_template(tool: str, template_dict=None, asynchronous=False):
     """
     Master function to write template string.
+
+    :param template_dict: parsed interface of the tool; queried from BART if not given
+    :param asynchronous: write an asyncio coroutine (for `aio.py`) instead of a blocking function
     """
-    template_dict = parse_interface(tool)
+    if template_dict is None:
+        template_dict = parse_interface(tool)
     if not template_dict:
         return ' '
     docstring, arg_list, kwarg_list = \
         template_dict['docstring'], template_dict['arg_list'], template_dict['kwarg_list']
-    formatted_docstring = format_docstring(docstring, arg_list, kwarg_list)
-    arg_str = create_arg_str(arg_list, kwarg_list)
+    formatted_docstring = format_docstring(docstring, arg_list, kwarg_list, template_dict['has_output'])
+    arg_str = create_arg_str(arg_list, kwarg_list, template_dict['has_output'])
     
     usage_string = template_dict['usage_str']
 
     tool = tool.decode('utf8')
 
+    # coroutines stage inputs and fetch outputs on an executor and launch BART without blocking the event loop
+    def_str = 'async def' if asynchronous else 'def'
+    stage = 'await scratch.astage' if asynchronous else 'scratch.stage'
+    fetch = 'await scratch.afetch' if asynchronous else 'scratch.fetch'
+
     template =f"""
-    def {tool}{arg_str}:
+    {def_str} {tool}{arg_str}:
     \"\"\"
     {formatted_docstring}
     \"\"\"
@@ -346,132 +365,172 @@ def create_template(tool: str):
 
     template += '\n'
 
-    template += "\n\tcmd_str = f'{BART_PATH} '"
-    template += f"\n\tcmd_str += '{tool} '"
+    # input arrays size the namespace, which decides between shared memory and disk scratch
+    array_args = [arg['name'] for arg in arg_list + kwarg_list if arg['input'] and arg['type'] == 'array']
 
-    arg_names = ""
+    # tools with several input arrays write them concurrently before building the command line
+    concurrent = len(array_args) > 1
 
-    template += f"\n\tflag_str = ''\n"
-    template += f"\n\topt_args = f''\n"
+    def staged(name):
+        return f"staged['{name}']" if concurrent else f"{stage}(NAME + '{name}', {name})"
+
+    # every call works in its own scratch namespace so that concurrent calls never share files
+    body = ''
+    if concurrent:
+        arrays = ', '.join(f"'{name}': {name}" for name in array_args)
+        body += f"\n\tstaged = {stage}_all(NAME, {{{arrays}}})\n"
+    body += f"\n\targv = [BART_PATH, '{tool}']"
+
+    body += f"\n\tflag_args = []\n"
+    body += f"\n\topt_args = []\n"
 
     has_multituple = False
-    template += f"\n\tmultituples = []\n"
+    body += f"\n\tmultituples = []\n"
+
+    # optional positional inputs, e.g. `input1 [input2] output`, follow the required inputs
+    opt_inputs = [kwarg['name'] for kwarg in kwarg_list if not kwarg['opt'] and kwarg['type'] == 'array']
+    if opt_inputs:
+        body += f"\n\topt_inputs = []\n"
 
-    # template += f"\n\tif not os.path.exists('tmp'):"
-    # template += f"\n\t\tos.makedirs('tmp')\n"
+    # body += f"\n\tif not os.path.exists('tmp'):"
+    # body += f"\n\t\tos.makedirs('tmp')\n"
 
     for kwarg in kwarg_list:
         if kwarg['opt']:
             flag = kwarg['flag']
             arg_name = kwarg['name']
             if kwarg['type'] == 'array':
-                template += f"\n\tif not isinstance({arg_name}, type(None)):\n\t"
-                template += f"\tcfl.writecfl(NAME + \'{arg_name}\', {arg_name})\n\t"
+                body += f"\n\tif not isinstance({arg_name}, type(None)):\n\t"
             else:
-                template += f"\n\tif " + arg_name + " is not None:\n\t"
+                body += f"\n\tif " + arg_name + " is not None:\n\t"
             if kwarg['is_long_opt']:
-                template += f"\tflag_str += f'--{flag} "
-            elif kwarg['type'] == 'array':
-                template += f"\tflag_str += f'-{flag} "
+                body += f"\tflag_args += ['--{flag}'"
             else:
-                template += f"\tflag_str += f'-{flag} "
+                body += f"\tflag_args += ['-{flag}'"
             
             if kwarg['type'] == 'array':
-                template += '{NAME}' + arg_name + " '\n"
+                body += f", {staged(arg_name)}]\n"
             elif kwarg['type'] == 'list':
-                template +=  "{" + f"\":\".join([str(x) for x in {arg_name}])" + "}" + " '\n"
+                body += f", \":\".join([str(x) for x in {arg_name}])]\n"
             elif kwarg['type'] == 'bool':
-                template += "'\n"    
+                body += "]\n"
             else:
-                template += '{' + arg_name + "} '\n"
+                body += f", str({arg_name})]\n"
 
         if not kwarg['opt']:
             name = kwarg['name']
             if kwarg['type'] == 'array':
-                template += f"\n\tif not isinstance({name}, type(None)):\n\t"
+                body += f"\n\tif not isinstance({name}, type(None)):\n\t"
             else:
-                template += f"\n\tif " + name + " != None:\n\t\t"
+                body += f"\n\tif " + name + " != None:\n\t"
             if kwarg['type'] == 'tuple':
-                template += "opt_args += f\"{" + f"\' \'.join([str(arg) for arg in {name}])" + "} \"\n"
+                body += f"\topt_args += [str(arg) for arg in {name}]\n"
             elif kwarg['type'] == 'multituple':
-                template += f"multituples.append({name}) \n"
+                body += f"\tmultituples.append({name}) \n"
             elif kwarg['type'] == 'array':
-                template += "\topt_args += 'NAME + {" + name + "}'\n" 
+                body += f"\topt_inputs += [{staged(name)}]\n"
             else:
-                template += "\topt_args += '{" + name + "}'\n" 
+                body += f"\topt_args += [str({name})]\n"
             
-    template += "\tcmd_str += flag_str + opt_args + '  '\n"
-
-    arg_names = "{" + f"' '.join([' '.join([str(x) for x in arg]) for arg in zip(*multituples)]).strip()" + "} "
+    body += "\targv += flag_args + opt_args\n"
 
-    output_names = ""
-    input_names = ""
+    arg_names = []
 
     for arg in arg_list:
-        if arg['type'] == 'array' or arg['type'] == 'OUTFILE':
-            arg_names += "{NAME}" + arg['name'] + " "
+        if opt_inputs and not arg['input']:
+            arg_names.append('*opt_inputs')
+            opt_inputs = None
+        if arg['type'] == 'array':
+            arg_names.append(staged(arg['name']))
+        elif arg['type'] == 'OUTFILE':
+            arg_names.append(f"NAME + '{arg['name']}'")
         elif arg['input'] and arg['type'] == 'tuple':
-            arg_names += "{" + f"' '.join([str(arg) for arg in {arg['name']}])" + "} " 
+            arg_names.append(f"*[str(arg) for arg in {arg['name']}]")
         elif arg['input'] and arg['type'] == 'multituple':
-            template += f"\n\tmultituples.append({arg['name']})\n\t"
+            body += f"\n\tmultituples.append({arg['name']})\n\t"
         else:
-            arg_names += "{" + arg['name'] + "} "
-    
-    template += f'\n\tcmd_str += f\"{arg_names} \"'
+            arg_names.append(f"str({arg['name']})")
 
-    for arg in arg_list:
-        name = arg['name']
-        if arg['input'] and arg['type'] == 'array':
-            template += f"\n\tcfl.writecfl(NAME + \'{name}\', {name})"
+    if opt_inputs:
+        arg_names.append('*opt_inputs')
+
+    # multituples are passed in alternating order, e.g., dim0 size0 ... dimN sizeN
+    body += "\n\targv += [str(x) for arg in zip(*multituples) for x in arg]"
+    if arg_names:
+        body += f"\n\targv += [{', '.join(arg_names)}]"
 
     # bitmask hotfix
     if tool != 'bitmask':
-        template += "\n\n\tif DEBUG:"
-        template += "\n\t\tprint(cmd_str)\n"
-        template += "\n\n\tos.system(cmd_str)\n"
+        body += "\n\n\tif DEBUG:"
+        body += "\n\t\tprint(' '.join(argv))\n"
+        if asynchronous:
+            body += "\n\n\tawait launch.arun(argv)\n"
+        else:
+            body += "\n\n\tlaunch.run(argv)\n"
 
     # TODO: fix optional output (estdelay)
     if template_dict['has_output']:
         output_str = '\n\toutputs = '
         clean_str = ""
         return_str = '\n\treturn outputs'
-        for arg in arg_list:
-            name = arg['name']
-            if not arg['input']:
-                output_str += f"cfl.readcfl(NAME + '{name}'), "
-                # clean_str += f"\n\tos.remove(\'{name}.hdr\')"
-                # clean_str += f"\n\tos.remove(\'{name}.cfl\')"
-        template += output_str.rstrip(', ')
-        template += clean_str
-        template += return_str
+        output_names = [arg['name'] for arg in arg_list if not arg['input']]
+        # several outputs are read concurrently
+        if len(output_names) > 1:
+            names = ', '.join(f"NAME + '{name}'" for name in output_names)
+            output_str += f"{fetch}_all([{names}], lazy, out)"
+        else:
+            output_str += f"{fetch}(NAME + '{output_names[0]}', lazy, out)"
+        # for name in output_names:
+            # clean_str += f"\n\tos.remove(\'{name}.hdr\')"
+            # clean_str += f"\n\tos.remove(\'{name}.cfl\')"
+        body += output_str
+        body += clean_str
+        body += return_str
 
     # bitmask hotfix
     if tool == 'bitmask':
-        template += "\n\n\tval = subprocess.Popen(cmd_str.split(), stdout=subprocess.PIPE).communicate()[0].decode('utf-8').strip()\n"
-        template += '\n\treturn [int(d) for d in val.split()] if len(val.split()) > 1 else int(val)\n'
+        if asynchronous:
+            body += "\n\n\tval = (await launch.aoutput(argv)).decode('utf-8').strip()\n"
+        else:
+            body += "\n\n\tval = launch.output(argv).decode('utf-8').strip()\n"
+        body += '\n\treturn [int(d) for d in val.split()] if len(val.split()) > 1 else int(val)\n'
+
+    with_str = 'async with scratch.anamespace' if asynchronous else 'with scratch.namespace'
+    namespace_args = array_args + ['backend=backend'] if template_dict['has_output'] else array_args
+    template += f"\n\t{with_str}({', '.join(namespace_args)}) as NAME:"
+    template += textwrap.indent(body, '\t')
 
     return template.strip()
 
 
-def write_tool_methods():
+def create_header(asynchronous=False):
     """
-    Autogenerate `tools.py` file which contains the BART tools
+    Write the imports and module settings at the top of `tools.py` or `aio.py`
     """
-    if not os.path.exists(TOOLS_PATH):
-        with open(TOOLS_PATH, 'w+'):
-            pass
-    template_str = 'from ..utils import cfl\nimport os\nimport subprocess\nimport tempfile as tmp\n\n'
+    template_str = 'from ..utils import cfl, launch, scratch\nimport os\n\n'
     template_str += "BART_PATH=os.environ['TOOLBOX_PATH'] + '/bart'\n"
-    template_str += "DEBUG=False\n"
-    template_str += "NAME=tmp.NamedTemporaryFile().name\n\n"
+    template_str += "DEBUG=False\n\n"
     template_str += "def set_debug(status):\n\tglobal DEBUG\n\tDEBUG=status\n\n\n"
+    return template_str
+
+
+def write_tool_methods():
+    """
+    Autogenerate `tools.py` and `aio.py` files which contain the BART tools
+    as blocking functions and asyncio coroutines, respectively
+    """
+    template_str = create_header()
+    aio_str = create_header(asynchronous=True)
     tool_lst = get_tools()[4:]
     for tool in tool_lst:
-        template_str += create_template(tool)
+        template_dict = parse_interface(tool)
+        template_str += create_template(tool, template_dict)
         template_str += '\n\n'
-    template_str = re.sub('\t', '    ', template_str)
-    with open(TOOLS_PATH, 'w+') as f:
-        f.write(template_str)
+        aio_str += create_template(tool, template_dict, asynchronous=True)
+        aio_str += '\n\n'
+    for path, contents in ((TOOLS_PATH, template_str), (AIO_PATH, aio_str)):
+        with open(path, 'w+') as f:
+            f.write(re.sub('\t', '    ', contents))
 
 if __name__ == '__main__':
     write_tool_methods()
@@ -6,10 +6,19 @@
 # 2021 Max Litster <litster@berkeley.edu>
 
 
-from distutils.core import setup, Extension
+try:
+    from setuptools import setup, Extension
+except ImportError:
+    from distutils.core import setup, Extension
+from distutils.ccompiler import new_compiler
+from distutils.errors import CompileError, LinkError
+from distutils.sysconfig import customize_compiler
+import ctypes.util
 import os
 import re
+import subprocess
 import sys
+import tempfile
 
 import numpy as np
 import brkbart
@@ -20,66 +29,108 @@ from build_tools.utils import write_tool_methods
 
 BART_PATH = os.environ['TOOLBOX_PATH']
 
-omp = 'gomp'
-if sys.platform == 'darwin':
-       omp = 'omp'
-
-#simu = Extension('_simu_swig',
-#                     extra_compile_args=['-fopenmp'],
-#                     extra_link_args=[f'-l{omp}'],
-#                     include_dirs=[f'{BART_PATH}/src/', '/opt/local/include/', '/opt/local/lib/',
-#                                   np.get_include()],
-#                     sources=[f'{BART_PATH}/src/simu/phantom.c',
-#                            'bartpy/simu/simu_wrap.c'],
-#                     libraries=['box', 'calib', 'dfwavelet', 'geom',
-#                                   'grecon', 'iter', 'linops', 'lowrank', 
-#                                   'misc', 'moba', 'nlops', 'noir', 'noncart',
-#                                   'num', 'sake', 'sense', 'simu', 'wavelet',
-#                                   'openblas', 'fftw3f', 'fftw3', 'fftw3f_threads',],
-#                     library_dirs=[f'{BART_PATH}/lib/', '/opt/local/include/', '/opt/local/lib/'],
-#                     )
-
-#fft = Extension('_fft_swig',
-#                     extra_compile_args=['-fopenmp'],
-#                     extra_link_args=[f'-l{omp}'],
-#                     include_dirs=[f'{BART_PATH}/src/', '/opt/local/include/', '/opt/local/lib/',
-#                                   np.get_include()],
-#                     sources=[f'{BART_PATH}/src/num/fft.c',
-#                            'bartpy/num/fft_wrap.c'],
-#                     libraries=['box', 'calib', 'dfwavelet', 'geom',
-#                                   'grecon', 'iter', 'linops', 'lowrank', 
-#                                   'misc', 'moba', 'nlops', 'noir', 'noncart',
-#                                   'num', 'sake', 'sense', 'simu', 'wavelet',
-#                                   'openblas', 'fftw3f', 'fftw3', 'fftw3f_threads',],
-#                     library_dirs=[f'{BART_PATH}/lib/', '/opt/local/include/', '/opt/local/lib/'],
-#                     )
-#
-#linops = Extension('_linop_swig',
-#                     extra_compile_args=['-fopenmp'],
-#                     extra_link_args=[f'-l{omp}'],
-#                     include_dirs=[f'{BART_PATH}/src/', '/opt/local/include/', '/opt/local/lib/',
-#                                   np.get_include()],
-#                     sources=[f'{BART_PATH}/src/linops/someops.c', f'{BART_PATH}/src/linops/linop.c',
-#                            'bartpy/linops/linop_wrap.c'],
-#                     libraries=['box', 'calib', 'dfwavelet', 'geom',
-#                                   'grecon', 'iter', 'linops', 'lowrank', 
-#                                   'misc', 'moba', 'nlops', 'noir', 'noncart',
-#                                   'num', 'sake', 'sense', 'simu', 'wavelet',
-#                                   'openblas', 'fftw3f', 'fftw3', 'fftw3f_threads',],
-#                     library_dirs=[f'{BART_PATH}/lib/', '/opt/local/include/', '/opt/local/lib/'],)
-
-#iter_module = Extension('_italgos',
-#                     extra_compile_args=['-fopenmp'],
-#                     extra_link_args=[f'-l{omp}'],
-#                     include_dirs=[f'{BART_PATH}/src/', '/opt/local/include/', '/opt/local/lib/',
-#                                   np.get_include()],
-#                     sources=[f'{BART_PATH}/src/iter/italgos.c', 'bartpy/italgos/iter_wrap.c'],
-#                     libraries=['box', 'calib', 'dfwavelet', 'geom',
-#                                   'grecon', 'iter', 'linops', 'lowrank', 
-#                                   'misc', 'moba', 'nlops', 'noir', 'noncart',
-#                                   'num', 'sake', 'sense', 'simu', 'wavelet',
-#                                   'openblas', 'fftw3f', 'fftw3', 'fftw3f_threads',],
-#                     library_dirs=[f'{BART_PATH}/lib/', '/opt/local/include/', '/opt/local/lib/'],)
+# BART libraries the extensions link against, in link order: the static linker resolves symbols
+# left to right, so each library comes before the ones it uses. num and misc use each other and
+# are repeated, as in BART's own Makefile.
+BART_LIBRARIES = ['moba', 'noir', 'grecon', 'sense', 'sake', 'calib',
+                  'noncart', 'lowrank', 'dfwavelet', 'wavelet', 'iter',
+                  'nlops', 'linops', 'simu', 'geom', 'box',
+                  'num', 'misc', 'num', 'misc']
+
+# external libraries of BART; the first one found of each group is linked
+EXTERNAL_LIBRARIES = [['openblas', 'blas'], ['lapacke'], ['fftw3f'], ['fftw3f_threads']]
+
+
+def pkg_config(*packages):
+    """
+    Include and library directories of `packages` according to pkg-config, if it knows them
+    """
+    include_dirs, library_dirs = [], []
+    for package in packages:
+        try:
+            flags = subprocess.run(['pkg-config', '--cflags-only-I', '--libs-only-L', package],
+                                   stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, check=True).stdout
+        except (OSError, subprocess.CalledProcessError):
+            continue
+        include_dirs += [flag[2:] for flag in flags.split() if flag.startswith('-I')]
+        library_dirs += [flag[2:] for flag in flags.split() if flag.startswith('-L')]
+    return include_dirs, library_dirs
+
+
+def find_library(name, library_dirs):
+    """
+    :returns: True if lib`name` is in one of `library_dirs` or known to the system linker
+    """
+    for directory in library_dirs:
+        for ext in ('.a', '.so', '.dylib'):
+            if os.path.isfile(os.path.join(directory, f'lib{name}{ext}')):
+                return True
+    return ctypes.util.find_library(name) is not None
+
+
+def openmp_flags():
+    """
+    Compile and link flags for OpenMP, found by building a test program, or no flags if it does not build
+    """
+    candidates = [(['-fopenmp'], ['-fopenmp'])]
+    if sys.platform == 'darwin':
+        # Apple clang needs the OpenMP runtime of MacPorts or Homebrew
+        candidates = [(['-Xpreprocessor', '-fopenmp'], ['-lomp'])] + candidates
+
+    compiler = new_compiler()
+    customize_compiler(compiler)
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'omp.c')
+        with open(source, 'w') as f:
+            f.write('#include <omp.h>\nint main(void) { return omp_get_max_threads() < 1; }\n')
+        for compile_args, link_args in candidates:
+            try:
+                objects = compiler.compile([source], output_dir=tmp, extra_postargs=compile_args)
+                compiler.link_executable(objects, os.path.join(tmp, 'omp'), extra_postargs=link_args)
+            except (CompileError, LinkError):
+                continue
+            return compile_args, link_args
+    print('[INFO] OpenMP not found, building the extensions without it')
+    return [], []
+
+
+def extensions():
+    """
+    SWIG extension modules, built against the BART build in `TOOLBOX_PATH`
+
+    BART must be built with its static libraries in `TOOLBOX_PATH/lib`, compiled with -fPIC.
+    """
+    lib_dir = os.path.join(BART_PATH, 'lib')
+    libraries = [name for name in BART_LIBRARIES if find_library(name, [lib_dir])]
+    if 'num' not in libraries:
+        print(f'[INFO] No BART libraries in {lib_dir}, skipping the extension modules')
+        return []
+
+    include_dirs, library_dirs = pkg_config('fftw3f', 'openblas')
+    if sys.platform == 'darwin':
+        include_dirs += ['/opt/local/include', '/opt/homebrew/include', '/usr/local/include']
+        library_dirs += ['/opt/local/lib', '/opt/homebrew/lib', '/usr/local/lib']
+    for names in EXTERNAL_LIBRARIES:
+        libraries += [name for name in names if find_library(name, library_dirs)][:1]
+    compile_args, link_args = openmp_flags()
+
+    def extension(name, sources):
+        return Extension(name,
+                         sources=sources,
+                         include_dirs=[os.path.join(BART_PATH, 'src'), np.get_include()] + include_dirs,
+                         libraries=libraries,
+                         library_dirs=[lib_dir] + library_dirs,
+                         extra_compile_args=['-std=gnu11'] + compile_args,
+                         extra_link_args=link_args)
+
+    src = os.path.join(BART_PATH, 'src')
+    return [
+        extension('bartpy.simu._simu_swig', [f'{src}/simu/phantom.c', 'bartpy/simu/simu_wrap.c']),
+        extension('bartpy.num._fft_swig', [f'{src}/num/fft.c', 'bartpy/num/fft_wrap.c']),
+        extension('bartpy.linops._linop_swig', [f'{src}/linops/someops.c', f'{src}/linops/linop.c',
+                                                'bartpy/linops/linop_wrap.c']),
+        extension('bartpy.italgos._italgos', [f'{src}/iter/italgos.c', 'bartpy/italgos/iter_wrap.c']),
+    ]
 
 print('[INFO] Writing Tool Methods')
 write_tool_methods()
@@ -98,7 +149,8 @@ setup(
         "Operating System :: OS X",
         "Operating System :: Linux"
     ],
-    ext_modules = [],
+    ext_modules = extensions(),
     package_dir = {},
-    packages = ["bartpy", "bartpy.utils", "bartpy.tools", "bartpy.wrapper"],
+    packages = ["bartpy", "bartpy.utils", "bartpy.tools", "bartpy.wrapper",
+                "bartpy.num", "bartpy.linops", "bartpy.simu", "bartpy.italgos"],
 )
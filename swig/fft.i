@@ -1,4 +1,4 @@
-%module fft_swig
+%module("threads"="1") fft_swig
 
 %include "carrays.i"
 %include "complex.i"
@@ -11,8 +11,8 @@
 		#include <complex.h>
 		#include <stdbool.h>
 
-		#include "/Users/malits/bart_work/bart/src/num/fft.h"
-        #include "/Users/malits/bart_work/bart/src/num/init.h"
+		#include "num/fft.h"
+        #include "num/init.h"
 %}
 
 %include "numpy.i"
@@ -63,6 +63,72 @@ void wrap_ifft(long dimensions[16], complex float * dst, long flags, complex flo
 }
 %}
 
+// FFT of arrays in any memory layout, through BART's strided FFT
+%apply(long dims[16], long strs[16], complex float *src){(long sdims[16], long sstrs[16], complex float* src)}
+
+%rename(fft_strided) wrap_fft_strided;
+%rename(ifft_strided) wrap_ifft_strided;
+%rename(fft_into) wrap_fft_into;
+%rename(ifft_into) wrap_ifft_into;
+
+%apply(long dims[16], complex float* out){(long odims[16], complex float* out)}
+
+%exception wrap_fft_strided {
+	$action
+	if (PyErr_Occurred()) SWIG_fail;
+}
+
+%exception wrap_ifft_strided {
+	$action
+	if (PyErr_Occurred()) SWIG_fail;
+}
+
+%exception wrap_fft_into {
+	$action
+	if (PyErr_Occurred()) SWIG_fail;
+}
+
+%exception wrap_ifft_into {
+	$action
+	if (PyErr_Occurred()) SWIG_fail;
+}
+
+%fragment("BART_Strides");
+%inline %{
+void wrap_fft_strided(long dimensions[16], complex float* dst, long flags, long sdims[16], long sstrs[16], complex float* src) {
+	long ostrs[16];
+
+	if (!same_dims(dimensions, sdims)) {
+		raise_value_error("Output dimensions must match the input");
+		return;
+	}
+
+	fortran_strides(ostrs, dimensions);
+	fft2(16, dimensions, flags, ostrs, dst, sstrs, src);
+}
+
+void wrap_ifft_strided(long dimensions[16], complex float* dst, long flags, long sdims[16], long sstrs[16], complex float* src) {
+	long ostrs[16];
+
+	if (!same_dims(dimensions, sdims)) {
+		raise_value_error("Output dimensions must match the input");
+		return;
+	}
+
+	fortran_strides(ostrs, dimensions);
+	ifft2(16, dimensions, flags, ostrs, dst, sstrs, src);
+}
+
+// FFT into a column-major array, which may be the input itself for an in-place FFT
+void wrap_fft_into(long odims[16], complex float* out, long flags, long sdims[16], long sstrs[16], complex float* src) {
+	wrap_fft_strided(odims, out, flags, sdims, sstrs, src);
+}
+
+void wrap_ifft_into(long odims[16], complex float* out, long flags, long sdims[16], long sstrs[16], complex float* src) {
+	wrap_ifft_strided(odims, out, flags, sdims, sstrs, src);
+}
+%}
+
 // centered
 extern void fftc(unsigned int D, const long dimensions[__VLA(D)], unsigned long flags, complex float* dst, const complex float* src);
 extern void ifftc(unsigned int D, const long dimensions[__VLA(D)], unsigned long flags, complex float* dst, const complex float* src);
@@ -1,4 +1,4 @@
-%module italgos
+%module("threads"="1") italgos
 
 %include "carrays.i"
 %include "complex.i"
@@ -13,8 +13,8 @@
     #include <complex.h>
     #include <stdbool.h>
 
-    #include "/Users/malits/bart_work/bart/src/iter/italgos.h"
+    #include "iter/italgos.h"
 %}
 
-%include "/Users/malits/bart_work/bart/src/iter/italgos.h"
+%include "iter/italgos.h"
 
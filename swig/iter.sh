@@ -1,2 +1,2 @@
-swig -python -threads iter.i
+swig -python -threads -I"$TOOLBOX_PATH/src" iter.i
 mv italgos.py iter_wrap.c ../bartpy/italgos/
\ No newline at end of file
@@ -1,4 +1,4 @@
-%module linop_swig
+%module("threads"="1") linop_swig
 
 %include "carrays.i"
 %include "complex.i"
@@ -11,10 +11,11 @@
 		#include <complex.h>
 		#include <stdbool.h>
 
-		#include "/Users/malits/bart_work/bart/src/linops/linop.h"
-        #include "/Users/malits/bart_work/bart/src/linops/someops.h"
-        #include "/Users/malits/bart_work/bart/src/num/init.h"
-        #include "/Users/malits/bart_work/bart/src/num/ops.h"
+		#include "linops/linop.h"
+        #include "linops/someops.h"
+        #include "num/init.h"
+        #include "num/ops.h"
+        #include "num/iovec.h"
 %}
 
 %include "numpy.i"
@@ -42,6 +43,12 @@
 %rename(adjoint) wrap_adjoint;
 %rename(normal) wrap_normal;
 %rename(pseudo_inv) wrap_pseudo_inv;
+%rename(forward_strided) wrap_forward_strided;
+%rename(adjoint_strided) wrap_adjoint_strided;
+%rename(forward_into) wrap_forward_into;
+%rename(adjoint_into) wrap_adjoint_into;
+%rename(normal_into) wrap_normal_into;
+%rename(pseudo_inv_into) wrap_pseudo_inv_into;
 
 %rename(resize_center_create) wrap_resize_center_create;
 %rename(expand_create) wrap_expand_create;
@@ -56,6 +63,44 @@
 %apply(complex float *src){(complex float* src),
                            (complex float* diag)}
 %apply(long dims[16], complex float* src) {(long sdims[16], complex float* src)}
+%apply(long dims[16], long strs[16], complex float *src) {(long sdims[16], long sstrs[16], complex float* src)}
+
+%exception wrap_normal {
+    $action
+    if (PyErr_Occurred()) SWIG_fail;
+}
+
+%exception wrap_forward_strided {
+    $action
+    if (PyErr_Occurred()) SWIG_fail;
+}
+
+%exception wrap_adjoint_strided {
+    $action
+    if (PyErr_Occurred()) SWIG_fail;
+}
+
+%exception wrap_forward_into {
+    $action
+    if (PyErr_Occurred()) SWIG_fail;
+}
+
+%exception wrap_adjoint_into {
+    $action
+    if (PyErr_Occurred()) SWIG_fail;
+}
+
+%exception wrap_normal_into {
+    $action
+    if (PyErr_Occurred()) SWIG_fail;
+}
+
+%exception wrap_pseudo_inv_into {
+    $action
+    if (PyErr_Occurred()) SWIG_fail;
+}
+
+%apply(long dims[16], complex float* out) {(long odims[16], complex float* out)}
 
 // NumPy Typemaps for specifying operator dims
 %apply(int DIM1, long* IN_ARRAY1) {(unsigned int N, const long dims[__VLA(N)]),
@@ -64,6 +109,13 @@
 
 // inline definitions of C wrappers 
 // TODO: find a cleaner way to do this that doesn't require listing out each function. Works for the prototype.
+%fragment("BART_Strides");
+%{
+static int iovec_dims(const struct iovec_s* iov, const long dims[16]) {
+    return (16 == iov->N) && same_dims(iov->dims, dims);
+}
+%}
+
 %inline %{
 void wrap_forward(struct linop_s* op, long ddims[16], complex float* dst, long sdims[16], const complex float* src) {
     linop_forward(op, 16, ddims, dst, 16, sdims, src);
@@ -73,7 +125,12 @@ void wrap_adjoint(struct linop_s* op, long ddims[16], complex float* dst, long s
     linop_adjoint(op, 16, ddims, dst, 16, sdims, src);
 }
 
-void wrap_normal(struct linop_s* op, long dims[16], complex float *dst, complex float *src) {
+void wrap_normal(struct linop_s* op, long dims[16], complex float *dst, long sdims[16], const complex float *src) {
+    if (!iovec_dims(linop_domain(op), dims) || !iovec_dims(linop_domain(op), sdims)) {
+        raise_value_error("Dimensions do not match the operator");
+        return;
+    }
+
     linop_normal(op, 16, dims, dst, src);
 }
 
@@ -101,6 +158,69 @@ void wrap_pseudo_inv(struct linop_s* op, float lambda, long ddims[16], complex f
 //     linop_transpose_create();
 // }
 
+
+/* Forward and adjoint of arrays in any memory layout: the operator is wrapped
+ * with linop_copy_wrapper for the strides of the input and of the column-major output.
+ * The copy wrapper has no strided normal or pseudo-inverse.
+ */
+void wrap_forward_strided(struct linop_s* op, long ddims[16], complex float* dst, long sdims[16], long sstrs[16], const complex float* src) {
+    long dstrs[16];
+
+    if (!iovec_dims(linop_codomain(op), ddims) || !iovec_dims(linop_domain(op), sdims)) {
+        raise_value_error("Dimensions do not match the operator");
+        return;
+    }
+
+    fortran_strides(dstrs, ddims);
+
+    const struct linop_s* wrapper = linop_copy_wrapper(16, sstrs, dstrs, op);
+    linop_forward_unchecked(wrapper, dst, src);
+    linop_free(wrapper);
+}
+
+void wrap_adjoint_strided(struct linop_s* op, long ddims[16], complex float* dst, long sdims[16], long sstrs[16], const complex float* src) {
+    long dstrs[16];
+
+    if (!iovec_dims(linop_domain(op), ddims) || !iovec_dims(linop_codomain(op), sdims)) {
+        raise_value_error("Dimensions do not match the operator");
+        return;
+    }
+
+    fortran_strides(dstrs, ddims);
+
+    const struct linop_s* wrapper = linop_copy_wrapper(16, dstrs, sstrs, op);
+    linop_adjoint_unchecked(wrapper, dst, src);
+    linop_free(wrapper);
+}
+
+/* Apply into a caller-supplied column-major output. The dims are checked against
+ * the operator first, since the checked BART functions abort on a mismatch.
+ */
+void wrap_forward_into(struct linop_s* op, long odims[16], complex float* out, long sdims[16], long sstrs[16], const complex float* src) {
+    wrap_forward_strided(op, odims, out, sdims, sstrs, src);
+}
+
+void wrap_adjoint_into(struct linop_s* op, long odims[16], complex float* out, long sdims[16], long sstrs[16], const complex float* src) {
+    wrap_adjoint_strided(op, odims, out, sdims, sstrs, src);
+}
+
+void wrap_normal_into(struct linop_s* op, long odims[16], complex float* out, long sdims[16], const complex float* src) {
+    if (!iovec_dims(linop_domain(op), odims) || !iovec_dims(linop_domain(op), sdims)) {
+        raise_value_error("Dimensions do not match the operator");
+        return;
+    }
+
+    linop_normal(op, 16, odims, out, src);
+}
+
+void wrap_pseudo_inv_into(struct linop_s* op, float lambda, long odims[16], complex float* out, long sdims[16], const complex float* src) {
+    if (!iovec_dims(linop_domain(op), odims) || !iovec_dims(linop_codomain(op), sdims)) {
+        raise_value_error("Dimensions do not match the operator");
+        return;
+    }
+
+    linop_pseudo_inv(op, lambda, 16, odims, out, 16, sdims, src);
+}
 %}
 
 
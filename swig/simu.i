@@ -1,4 +1,4 @@
-%module simu_swig
+%module("threads"="1") simu_swig
 
 %include "carrays.i"
 %include "complex.i"
@@ -11,8 +11,8 @@
 		#include <complex.h>
 		#include <stdbool.h>
 
-		#include "/Users/malits/bart_work/bart/src/simu/phantom.h"
-        #include "/Users/malits/bart_work/bart/src/num/init.h"
+		#include "simu/phantom.h"
+        #include "num/init.h"
 %}
 
 %include "numpy.i"
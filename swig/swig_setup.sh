@@ -1,8 +1,9 @@
-swig -python -threads simu.i
+# BART headers are included relative to $TOOLBOX_PATH/src
+swig -python -threads -I"$TOOLBOX_PATH/src" simu.i
 mv simu_swig.py simu_wrap.c ../bartpy/simu/
 
-swig -python -threads fft.i
+swig -python -threads -I"$TOOLBOX_PATH/src" fft.i
 mv fft_swig.py fft_wrap.c ../bartpy/num/
 
-swig -python -threads linop.i
-mv linop_swig.py linop_wrap.c ../bartpy/linops/
\ No newline at end of file
+swig -python -threads -I"$TOOLBOX_PATH/src" linop.i
+mv linop_swig.py linop_wrap.c ../bartpy/linops/
@@ -6,10 +6,17 @@
  */
 
 
+/* All wrapped functions run with the GIL released (the "threads" module
+ * option, or swig -threads). The typemaps below only touch Python objects
+ * before and after the call, and everything the C function reads, such as
+ * dims and strides, lives in typemap locals that outlive the call.
+ */
+
+
 //typemap for input as an array pointer
 %typemap(in, fragment="NumPy_Fragments")
     (complex float * src)
-    (PyObject* arr=NULL, int is_new_object=0)
+    (PyArrayObject* arr=NULL, int is_new_object=0)
     {
         arr = obj_to_array_fortran_allow_conversion($input,
                                                     NPY_COMPLEX64,
@@ -20,30 +27,135 @@
         $1 = (complex float *) array_data(arr);
     }
 
+%typemap(freearg)
+    (complex float * src)
+    {
+        if (is_new_object$argnum && arr$argnum) { Py_DECREF(arr$argnum); }
+    }
+
 //typemap for input with dimensions
 %typemap(in, fragment="NumPy_Fragments")
     (long dims[16], complex float *src)
-    (PyObject* arr=NULL, int is_new_object=0)
+    (PyArrayObject* arr=NULL, int is_new_object=0, long dims[16])
     {
-        long dims[16];
-        
         arr = obj_to_array_fortran_allow_conversion($input,
                                                         NPY_COMPLEX64,
                                                         &is_new_object);
 
         if (!arr) SWIG_fail;
 
-        for (int i = 0; i < 16; i++) dims[i] = (long) array_size(arr, i);
+        if (array_numdims(arr) > 16) {
+            PyErr_SetString(PyExc_ValueError, "Array must have at most 16 dimensions");
+            SWIG_fail;
+        }
+
+        for (int i = 0; i < 16; i++)
+            dims[i] = (i < array_numdims(arr)) ? (long) array_size(arr, i) : 1;
 
         $1 = dims;
         $2 = array_data(arr);
     }
 
+%typemap(freearg)
+    (long dims[16], complex float *src)
+    {
+        if (is_new_object$argnum && arr$argnum) { Py_DECREF(arr$argnum); }
+    }
+
+
+// helpers for strided arrays; interface files that use them in inline code force
+// the fragment with %fragment("BART_Strides"); before the %inline block
+%fragment("BART_Strides", "header", fragment="NumPy_Fragments")
+%{
+    // arrays BART can read in place: aligned native complex64 with at most 16
+    // dimensions and no negative strides
+    static int borrowable(PyObject* obj)
+    {
+        if (!is_array(obj) || array_type(obj) != NPY_COMPLEX64 || array_numdims(obj) > 16)
+            return 0;
+
+        if (!PyArray_ISALIGNED((PyArrayObject*) obj) || !PyArray_ISNOTSWAPPED((PyArrayObject*) obj))
+            return 0;
+
+        for (int i = 0; i < array_numdims(obj); i++)
+            if (array_stride(obj, i) < 0)
+                return 0;
+
+        return 1;
+    }
+
+    // byte strides of a column-major complex float array
+    static void fortran_strides(long strs[16], const long dims[16])
+    {
+        long str = sizeof(complex float);
+
+        for (int i = 0; i < 16; i++) {
+            strs[i] = str;
+            str *= dims[i];
+        }
+    }
+
+    static int same_dims(const long a[16], const long b[16])
+    {
+        for (int i = 0; i < 16; i++)
+            if (a[i] != b[i])
+                return 0;
+
+        return 1;
+    }
+
+    // raise from a wrapper that runs with the GIL released; the
+    // interface file checks PyErr_Occurred() after the call with %exception
+    static void raise_value_error(const char* msg)
+    {
+        SWIG_PYTHON_THREAD_BEGIN_BLOCK;
+        PyErr_SetString(PyExc_ValueError, msg);
+        SWIG_PYTHON_THREAD_END_BLOCK;
+    }
+%}
+
+//typemap for input with dimensions and byte strides; arrays BART can read in place,
+//such as C-ordered arrays and sliced views, are passed without copying
+%typemap(in, fragment="BART_Strides")
+    (long dims[16], long strs[16], complex float *src)
+    (PyArrayObject* arr=NULL, int is_new_object=0, long dims[16], long strs[16])
+    {
+        if (borrowable($input)) {
+            arr = (PyArrayObject*) $input;
+        } else {
+            arr = obj_to_array_fortran_allow_conversion($input,
+                                                        NPY_COMPLEX64,
+                                                        &is_new_object);
+
+            if (!arr) SWIG_fail;
+
+            if (array_numdims(arr) > 16) {
+                PyErr_SetString(PyExc_ValueError, "Array must have at most 16 dimensions");
+                SWIG_fail;
+            }
+        }
 
-// typemap for output
+        for (int i = 0; i < 16; i++) {
+            dims[i] = (i < array_numdims(arr)) ? (long) array_size(arr, i) : 1;
+            strs[i] = (i < array_numdims(arr)) ? (long) array_stride(arr, i) : 0;
+        }
+
+        $1 = dims;
+        $2 = strs;
+        $3 = (complex float *) array_data(arr);
+    }
+
+%typemap(freearg)
+    (long dims[16], long strs[16], complex float *src)
+    {
+        if (is_new_object$argnum && arr$argnum) { Py_DECREF(arr$argnum); }
+    }
+
+
+// typemap for output, allocated in column-major order as BART writes it
 %typemap(in, fragment="NumPy_Fragments")
     (long dims[16], complex float* data)
-    (PyObject* out=NULL, PyArrayObject* in_dims = NULL, int is_new_object=0)
+    (PyArrayObject* out=NULL, PyArrayObject* in_dims = NULL, int is_new_object=0, long odims[16])
     {
         npy_intp dims[16];
 
@@ -52,21 +164,27 @@
                                                         &is_new_object);
         
 
-        if (!in_dims || !require_dimensions(in_dims, 1)) SWIG_fail; // check dims not greater than 16
+        if (!in_dims || !require_dimensions(in_dims, 1)) SWIG_fail;
 
         int N = array_size(in_dims, 0);
 
+        if (N > 16) {
+            PyErr_SetString(PyExc_ValueError, "At most 16 dimensions are supported");
+            SWIG_fail;
+        }
+
         long * dim_data_in = (long *) array_data(in_dims);
         
-        for (int i = 0; i < N; i++) 
-            dims[i] = (npy_intp) dim_data_in[i];
-        
-        for (int i = N; i < 16; i++)
-            dims[i] = 1;
+        for (int i = 0; i < 16; i++) {
+            odims[i] = (i < N) ? dim_data_in[i] : 1;
+            dims[i] = (npy_intp) odims[i];
+        }
+
+        out = (PyArrayObject*) PyArray_EMPTY(16, dims, NPY_CFLOAT, 1);
 
-        out = PyArray_SimpleNew(16, dims, NPY_CFLOAT);
+        if (!out) SWIG_fail;
 
-        $1 = (long *) array_data(in_dims);
+        $1 = odims;
         $2 = (complex float *) array_data(out);
     }
 
@@ -74,6 +192,36 @@
     (long dims[16], complex float* data)
     {
         $result = SWIG_Python_AppendOutput($result,(PyObject*)out$argnum);
+        out$argnum = NULL;
+    }
+
+%typemap(freearg)
+    (long dims[16], complex float* data)
+    {
+        if (is_new_object$argnum && in_dims$argnum) { Py_DECREF(in_dims$argnum); }
+        Py_XDECREF(out$argnum);
+    }
+
+
+// typemap for an output written into a caller-supplied writeable column-major
+// complex64 array, which the wrapped function returns as None
+%typemap(in, fragment="NumPy_Fragments")
+    (long dims[16], complex float* out)
+    (long dims[16])
+    {
+        if (!is_array($input) || array_type($input) != NPY_COMPLEX64 || array_numdims($input) > 16
+            || !array_is_fortran($input) || !PyArray_ISWRITEABLE((PyArrayObject*) $input)
+            || !PyArray_ISALIGNED((PyArrayObject*) $input) || !PyArray_ISNOTSWAPPED((PyArrayObject*) $input)) {
+            PyErr_SetString(PyExc_ValueError, "out must be a writeable complex64 array in column-major order "
+                                              "with at most 16 dimensions");
+            SWIG_fail;
+        }
+
+        for (int i = 0; i < 16; i++)
+            dims[i] = (i < array_numdims($input)) ? (long) array_size($input, i) : 1;
+
+        $1 = dims;
+        $2 = (complex float *) array_data($input);
     }
 
 
@@ -86,9 +234,10 @@
 
 %typemap(in, numinputs=0)
     (long strides[16], complex float* traj)
+    (long strs[16])
     {
-        long strs[16] = { 0 };
+        for (int i = 0; i < 16; i++) strs[i] = 0;
 
         $1 = strs;
         $2 = NULL; 
-    }
\ No newline at end of file
+    }
@@ -0,0 +1,65 @@
+# Tests for the on-disk tool result cache in bartpy.tools.cache
+import os
+
+import numpy as np
+import pytest
+
+pytestmark = pytest.mark.skipif('TOOLBOX_PATH' not in os.environ,
+                                reason="BART is not installed (TOOLBOX_PATH is not set)")
+
+
+def test_tool_cache(tmp_path):
+    from bartpy.tools import scale
+    from bartpy.tools.cache import ToolCache
+
+    x = np.ones((4, 4), dtype=np.complex64)
+    entry_bytes = x.size * x.itemsize
+    store = ToolCache(str(tmp_path), max_bytes=2 * entry_bytes)
+    cached_scale = store.memoize(scale)
+
+    np.testing.assert_allclose(cached_scale(x, 2), 2 * x)
+    np.testing.assert_allclose(cached_scale(x, 2), 2 * x)
+    assert store.stats()['hits'] == 1 and store.stats()['misses'] == 1
+
+    # `out` is not part of the key, and hits are copied into it
+    out = np.zeros_like(x, order='F')
+    assert cached_scale(x, 2, out=out) is out
+    np.testing.assert_allclose(out, 2 * x)
+    assert store.stats()['hits'] == 2
+
+    cached_scale(x, 3, out=out)
+    np.testing.assert_allclose(out, 3 * x)
+    cached_scale(x, 4)
+    stats = store.stats()
+    assert stats['evictions'] == 1 and stats['entries'] == 2 and stats['bytes'] == 2 * entry_bytes
+
+    # the index persists across instances
+    assert ToolCache(str(tmp_path)).stats()['entries'] == 2
+
+
+def test_hits_read_outside_the_lock_and_save_lazily(tmp_path, monkeypatch):
+    from bartpy.tools import cache
+
+    store = cache.ToolCache(str(tmp_path))
+    x = np.ones((4, 4), dtype=np.complex64)
+    store.put('key', x)
+
+    saves = []
+    save_index = store._save_index
+    monkeypatch.setattr(store, '_save_index', lambda: saves.append(1) or save_index())
+    readcfl = cache.cfl.readcfl
+
+    def unlocked_readcfl(name):
+        assert not store._lock.locked()
+        return readcfl(name)
+
+    monkeypatch.setattr(cache.cfl, 'readcfl', unlocked_readcfl)
+    monkeypatch.setattr(cache, 'SAVE_EVERY_HITS', 3)
+
+    for _ in range(7):
+        np.testing.assert_array_equal(store.get('key'), x)
+    assert len(saves) == 2 and store.stats()['hits'] == 7
+
+    # an entry whose files are gone is a miss and is dropped
+    os.remove(store._name('key', 0) + '.cfl')
+    assert store.get('key') is None and store.stats()['entries'] == 0
@@ -0,0 +1,32 @@
+# Tests for the cfl header index in bartpy.utils.catalog
+import os
+
+import numpy as np
+
+from bartpy.utils import cfl
+from bartpy.utils.catalog import Catalog
+
+
+def test_catalog(tmp_path):
+    os.makedirs(tmp_path / 'a' / 'b')
+    cfl.writecfl(str(tmp_path / 'a' / 'small'), np.ones((4, 4), dtype=np.complex64))
+    cfl.writecfl(str(tmp_path / 'a' / 'b' / 'large'), np.ones((8, 8, 1, 3), dtype=np.complex64))
+    cfl.writecflz(str(tmp_path / 'archive'), np.ones((4, 4), dtype=np.complex64))
+
+    catalog = Catalog(str(tmp_path))
+    assert catalog.update(hashes=True) == {'added': 3, 'updated': 0, 'removed': 0}
+    assert catalog[str(tmp_path / 'archive')]['compressed']
+    assert 'hash' in catalog[str(tmp_path / 'a' / 'small')]
+
+    assert catalog.query(shape=(4, 4)) == [str(tmp_path / 'a' / 'small'), str(tmp_path / 'archive')]
+    assert catalog.query(lambda dims: len(dims) > 3 and dims[3] == 3) == [str(tmp_path / 'a' / 'b' / 'large')]
+    assert catalog.query(ndim=4, max_bytes=8 * 8 * 8 * 3 - 1) == []
+    assert catalog.total_bytes() == 8 * (16 + 192 + 16)
+
+    # only changes are picked up, and the index persists
+    os.remove(tmp_path / 'archive.cflz')
+    cfl.writecfl(str(tmp_path / 'a' / 'small'), np.ones((4, 5), dtype=np.complex64))
+    reopened = Catalog(str(tmp_path))
+    assert reopened.update() == {'added': 0, 'updated': 1, 'removed': 1}
+    assert reopened.query(shape=(4, 5)) == [str(tmp_path / 'a' / 'small')]
+    assert reopened.update() == {'added': 0, 'updated': 0, 'removed': 0}
@@ -0,0 +1,163 @@
+# Tests for reading and writing cfl files in bartpy.utils.cfl
+import numpy as np
+import pytest
+
+from bartpy.utils import cfl, scratch
+
+
+@pytest.fixture
+def array():
+    rng = np.random.default_rng(0)
+    return (rng.standard_normal((4, 3, 2)) + 1j * rng.standard_normal((4, 3, 2))).astype(np.complex64)
+
+
+def test_lazy_cfl(tmp_path, array):
+    name = str(tmp_path / 'data')
+    cfl.writecfl(name, array)
+
+    handle = cfl.LazyCfl(name)
+    assert handle.shape == array.shape
+    assert repr(handle).endswith('loaded=False)')
+
+    np.testing.assert_array_equal(np.asarray(handle), array)
+    assert not np.asarray(handle).flags.writeable
+    assert scratch.stage(str(tmp_path / 'other'), handle) == name
+
+    # handles and other array-likes can be written like arrays
+    cfl.writecfl(str(tmp_path / 'copy'), handle)
+    np.testing.assert_array_equal(cfl.readcfl(str(tmp_path / 'copy')), array)
+    cfl.writecfl(str(tmp_path / 'list'), array.tolist())
+    np.testing.assert_array_equal(cfl.readcfl(str(tmp_path / 'list')), array)
+
+
+def test_readcfl_mmap(tmp_path, array):
+    name = str(tmp_path / 'data')
+    cfl.writecfl(name, array[..., np.newaxis, np.newaxis])
+
+    mapped = cfl.readcfl(name, mmap='r')
+    assert isinstance(mapped, np.memmap) and mapped.shape == array.shape and mapped.flags.f_contiguous
+    np.testing.assert_array_equal(mapped, array)
+    with pytest.raises(ValueError):
+        mapped[0, 0, 0] = 0
+
+    private = cfl.readcfl(name, mmap='c')
+    private[0, 0, 0] = 0
+    np.testing.assert_array_equal(cfl.readcfl(name), array)
+
+
+@pytest.mark.parametrize('layout', [
+    lambda a: np.asfortranarray(a),
+    lambda a: np.ascontiguousarray(a),
+    lambda a: a.astype(np.complex128)[::-1, 1:],
+])
+def test_writecfl_in_chunks(tmp_path, monkeypatch, array, layout):
+    monkeypatch.setattr(cfl, 'WRITE_CHUNK_BYTES', 16)
+    name = str(tmp_path / 'data')
+    expected = layout(array)
+    cfl.writecfl(name, expected)
+    np.testing.assert_array_equal(cfl.readcfl(name), expected.astype(np.complex64))
+
+
+def test_readcfl_into_buffer(tmp_path, array):
+    name = str(tmp_path / 'data')
+    cfl.writecfl(name, array)
+
+    out = np.zeros(array.shape + (1,), dtype=np.complex64, order='F')
+    assert cfl.readcfl(name, out=out) is out
+    np.testing.assert_array_equal(out[..., 0], array)
+
+    with pytest.raises(ValueError, match='dimensions'):
+        cfl.readcfl(name, out=np.zeros((4, 3), dtype=np.complex64, order='F'))
+    with pytest.raises(ValueError, match='column-major'):
+        cfl.readcfl(name, out=np.zeros(array.shape, dtype=np.complex64, order='C'))
+
+
+@pytest.mark.parametrize('dim, chunk', [(0, 3), (1, 1), (2, 2), (4, 1)])
+def test_iter_cfl(tmp_path, array, dim, chunk):
+    name = str(tmp_path / 'data')
+    cfl.writecfl(name, array)
+
+    blocks = list(cfl.iter_cfl(name, dim, chunk))
+    assert len(blocks) == -(-np.shape(array[..., np.newaxis, np.newaxis])[dim] // chunk)
+    assert all(not block.flags.writeable and block.ndim == max(dim + 1, array.ndim) for block in blocks)
+    if dim >= 2:
+        assert all(block.flags.f_contiguous for block in blocks)
+    joined = np.concatenate(blocks, axis=dim)
+    np.testing.assert_array_equal(joined.reshape(array.shape, order='F'), array)
+
+
+def test_multicfl(tmp_path, array):
+    name = str(tmp_path / 'bundle')
+    arrays = [array, np.arange(5, dtype=np.complex128), np.ones((2, 2), dtype=np.complex64, order='F')]
+    cfl.writemulticfl(name, arrays)
+
+    # a plain cfl reader sees all data in one flat array
+    np.testing.assert_array_equal(cfl.readcfl(name), np.concatenate([a.ravel(order='F') for a in arrays]))
+
+    members = cfl.readmulticfl(name)
+    assert len(members) == len(arrays)
+    for member, expected in zip(members, arrays):
+        assert not member.flags.writeable and member.base is not None
+        np.testing.assert_array_equal(member, expected)
+
+    cfl.writecfl(str(tmp_path / 'single'), array)
+    with pytest.raises(ValueError, match='multi-cfl'):
+        cfl.readmulticfl(str(tmp_path / 'single'))
+
+
+def test_compressed_cfl_is_read_in_bounded_windows(tmp_path, array, monkeypatch):
+    name = str(tmp_path / 'archive')
+    cfl.writecflz(name, array, chunk_bytes=16, workers=2)
+    nchunks = len(cfl.readcflz_index(name)[3])
+    windows, pools, indexes = [], set(), []
+    read_chunks, readcflz_index = cfl._read_chunks, cfl.readcflz_index
+
+    def read_window(name, codec, index, chunks, pool):
+        windows.append(len(chunks))
+        pools.add(pool)
+        return read_chunks(name, codec, index, chunks, pool)
+
+    monkeypatch.setattr(cfl, '_read_chunks', read_window)
+    monkeypatch.setattr(cfl, 'readcflz_index', lambda name: indexes.append(name) or readcflz_index(name))
+
+    np.testing.assert_array_equal(cfl.readcflz(name, workers=2), array)
+    cfl.decompress(name, str(tmp_path / 'plain'), workers=2)
+    np.testing.assert_array_equal(cfl.readcfl(str(tmp_path / 'plain')), array)
+    assert sum(windows) == 2 * nchunks and max(windows) <= 4
+    # one index read and one pool per call, whatever the number of windows
+    assert len(indexes) == 2 and len(pools) == 2
+
+
+@pytest.mark.parametrize('codec', ['zlib', 'lzma'])
+def test_compressed_cfl(tmp_path, array, codec):
+    name = str(tmp_path / 'archive')
+    cfl.writecflz(name, array, codec=codec, chunk_bytes=40, workers=2)
+    assert len(cfl.readcflz_index(name)[3]) == -(-array.nbytes // 40)
+
+    # readcfl falls back to the compressed file
+    np.testing.assert_array_equal(cfl.readcfl(name), array)
+    np.testing.assert_array_equal(cfl.readcflz(name, 1, 1, 3), array[:, 1:3])
+    np.testing.assert_array_equal(cfl.readcflz(name, 2, 1), array[:, :, 1])
+    assert cfl.readcflz(name, 1, 2, 2).shape == array[:, 2:2].shape
+
+    # tools get a decompressed copy in scratch
+    handle = cfl.LazyCfl(name)
+    assert handle.compressed and scratch.footprint(handle) == 2 * array.nbytes
+    with scratch.namespace(handle) as NAME:
+        assert scratch.stage(NAME + 'input', handle) == NAME + 'input'
+        np.testing.assert_array_equal(cfl.readcfl(NAME + 'input', mmap='r'), array)
+
+
+def test_backing_cfl(tmp_path, array):
+    name = str(tmp_path / 'data')
+    cfl.writecfl(name, array[..., np.newaxis])
+
+    mapped = cfl.readcfl(name, mmap='r')
+    assert cfl.backing_cfl(mapped) == name
+    assert scratch.stage(str(tmp_path / 'other'), mapped) == name and scratch.footprint(mapped) == 0
+
+    # partial views, copy-on-write maps and plain arrays are written out
+    assert cfl.backing_cfl(mapped[:, :, :1]) is None
+    assert cfl.backing_cfl(cfl.readcfl(name, mmap='c')) is None
+    assert cfl.backing_cfl(np.asarray(mapped)) is None
+    assert scratch.stage(str(tmp_path / 'other'), mapped[1:]) == str(tmp_path / 'other')
@@ -0,0 +1,82 @@
+# Parity tests of the in-process embed backend against launching the bart executable
+import asyncio
+import os
+import threading
+import types
+
+import numpy as np
+import pytest
+
+from bartpy.utils import embed, scratch
+
+requires_libbart = pytest.mark.skipif('TOOLBOX_PATH' not in os.environ or not embed.available(),
+                                      reason="BART is not built as a shared library (libbart)")
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError, match='backend'):
+        with scratch.namespace(backend='cluster'):
+            pass
+
+
+@pytest.fixture
+def array():
+    rng = np.random.default_rng(0)
+    return (rng.standard_normal((8, 6, 1, 3)) + 1j * rng.standard_normal((8, 6, 1, 3))).astype(np.complex64)
+
+
+@requires_libbart
+@pytest.mark.parametrize('call', [
+    lambda tools, x, backend: tools.scale(x, 0.5 + 1j, backend=backend),
+    lambda tools, x, backend: tools.fft(x, 3, backend=backend),
+    lambda tools, x, backend: tools.saxpy(x, np.conj(x), 2, backend=backend),
+    lambda tools, x, backend: tools.rss(x, 8, backend=backend),
+])
+def test_embed_matches_subprocess(array, call):
+    from bartpy import tools
+
+    expected = call(tools, array, 'subprocess')
+    result = call(tools, array, 'embed')
+    assert result.shape == expected.shape
+    np.testing.assert_allclose(result, expected, rtol=1e-5, atol=1e-5)
+
+
+@requires_libbart
+def test_embed_borrows_and_returns_buffers(array):
+    from bartpy.tools import scale
+
+    out = np.empty(array.shape, dtype=np.complex64, order='F')
+    assert scale(array, 2, out=out, backend='embed') is out
+    np.testing.assert_allclose(out, 2 * array)
+
+    # inputs in other layouts are converted
+    np.testing.assert_allclose(scale(np.ascontiguousarray(array).astype(np.complex128), 2, backend='embed'), 2 * array)
+
+
+def test_closing_a_memory_namespace_does_not_block_the_event_loop(array, monkeypatch):
+    freed = []
+    lib = types.SimpleNamespace(register_mem_cfl_non_managed=lambda *args: None, deallocate_mem_cfl=freed.append)
+    monkeypatch.setattr(embed, '_lib', lib)
+    held, done = threading.Event(), threading.Event()
+
+    def command():
+        # a BART command running on another thread
+        with embed._command_lock:
+            held.set()
+            done.wait(5)
+
+    async def call():
+        async with scratch.anamespace(backend='embed') as prefix:
+            embed.register(prefix + 'input', array)
+            threading.Thread(target=command).start()
+            held.wait(5)
+
+    async def run():
+        task = asyncio.ensure_future(call())
+        await asyncio.sleep(0.1)
+        assert not task.done() and not freed
+        done.set()
+        await task
+
+    asyncio.run(asyncio.wait_for(run(), 10))
+    assert len(freed) == 1 and not embed._registered
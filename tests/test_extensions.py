@@ -0,0 +1,50 @@
+import os
+
+import numpy as np
+import pytest
+
+from bartpy.utils import extensions
+
+
+def test_capabilities():
+    capabilities = extensions.capabilities()
+    assert set(capabilities) == set(extensions.EXTENSIONS)
+    assert all(isinstance(flag, bool) for flag in capabilities.values())
+
+
+def test_require_missing_extension():
+    if extensions.available('linops'):
+        pytest.skip('linops extension is built')
+    with pytest.raises(ImportError, match='linops extension'):
+        extensions.require('linops')
+    with pytest.raises(ImportError, match='linops extension'):
+        import bartpy.linops  # noqa: F401
+
+
+@pytest.mark.skipif('TOOLBOX_PATH' not in os.environ,
+                    reason="BART is not installed (TOOLBOX_PATH is not set)")
+def test_fft_falls_back_to_tool(monkeypatch):
+    if extensions.available('fft'):
+        pytest.skip('fft extension is built')
+    import bartpy.num
+    import bartpy.tools
+
+    calls = []
+
+    def bart_fft(input, bitmask, u=None, i=None, n=None, out=None):
+        calls.append((bitmask, i, n))
+        result = np.fft.fft(input, axis=0).squeeze()
+        if out is None:
+            return result
+        out[...] = result
+        return out
+
+    monkeypatch.setattr(bartpy.tools, 'fft', bart_fft)
+    x = np.arange(8, dtype=np.complex64)
+    np.testing.assert_allclose(bartpy.num.fft(x, 1), np.fft.fft(x))
+    bartpy.num.ifft(x, 1)
+    assert calls == [(1, None, True), (1, True, True)]
+
+    out = np.empty(8, dtype=np.complex64)
+    assert bartpy.num.fft(x, 1, out=out) is out
+    np.testing.assert_allclose(out, np.fft.fft(x), rtol=1e-5, atol=1e-5)
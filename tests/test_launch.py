@@ -0,0 +1,102 @@
+# Tests for launching commands without a shell in bartpy.utils.launch
+import asyncio
+import os
+import shutil
+import signal
+import subprocess
+import threading
+
+import numpy as np
+import pytest
+
+from bartpy.utils import launch, scratch
+
+TRUE, FALSE, ECHO = shutil.which('true'), shutil.which('false'), shutil.which('echo')
+SLEEP = shutil.which('sleep')
+
+
+def test_run_checks_exit_code():
+    launch.run([TRUE])
+    with pytest.raises(subprocess.CalledProcessError):
+        launch.run([FALSE])
+
+
+def test_arguments_are_not_split_by_a_shell():
+    assert launch.output([ECHO, 'a b', '$HOME']) == b'a b $HOME\n'
+    assert asyncio.run(launch.aoutput([ECHO, 'a b'])) == b'a b\n'
+    with pytest.raises(subprocess.CalledProcessError):
+        asyncio.run(launch.arun([FALSE]))
+
+
+def assert_reaped(pid):
+    with pytest.raises(ChildProcessError):
+        os.waitpid(pid, os.WNOHANG)
+
+
+@pytest.mark.parametrize('coroutine', [launch.arun, launch.aoutput])
+def test_cancelled_coroutines_kill_the_command(monkeypatch, coroutine):
+    processes = []
+    create = asyncio.create_subprocess_exec
+
+    async def create_subprocess_exec(*args, **kwargs):
+        processes.append(await create(*args, **kwargs))
+        return processes[-1]
+
+    monkeypatch.setattr(asyncio, 'create_subprocess_exec', create_subprocess_exec)
+
+    async def cancel():
+        task = asyncio.ensure_future(coroutine([SLEEP, '10']))
+        while not processes:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(asyncio.wait_for(cancel(), 5))
+    assert processes[0].returncode == -signal.SIGKILL
+    assert_reaped(processes[0].pid)
+
+
+@pytest.mark.skipif(not hasattr(os, 'posix_spawn'), reason="spawn falls back to subprocess.call")
+def test_interrupted_spawn_kills_the_command(monkeypatch):
+    pids = []
+    posix_spawn = os.posix_spawn
+
+    def spawn(*args):
+        pids.append(posix_spawn(*args))
+        return pids[-1]
+
+    monkeypatch.setattr(os, 'posix_spawn', spawn)
+    timer = threading.Timer(0.2, os.kill, (os.getpid(), signal.SIGINT))
+    timer.start()
+    with pytest.raises(KeyboardInterrupt):
+        launch.spawn([SLEEP, '10'])
+    timer.join()
+    assert_reaped(pids[0])
+
+
+@pytest.mark.skipif('TOOLBOX_PATH' not in os.environ, reason="BART is not installed (TOOLBOX_PATH is not set)")
+def test_optional_positional_inputs_follow_the_required_ones(monkeypatch):
+    from bartpy.tools import aio, fmac
+
+    calls = []
+
+    async def arun(argv):
+        calls.append(argv)
+
+    async def afetch(name, lazy, out):
+        return None
+
+    monkeypatch.setattr(launch, 'run', calls.append)
+    monkeypatch.setattr(launch, 'arun', arun)
+    monkeypatch.setattr(scratch, 'fetch', lambda name, lazy, out: None)
+    monkeypatch.setattr(scratch, 'afetch', afetch)
+    a, b = np.ones(4, dtype=np.complex64), np.zeros(4, dtype=np.complex64)
+
+    fmac(a, b, C=True)
+    asyncio.run(aio.fmac(a, b, C=True))
+    fmac(a)
+    for argv in calls[:2]:
+        assert argv[1:3] == ['fmac', '-C']
+        assert [os.path.basename(arg) for arg in argv[3:]] == ['input1', 'input2', 'output']
+    assert [os.path.basename(arg) for arg in calls[2][2:]] == ['input1', 'output']
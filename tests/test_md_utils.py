@@ -0,0 +1,32 @@
+# Tests for the md array helpers in bartpy.utils.md_utils
+import numpy as np
+import pytest
+
+from bartpy.utils.md_utils import check_out, expand_array, expand_dims
+
+
+def test_expand_array_keeps_layout():
+    x = np.zeros((6, 8), dtype=np.complex64)[:, ::2]
+    expanded = expand_array(x)
+    assert expanded.shape == (6, 4) + (1,) * 14
+    assert np.shares_memory(expanded, x)
+    assert expanded.strides[:2] == x.strides
+    assert expand_array(np.ones((2, 3))).dtype == np.complex64
+
+
+def test_expand_dims():
+    assert expand_dims([6, 4]) == [6, 4] + [1] * 14
+
+
+def test_check_out():
+    z = np.zeros((6, 8), dtype=np.complex64, order='F')
+    check_out(z, (6, 8, 1))
+    check_out(z, (6, 8), z, in_place=True)
+    with pytest.raises(ValueError, match='column-major'):
+        check_out(np.zeros((6, 8), dtype=np.complex64), (6, 8))
+    with pytest.raises(ValueError, match='shape'):
+        check_out(z, (8, 6))
+    with pytest.raises(ValueError, match='overlaps'):
+        check_out(z, (6, 8), z)
+    with pytest.raises(ValueError, match='overlaps'):
+        check_out(z[:, :4], (6, 4), z[:, 2:6], in_place=True)
@@ -0,0 +1,42 @@
+# Tests for reading cfl datasets ahead in bartpy.utils.prefetch
+import time
+
+import numpy as np
+import pytest
+
+from bartpy.utils import cfl
+from bartpy.utils.prefetch import CflPrefetcher, list_cfl
+
+
+@pytest.fixture
+def datasets(tmp_path):
+    arrays = [np.full((16, 16), i, dtype=np.complex64) for i in range(6)]
+    for i, array in enumerate(arrays):
+        cfl.writecfl(str(tmp_path / f'scan{i}'), array)
+    return str(tmp_path), arrays
+
+
+@pytest.mark.parametrize('mmap_mode', [None, 'r'])
+def test_prefetcher_reads_ahead(datasets, mmap_mode):
+    directory, arrays = datasets
+    loader = CflPrefetcher(list_cfl(directory), depth=2, mmap_mode=mmap_mode)
+
+    for array, expected in zip(loader, arrays):
+        np.testing.assert_array_equal(array, expected)
+        time.sleep(0.05)
+
+    stats = loader.stats()
+    assert stats['hits'] + stats['stalls'] == len(arrays)
+    assert stats['hits'] >= len(arrays) - 1
+    assert stats['bytes'] == sum(a.nbytes for a in arrays)
+
+
+def test_prefetcher_respects_budget(datasets, monkeypatch):
+    directory, arrays = datasets
+    loaded = []
+    monkeypatch.setattr('bartpy.utils.prefetch.load', lambda name, mmap_mode: loaded.append(name) or cfl.readcfl(name))
+
+    loader = CflPrefetcher(list_cfl(directory), depth=4, max_bytes=arrays[0].nbytes - 1)
+    for i, _ in enumerate(loader):
+        time.sleep(0.02)
+        assert len(loaded) == i + 1
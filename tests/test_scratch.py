@@ -0,0 +1,206 @@
+# Tests for scratch file lifetimes in bartpy.utils.scratch
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from bartpy.utils import scratch
+
+
+def test_orphans_of_dead_processes_are_removed(tmp_path):
+    create = f'import os, tempfile; print(tempfile.mkdtemp(prefix="{scratch.PREFIX}%d-" % os.getpid(), dir="{tmp_path}"))'
+    orphan = subprocess.run([sys.executable, '-c', create], stdout=subprocess.PIPE, text=True).stdout.strip()
+
+    with scratch.namespace() as NAME:
+        assert scratch.remove_orphans([str(tmp_path), os.path.dirname(os.path.dirname(NAME))]) == [orphan]
+        assert os.path.isdir(os.path.dirname(NAME))
+
+
+def test_quota_limits_concurrent_namespaces():
+    array = np.ones(64, dtype=np.complex64)
+    nbytes = scratch.footprint(array)
+    peak = []
+
+    def hold():
+        with scratch.namespace(array):
+            peak.append(scratch.usage())
+            time.sleep(0.05)
+
+    scratch.set_scratch_quota(nbytes)
+    try:
+        threads = [threading.Thread(target=hold) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        scratch.set_scratch_quota(None)
+
+    assert max(peak) == nbytes
+    assert scratch.usage() == 0
+
+
+def test_coroutines_wait_for_the_quota_on_the_event_loop():
+    array = np.ones(64, dtype=np.complex64)
+    nbytes = scratch.footprint(array)
+
+    async def call():
+        async with scratch.anamespace(array) as NAME:
+            await scratch.astage(NAME + 'out', array)
+            return await scratch.afetch(NAME + 'out')
+
+    async def run():
+        # more waiters than the default executor has threads
+        return await asyncio.gather(*[call() for _ in range(4 * scratch.IO_WORKERS)])
+
+    scratch.set_scratch_quota(2 * nbytes)
+    try:
+        results = asyncio.run(asyncio.wait_for(run(), 60))
+    finally:
+        scratch.set_scratch_quota(None)
+
+    assert len(results) == 4 * scratch.IO_WORKERS
+    np.testing.assert_array_equal(results[-1], array)
+    assert scratch.usage() == 0
+
+
+def test_fetched_outputs_count_toward_the_quota():
+    array = np.ones(64, dtype=np.complex64)
+    started = threading.Event()
+
+    def later():
+        with scratch.namespace():
+            started.set()
+
+    scratch.set_scratch_quota(array.nbytes)
+    try:
+        # no array inputs, so nothing is reserved up front
+        with scratch.namespace() as NAME:
+            assert scratch.usage() == 0
+            scratch.stage(NAME + 'out', np.concatenate([array, array]))
+            scratch.fetch(NAME + 'out')
+            assert scratch.usage() > 2 * array.nbytes
+            thread = threading.Thread(target=later)
+            thread.start()
+            assert not started.wait(0.2)
+        assert started.wait(5)
+        thread.join()
+    finally:
+        scratch.set_scratch_quota(None)
+    assert scratch.usage() == 0
+
+
+def test_lazy_outputs_do_not_hold_up_new_namespaces():
+    array = np.ones(64, dtype=np.complex64)
+
+    scratch.set_scratch_quota(scratch.footprint(array))
+    try:
+        with scratch.namespace(array) as NAME:
+            scratch.stage(NAME + 'out', array)
+            handle = scratch.fetch(NAME + 'out', lazy=True)
+        assert scratch.usage() == array.nbytes
+        with scratch.namespace(array) as NAME:
+            assert os.path.isdir(os.path.dirname(NAME))
+    finally:
+        scratch.set_scratch_quota(None)
+
+    np.testing.assert_array_equal(np.asarray(handle), array)
+    del handle
+    assert scratch.usage() == 0
+
+
+def test_large_outputs_are_mapped(monkeypatch):
+    array = np.arange(64, dtype=np.complex64).reshape(8, 8)
+    monkeypatch.setattr(scratch, 'MMAP_THRESHOLD', array.nbytes)
+
+    with scratch.namespace(array) as NAME:
+        scratch.stage(NAME + 'out', array)
+        mapped = scratch.fetch(NAME + 'out')
+        monkeypatch.setattr(scratch, 'MMAP_THRESHOLD', array.nbytes + 1)
+        small = scratch.fetch(NAME + 'out')
+    assert not os.path.exists(os.path.dirname(NAME))
+
+    assert isinstance(mapped, np.memmap) and not isinstance(small, np.memmap)
+    mapped[0, 0] = -1
+    np.testing.assert_array_equal(mapped[1:], array[1:])
+    np.testing.assert_array_equal(small, array)
+
+
+def test_session_writes_inputs_once(monkeypatch):
+    writes = []
+    writecfl = scratch.cfl.writecfl
+    monkeypatch.setattr(scratch.cfl, 'writecfl', lambda name, array: writes.append(name) or writecfl(name, array))
+    sensitivities = np.ones((4, 4), dtype=np.complex64)
+    frozen = np.zeros((4, 4), dtype=np.complex64)
+    frozen.flags.writeable = False
+
+    with scratch.Session() as session:
+        names = set()
+        for _ in range(3):
+            with scratch.namespace(sensitivities, frozen) as NAME:
+                names.add(scratch.stage(NAME + 'sensitivities', sensitivities))
+                names.add(scratch.stage(NAME + 'frozen', frozen))
+                # equal contents are recognized in a different array
+                names.add(scratch.stage(NAME + 'copy', sensitivities.copy()))
+        assert len(names) == 2 and len(writes) == 2
+        assert session.stats() == {'hits': 7, 'misses': 2, 'entries': 2, 'bytes': 2 * sensitivities.nbytes}
+    assert not any(os.path.exists(name + '.cfl') for name in names)
+
+    # unused files are removed beyond max_bytes
+    with scratch.Session(max_bytes=0):
+        with scratch.namespace(sensitivities) as NAME:
+            name = scratch.stage(NAME + 'sensitivities', sensitivities)
+            assert os.path.exists(name + '.cfl')
+        assert not os.path.exists(name + '.cfl')
+
+
+def test_session_rehashes_read_only_views_of_writeable_arrays():
+    base = np.ones((4, 4), dtype=np.complex64)
+    view = base[:]
+    view.flags.writeable = False
+
+    with scratch.Session():
+        with scratch.namespace(view) as NAME:
+            first = scratch.stage(NAME + 'view', view)
+            np.testing.assert_array_equal(scratch.cfl.readcfl(first), base)
+        base[...] = 5
+        with scratch.namespace(view) as NAME:
+            second = scratch.stage(NAME + 'view', view)
+            np.testing.assert_array_equal(scratch.cfl.readcfl(second), base)
+    assert first != second
+
+    owned = np.ones(4, dtype=np.complex64)
+    owned.flags.writeable = False
+    assert scratch.frozen(owned) and scratch.frozen(owned[1:])
+    assert not scratch.frozen(view) and not scratch.frozen(np.frombuffer(bytearray(8), np.complex64))
+
+
+def test_stage_and_fetch_all():
+    arrays = {'a': np.ones((4, 4), dtype=np.complex64), 'b': np.zeros(3, dtype=np.complex64), 'c': None}
+    with scratch.namespace(*arrays.values()) as NAME:
+        names = scratch.stage_all(NAME, arrays)
+        assert names == {'a': NAME + 'a', 'b': NAME + 'b'}
+
+        out = np.empty(3, dtype=np.complex64)
+        a, b = scratch.fetch_all([names['a'], names['b']], out=(None, out))
+        assert b is out
+        np.testing.assert_array_equal(a, arrays['a'])
+
+
+def test_fetch_all_needs_one_out_per_output():
+    arrays = {'a': np.ones(4, dtype=np.complex64), 'b': np.zeros(3, dtype=np.complex64)}
+    with scratch.namespace(*arrays.values()) as NAME:
+        names = list(scratch.stage_all(NAME, arrays).values())
+        out = np.empty(3, dtype=np.complex64)
+        for bad in [out, (out,), (None, out, None), ()]:
+            with pytest.raises(ValueError):
+                scratch.fetch_all(names, out=bad)
+            with pytest.raises(ValueError):
+                asyncio.run(scratch.afetch_all(names, out=bad))
+        a, b = asyncio.run(scratch.afetch_all(names, out=[None, out]))
+        assert b is out
@@ -0,0 +1,133 @@
+# Tests for the process-wide OpenMP thread budget in bartpy.utils.threads
+import asyncio
+import os
+import shutil
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from bartpy.utils import launch, threads
+
+requires_bart = pytest.mark.skipif('TOOLBOX_PATH' not in os.environ,
+                                   reason="BART is not installed (TOOLBOX_PATH is not set)")
+
+
+def hold_claim(num_threads=None):
+    """
+    Claim threads on another thread until the returned function is called
+
+    :returns: function that releases the claim, and the number of threads claimed
+    """
+    claimed, done = [], threading.Event()
+
+    def hold():
+        with threads.limit(num_threads), threads.claim() as n:
+            claimed.append(n)
+            done.wait()
+
+    thread = threading.Thread(target=hold, daemon=True)
+    thread.start()
+    while not claimed:
+        time.sleep(0.001)
+    def release():
+        done.set()
+        thread.join()
+
+    return release, claimed[0]
+
+
+def test_claims_share_the_budget(monkeypatch):
+    monkeypatch.setattr(threads, 'THREAD_BUDGET', 8)
+    with threads.claim() as first:
+        assert first == 8
+        # nested claims of the same thread reuse its threads
+        with threads.claim() as nested:
+            assert nested == 8
+        with threads.limit(2), threads.claim() as capped:
+            assert capped == 2
+
+    release, held = hold_claim(3)
+    with threads.claim() as second:
+        assert (held, second) == (3, 4)
+    release()
+
+
+def test_running_calls_do_not_hold_up_new_ones(monkeypatch):
+    monkeypatch.setattr(threads, 'THREAD_BUDGET', 8)
+    release, held = hold_claim()
+    assert held == 8
+
+    # a second call starts right away, with a share of the budget
+    started = []
+
+    def call():
+        with threads.claim() as n:
+            started.append(n)
+
+    thread = threading.Thread(target=call)
+    thread.start()
+    thread.join(5)
+    assert started == [4]
+    release()
+
+
+@requires_bart
+def test_map_dim_splits_the_budget_among_workers(monkeypatch):
+    from bartpy.tools import map_dim
+
+    monkeypatch.setattr(threads, 'THREAD_BUDGET', 8)
+    claimed = []
+
+    def tool(x):
+        with threads.claim() as n:
+            claimed.append(n)
+            time.sleep(0.01)
+        return x
+
+    x = np.ones((4, 3, 8), dtype=np.complex64)
+    np.testing.assert_array_equal(map_dim(tool, x, 2, workers=8), x)
+    assert claimed == [1] * 8
+    map_dim(tool, x, 2, workers=2)
+    assert claimed[8:] == [4] * 8
+
+
+def test_launched_tools_get_omp_num_threads(monkeypatch):
+    monkeypatch.setattr(threads, 'THREAD_BUDGET', 6)
+    monkeypatch.setenv('OMP_NUM_THREADS', '64')
+    assert launch.output([shutil.which('sh'), '-c', 'echo $OMP_NUM_THREADS']) == b'6\n'
+    release, _ = hold_claim(2)
+    assert launch.output([shutil.which('sh'), '-c', 'echo $OMP_NUM_THREADS']) == b'3\n'
+    release()
+
+
+def test_coroutine_claims_run_concurrently(monkeypatch):
+    monkeypatch.setattr(threads, 'THREAD_BUDGET', 2)
+    running, peak, claimed = [0], [0], []
+
+    async def call():
+        async with threads.aclaim() as n:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+            claimed.append(n)
+            await asyncio.sleep(0.01)
+            running[0] -= 1
+
+    async def run():
+        await asyncio.gather(*[call() for _ in range(8)])
+
+    asyncio.run(run())
+    assert peak[0] == 8 and claimed[0] == 2 and min(claimed) == 1
+    assert threads._running == 0
+
+
+def test_in_process_sets_openmp_threads(monkeypatch):
+    monkeypatch.setattr(threads, 'THREAD_BUDGET', 4)
+    calls = []
+    monkeypatch.setattr(threads, '_omp_set_num_threads', calls.append)
+    with threads.in_process() as first, threads.limit(1), threads.in_process() as second:
+        assert (first, second) == (4, 1)
+    assert calls == [4, 1]
+    with threads.claim() as again:
+        assert again == 4
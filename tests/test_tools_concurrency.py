@@ -0,0 +1,75 @@
+# Stress tests for running bartpy.tools functions from many threads at once
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from bartpy.utils import scratch
+
+NUM_CALLS = 400
+NUM_WORKERS = 32
+
+requires_bart = pytest.mark.skipif('TOOLBOX_PATH' not in os.environ,
+                                   reason="BART is not installed (TOOLBOX_PATH is not set)")
+
+
+def test_scratch_namespaces_are_private():
+    def claim(i):
+        with scratch.namespace() as name:
+            assert os.path.isdir(os.path.dirname(name))
+            return name
+
+    with ThreadPoolExecutor(NUM_WORKERS) as pool:
+        names = list(pool.map(claim, range(NUM_CALLS)))
+
+    assert len(set(names)) == NUM_CALLS
+    assert not any(os.path.exists(os.path.dirname(name)) for name in names)
+
+
+@requires_bart
+def test_concurrent_tool_calls():
+    from bartpy.tools import scale, conj
+
+    rng = np.random.default_rng(0)
+    inputs = [(rng.standard_normal((8, 8)) + 1j * rng.standard_normal((8, 8))).astype(np.complex64)
+              for _ in range(NUM_CALLS)]
+
+    def run(i):
+        if i % 2:
+            return scale(inputs[i], i)
+        return conj(inputs[i])
+
+    with ThreadPoolExecutor(NUM_WORKERS) as pool:
+        results = list(pool.map(run, range(NUM_CALLS)))
+
+    for i, result in enumerate(results):
+        expected = inputs[i] * i if i % 2 else np.conj(inputs[i])
+        np.testing.assert_allclose(result, expected, rtol=1e-5, atol=1e-5)
+
+
+@requires_bart
+def test_concurrent_coroutines():
+    from bartpy.tools import aio
+
+    inputs = [np.full((8, 8), i, dtype=np.complex64) for i in range(NUM_WORKERS)]
+
+    async def run():
+        return await asyncio.gather(*[aio.scale(x, 2) for x in inputs])
+
+    for x, result in zip(inputs, asyncio.run(run())):
+        np.testing.assert_allclose(result, 2 * x)
+
+
+@requires_bart
+def test_map_dim():
+    from bartpy.tools import map_dim, scale
+
+    rng = np.random.default_rng(0)
+    kspace = rng.standard_normal((6, 5, 1, 4)).astype(np.complex64)
+
+    result = map_dim(scale, kspace, 3, workers=4, factor=3)
+
+    assert result.shape == kspace.shape
+    np.testing.assert_allclose(result, 3 * kspace, rtol=1e-5)
@@ -0,0 +1,34 @@
+# Tests for the bart() command wrapper in bartpy.wrapper.bart
+import os
+
+import numpy as np
+import pytest
+
+from bartpy.utils import launch, scratch
+from bartpy.wrapper.bart import bart
+from bartpy.wrapper.wslsupport import PathCorrection
+
+requires_bart = pytest.mark.skipif('TOOLBOX_PATH' not in os.environ,
+                                   reason="BART is not installed (TOOLBOX_PATH is not set)")
+
+
+@requires_bart
+def test_bart_runs_commands_in_private_namespaces():
+    x = np.arange(12, dtype=np.complex64).reshape(4, 3)
+
+    np.testing.assert_allclose(bart(1, 'scale 2', x), 2 * x)
+    assert scratch.usage() == 0
+
+
+@requires_bart
+def test_bart_ignores_the_embed_backend(tmp_path, monkeypatch):
+    monkeypatch.setattr(launch, 'BACKEND', 'embed')
+    monkeypatch.chdir(tmp_path)
+    x = np.ones((2, 2), dtype=np.complex64)
+
+    np.testing.assert_allclose(bart(1, 'scale 3', x), 3 * x)
+    assert os.listdir(tmp_path) == []
+
+
+def test_path_correction():
+    assert PathCorrection('C:' + os.path.sep + 'data') == '/mnt/c/data'